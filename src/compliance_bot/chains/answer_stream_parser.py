@@ -0,0 +1,184 @@
+"""Incremental parser for streamed grounded-answer JSON drafts."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import ValidationError
+
+from compliance_bot.schemas.answer import GroundedAnswerDraft
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import Citation
+
+_DECISIONS = {decision.value: decision for decision in DecisionEnum}
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+@dataclass
+class AnswerProgress:
+    """What one streamed chunk added: a committed decision, answer text, citations."""
+
+    decision: DecisionEnum | None = None
+    answer_delta: str = ""
+    citations: list[Citation] = field(default_factory=list)
+
+
+class IncrementalAnswerParser:
+    """Surface fields of a ``GroundedAnswerDraft`` JSON object while it streams.
+
+    ``decision`` is reported once its string is closed, ``answer`` text as it
+    grows, and each citation once its object is closed, so a citation is never
+    validated on a half-written ``quote_span``. Each character is scanned once,
+    so feeding a whole answer costs time linear in its length.
+    :meth:`finish` parses the full text with the same parser as the
+    non-streaming chain.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._parser = PydanticOutputParser(pydantic_object=GroundedAnswerDraft)
+        self.decision: DecisionEnum | None = None
+        self.answer_text = ""
+        self.citations: list[Citation] = []
+        # Scanner state: nesting depth (1 = inside the top-level object), the
+        # current top-level key, and what the string being read is for.
+        self._depth = 0
+        self._done = False
+        self._in_string = False
+        self._escape: str | None = None
+        self._high_surrogate = ""
+        self._expect_key = False
+        self._key = ""
+        self._role: str | None = None
+        self._chars: list[str] = []
+        self._in_citations = False
+        self._element: list[str] = []
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, text: str) -> AnswerProgress:
+        """Append streamed ``text`` and return what became newly available."""
+
+        progress = AnswerProgress()
+        if not text:
+            return progress
+        self._parts.append(text)
+        if self._done:
+            return progress
+        for char in text:
+            if self._depth >= 3:
+                self._element.append(char)
+            if self._in_string:
+                self._string_char(char, progress)
+            else:
+                self._structural_char(char, progress)
+            if self._done:
+                break
+        return progress
+
+    def finish(self) -> GroundedAnswerDraft:
+        """Parse the complete streamed text; raises like the non-streaming chain."""
+
+        return self._parser.parse(self.text)
+
+    def _structural_char(self, char: str, progress: AnswerProgress) -> None:
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expect_key:
+                self._role = "key"
+            elif self._depth == 1 and self._key in {"decision", "answer"}:
+                self._role = self._key
+            else:
+                self._role = None
+            self._chars = []
+        elif char in "{[":
+            if self._depth == 0 and char == "{":
+                self._expect_key = True
+            elif self._depth == 1 and char == "[" and self._key == "citations":
+                self._in_citations = True
+            elif self._depth == 2 and self._in_citations:
+                self._element = [char]
+            if self._depth > 0 or char == "{":
+                self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 2 and self._in_citations:
+                self._citation_closed(progress)
+            elif self._depth == 1:
+                self._in_citations = False
+            elif self._depth <= 0:
+                self._done = True
+        elif self._depth == 1 and char == ":":
+            self._expect_key = False
+        elif self._depth == 1 and char == ",":
+            self._expect_key = True
+
+    def _string_char(self, char: str, progress: AnswerProgress) -> None:
+        if self._escape is not None:
+            self._escape += char
+            if self._escape[0] != "u":
+                self._append(_SIMPLE_ESCAPES.get(char, char), progress)
+                self._escape = None
+            elif len(self._escape) == 5:
+                self._append(self._decode_unicode(self._escape[1:]), progress)
+                self._escape = None
+        elif char == "\\":
+            self._escape = ""
+        elif char == '"':
+            self._in_string = False
+            self._string_closed(progress)
+        else:
+            self._append(char, progress)
+
+    def _decode_unicode(self, digits: str) -> str:
+        try:
+            code_unit = int(digits, 16)
+        except ValueError:
+            return ""
+        if 0xD800 <= code_unit < 0xDC00:
+            self._high_surrogate = chr(code_unit)
+            return ""
+        text = self._high_surrogate + chr(code_unit)
+        self._high_surrogate = ""
+        return text.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+
+    def _append(self, text: str, progress: AnswerProgress) -> None:
+        if not text or self._role is None:
+            return
+        if self._role == "answer":
+            self.answer_text += text
+            progress.answer_delta += text
+        else:
+            self._chars.append(text)
+
+    def _string_closed(self, progress: AnswerProgress) -> None:
+        value = "".join(self._chars)
+        if self._role == "key":
+            self._key = value
+        elif self._role == "decision" and self.decision is None:
+            decision = _DECISIONS.get(value.strip().upper())
+            if decision is not None:
+                self.decision = decision
+                progress.decision = decision
+        self._role = None
+
+    def _citation_closed(self, progress: AnswerProgress) -> None:
+        try:
+            citation = Citation.model_validate(json.loads("".join(self._element)))
+        except (json.JSONDecodeError, ValidationError):
+            return
+        self.citations.append(citation)
+        progress.citations.append(citation)
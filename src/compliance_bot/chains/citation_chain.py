@@ -5,31 +5,79 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Mapping
+from typing import Any, Callable, Iterator, Mapping
 
+from langchain_core.callbacks import BaseCallbackHandler, UsageMetadataCallbackHandler
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from pydantic import ValidationError
 
 from compliance_bot.chains.abstention_policy import (
     controlled_abstention,
     controlled_escalation,
     enforce_grounding_policy,
 )
+from compliance_bot.chains.answer_stream_parser import IncrementalAnswerParser
+from compliance_bot.chains.evidence_packer import (
+    EvidencePackingConfig,
+    PackedEvidence,
+    estimate_tokens,
+    pack_evidence,
+    parse_evidence_budget,
+)
 from compliance_bot.llms.siliconflow import (
     DEFAULT_SILICONFLOW_MODEL,
     build_siliconflow_llm,
     load_siliconflow_config,
 )
+from compliance_bot.providers.client_registry import get_client_registry
+from compliance_bot.providers.llm_cache import (
+    cache_chat_model,
+    load_llm_cache_config,
+    scope_llm_cache,
+    track_llm_cache,
+)
 from compliance_bot.providers.provider_registry import (
-    resolve_embedding_provider,
-    resolve_rerank_provider,
+    EMBEDDING_PROVIDER_MODES,
+    RERANK_PROVIDER_MODES,
+)
+from compliance_bot.providers.rate_limit import load_rate_limit_config, rate_limit_chat_model
+from compliance_bot.providers.resilience import (
+    CircuitOpenError,
+    load_resilience_config,
+    resilience_enabled,
+    wrap_chat_model,
+)
+from compliance_bot.providers.single_flight import (
+    coalesce_chat_model,
+    single_flight_enabled,
+    track_coalescing,
+)
+from compliance_bot.retrieval.embedding_store import load_cached_retrieval_index
+from compliance_bot.retrieval.indexer import RetrievalIndex
+from compliance_bot.retrieval.live_index import LiveRetrievalIndex
+from compliance_bot.retrieval.rerank_payload import RerankPayloadConfig, parse_rerank_budget
+from compliance_bot.retrieval.retriever import (
+    RetrieverConfig,
+    resolve_retriever_config,
+    run_retrieval,
+)
+from compliance_bot.schemas.answer import (
+    AnswerStreamEvent,
+    BatchAnswerSummary,
+    BatchQuestion,
+    GroundedAnswerDraft,
+    GroundedAnswerResponse,
 )
-from compliance_bot.retrieval.indexer import build_retrieval_index, load_manifest
-from compliance_bot.retrieval.retriever import run_retrieval
-from compliance_bot.schemas.answer import GroundedAnswerDraft, GroundedAnswerResponse
 from compliance_bot.schemas.audit import build_audit_event
 from compliance_bot.schemas.query import DecisionEnum
 from compliance_bot.schemas.retrieval import Citation, RetrievedChunk, RetrievalFilters, RetrievalResponse
@@ -53,25 +101,6 @@ def _to_text(model_output: Any) -> str:
     raise TypeError(f"Unsupported model output type: {type(model_output)!r}")
 
 
-def _format_evidence_chunks(retrieved_chunks: list[RetrievedChunk]) -> str:
-    lines: list[str] = []
-    for chunk in retrieved_chunks:
-        section = chunk.metadata.get("section") or str(chunk.chunk_index)
-        lines.append(
-            "\n".join(
-                [
-                    f"- chunk_id: {chunk.chunk_id}",
-                    f"  doc_id: {chunk.doc_id}",
-                    f"  version: {chunk.version_tag}",
-                    f"  section: {section}",
-                    f"  retrieval_score: {chunk.retrieval_score:.4f}",
-                    f"  content: {chunk.content}",
-                ]
-            )
-        )
-    return "\n\n".join(lines)
-
-
 def _citation_matches_chunk(citation: Citation, chunk: RetrievedChunk) -> bool:
     if citation.doc_id != chunk.doc_id:
         return False
@@ -104,13 +133,8 @@ def citations_are_grounded(
     return True
 
 
-def build_citation_answer_chain(
-    llm: Runnable[Any, Any],
-) -> Runnable[Any, GroundedAnswerDraft]:
-    """Create Week 4 grounded answer LCEL chain with citation schema output."""
-
-    parser = PydanticOutputParser(pydantic_object=GroundedAnswerDraft)
-    prompt = ChatPromptTemplate.from_messages(
+def _answer_prompt(parser: PydanticOutputParser) -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages(
         [
             (
                 "system",
@@ -118,7 +142,8 @@ def build_citation_answer_chain(
                     "You are a compliance assistant. Use only provided evidence chunks. "
                     "If evidence is insufficient, abstain. Never invent citations. "
                     "For ANSWERED, include at least one citation and each citation quote_span "
-                    "must be an exact substring from evidence content. "
+                    "must be an exact substring of the content listed under the cited chunk_id. "
+                    "Write the decision field first, before answer, confidence and citations. "
                     "Return JSON only.\n{format_instructions}"
                 ),
             ),
@@ -132,28 +157,91 @@ def build_citation_answer_chain(
             ),
         ]
     ).partial(format_instructions=parser.get_format_instructions())
-    return prompt | llm | RunnableLambda(_to_text) | parser
 
 
-def invoke_citation_answer_chain(
-    chain: Runnable[Any, GroundedAnswerDraft],
+def build_citation_answer_chain(
+    llm: Runnable[Any, Any],
+    *,
+    manifest_hash: str | None = None,
+) -> Runnable[Any, GroundedAnswerDraft]:
+    """Create Week 4 grounded answer LCEL chain with citation schema output.
+
+    When ``llm`` is cached, answers are keyed under ``manifest_hash`` so a new
+    corpus build never serves answers drafted against the previous one.
+    """
+
+    parser = PydanticOutputParser(pydantic_object=GroundedAnswerDraft)
+    namespace = f"answer:{manifest_hash}" if manifest_hash else "answer"
+    return (
+        _answer_prompt(parser)
+        | scope_llm_cache(llm, namespace)
+        | RunnableLambda(_to_text)
+        | parser
+    )
+
+
+def build_citation_stream_chain(llm: Runnable[Any, Any]) -> Runnable[Any, Any]:
+    """Create the streaming variant: same prompt, raw message chunks out.
+
+    Parsing happens incrementally in :func:`stream_citation_answer`.
+    """
+
+    parser = PydanticOutputParser(pydantic_object=GroundedAnswerDraft)
+    return _answer_prompt(parser) | llm
+
+
+def _answer_chain_payload(
     *,
     question: str,
     retrieved_chunks: list[RetrievedChunk],
-) -> GroundedAnswerDraft:
-    """Invoke citation answer chain with validated inputs."""
-
+    evidence_packing: EvidencePackingConfig | None = None,
+) -> tuple[dict[str, str], PackedEvidence]:
     normalized_question = " ".join(question.split())
     if not normalized_question:
         raise ValueError("question must not be blank")
     if not retrieved_chunks:
         raise ValueError("retrieved_chunks must not be empty")
 
+    evidence = pack_evidence(
+        retrieved_chunks,
+        question=normalized_question,
+        config=evidence_packing,
+    )
     payload = {
         "question": normalized_question,
-        "evidence_chunks": _format_evidence_chunks(retrieved_chunks),
-        "allowed_chunk_ids": ", ".join(chunk.chunk_id for chunk in retrieved_chunks),
+        "evidence_chunks": evidence.text,
+        "allowed_chunk_ids": ", ".join(evidence.chunk_ids),
+    }
+    return payload, evidence
+
+
+def _evidence_metadata(evidence: PackedEvidence | None) -> dict[str, Any]:
+    if evidence is None:
+        return {}
+    return {
+        "evidence_tokens": evidence.tokens,
+        "evidence_tokens_saved": evidence.tokens_saved,
+        "evidence_merged": evidence.merged_count,
+        "evidence_deduplicated": evidence.deduplicated_count,
+        "evidence_trimmed": evidence.trimmed_count,
+        "evidence_dropped": evidence.dropped_count,
     }
+
+
+def invoke_citation_answer_chain(
+    chain: Runnable[Any, GroundedAnswerDraft],
+    *,
+    question: str,
+    retrieved_chunks: list[RetrievedChunk],
+    evidence_packing: EvidencePackingConfig | None = None,
+) -> GroundedAnswerDraft:
+    """Invoke citation answer chain with validated inputs."""
+
+    payload, _ = _answer_chain_payload(
+        question=question,
+        retrieved_chunks=retrieved_chunks,
+        evidence_packing=evidence_packing,
+    )
     return chain.invoke(payload)
 
 
@@ -206,164 +294,159 @@ def resolve_answer_llm(
 
     if normalized_mode == "none":
         return None
-    if normalized_mode == "siliconflow":
-        return build_siliconflow_llm(load_siliconflow_config(source))
-    if _has_siliconflow_key(source):
-        return build_siliconflow_llm(load_siliconflow_config(source))
+    if normalized_mode == "siliconflow" or _has_siliconflow_key(source):
+        config = load_siliconflow_config(source)
+        rate_limit = replace(load_rate_limit_config("chat", source), max_retries=config.max_retries)
+        llm: Runnable[Any, Any] = rate_limit_chat_model(
+            build_siliconflow_llm(replace(config, max_retries=0)),
+            rate_limit,
+            model=config.model,
+        )
+        if resilience_enabled(source):
+            llm = wrap_chat_model(llm, load_resilience_config(source), model=config.model)
+        if single_flight_enabled(source):
+            llm = coalesce_chat_model(llm, model=config.model)
+        cache_config = load_llm_cache_config(source)
+        if cache_config is not None:
+            llm = cache_chat_model(
+                llm,
+                cache_config,
+                model=config.model,
+                temperature=config.temperature,
+            )
+        return llm
     return None
 
 
-def run_citation_answer(
-    retrieval_response: RetrievalResponse,
+def shared_answer_llm(
+    mode: str = "auto",
     *,
-    answer_chain: Runnable[Any, GroundedAnswerDraft] | None = None,
-    min_confidence_for_answer: float = 0.55,
-    llm_provider: str = "none",
-    llm_model: str = "fallback",
-) -> GroundedAnswerResponse:
-    """Run Week 4 grounded answering with citation validation and abstention controls."""
+    env: Mapping[str, str] | None = None,
+) -> Runnable[Any, Any] | None:
+    """Return the long-lived answer LLM for ``mode`` from the process-wide client registry.
 
-    if not 0.0 <= min_confidence_for_answer <= 1.0:
-        raise ValueError("min_confidence_for_answer must be within [0, 1]")
+    Same resolution as :func:`resolve_answer_llm`, but the client is built once per
+    provider environment and reused by every query.
+    """
 
-    trace_id = retrieval_response.trace_id
-    audit_events = list(retrieval_response.audit_events)
-    question = retrieval_response.question
-    normalized_query = retrieval_response.normalized_query
-    status = "ok"
-    error_code: str | None = None
-    elapsed_ms = 0.0
+    return get_client_registry().get(
+        "chat",
+        mode,
+        lambda: resolve_answer_llm(mode, env=env),
+        env=env,
+    )
 
-    if (
-        retrieval_response.decision != DecisionEnum.ANSWERED
-        or not retrieval_response.retrieved_chunks
-    ):
-        draft, abstention_reason = controlled_abstention("retrieval_insufficient_evidence")
-        audit_events.append(
-            build_audit_event(
-                trace_id=trace_id,
-                stage="answer_grounding",
-                actor="chains.citation_chain",
-                status="abstained",
-                input_payload=json.dumps(
-                    {
-                        "question": question,
-                        "retrieved_chunk_ids": [
-                            chunk.chunk_id for chunk in retrieval_response.retrieved_chunks
-                        ],
-                    },
-                    sort_keys=True,
-                ),
-                output_payload=json.dumps(
-                    {
-                        "decision": draft.decision.value,
-                        "reason": abstention_reason,
-                    },
-                    sort_keys=True,
-                ),
-                metadata={
-                    "llm_provider": llm_provider,
-                    "llm_model": llm_model,
-                    "latency_ms": 0.0,
-                    "status": "abstained",
-                    "min_confidence_for_answer": min_confidence_for_answer,
-                },
-            )
-        )
-        return GroundedAnswerResponse(
-            trace_id=trace_id,
-            question=question,
-            normalized_query=normalized_query,
-            answer=draft.answer,
-            confidence=draft.confidence,
-            decision=draft.decision,
-            citations=[],
-            retrieved_chunks=retrieval_response.retrieved_chunks,
-            audit_events=audit_events,
-            abstention_reason=abstention_reason,
-        )
 
-    try:
-        start = perf_counter()
-        if answer_chain is None:
-            draft = fallback_grounded_answer(
-                question=question,
-                retrieved_chunks=retrieval_response.retrieved_chunks,
-            )
-            status = "fallback"
-        else:
-            draft = invoke_citation_answer_chain(
-                answer_chain,
-                question=question,
-                retrieved_chunks=retrieval_response.retrieved_chunks,
-            )
-        elapsed_ms = (perf_counter() - start) * 1000.0
-    except TimeoutError:
-        draft, abstention_reason = controlled_escalation("llm_timeout")
-        status = "error"
-        error_code = "llm_timeout"
-        audit_events.append(
-            build_audit_event(
-                trace_id=trace_id,
-                stage="answer_grounding",
-                actor="chains.citation_chain",
-                status=status,
-                input_payload=question,
-                output_payload=draft.answer,
-                metadata={
-                    "llm_provider": llm_provider,
-                    "llm_model": llm_model,
-                    "latency_ms": elapsed_ms,
-                    "status": status,
-                    "error_code": error_code,
+def _retrieval_abstained_response(
+    retrieval_response: RetrievalResponse,
+    *,
+    llm_provider: str,
+    llm_model: str,
+    min_confidence_for_answer: float,
+) -> GroundedAnswerResponse:
+    draft, abstention_reason = controlled_abstention("retrieval_insufficient_evidence")
+    audit_events = list(retrieval_response.audit_events)
+    audit_events.append(
+        build_audit_event(
+            trace_id=retrieval_response.trace_id,
+            stage="answer_grounding",
+            actor="chains.citation_chain",
+            status="abstained",
+            input_payload=json.dumps(
+                {
+                    "question": retrieval_response.question,
+                    "retrieved_chunk_ids": [
+                        chunk.chunk_id for chunk in retrieval_response.retrieved_chunks
+                    ],
                 },
-            )
-        )
-        return GroundedAnswerResponse(
-            trace_id=trace_id,
-            question=question,
-            normalized_query=normalized_query,
-            answer=draft.answer,
-            confidence=draft.confidence,
-            decision=draft.decision,
-            citations=[],
-            retrieved_chunks=retrieval_response.retrieved_chunks,
-            audit_events=audit_events,
-            abstention_reason=abstention_reason,
-        )
-    except Exception:
-        draft, abstention_reason = controlled_escalation("llm_failed")
-        status = "error"
-        error_code = "llm_failed"
-        audit_events.append(
-            build_audit_event(
-                trace_id=trace_id,
-                stage="answer_grounding",
-                actor="chains.citation_chain",
-                status=status,
-                input_payload=question,
-                output_payload=draft.answer,
-                metadata={
-                    "llm_provider": llm_provider,
-                    "llm_model": llm_model,
-                    "latency_ms": elapsed_ms,
-                    "status": status,
-                    "error_code": error_code,
+                sort_keys=True,
+            ),
+            output_payload=json.dumps(
+                {
+                    "decision": draft.decision.value,
+                    "reason": abstention_reason,
                 },
-            )
+                sort_keys=True,
+            ),
+            metadata={
+                "llm_provider": llm_provider,
+                "llm_model": llm_model,
+                "latency_ms": 0.0,
+                "status": "abstained",
+                "min_confidence_for_answer": min_confidence_for_answer,
+            },
         )
-        return GroundedAnswerResponse(
-            trace_id=trace_id,
-            question=question,
-            normalized_query=normalized_query,
-            answer=draft.answer,
-            confidence=draft.confidence,
-            decision=draft.decision,
-            citations=[],
-            retrieved_chunks=retrieval_response.retrieved_chunks,
-            audit_events=audit_events,
-            abstention_reason=abstention_reason,
+    )
+    return GroundedAnswerResponse(
+        trace_id=retrieval_response.trace_id,
+        question=retrieval_response.question,
+        normalized_query=retrieval_response.normalized_query,
+        answer=draft.answer,
+        confidence=draft.confidence,
+        decision=draft.decision,
+        citations=[],
+        retrieved_chunks=retrieval_response.retrieved_chunks,
+        audit_events=audit_events,
+        abstention_reason=abstention_reason,
+    )
+
+
+def _llm_error_response(
+    retrieval_response: RetrievalResponse,
+    *,
+    error_code: str,
+    llm_provider: str,
+    llm_model: str,
+    elapsed_ms: float,
+    extra_metadata: Mapping[str, Any] | None = None,
+) -> GroundedAnswerResponse:
+    draft, abstention_reason = controlled_escalation(error_code)
+    audit_events = list(retrieval_response.audit_events)
+    audit_events.append(
+        build_audit_event(
+            trace_id=retrieval_response.trace_id,
+            stage="answer_grounding",
+            actor="chains.citation_chain",
+            status="error",
+            input_payload=retrieval_response.question,
+            output_payload=draft.answer,
+            metadata={
+                "llm_provider": llm_provider,
+                "llm_model": llm_model,
+                "latency_ms": elapsed_ms,
+                "status": "error",
+                "error_code": error_code,
+                **(extra_metadata or {}),
+            },
         )
+    )
+    return GroundedAnswerResponse(
+        trace_id=retrieval_response.trace_id,
+        question=retrieval_response.question,
+        normalized_query=retrieval_response.normalized_query,
+        answer=draft.answer,
+        confidence=draft.confidence,
+        decision=draft.decision,
+        citations=[],
+        retrieved_chunks=retrieval_response.retrieved_chunks,
+        audit_events=audit_events,
+        abstention_reason=abstention_reason,
+    )
+
+
+def _grounded_response(
+    retrieval_response: RetrievalResponse,
+    draft: GroundedAnswerDraft,
+    *,
+    status: str,
+    error_code: str | None,
+    llm_provider: str,
+    llm_model: str,
+    elapsed_ms: float,
+    min_confidence_for_answer: float,
+    extra_metadata: Mapping[str, Any] | None = None,
+) -> GroundedAnswerResponse:
+    """Validate ``draft`` citations, apply the grounding policy, and audit the outcome."""
 
     citations_valid = citations_are_grounded(
         draft.citations,
@@ -375,15 +458,16 @@ def run_citation_answer(
         min_confidence_for_answer=min_confidence_for_answer,
     )
 
+    audit_events = list(retrieval_response.audit_events)
     audit_events.append(
         build_audit_event(
-            trace_id=trace_id,
+            trace_id=retrieval_response.trace_id,
             stage="answer_grounding",
             actor="chains.citation_chain",
             status=status,
             input_payload=json.dumps(
                 {
-                    "question": question,
+                    "question": retrieval_response.question,
                     "retrieved_chunk_ids": [
                         chunk.chunk_id for chunk in retrieval_response.retrieved_chunks
                     ],
@@ -408,14 +492,15 @@ def run_citation_answer(
                 "error_code": error_code,
                 "min_confidence_for_answer": min_confidence_for_answer,
                 "citations_valid": citations_valid,
+                **(extra_metadata or {}),
             },
         )
     )
 
     return GroundedAnswerResponse(
-        trace_id=trace_id,
-        question=question,
-        normalized_query=normalized_query,
+        trace_id=retrieval_response.trace_id,
+        question=retrieval_response.question,
+        normalized_query=retrieval_response.normalized_query,
         answer=enforced_draft.answer,
         confidence=enforced_draft.confidence,
         decision=enforced_draft.decision,
@@ -426,50 +511,925 @@ def run_citation_answer(
     )
 
 
+def retrieval_supports_answer(retrieval_response: RetrievalResponse) -> bool:
+    """Return True when retrieval produced evidence the answer step may use."""
+
+    return (
+        retrieval_response.decision == DecisionEnum.ANSWERED
+        and bool(retrieval_response.retrieved_chunks)
+    )
+
+
+@dataclass
+class AnswerAttempt:
+    """One answer-chain call before grounding checks.
+
+    ``draft`` is ``None`` when the call failed with ``error_code``. ``tokens`` is
+    the provider-reported usage, or a characters/4 estimate of prompt plus draft
+    when the model reports none. ``evidence`` is the packed prompt evidence.
+    """
+
+    draft: GroundedAnswerDraft | None
+    status: str = "ok"
+    error_code: str | None = None
+    elapsed_ms: float = 0.0
+    coalesced: bool = False
+    cache_hit: bool = False
+    tokens: int = 0
+    evidence: PackedEvidence | None = None
+
+
+class _SpeculationCancelled(Exception):
+    """Raised inside a speculative draft whose result is no longer wanted."""
+
+
+class _CancelOnModelStart(BaseCallbackHandler):
+    """Abort the draft at its next model call (first call or retry) once ``cancel`` is set."""
+
+    raise_error = True
+
+    def __init__(self, cancel: threading.Event) -> None:
+        self.cancel = cancel
+
+    def _check(self) -> None:
+        if self.cancel.is_set():
+            raise _SpeculationCancelled()
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, **kwargs: Any) -> None:
+        self._check()
+
+    def on_llm_start(self, serialized: Any, prompts: Any, **kwargs: Any) -> None:
+        self._check()
+
+
+def draft_citation_answer(
+    retrieval_response: RetrievalResponse,
+    *,
+    answer_chain: Runnable[Any, GroundedAnswerDraft] | None = None,
+    evidence_packing: EvidencePackingConfig | None = None,
+    cancel: threading.Event | None = None,
+) -> AnswerAttempt:
+    """Call the answer chain (or the offline fallback) on ``retrieval_response``'s evidence.
+
+    Provider failures are captured on the returned attempt instead of raised.
+    Once ``cancel`` is set the draft makes no further model calls and ends with
+    error code ``speculation_cancelled``.
+    """
+
+    question = retrieval_response.question
+    retrieved_chunks = retrieval_response.retrieved_chunks
+    start = perf_counter()
+    if answer_chain is None:
+        draft = fallback_grounded_answer(question=question, retrieved_chunks=retrieved_chunks)
+        return AnswerAttempt(
+            draft=draft,
+            status="fallback",
+            elapsed_ms=(perf_counter() - start) * 1000.0,
+        )
+
+    if cancel is not None and cancel.is_set():
+        return AnswerAttempt(draft=None, status="cancelled", error_code="speculation_cancelled")
+
+    usage = UsageMetadataCallbackHandler()
+    callbacks: list[BaseCallbackHandler] = [usage]
+    if cancel is not None:
+        callbacks.append(_CancelOnModelStart(cancel))
+    evidence: PackedEvidence | None = None
+    try:
+        payload, evidence = _answer_chain_payload(
+            question=question,
+            retrieved_chunks=retrieved_chunks,
+            evidence_packing=evidence_packing,
+        )
+        with track_coalescing() as tally, track_llm_cache() as cache_tally:
+            draft = answer_chain.invoke(payload, config={"callbacks": callbacks})
+    except CircuitOpenError:
+        return AnswerAttempt(
+            draft=fallback_grounded_answer(question=question, retrieved_chunks=retrieved_chunks),
+            status="fallback",
+            error_code="circuit_open",
+            elapsed_ms=(perf_counter() - start) * 1000.0,
+            evidence=evidence,
+        )
+    except Exception as exc:
+        if cancel is not None and cancel.is_set():
+            error_code = "speculation_cancelled"
+        else:
+            error_code = "llm_timeout" if isinstance(exc, TimeoutError) else "llm_failed"
+        return AnswerAttempt(
+            draft=None,
+            status="error",
+            error_code=error_code,
+            elapsed_ms=(perf_counter() - start) * 1000.0,
+            evidence=evidence,
+        )
+
+    cache_hit = cache_tally.hits > 0
+    tokens = sum(item.get("total_tokens", 0) for item in usage.usage_metadata.values())
+    if not tokens and not cache_hit:
+        tokens = estimate_tokens(*payload.values(), draft.model_dump_json())
+    return AnswerAttempt(
+        draft=draft,
+        elapsed_ms=(perf_counter() - start) * 1000.0,
+        coalesced=tally.coalesced > 0,
+        cache_hit=cache_hit,
+        tokens=tokens,
+        evidence=evidence,
+    )
+
+
+def finalize_citation_answer(
+    retrieval_response: RetrievalResponse,
+    attempt: AnswerAttempt,
+    *,
+    min_confidence_for_answer: float = 0.55,
+    llm_provider: str = "none",
+    llm_model: str = "fallback",
+    extra_metadata: Mapping[str, Any] | None = None,
+) -> GroundedAnswerResponse:
+    """Turn ``attempt`` into the audited response for ``retrieval_response``."""
+
+    if attempt.draft is None:
+        return _llm_error_response(
+            retrieval_response,
+            error_code=attempt.error_code or "llm_failed",
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            elapsed_ms=attempt.elapsed_ms,
+            extra_metadata={**_evidence_metadata(attempt.evidence), **(extra_metadata or {})},
+        )
+    return _grounded_response(
+        retrieval_response,
+        attempt.draft,
+        status=attempt.status,
+        error_code=attempt.error_code,
+        llm_provider=f"{llm_provider}:cache" if attempt.cache_hit else llm_provider,
+        llm_model=llm_model,
+        elapsed_ms=attempt.elapsed_ms,
+        min_confidence_for_answer=min_confidence_for_answer,
+        extra_metadata={
+            "coalesced": attempt.coalesced,
+            "llm_cache_hit": attempt.cache_hit,
+            **_evidence_metadata(attempt.evidence),
+            **(extra_metadata or {}),
+        },
+    )
+
+
+def run_citation_answer(
+    retrieval_response: RetrievalResponse,
+    *,
+    answer_chain: Runnable[Any, GroundedAnswerDraft] | None = None,
+    min_confidence_for_answer: float = 0.55,
+    llm_provider: str = "none",
+    llm_model: str = "fallback",
+    evidence_packing: EvidencePackingConfig | None = None,
+) -> GroundedAnswerResponse:
+    """Run Week 4 grounded answering with citation validation and abstention controls.
+
+    ``evidence_packing`` merges adjacent chunks and sets the evidence token budget
+    of the prompt (see :func:`~compliance_bot.chains.evidence_packer.pack_evidence`).
+    """
+
+    if not 0.0 <= min_confidence_for_answer <= 1.0:
+        raise ValueError("min_confidence_for_answer must be within [0, 1]")
+
+    if not retrieval_supports_answer(retrieval_response):
+        return _retrieval_abstained_response(
+            retrieval_response,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            min_confidence_for_answer=min_confidence_for_answer,
+        )
+
+    return finalize_citation_answer(
+        retrieval_response,
+        draft_citation_answer(
+            retrieval_response,
+            answer_chain=answer_chain,
+            evidence_packing=evidence_packing,
+        ),
+        min_confidence_for_answer=min_confidence_for_answer,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+    )
+
+
+def stream_citation_answer(
+    retrieval_response: RetrievalResponse,
+    *,
+    stream_chain: Runnable[Any, Any] | None = None,
+    min_confidence_for_answer: float = 0.55,
+    llm_provider: str = "none",
+    llm_model: str = "fallback",
+    evidence_packing: EvidencePackingConfig | None = None,
+) -> Iterator[AnswerStreamEvent]:
+    """Streaming :func:`run_citation_answer`: surface the draft while the LLM writes it.
+
+    ``stream_chain`` comes from :func:`build_citation_stream_chain`. Events report
+    the committed decision, answer text deltas, and each citation with its
+    grounding check as soon as it is complete. Once the model commits to
+    ``ABSTAINED`` or ``ESCALATE`` generation is stopped, since the grounding
+    policy abstains either way. The final ``done`` event carries the same
+    response :func:`run_citation_answer` would build, with ``ttft_ms``,
+    ``streamed``, and ``stopped_early`` added to the audit metadata.
+    """
+
+    if not 0.0 <= min_confidence_for_answer <= 1.0:
+        raise ValueError("min_confidence_for_answer must be within [0, 1]")
+
+    start = perf_counter()
+
+    def elapsed_ms() -> float:
+        return (perf_counter() - start) * 1000.0
+
+    if stream_chain is None or not retrieval_supports_answer(retrieval_response):
+        response = run_citation_answer(
+            retrieval_response,
+            min_confidence_for_answer=min_confidence_for_answer,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            evidence_packing=evidence_packing,
+        )
+        yield AnswerStreamEvent(event="done", elapsed_ms=elapsed_ms(), response=response)
+        return
+
+    chunk_lookup = {chunk.chunk_id: chunk for chunk in retrieval_response.retrieved_chunks}
+
+    def citation_event(citation: Citation) -> AnswerStreamEvent:
+        chunk = chunk_lookup.get(citation.chunk_id)
+        return AnswerStreamEvent(
+            event="citation",
+            elapsed_ms=elapsed_ms(),
+            citation=citation,
+            citation_valid=chunk is not None and _citation_matches_chunk(citation, chunk),
+        )
+
+    parser = IncrementalAnswerParser()
+    ttft_ms: float | None = None
+    stopped_early = False
+    status = "ok"
+    error_code: str | None = None
+    evidence: PackedEvidence | None = None
+
+    def stream_metadata() -> dict[str, Any]:
+        return {
+            "streamed": True,
+            "ttft_ms": ttft_ms,
+            "stopped_early": stopped_early,
+            **_evidence_metadata(evidence),
+        }
+
+    try:
+        payload, evidence = _answer_chain_payload(
+            question=retrieval_response.question,
+            retrieved_chunks=retrieval_response.retrieved_chunks,
+            evidence_packing=evidence_packing,
+        )
+        with closing(iter(stream_chain.stream(payload))) as message_chunks:
+            for message_chunk in message_chunks:
+                text = _to_text(message_chunk)
+                if text and ttft_ms is None:
+                    ttft_ms = elapsed_ms()
+                progress = parser.feed(text)
+                if progress.decision is not None:
+                    yield AnswerStreamEvent(
+                        event="decision",
+                        elapsed_ms=elapsed_ms(),
+                        decision=progress.decision,
+                    )
+                if progress.answer_delta:
+                    yield AnswerStreamEvent(
+                        event="answer_delta",
+                        elapsed_ms=elapsed_ms(),
+                        text=progress.answer_delta,
+                    )
+                for citation in progress.citations:
+                    yield citation_event(citation)
+                if parser.decision in {DecisionEnum.ABSTAINED, DecisionEnum.ESCALATE}:
+                    stopped_early = True
+                    break
+
+        if parser.decision == DecisionEnum.ABSTAINED:
+            draft, _ = controlled_abstention("llm_abstained_or_escalated")
+        elif parser.decision == DecisionEnum.ESCALATE:
+            draft, _ = controlled_escalation("llm_abstained_or_escalated")
+        else:
+            draft = parser.finish()
+            for citation in draft.citations[len(parser.citations) :]:
+                yield citation_event(citation)
+    except CircuitOpenError:
+        draft = fallback_grounded_answer(
+            question=retrieval_response.question,
+            retrieved_chunks=retrieval_response.retrieved_chunks,
+        )
+        status = "fallback"
+        error_code = "circuit_open"
+    except Exception as exc:
+        response = _llm_error_response(
+            retrieval_response,
+            error_code="llm_timeout" if isinstance(exc, TimeoutError) else "llm_failed",
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            elapsed_ms=elapsed_ms(),
+            extra_metadata=stream_metadata(),
+        )
+        yield AnswerStreamEvent(event="done", elapsed_ms=elapsed_ms(), response=response)
+        return
+
+    response = _grounded_response(
+        retrieval_response,
+        draft,
+        status=status,
+        error_code=error_code,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        elapsed_ms=elapsed_ms(),
+        min_confidence_for_answer=min_confidence_for_answer,
+        extra_metadata=stream_metadata(),
+    )
+    yield AnswerStreamEvent(event="done", elapsed_ms=elapsed_ms(), response=response)
+
+
+def run_streaming_citation_answer(
+    retrieval_response: RetrievalResponse,
+    *,
+    stream_chain: Runnable[Any, Any] | None = None,
+    min_confidence_for_answer: float = 0.55,
+    llm_provider: str = "none",
+    llm_model: str = "fallback",
+    on_event: Callable[[AnswerStreamEvent], None] | None = None,
+    evidence_packing: EvidencePackingConfig | None = None,
+) -> GroundedAnswerResponse:
+    """Drain :func:`stream_citation_answer`, passing each event to ``on_event``."""
+
+    for event in stream_citation_answer(
+        retrieval_response,
+        stream_chain=stream_chain,
+        min_confidence_for_answer=min_confidence_for_answer,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        evidence_packing=evidence_packing,
+    ):
+        if on_event is not None:
+            on_event(event)
+        if event.response is not None:
+            return event.response
+    raise RuntimeError("answer stream ended without a final response")
+
+
+_speculation_executor: ThreadPoolExecutor | None = None
+_speculation_executor_lock = threading.Lock()
+# Mispredicted drafts still running; no new speculation starts while any remain.
+_abandoned_drafts = 0
+
+
+def _get_speculation_executor() -> ThreadPoolExecutor:
+    global _speculation_executor
+    with _speculation_executor_lock:
+        if _speculation_executor is None:
+            _speculation_executor = ThreadPoolExecutor(thread_name_prefix="speculative-answer")
+        return _speculation_executor
+
+
+def _has_abandoned_drafts() -> bool:
+    with _speculation_executor_lock:
+        return _abandoned_drafts > 0
+
+
+def _abandon_draft(future: Future[AnswerAttempt]) -> None:
+    global _abandoned_drafts
+
+    def _release(_: Future[AnswerAttempt]) -> None:
+        global _abandoned_drafts
+        with _speculation_executor_lock:
+            _abandoned_drafts -= 1
+
+    with _speculation_executor_lock:
+        _abandoned_drafts += 1
+    future.add_done_callback(_release)
+
+
+@dataclass
+class _Speculation:
+    provisional: RetrievalResponse | None = None
+    future: Future[AnswerAttempt] | None = None
+    started: float = 0.0
+    cancel: threading.Event = field(default_factory=threading.Event)
+
+
+def _speculation_event(
+    retrieval_response: RetrievalResponse,
+    provisional: RetrievalResponse,
+    *,
+    hit: bool,
+    attempt: AnswerAttempt | None,
+    cancelled: bool,
+    rerank_wait_ms: float,
+    evidence_packing: EvidencePackingConfig | None,
+) -> RetrievalResponse:
+    if hit and attempt is not None:
+        latency_saved_ms = min(attempt.elapsed_ms, rerank_wait_ms)
+        wasted_tokens = 0
+    else:
+        latency_saved_ms = 0.0
+        if attempt is not None:
+            wasted_tokens = attempt.tokens
+        elif cancelled:
+            wasted_tokens = 0
+        else:
+            # Still generating: the prompt has been sent, the completion is unknown.
+            payload, _ = _answer_chain_payload(
+                question=provisional.question,
+                retrieved_chunks=provisional.retrieved_chunks,
+                evidence_packing=evidence_packing,
+            )
+            wasted_tokens = estimate_tokens(*payload.values())
+    status = "hit" if hit else "miss"
+    event = build_audit_event(
+        trace_id=retrieval_response.trace_id,
+        stage="answer_speculation",
+        actor="chains.citation_chain",
+        status=status,
+        input_payload=json.dumps(
+            {"speculative_chunk_ids": [chunk.chunk_id for chunk in provisional.retrieved_chunks]},
+            sort_keys=True,
+        ),
+        output_payload=json.dumps(
+            {
+                "reranked_chunk_ids": [
+                    chunk.chunk_id for chunk in retrieval_response.retrieved_chunks
+                ],
+            },
+            sort_keys=True,
+        ),
+        metadata={
+            "speculation": status,
+            "rerank_wait_ms": rerank_wait_ms,
+            "latency_saved_ms": latency_saved_ms,
+            "wasted_tokens": wasted_tokens,
+            "speculation_cancelled": cancelled,
+        },
+    )
+    return retrieval_response.model_copy(
+        update={"audit_events": [*retrieval_response.audit_events, event]}
+    )
+
+
+def run_speculative_answer(
+    index: RetrievalIndex,
+    *,
+    question: str,
+    filters: RetrievalFilters | None = None,
+    embedding_provider: Any = None,
+    rerank_provider: Any = None,
+    answer_chain: Runnable[Any, GroundedAnswerDraft] | None = None,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
+    min_confidence_for_answer: float = 0.55,
+    llm_provider: str = "none",
+    llm_model: str = "fallback",
+    trace_id: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
+    evidence_packing: EvidencePackingConfig | None = None,
+) -> GroundedAnswerResponse:
+    """Retrieve and answer, drafting the answer on first-stage results while rerank runs.
+
+    When the first-stage top-k supports an answer, the answer chain starts on it in
+    a worker thread just before the rerank call. If rerank returns the same chunk
+    set the speculative draft is grounded against the reranked evidence and used;
+    otherwise it is cancelled and the answer is regenerated on the reranked chunks.
+    A draft already waiting on the provider cannot be interrupted, but it makes no
+    further model calls or retries, and no new speculation starts until it ends.
+    An ``answer_speculation`` audit event records the hit or miss, the overlap
+    saved, and the tokens a miss wasted. Without a rerank provider or an answer
+    chain this is :func:`run_retrieval` followed by :func:`run_citation_answer`.
+    """
+
+    if not 0.0 <= min_confidence_for_answer <= 1.0:
+        raise ValueError("min_confidence_for_answer must be within [0, 1]")
+
+    speculation = _Speculation()
+
+    def _speculate(provisional: RetrievalResponse) -> None:
+        if answer_chain is None or not retrieval_supports_answer(provisional):
+            return
+        if _has_abandoned_drafts():
+            return
+        speculation.provisional = provisional
+        speculation.started = perf_counter()
+        speculation.future = _get_speculation_executor().submit(
+            draft_citation_answer,
+            provisional,
+            answer_chain=answer_chain,
+            evidence_packing=evidence_packing,
+            cancel=speculation.cancel,
+        )
+
+    retrieval_response = run_retrieval(
+        index,
+        question=question,
+        filters=filters,
+        embedding_provider=embedding_provider,
+        rerank_provider=rerank_provider,
+        top_k=top_k,
+        min_score_for_answer=min_score_for_answer,
+        trace_id=trace_id,
+        rerank_payload=rerank_payload,
+        on_pre_rerank=_speculate,
+    )
+    if speculation.future is None or speculation.provisional is None:
+        return run_citation_answer(
+            retrieval_response,
+            answer_chain=answer_chain,
+            min_confidence_for_answer=min_confidence_for_answer,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            evidence_packing=evidence_packing,
+        )
+
+    rerank_wait_ms = (perf_counter() - speculation.started) * 1000.0
+    speculative_ids = {chunk.chunk_id for chunk in speculation.provisional.retrieved_chunks}
+    reranked_ids = {chunk.chunk_id for chunk in retrieval_response.retrieved_chunks}
+    hit = retrieval_supports_answer(retrieval_response) and speculative_ids == reranked_ids
+
+    if hit:
+        attempt = speculation.future.result()
+        return finalize_citation_answer(
+            _speculation_event(
+                retrieval_response,
+                speculation.provisional,
+                hit=True,
+                attempt=attempt,
+                cancelled=False,
+                rerank_wait_ms=rerank_wait_ms,
+                evidence_packing=evidence_packing,
+            ),
+            attempt,
+            min_confidence_for_answer=min_confidence_for_answer,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+        )
+
+    speculation.cancel.set()
+    cancelled = speculation.future.cancel()
+    finished = speculation.future.done() and not cancelled
+    if not cancelled and not finished:
+        _abandon_draft(speculation.future)
+    return run_citation_answer(
+        _speculation_event(
+            retrieval_response,
+            speculation.provisional,
+            hit=False,
+            attempt=speculation.future.result() if finished else None,
+            cancelled=cancelled,
+            rerank_wait_ms=rerank_wait_ms,
+            evidence_packing=evidence_packing,
+        ),
+        answer_chain=answer_chain,
+        min_confidence_for_answer=min_confidence_for_answer,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        evidence_packing=evidence_packing,
+    )
+
+
+@dataclass(frozen=True)
+class _Week4Runtime:
+    """Shared clients and index for Week 4 single and batch runs.
+
+    Each question reads ``live_index.current()`` once and answers against that
+    snapshot, so a hot swap between questions is picked up without a restart.
+    """
+
+    live_index: LiveRetrievalIndex
+    retriever: RetrieverConfig
+    embedding_provider: Any
+    rerank_provider: Any
+    llm: Runnable[Any, Any] | None
+    llm_provider: str
+    llm_model: str
+
+    def answer_chain(self, index: RetrievalIndex) -> Runnable[Any, GroundedAnswerDraft] | None:
+        if self.llm is None:
+            return None
+        return build_citation_answer_chain(self.llm, manifest_hash=index.manifest_hash)
+
+
+def _resolve_week4_runtime(
+    *,
+    manifest_path: Path | None,
+    live_index: LiveRetrievalIndex | None,
+    retriever: RetrieverConfig,
+    embedding_provider_mode: str,
+    llm_provider_mode: str,
+    env: Mapping[str, str] | None,
+    embedding_store_path: Path | None,
+) -> _Week4Runtime:
+    source = env if env is not None else os.environ
+    clients = get_client_registry()
+    embedding_provider = clients.embedding_provider(embedding_provider_mode, env=source)
+    rerank_provider = clients.rerank_provider(retriever.rerank_mode, env=source)
+    llm = shared_answer_llm(llm_provider_mode, env=source)
+    llm_model = source.get("SILICONFLOW_MODEL", DEFAULT_SILICONFLOW_MODEL).strip()
+
+    if live_index is None:
+        if manifest_path is None:
+            raise ValueError("manifest_path or live_index is required")
+        live_index = LiveRetrievalIndex(
+            load_cached_retrieval_index(
+                manifest_path,
+                embedding_provider=embedding_provider,
+                embedding_store_path=embedding_store_path,
+            )
+        )
+    elif manifest_path is not None:
+        raise ValueError("pass manifest_path or live_index, not both")
+    return _Week4Runtime(
+        live_index=live_index,
+        retriever=retriever,
+        embedding_provider=embedding_provider,
+        rerank_provider=rerank_provider,
+        llm=llm,
+        llm_provider="siliconflow" if llm is not None else "none",
+        llm_model=llm_model if llm is not None else "fallback",
+    )
+
+
 def run_week4_query(
     *,
-    manifest_path: Path,
+    manifest_path: Path | None = None,
     question: str,
     jurisdiction: str | None = None,
     policy_scope: list[str] | None = None,
-    top_k: int = 4,
-    min_score_for_answer: float = 0.3,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
     min_confidence_for_answer: float = 0.55,
     embedding_provider_mode: str = "auto",
-    rerank_provider_mode: str = "auto",
+    rerank_provider_mode: str | None = None,
     llm_provider_mode: str = "auto",
     env: Mapping[str, str] | None = None,
+    embedding_store_path: Path | None = None,
+    on_answer_event: Callable[[AnswerStreamEvent], None] | None = None,
+    speculative: bool = False,
+    evidence_packing: EvidencePackingConfig | None = None,
+    live_index: LiveRetrievalIndex | None = None,
+    retriever_config: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
 ) -> GroundedAnswerResponse:
-    """Run retrieval + citation-first answer as a single Week 4 flow."""
+    """Run retrieval + citation-first answer as a single Week 4 flow.
 
-    source = env if env is not None else os.environ
-    embedding_provider = resolve_embedding_provider(embedding_provider_mode, env=source)
-    rerank_provider = resolve_rerank_provider(rerank_provider_mode, env=source)
-    llm = resolve_answer_llm(llm_provider_mode, env=source)
-    answer_chain = build_citation_answer_chain(llm) if llm is not None else None
-    llm_model = source.get("SILICONFLOW_MODEL", DEFAULT_SILICONFLOW_MODEL).strip()
+    With ``on_answer_event`` the answer is streamed and each event is passed to
+    the callback as it arrives. With ``speculative`` the answer is drafted on the
+    first-stage results while rerank runs (see :func:`run_speculative_answer`).
+    ``evidence_packing`` sets how evidence is packed into the answer prompt.
+    Pass ``live_index`` instead of ``manifest_path`` to query whatever index a
+    :class:`~compliance_bot.ingestion.watch.PolicyWatcher` last published.
+    ``retriever_config`` names a retriever profile whose ``top_k``,
+    ``min_score_for_answer``, rerank mode and ``rerank_payload`` budget apply
+    unless given explicitly.
+    """
+
+    if speculative and on_answer_event is not None:
+        raise ValueError("speculative answering cannot be combined with streaming")
+
+    runtime = _resolve_week4_runtime(
+        manifest_path=manifest_path,
+        live_index=live_index,
+        retriever=resolve_retriever_config(
+            retriever_config,
+            top_k=top_k,
+            min_score_for_answer=min_score_for_answer,
+            rerank_mode=rerank_provider_mode,
+            rerank_payload=rerank_payload,
+        ),
+        embedding_provider_mode=embedding_provider_mode,
+        llm_provider_mode=llm_provider_mode,
+        env=env,
+        embedding_store_path=embedding_store_path,
+    )
+    index = runtime.live_index.current()
+    filters = RetrievalFilters(jurisdiction=jurisdiction, policy_scope=policy_scope or [])
+    if speculative:
+        return run_speculative_answer(
+            index,
+            question=question,
+            filters=filters,
+            embedding_provider=runtime.embedding_provider,
+            rerank_provider=runtime.rerank_provider,
+            answer_chain=runtime.answer_chain(index),
+            top_k=runtime.retriever.top_k,
+            min_score_for_answer=runtime.retriever.min_score_for_answer,
+            min_confidence_for_answer=min_confidence_for_answer,
+            rerank_payload=runtime.retriever.rerank_payload,
+            llm_provider=runtime.llm_provider,
+            llm_model=runtime.llm_model,
+            evidence_packing=evidence_packing,
+        )
 
-    manifest = load_manifest(manifest_path)
-    index = build_retrieval_index(manifest, embedding_provider=embedding_provider)
     retrieval_response = run_retrieval(
         index,
         question=question,
-        filters=RetrievalFilters(
-            jurisdiction=jurisdiction,
-            policy_scope=policy_scope or [],
-        ),
-        embedding_provider=embedding_provider,  # type: ignore[arg-type]
-        rerank_provider=rerank_provider,  # type: ignore[arg-type]
-        top_k=top_k,
-        min_score_for_answer=min_score_for_answer,
+        filters=filters,
+        embedding_provider=runtime.embedding_provider,
+        rerank_provider=runtime.rerank_provider,
+        top_k=runtime.retriever.top_k,
+        min_score_for_answer=runtime.retriever.min_score_for_answer,
+        rerank_payload=runtime.retriever.rerank_payload,
     )
 
+    if on_answer_event is not None:
+        return run_streaming_citation_answer(
+            retrieval_response,
+            stream_chain=(
+                build_citation_stream_chain(runtime.llm) if runtime.llm is not None else None
+            ),
+            min_confidence_for_answer=min_confidence_for_answer,
+            llm_provider=runtime.llm_provider,
+            llm_model=runtime.llm_model,
+            on_event=on_answer_event,
+            evidence_packing=evidence_packing,
+        )
     return run_citation_answer(
         retrieval_response,
-        answer_chain=answer_chain,
+        answer_chain=runtime.answer_chain(index),
         min_confidence_for_answer=min_confidence_for_answer,
-        llm_provider="siliconflow" if llm is not None else "none",
-        llm_model=llm_model if llm is not None else "fallback",
+        llm_provider=runtime.llm_provider,
+        llm_model=runtime.llm_model,
+        evidence_packing=evidence_packing,
+    )
+
+
+def load_batch_questions(path: Path) -> list[BatchQuestion]:
+    """Read one :class:`BatchQuestion` per non-blank JSONL line."""
+
+    questions: list[BatchQuestion] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                questions.append(BatchQuestion.model_validate_json(stripped))
+            except ValidationError as exc:
+                raise ValueError(f"{path}:{line_number}: invalid batch question: {exc}") from exc
+    return questions
+
+
+def _nearest_rank(ordered: list[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(0, int(round(percentile / 100.0 * len(ordered))) - 1)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+@dataclass
+class _BatchOutcome:
+    """One batch question's response, or the error it raised, and its timings."""
+
+    response: GroundedAnswerResponse | None = None
+    error: Exception | None = None
+    retrieval_ms: float = 0.0
+    latency_ms: float = 0.0
+
+
+def run_week4_batch(
+    *,
+    manifest_path: Path | None = None,
+    questions: list[BatchQuestion],
+    output_path: Path,
+    max_concurrency: int = 4,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
+    min_confidence_for_answer: float = 0.55,
+    embedding_provider_mode: str = "auto",
+    rerank_provider_mode: str | None = None,
+    llm_provider_mode: str = "auto",
+    env: Mapping[str, str] | None = None,
+    embedding_store_path: Path | None = None,
+    evidence_packing: EvidencePackingConfig | None = None,
+    live_index: LiveRetrievalIndex | None = None,
+    retriever_config: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
+) -> BatchAnswerSummary:
+    """Answer many questions and write results as JSONL.
+
+    Each question is retrieved and then answered straight away through LCEL
+    ``batch_as_completed``, so at most ``max_concurrency`` questions are in
+    flight and answering starts as soon as the first retrieval finishes. Each
+    output line (written and flushed as its question completes, so in
+    completion order) carries the question's input ``index``, its
+    ``latency_ms``, and the full ``GroundedAnswerResponse``. A question that
+    raises gets an ``error`` line with the exception type and message instead,
+    and the rest of the batch carries on. Each question is answered against
+    the index snapshot it was retrieved from. The summary's throughput and
+    latency percentiles cover successfully answered questions only; errors
+    are reported in ``error_count``.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    runtime = _resolve_week4_runtime(
+        manifest_path=manifest_path,
+        live_index=live_index,
+        retriever=resolve_retriever_config(
+            retriever_config,
+            top_k=top_k,
+            min_score_for_answer=min_score_for_answer,
+            rerank_mode=rerank_provider_mode,
+            rerank_payload=rerank_payload,
+        ),
+        embedding_provider_mode=embedding_provider_mode,
+        llm_provider_mode=llm_provider_mode,
+        env=env,
+        embedding_store_path=embedding_store_path,
+    )
+    batch_config = RunnableConfig(max_concurrency=max_concurrency)
+
+    def _run_one(item: BatchQuestion) -> _BatchOutcome:
+        start = perf_counter()
+        outcome = _BatchOutcome()
+        try:
+            index = runtime.live_index.current()
+            retrieval_response = run_retrieval(
+                index,
+                question=item.question,
+                filters=RetrievalFilters(
+                    jurisdiction=item.jurisdiction,
+                    policy_scope=item.policy_scope,
+                ),
+                embedding_provider=runtime.embedding_provider,
+                rerank_provider=runtime.rerank_provider,
+                top_k=runtime.retriever.top_k,
+                min_score_for_answer=runtime.retriever.min_score_for_answer,
+                trace_id=item.trace_id,
+                rerank_payload=runtime.retriever.rerank_payload,
+            )
+            outcome.retrieval_ms = (perf_counter() - start) * 1000.0
+            outcome.response = run_citation_answer(
+                retrieval_response,
+                answer_chain=runtime.answer_chain(index),
+                min_confidence_for_answer=min_confidence_for_answer,
+                llm_provider=runtime.llm_provider,
+                llm_model=runtime.llm_model,
+                evidence_packing=evidence_packing,
+            )
+        except Exception as exc:
+            outcome.error = exc
+        outcome.latency_ms = (perf_counter() - start) * 1000.0
+        return outcome
+
+    latencies: list[float] = []
+    retrieval_elapsed_ms = 0.0
+    answer_elapsed_ms = 0.0
+    error_count = 0
+    decision_counts: Counter[str] = Counter()
+    abstention_reasons: Counter[str] = Counter()
+    run_start = perf_counter()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8") as handle:
+        for position, outcome in RunnableLambda(_run_one).batch_as_completed(
+            questions,
+            config=batch_config,
+        ):
+            record: dict[str, Any] = {"index": position, "latency_ms": outcome.latency_ms}
+            retrieval_elapsed_ms += outcome.retrieval_ms
+            if outcome.response is None:
+                error_count += 1
+                item = questions[position]
+                record["trace_id"] = item.trace_id
+                record["question"] = item.question
+                record["error"] = {
+                    "type": type(outcome.error).__name__,
+                    "message": str(outcome.error),
+                }
+            else:
+                response = outcome.response
+                record["response"] = response.model_dump(mode="json")
+                answer_elapsed_ms += outcome.latency_ms - outcome.retrieval_ms
+                latencies.append(outcome.latency_ms)
+                decision_counts[response.decision.value] += 1
+                if response.abstention_reason:
+                    abstention_reasons[response.abstention_reason] += 1
+            handle.write(json.dumps(record, sort_keys=True))
+            handle.write("\n")
+            handle.flush()
+    elapsed_ms = (perf_counter() - run_start) * 1000.0
+
+    latencies.sort()
+    return BatchAnswerSummary(
+        question_count=len(questions),
+        max_concurrency=max_concurrency,
+        elapsed_ms=elapsed_ms,
+        retrieval_elapsed_ms=retrieval_elapsed_ms,
+        answer_elapsed_ms=answer_elapsed_ms,
+        error_count=error_count,
+        throughput_qps=len(latencies) / (elapsed_ms / 1000.0) if elapsed_ms > 0 else 0.0,
+        p50_latency_ms=_nearest_rank(latencies, 50.0),
+        p95_latency_ms=_nearest_rank(latencies, 95.0),
+        p99_latency_ms=_nearest_rank(latencies, 99.0),
+        decision_counts=dict(sorted(decision_counts.items())),
+        abstention_reasons=dict(sorted(abstention_reasons.items())),
     )
 
 
@@ -479,14 +1439,22 @@ def _build_parser() -> argparse.ArgumentParser:
         "--manifest-path",
         type=Path,
         required=True,
-        help="Path to Week 2 corpus manifest JSON",
+        help="Path to Week 2 corpus manifest (JSON or JSONL)",
     )
-    parser.add_argument(
+    questions = parser.add_mutually_exclusive_group(required=True)
+    questions.add_argument(
         "--question",
         type=str,
-        required=True,
         help="Compliance question to answer",
     )
+    questions.add_argument(
+        "--questions-path",
+        type=Path,
+        help=(
+            "JSONL file of questions to answer as a batch; each line holds question and "
+            "optional trace_id, jurisdiction, policy_scope"
+        ),
+    )
     parser.add_argument("--jurisdiction", type=str, default=None)
     parser.add_argument(
         "--policy-scope",
@@ -495,18 +1463,36 @@ def _build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Policy scope terms (space-separated)",
     )
-    parser.add_argument("--top-k", type=int, default=4)
-    parser.add_argument("--min-score-for-answer", type=float, default=0.3)
+    parser.add_argument(
+        "--retriever-config",
+        type=str,
+        default=None,
+        help="Named retriever profile for top-k, score floor and rerank mode (default: balanced)",
+    )
+    parser.add_argument("--top-k", type=int, default=None, help="Overrides the profile top-k")
+    parser.add_argument(
+        "--min-score-for-answer",
+        type=float,
+        default=None,
+        help="Overrides the profile score floor",
+    )
     parser.add_argument("--min-confidence-for-answer", type=float, default=0.55)
     parser.add_argument(
         "--embedding-provider",
-        choices=("auto", "none", "siliconflow"),
+        choices=EMBEDDING_PROVIDER_MODES,
         default="auto",
     )
     parser.add_argument(
         "--rerank-provider",
-        choices=("auto", "none", "siliconflow"),
-        default="auto",
+        choices=RERANK_PROVIDER_MODES,
+        default=None,
+        help="Overrides the profile rerank mode",
+    )
+    parser.add_argument(
+        "--rerank-budget",
+        type=parse_rerank_budget,
+        default=None,
+        help="Overrides the profile rerank payload budget: full, chars:N, tokens:N",
     )
     parser.add_argument(
         "--llm-provider",
@@ -514,13 +1500,98 @@ def _build_parser() -> argparse.ArgumentParser:
         default="auto",
         help="Answer generation provider mode",
     )
+    parser.add_argument(
+        "--embedding-store-path",
+        type=Path,
+        default=None,
+        help="Optional SQLite embedding store; only chunks missing from it are embedded",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the answer, echoing decision and answer text to stderr as they arrive",
+    )
+    parser.add_argument(
+        "--speculative",
+        action="store_true",
+        help="Start answering on first-stage results while rerank runs; regenerate on a miss",
+    )
+    parser.add_argument(
+        "--evidence-budget",
+        type=parse_evidence_budget,
+        default=EvidencePackingConfig(),
+        help="Answer prompt evidence budget: full or tokens:N (adjacent chunks merge either way)",
+    )
+    parser.add_argument(
+        "--output-path",
+        type=Path,
+        default=None,
+        help="Batch results JSONL (default: <questions-path stem>-answers.jsonl alongside it)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Questions retrieved or answered concurrently in batch mode",
+    )
     return parser
 
 
+def _echo_answer_event(event: AnswerStreamEvent) -> None:
+    if event.event == "decision" and event.decision is not None:
+        print(f"[decision {event.decision.value} @ {event.elapsed_ms:.0f}ms]", file=sys.stderr)
+    elif event.event == "answer_delta":
+        print(event.text, end="", file=sys.stderr, flush=True)
+    elif event.event == "citation" and event.citation is not None:
+        print(
+            f"\n[citation {event.citation.chunk_id} valid={event.citation_valid}]",
+            file=sys.stderr,
+        )
+    elif event.event == "done":
+        print(file=sys.stderr)
+
+
 def main() -> None:
     """CLI entrypoint for Week 4 grounded answer flow."""
 
     args = _build_parser().parse_args()
+    if args.questions_path is not None:
+        output_path = args.output_path or args.questions_path.with_name(
+            f"{args.questions_path.stem}-answers.jsonl"
+        )
+        summary = run_week4_batch(
+            manifest_path=args.manifest_path,
+            questions=load_batch_questions(args.questions_path),
+            output_path=output_path,
+            max_concurrency=args.max_concurrency,
+            top_k=args.top_k,
+            min_score_for_answer=args.min_score_for_answer,
+            min_confidence_for_answer=args.min_confidence_for_answer,
+            embedding_provider_mode=args.embedding_provider,
+            rerank_provider_mode=args.rerank_provider,
+            llm_provider_mode=args.llm_provider,
+            embedding_store_path=args.embedding_store_path,
+            evidence_packing=args.evidence_budget,
+            retriever_config=args.retriever_config,
+            rerank_payload=args.rerank_budget,
+        )
+        print(f"output_path: {output_path}")
+        print(f"questions: {summary.question_count}")
+        print(f"max_concurrency: {summary.max_concurrency}")
+        print(f"elapsed_ms: {summary.elapsed_ms:.2f}")
+        print(f"retrieval_elapsed_ms: {summary.retrieval_elapsed_ms:.2f}")
+        print(f"answer_elapsed_ms: {summary.answer_elapsed_ms:.2f}")
+        print(f"errors: {summary.error_count}")
+        print(f"throughput_qps: {summary.throughput_qps:.2f}")
+        print(f"p50_latency_ms: {summary.p50_latency_ms:.2f}")
+        print(f"p95_latency_ms: {summary.p95_latency_ms:.2f}")
+        print(f"p99_latency_ms: {summary.p99_latency_ms:.2f}")
+        for decision, count in summary.decision_counts.items():
+            print(f"decision.{decision}: {count}")
+        for reason, count in summary.abstention_reasons.items():
+            print(f"abstention_reason.{reason}: {count}")
+        return
+
     response = run_week4_query(
         manifest_path=args.manifest_path,
         question=args.question,
@@ -532,6 +1603,12 @@ def main() -> None:
         embedding_provider_mode=args.embedding_provider,
         rerank_provider_mode=args.rerank_provider,
         llm_provider_mode=args.llm_provider,
+        embedding_store_path=args.embedding_store_path,
+        on_answer_event=_echo_answer_event if args.stream else None,
+        speculative=args.speculative,
+        evidence_packing=args.evidence_budget,
+        retriever_config=args.retriever_config,
+        rerank_payload=args.rerank_budget,
     )
     print(json.dumps(response.model_dump(mode="json"), indent=2, sort_keys=True))
 
@@ -0,0 +1,265 @@
+"""Token-budgeted evidence packing for the grounded answer prompt.
+
+Chunks of one document overlap by ``DEFAULT_CHUNK_OVERLAP`` characters, so
+listing every retrieved chunk in full repeats text the model has already read.
+The packer here lists adjacent chunks of one document under a single entry with
+the overlap removed, lists identical texts once, and can fit the evidence to a
+token budget by trimming (then dropping) the lowest-ranked chunks. Every shown
+text is an exact substring of its chunk's content under that chunk's
+``chunk_id``, so quotes still validate against the retrieved chunks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from compliance_bot.retrieval.indexer import tokenize
+from compliance_bot.retrieval.rerank_payload import trim_candidate_text
+from compliance_bot.schemas.retrieval import RetrievedChunk
+
+_CHARS_PER_TOKEN = 4
+# Smallest trimmed excerpt worth a chunk header; below this the chunk is dropped.
+_MIN_EXCERPT_TOKENS = 16
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Approximate prompt tokens as one per four characters, rounded up per text."""
+
+    return sum(-(-len(text) // _CHARS_PER_TOKEN) for text in texts)
+
+
+@dataclass(frozen=True)
+class EvidencePackingConfig:
+    """How evidence is packed into the answer prompt.
+
+    ``max_tokens`` bounds the estimated tokens of the packed evidence; ``None``
+    keeps every chunk whole. ``merge_adjacent`` lists consecutive chunks of one
+    document together, dropping a shared overlap of at least
+    ``min_overlap_chars`` characters.
+    """
+
+    max_tokens: int | None = None
+    merge_adjacent: bool = True
+    min_overlap_chars: int = 20
+
+    def __post_init__(self) -> None:
+        if self.max_tokens is not None and self.max_tokens < 1:
+            raise ValueError("max_tokens must be >= 1")
+        if self.min_overlap_chars < 1:
+            raise ValueError("min_overlap_chars must be >= 1")
+
+    @property
+    def label(self) -> str:
+        return f"tokens:{self.max_tokens}" if self.max_tokens is not None else "full"
+
+
+def parse_evidence_budget(spec: str) -> EvidencePackingConfig:
+    """Parse ``full`` or ``tokens:N``."""
+
+    normalized = spec.strip().lower()
+    if normalized == "full":
+        return EvidencePackingConfig()
+    name, _, raw = normalized.partition(":")
+    if name != "tokens":
+        raise ValueError(f"invalid evidence budget '{spec}'; expected full or tokens:N")
+    try:
+        return EvidencePackingConfig(max_tokens=int(raw))
+    except ValueError as exc:
+        raise ValueError(f"invalid evidence budget '{spec}': {exc}") from exc
+
+
+@dataclass(frozen=True)
+class PackedEvidence:
+    """Packed evidence text and what packing did to it.
+
+    ``chunk_ids`` lists the chunks the text anchors, in rank order; chunks
+    dropped for the budget are absent. ``unpacked_tokens`` is the estimate for
+    listing every chunk in full.
+    """
+
+    text: str
+    chunk_ids: tuple[str, ...]
+    tokens: int
+    unpacked_tokens: int
+    merged_count: int = 0
+    overlap_chars_removed: int = 0
+    deduplicated_count: int = 0
+    trimmed_count: int = 0
+    dropped_count: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.unpacked_tokens - self.tokens)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    chunk: RetrievedChunk
+    text: str
+    rank: int
+    duplicate_of: str | None = None
+
+
+def _section(chunk: RetrievedChunk) -> str:
+    return chunk.metadata.get("section") or str(chunk.chunk_index)
+
+
+def _chunk_lines(chunk: RetrievedChunk, content: str, *, with_source: bool) -> list[str]:
+    lines = [f"- chunk_id: {chunk.chunk_id}" if with_source else f"  chunk_id: {chunk.chunk_id}"]
+    if with_source:
+        lines.extend([f"  doc_id: {chunk.doc_id}", f"  version: {chunk.version_tag}"])
+    lines.extend(
+        [
+            f"  section: {_section(chunk)}",
+            f"  retrieval_score: {chunk.retrieval_score:.4f}",
+            f"  content: {content}",
+        ]
+    )
+    return lines
+
+
+def format_evidence_chunks(retrieved_chunks: list[RetrievedChunk]) -> str:
+    """List every chunk in full, one entry per chunk."""
+
+    return "\n\n".join(
+        "\n".join(_chunk_lines(chunk, chunk.content, with_source=True))
+        for chunk in retrieved_chunks
+    )
+
+
+def _overlap(previous: str, following: str, min_chars: int) -> int:
+    """Length of the longest suffix of ``previous`` that starts ``following``."""
+
+    if len(previous) < min_chars or len(following) < min_chars:
+        return 0
+    seed = following[:min_chars]
+    position = previous.find(seed, max(0, len(previous) - len(following)))
+    while position >= 0:
+        if following.startswith(previous[position:]):
+            return len(previous) - position
+        position = previous.find(seed, position + 1)
+    return 0
+
+
+@dataclass
+class _Rendered:
+    text: str
+    merged_count: int = 0
+    overlap_chars_removed: int = 0
+
+
+def _runs(entries: list[_Entry], merge_adjacent: bool) -> list[list[_Entry]]:
+    """Group entries into runs of consecutive chunks of one document, in rank order."""
+
+    if not merge_adjacent:
+        return [[entry] for entry in entries]
+    by_source: dict[tuple[str, str], list[_Entry]] = {}
+    for entry in entries:
+        if entry.duplicate_of is None:
+            by_source.setdefault((entry.chunk.doc_id, entry.chunk.version_tag), []).append(entry)
+    runs: list[list[_Entry]] = []
+    for members in by_source.values():
+        members.sort(key=lambda entry: entry.chunk.chunk_index)
+        run = [members[0]]
+        for entry in members[1:]:
+            if entry.chunk.chunk_index == run[-1].chunk.chunk_index + 1:
+                run.append(entry)
+            else:
+                runs.append(run)
+                run = [entry]
+        runs.append(run)
+    runs.extend([entry] for entry in entries if entry.duplicate_of is not None)
+    runs.sort(key=lambda run: min(entry.rank for entry in run))
+    return runs
+
+
+def _render(entries: list[_Entry], config: EvidencePackingConfig) -> _Rendered:
+    rendered = _Rendered(text="")
+    blocks: list[str] = []
+    for run in _runs(entries, config.merge_adjacent):
+        first = run[0]
+        if first.duplicate_of is not None:
+            content = f"identical to chunk_id {first.duplicate_of}"
+        else:
+            content = first.text
+        lines = _chunk_lines(first.chunk, content, with_source=True)
+        previous = first.text
+        for entry in run[1:]:
+            overlap = _overlap(previous, entry.text, config.min_overlap_chars)
+            shown = entry.text[overlap:].strip() if overlap else entry.text
+            if overlap:
+                rendered.overlap_chars_removed += len(entry.text) - len(shown)
+            rendered.merged_count += 1
+            lines.append("  continued by:")
+            lines.extend(
+                _chunk_lines(entry.chunk, shown or "(already quoted above)", with_source=False)
+            )
+            previous = entry.text
+        blocks.append("\n".join(lines))
+    rendered.text = "\n\n".join(blocks)
+    return rendered
+
+
+def pack_evidence(
+    retrieved_chunks: list[RetrievedChunk],
+    *,
+    question: str = "",
+    config: EvidencePackingConfig | None = None,
+) -> PackedEvidence:
+    """Pack ``retrieved_chunks`` (in rank order) into answer-prompt evidence.
+
+    Under a token budget chunks are added by rank; the first one that does not
+    fit whole is trimmed around its matched terms (or ``question`` terms) to the
+    remaining budget, and chunks with no room left are dropped. The top-ranked
+    chunk is always kept.
+    """
+
+    resolved = config or EvidencePackingConfig()
+    unpacked_tokens = estimate_tokens(format_evidence_chunks(retrieved_chunks))
+    question_terms = set(tokenize(question))
+    entries: list[_Entry] = []
+    first_by_text: dict[str, str] = {}
+    trimmed_count = 0
+    dropped_count = 0
+
+    for rank, chunk in enumerate(retrieved_chunks):
+        duplicate_of = first_by_text.get(chunk.content.strip())
+        entry = _Entry(chunk=chunk, text=chunk.content, rank=rank, duplicate_of=duplicate_of)
+        candidate = [*entries, entry]
+        if resolved.max_tokens is None or (
+            estimate_tokens(_render(candidate, resolved).text) <= resolved.max_tokens
+        ):
+            entries = candidate
+        elif duplicate_of is None:
+            header_tokens = estimate_tokens(
+                _render([*entries, _Entry(chunk=chunk, text="", rank=rank)], resolved).text
+            )
+            spare_tokens = resolved.max_tokens - header_tokens
+            if spare_tokens < _MIN_EXCERPT_TOKENS and entries:
+                dropped_count += 1
+                continue
+            excerpt = trim_candidate_text(
+                chunk.content,
+                set(chunk.matched_terms) or question_terms,
+                max_chars=max(spare_tokens, _MIN_EXCERPT_TOKENS) * _CHARS_PER_TOKEN,
+            )
+            trimmed_count += int(excerpt != chunk.content)
+            entries.append(_Entry(chunk=chunk, text=excerpt, rank=rank))
+        else:
+            dropped_count += 1
+            continue
+        if duplicate_of is None:
+            first_by_text.setdefault(chunk.content.strip(), chunk.chunk_id)
+
+    rendered = _render(entries, resolved)
+    return PackedEvidence(
+        text=rendered.text,
+        chunk_ids=tuple(entry.chunk.chunk_id for entry in entries),
+        tokens=estimate_tokens(rendered.text),
+        unpacked_tokens=unpacked_tokens,
+        merged_count=rendered.merged_count,
+        overlap_chars_removed=rendered.overlap_chars_removed,
+        deduplicated_count=sum(1 for entry in entries if entry.duplicate_of is not None),
+        trimmed_count=trimmed_count,
+        dropped_count=dropped_count,
+    )
@@ -0,0 +1,17 @@
+"""Local development and benchmarking tools (not used by the runtime stack)."""
+
+from compliance_bot.devtools.siliconflow_standin import (
+    LatencyProfile,
+    SiliconFlowStandIn,
+    StandInConfig,
+    parse_latency_profile,
+    stand_in_chat_reply,
+)
+
+__all__ = [
+    "LatencyProfile",
+    "SiliconFlowStandIn",
+    "StandInConfig",
+    "parse_latency_profile",
+    "stand_in_chat_reply",
+]
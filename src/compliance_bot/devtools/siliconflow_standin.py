@@ -0,0 +1,560 @@
+"""Local OpenAI-compatible SiliconFlow stand-in server for load and latency testing.
+
+Implements ``/v1/chat/completions`` (including SSE streaming), ``/v1/embeddings``,
+and ``/v1/rerank`` with deterministic outputs: embeddings come from the local
+hashed n-gram embedder, rerank scores from the local reranker, and chat replies
+from the prompt itself (grounded-answer and query-rewrite prompts get valid JSON
+drafts citing the first evidence chunk). Latency, error injection, and a
+server-side rate limit are configurable, so the full client stack can be
+measured end to end by pointing ``SILICONFLOW_BASE_URL`` at the stand-in.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from compliance_bot.providers.local_embeddings import (
+    LocalEmbeddingConfig,
+    LocalHashEmbeddingProvider,
+)
+from compliance_bot.providers.local_rerank import LocalRerankProvider
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+STAND_IN_ENDPOINTS = ("chat", "embeddings", "rerank")
+
+_EVIDENCE_PATTERN = re.compile(
+    r"- chunk_id: (?P<chunk_id>[^\n]+)\n"
+    r"  doc_id: (?P<doc_id>[^\n]+)\n"
+    r"  version: (?P<version>[^\n]+)\n"
+    r"  section: (?P<section>[^\n]+)\n"
+    r"  retrieval_score: (?P<score>[0-9.]+)\n"
+    # A merged run lists its continuation chunks under ``continued by:``.
+    r"  content: (?P<content>.*?)"
+    r"(?=\n  continued by:|\n\n- chunk_id: |\n\nAllowed chunk_ids: |\Z)",
+    re.DOTALL,
+)
+_QUESTION_PATTERN = re.compile(r"Question: (?P<question>.+)")
+_Z_95 = 1.6448536269514722
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Per-request latency distribution.
+
+    ``fixed`` always waits ``median_ms``; ``uniform`` draws from
+    ``median_ms ± spread_ms``; ``lognormal`` has median ``median_ms`` and p95
+    ``median_ms + spread_ms``.
+    """
+
+    distribution: str = "fixed"
+    median_ms: float = 0.0
+    spread_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                "latency distribution must be one of: " + ", ".join(LATENCY_DISTRIBUTIONS)
+            )
+        if self.median_ms < 0.0 or self.spread_ms < 0.0:
+            raise ValueError("latency median and spread must be >= 0")
+
+    def sample_ms(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            low = max(0.0, self.median_ms - self.spread_ms)
+            return rng.uniform(low, self.median_ms + self.spread_ms)
+        if self.distribution == "lognormal" and self.median_ms > 0.0 and self.spread_ms > 0.0:
+            sigma = math.log((self.median_ms + self.spread_ms) / self.median_ms) / _Z_95
+            return self.median_ms * math.exp(rng.gauss(0.0, sigma))
+        return self.median_ms
+
+
+def parse_latency_profile(spec: str) -> LatencyProfile:
+    """Parse ``distribution:median_ms[:spread_ms]``, e.g. ``lognormal:800:300``."""
+
+    parts = spec.strip().split(":")
+    if not 2 <= len(parts) <= 3:
+        raise ValueError("latency spec must be distribution:median_ms[:spread_ms]")
+    return LatencyProfile(
+        distribution=parts[0].strip().lower(),
+        median_ms=float(parts[1]),
+        spread_ms=float(parts[2]) if len(parts) == 3 else 0.0,
+    )
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    """Behaviour of the stand-in server."""
+
+    latency: dict[str, LatencyProfile] = field(default_factory=dict)
+    stream_chunk_delay_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 1
+    retry_after_seconds: float = 1.0
+    embedding_dim: int = 1024
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        unknown = set(self.latency) - set(STAND_IN_ENDPOINTS)
+        if unknown:
+            raise ValueError(f"unknown stand-in endpoints: {', '.join(sorted(unknown))}")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be within [0, 1]")
+        if not 400 <= self.error_status <= 599:
+            raise ValueError("error_status must be an HTTP error status")
+        if self.rate_limit_rps < 0.0:
+            raise ValueError("rate_limit_rps must be >= 0")
+        if self.rate_limit_burst < 1:
+            raise ValueError("rate_limit_burst must be >= 1")
+        if self.stream_chunk_delay_ms < 0.0 or self.retry_after_seconds < 0.0:
+            raise ValueError("delays must be >= 0")
+
+    def latency_for(self, endpoint: str) -> LatencyProfile:
+        return self.latency.get(endpoint, LatencyProfile())
+
+
+def _token_count(text: str) -> int:
+    return len(text.split())
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(str(part.get("text", "")) for part in content if isinstance(part, dict))
+    return ""
+
+
+def _grounded_answer(prompt: str) -> str | None:
+    match = _EVIDENCE_PATTERN.search(prompt)
+    if match is None:
+        return None
+    content = match["content"]
+    quote_span = content[:160]
+    score = float(match["score"])
+    return json.dumps(
+        {
+            "answer": f"According to {match['doc_id']} section {match['section']}: {quote_span}",
+            "confidence": min(0.95, 0.6 + score / 2.0),
+            "decision": "ANSWERED",
+            "citations": [
+                {
+                    "doc_id": match["doc_id"],
+                    "section": match["section"],
+                    "chunk_id": match["chunk_id"],
+                    "quote_span": quote_span,
+                    "retrieval_score": min(1.0, score),
+                    "version": match["version"],
+                }
+            ],
+        }
+    )
+
+
+def stand_in_chat_reply(messages: list[dict[str, Any]]) -> str:
+    """Deterministic assistant reply for an OpenAI-style message list."""
+
+    prompt = "\n".join(_message_text(message.get("content")) for message in messages)
+    grounded = _grounded_answer(prompt)
+    if grounded is not None:
+        return grounded
+
+    question_match = _QUESTION_PATTERN.search(prompt)
+    if question_match is not None and "retrieval queries" in prompt:
+        question = " ".join(question_match["question"].lower().split())
+        return json.dumps({"normalized_query": question, "expanded_queries": []})
+
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+    last = _message_text(messages[-1].get("content")) if messages else ""
+    return f"Stand-in reply {digest}: {' '.join(last.split()[:32])}"
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stand_in: SiliconFlowStandIn
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StandInHTTPServer
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+    def _send_json(
+        self,
+        status: int,
+        body: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: int, message: str, headers: dict[str, str] | None = None) -> None:
+        self._send_json(status, {"error": {"message": message, "code": status}}, headers)
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        stand_in = self.server.stand_in
+        raw = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        endpoint = _endpoint_for(self.path)
+        if endpoint is None:
+            self._send_error(404, f"unknown endpoint {self.path}")
+            return
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._send_error(401, "missing bearer token")
+            return
+        try:
+            payload = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            self._send_error(400, "request body must be JSON")
+            return
+
+        rejection = stand_in._admit(endpoint)
+        if rejection == "rate_limited":
+            retry_after = f"{stand_in.config.retry_after_seconds:g}"
+            self._send_error(429, "rate limit exceeded", {"Retry-After": retry_after})
+            return
+        time.sleep(stand_in._sample_latency_ms(endpoint) / 1000.0)
+        if rejection == "error":
+            self._send_error(stand_in.config.error_status, "injected stand-in error")
+            return
+
+        if endpoint == "chat":
+            self._handle_chat(payload)
+        elif endpoint == "embeddings":
+            self._handle_embeddings(payload)
+        else:
+            self._handle_rerank(payload)
+
+    def _handle_chat(self, payload: dict[str, Any]) -> None:
+        messages = payload.get("messages") or []
+        model = str(payload.get("model", "stand-in-chat"))
+        reply = stand_in_chat_reply(messages)
+        prompt_tokens = sum(_token_count(_message_text(item.get("content"))) for item in messages)
+        completion_id = "chatcmpl-" + hashlib.sha256(reply.encode("utf-8")).hexdigest()[:16]
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": _token_count(reply),
+            "total_tokens": prompt_tokens + _token_count(reply),
+        }
+        if payload.get("stream"):
+            self._stream_chat(completion_id, model, reply, usage)
+            return
+        self._send_json(
+            200,
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            },
+        )
+
+    def _stream_chat(
+        self,
+        completion_id: str,
+        model: str,
+        reply: str,
+        usage: dict[str, int],
+    ) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        created = int(time.time())
+        delay = self.server.stand_in.config.stream_chunk_delay_ms / 1000.0
+        pieces = re.findall(r"\S+\s*|\s+", reply) or [""]
+        for position, piece in enumerate(pieces):
+            delta: dict[str, str] = {"content": piece}
+            if position == 0:
+                delta["role"] = "assistant"
+            self._write_event(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+                }
+            )
+            if delay and position < len(pieces) - 1:
+                time.sleep(delay)
+        self._write_event(
+            {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "usage": usage,
+            }
+        )
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _write_event(self, body: dict[str, Any]) -> None:
+        self.wfile.write(b"data: " + json.dumps(body).encode("utf-8") + b"\n\n")
+        self.wfile.flush()
+
+    def _handle_embeddings(self, payload: dict[str, Any]) -> None:
+        texts = _embedding_inputs(payload.get("input", []))
+        vectors = self.server.stand_in.embedder.embed_documents(texts)
+        self._send_json(
+            200,
+            {
+                "object": "list",
+                "data": [
+                    {"object": "embedding", "index": index, "embedding": vector}
+                    for index, vector in enumerate(vectors)
+                ],
+                "model": str(payload.get("model", "stand-in-embedding")),
+                "usage": {
+                    "prompt_tokens": sum(_token_count(text) for text in texts),
+                    "total_tokens": sum(_token_count(text) for text in texts),
+                },
+            },
+        )
+
+    def _handle_rerank(self, payload: dict[str, Any]) -> None:
+        documents = [str(document) for document in payload.get("documents", [])]
+        query = str(payload.get("query", ""))
+        top_n = int(payload.get("top_n") or len(documents))
+        scores = self.server.stand_in.reranker.score(query, documents)
+        ranked = sorted(range(len(documents)), key=lambda index: (-scores[index], index))
+        self._send_json(
+            200,
+            {
+                "id": "rerank-" + hashlib.sha256(query.encode("utf-8")).hexdigest()[:16],
+                "results": [
+                    {"index": index, "relevance_score": scores[index]}
+                    for index in ranked[:top_n]
+                ],
+            },
+        )
+
+
+def _endpoint_for(path: str) -> str | None:
+    route = path.split("?", 1)[0].rstrip("/")
+    if route.endswith("/chat/completions"):
+        return "chat"
+    if route.endswith("/embeddings"):
+        return "embeddings"
+    if route.endswith("/rerank"):
+        return "rerank"
+    return None
+
+
+def _embedding_inputs(value: Any) -> list[str]:
+    """Normalise OpenAI ``input`` (string, strings, or token id arrays) to texts."""
+
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list) and value and all(isinstance(item, int) for item in value):
+        return [" ".join(str(item) for item in value)]
+    texts: list[str] = []
+    for item in value if isinstance(value, list) else []:
+        if isinstance(item, list):
+            texts.append(" ".join(str(token) for token in item))
+        else:
+            texts.append(str(item))
+    return texts
+
+
+class SiliconFlowStandIn:
+    """In-process stand-in server; use as a context manager or call :meth:`start`/:meth:`close`."""
+
+    def __init__(
+        self,
+        config: StandInConfig | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.config = config or StandInConfig()
+        self.embedder = LocalHashEmbeddingProvider(
+            LocalEmbeddingConfig(dim=self.config.embedding_dim, seed=self.config.seed)
+        )
+        self.reranker = LocalRerankProvider()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._bucket = (
+            _TokenBucket(self.config.rate_limit_rps, self.config.rate_limit_burst)
+            if self.config.rate_limit_rps > 0.0
+            else None
+        )
+        self._counts: dict[str, int] = {}
+        self._server = _StandInHTTPServer((host, port), _StandInHandler)
+        self._server.stand_in = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _count(self, name: str) -> None:
+        # Caller holds self._lock.
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def _admit(self, endpoint: str) -> str | None:
+        """Return ``"rate_limited"``, ``"error"``, or ``None`` for a normal response."""
+
+        with self._lock:
+            self._count(f"requests.{endpoint}")
+            if self._bucket is not None and not self._bucket.take():
+                self._count(f"rate_limited.{endpoint}")
+                return "rate_limited"
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                self._count(f"errors.{endpoint}")
+                return "error"
+            return None
+
+    def _sample_latency_ms(self, endpoint: str) -> float:
+        with self._lock:
+            return self.config.latency_for(endpoint).sample_ms(self._rng)
+
+    def stats(self) -> dict[str, int]:
+        """Request, injected error, and rate-limited counts per endpoint."""
+
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def env(self, api_key: str = "stand-in") -> dict[str, str]:
+        """Environment overrides pointing SiliconFlow clients at this server."""
+
+        return {"SILICONFLOW_BASE_URL": self.base_url, "SILICONFLOW_API_KEY": api_key}
+
+    def start(self) -> SiliconFlowStandIn:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="siliconflow-stand-in",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> SiliconFlowStandIn:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run a local OpenAI-compatible SiliconFlow stand-in server."
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    for endpoint in STAND_IN_ENDPOINTS:
+        parser.add_argument(
+            f"--{endpoint}-latency",
+            type=parse_latency_profile,
+            default=None,
+            help="distribution:median_ms[:spread_ms], e.g. lognormal:800:300",
+        )
+    parser.add_argument("--stream-chunk-delay-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit-rps", type=float, default=0.0)
+    parser.add_argument("--rate-limit-burst", type=int, default=1)
+    parser.add_argument("--retry-after-seconds", type=float, default=1.0)
+    parser.add_argument("--embedding-dim", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main() -> None:
+    """CLI entrypoint for the SiliconFlow stand-in server."""
+
+    args = _build_parser().parse_args()
+    latency = {
+        endpoint: getattr(args, f"{endpoint}_latency")
+        for endpoint in STAND_IN_ENDPOINTS
+        if getattr(args, f"{endpoint}_latency") is not None
+    }
+    stand_in = SiliconFlowStandIn(
+        StandInConfig(
+            latency=latency,
+            stream_chunk_delay_ms=args.stream_chunk_delay_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            rate_limit_rps=args.rate_limit_rps,
+            rate_limit_burst=args.rate_limit_burst,
+            retry_after_seconds=args.retry_after_seconds,
+            embedding_dim=args.embedding_dim,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"base_url: {stand_in.base_url}")
+    print(f"export SILICONFLOW_BASE_URL={stand_in.base_url}")
+    try:
+        stand_in.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.close()
+        for name, count in stand_in.stats().items():
+            print(f"{name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
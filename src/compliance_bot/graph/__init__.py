@@ -3,6 +3,7 @@
 from compliance_bot.graph.comparison import run_week5_comparison, run_week6_comparison
 from compliance_bot.graph.state import ComplianceAgentState
 from compliance_bot.graph.workflow import (
+    arun_week6_query,
     build_week5_workflow,
     build_week6_workflow,
     run_week5_query,
@@ -11,6 +12,7 @@ from compliance_bot.graph.workflow import (
 
 __all__ = [
     "ComplianceAgentState",
+    "arun_week6_query",
     "build_week5_workflow",
     "build_week6_workflow",
     "run_week5_comparison",
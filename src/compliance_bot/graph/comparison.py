@@ -9,6 +9,10 @@ from pathlib import Path
 from compliance_bot.audit.replay import replay_audit_trace
 from compliance_bot.chains.citation_chain import run_week4_query
 from compliance_bot.graph.workflow import run_week6_query
+from compliance_bot.providers.provider_registry import (
+    EMBEDDING_PROVIDER_MODES,
+    RERANK_PROVIDER_MODES,
+)
 
 
 def comparison_workflow_diagram() -> str:
@@ -44,6 +48,7 @@ def run_week5_comparison(
     embedding_provider_mode: str = "auto",
     rerank_provider_mode: str = "auto",
     llm_provider_mode: str = "auto",
+    embedding_store_path: Path | None = None,
 ) -> dict[str, object]:
     """Run one question through both Week 4 and Week 6 paths and summarize differences."""
 
@@ -58,6 +63,7 @@ def run_week5_comparison(
         embedding_provider_mode=embedding_provider_mode,
         rerank_provider_mode=rerank_provider_mode,
         llm_provider_mode=llm_provider_mode,
+        embedding_store_path=embedding_store_path,
     )
     graph_state = run_week6_query(
         manifest_path=manifest_path,
@@ -70,6 +76,7 @@ def run_week5_comparison(
         embedding_provider_mode=embedding_provider_mode,
         rerank_provider_mode=rerank_provider_mode,
         llm_provider_mode=llm_provider_mode,
+        embedding_store_path=embedding_store_path,
     )
     replay = replay_audit_trace(graph_state.audit_events, trace_id=graph_state.trace_id)
 
@@ -127,7 +134,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "--manifest-path",
         type=Path,
         required=True,
-        help="Path to Week 2 corpus manifest JSON",
+        help="Path to Week 2 corpus manifest (JSON or JSONL)",
     )
     parser.add_argument("--question", type=str, required=True)
     parser.add_argument("--jurisdiction", type=str, default=None)
@@ -143,12 +150,12 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--min-confidence-for-answer", type=float, default=0.55)
     parser.add_argument(
         "--embedding-provider",
-        choices=("auto", "none", "siliconflow"),
+        choices=EMBEDDING_PROVIDER_MODES,
         default="auto",
     )
     parser.add_argument(
         "--rerank-provider",
-        choices=("auto", "none", "siliconflow"),
+        choices=RERANK_PROVIDER_MODES,
         default="auto",
     )
     parser.add_argument(
@@ -161,6 +168,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Output JSON only (disable ASCII workflow diagram header).",
     )
+    parser.add_argument(
+        "--embedding-store-path",
+        type=Path,
+        default=None,
+        help="Optional SQLite embedding store; only chunks missing from it are embedded",
+    )
     return parser
 
 
@@ -179,6 +192,7 @@ def main() -> None:
         embedding_provider_mode=args.embedding_provider,
         rerank_provider_mode=args.rerank_provider,
         llm_provider_mode=args.llm_provider,
+        embedding_store_path=args.embedding_store_path,
     )
     if not args.json_only:
         print(comparison_workflow_diagram())
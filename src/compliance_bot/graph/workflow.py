@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Mapping, TypeVar
+from typing import Any, Callable, Mapping, TypeVar
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
@@ -21,19 +22,26 @@ from compliance_bot.chains.abstention_policy import DEFAULT_ABSTAIN_ANSWER
 from compliance_bot.chains.citation_chain import (
     build_citation_answer_chain,
     run_citation_answer,
-    resolve_answer_llm,
+    shared_answer_llm,
 )
 from compliance_bot.graph.escalation_node import apply_escalation_policy
 from compliance_bot.graph.state import ComplianceAgentState
 from compliance_bot.llms.siliconflow import DEFAULT_SILICONFLOW_MODEL
+from compliance_bot.providers.client_registry import get_client_registry
+from compliance_bot.providers.llm_cache import scope_llm_cache, track_llm_cache
 from compliance_bot.providers.provider_registry import (
-    resolve_embedding_provider,
-    resolve_rerank_provider,
+    EMBEDDING_PROVIDER_MODES,
+    RERANK_PROVIDER_MODES,
 )
-from compliance_bot.retrieval.indexer import RetrievalIndex, build_retrieval_index, load_manifest, tokenize
+from compliance_bot.retrieval.embedding_store import load_cached_retrieval_index
+from compliance_bot.retrieval.indexer import RetrievalIndex, tokenize
+from compliance_bot.retrieval.live_index import LiveRetrievalIndex
+from compliance_bot.retrieval.rerank_payload import RerankPayloadConfig, parse_rerank_budget
 from compliance_bot.retrieval.retriever import (
     QueryEmbeddingProvider,
     RerankProvider,
+    arun_retrieval,
+    resolve_retriever_config,
     run_retrieval,
 )
 from compliance_bot.schemas.answer import GroundedAnswerDraft
@@ -138,6 +146,7 @@ class Week6WorkflowRuntime:
     tavily_search_tool: BaseTool | None
     top_k: int
     min_score_for_answer: float
+    rerank_payload: RerankPayloadConfig
     min_confidence_for_answer: float
     llm_provider: str
     llm_model: str
@@ -215,11 +224,10 @@ def build_tool_router_chain(
 ) -> Runnable[Any, Any]:
     """Create a real tool-calling planner that can emit LangChain tool calls."""
 
-    bind_tools = getattr(llm, "bind_tools", None)
-    if bind_tools is None:
+    if getattr(llm, "bind_tools", None) is None:
         raise TypeError("Configured LLM does not support bind_tools().")
 
-    tool_llm = bind_tools(tools)
+    tool_llm = scope_llm_cache(llm, "tool_router").bind_tools(tools)
     prompt = ChatPromptTemplate.from_messages(
         [
             (
@@ -328,6 +336,7 @@ def _build_tool_plan_node(runtime: Week6WorkflowRuntime):
     def _tool_plan_node(raw_state: dict[str, Any]) -> dict[str, object]:
         state = ComplianceAgentState.from_graph_state(raw_state)
         router_status = "ok"
+        cache_hit = False
         if runtime.tool_router is None:
             plan = _heuristic_tool_plan(
                 question=state.normalized_query or state.question,
@@ -336,13 +345,17 @@ def _build_tool_plan_node(runtime: Week6WorkflowRuntime):
             )
         else:
             try:
-                planner_output = runtime.tool_router.invoke(
-                    {
-                        "question": state.normalized_query or state.question,
-                        "jurisdiction": state.retrieval_filters.jurisdiction or "any",
-                        "policy_scope": ", ".join(state.retrieval_filters.policy_scope) or "none",
-                    }
-                )
+                with track_llm_cache() as cache_tally:
+                    planner_output = runtime.tool_router.invoke(
+                        {
+                            "question": state.normalized_query or state.question,
+                            "jurisdiction": state.retrieval_filters.jurisdiction or "any",
+                            "policy_scope": (
+                                ", ".join(state.retrieval_filters.policy_scope) or "none"
+                            ),
+                        }
+                    )
+                cache_hit = cache_tally.hits > 0
                 plan = _tool_plan_from_tool_calls(
                     question=state.normalized_query or state.question,
                     retrieval_filters=state.retrieval_filters,
@@ -359,6 +372,7 @@ def _build_tool_plan_node(runtime: Week6WorkflowRuntime):
 
         state.tool_plan = plan
         state.decision_path.append("tool_plan")
+        llm_provider = runtime.llm_provider if runtime.tool_router is not None else "heuristic"
         if plan.high_risk:
             _append_policy_flag(state, "high_risk_intent")
 
@@ -380,7 +394,8 @@ def _build_tool_plan_node(runtime: Week6WorkflowRuntime):
                 metadata={
                     "router_mode": plan.router_mode,
                     "router_status": router_status,
-                    "llm_provider": runtime.llm_provider if runtime.tool_router is not None else "heuristic",
+                    "llm_provider": f"{llm_provider}:cache" if cache_hit else llm_provider,
+                    "llm_cache_hit": cache_hit,
                     "llm_model": runtime.llm_model if runtime.tool_router is not None else "heuristic",
                 },
             )
@@ -390,6 +405,52 @@ def _build_tool_plan_node(runtime: Week6WorkflowRuntime):
     return _tool_plan_node
 
 
+def _tool_success(
+    tool: BaseTool,
+    raw_result: Any,
+    output_model: type[TToolResult],
+    *,
+    start: float,
+) -> tuple[TToolResult, ToolExecutionRecord]:
+    elapsed_ms = (perf_counter() - start) * 1000.0
+    result = output_model.model_validate(raw_result)
+    return (
+        result,
+        ToolExecutionRecord(
+            tool_name=tool.name,
+            status="ok",
+            latency_ms=elapsed_ms,
+            resolved=result.resolved,
+            summary=result.summary,
+            requires_human_review=getattr(result, "requires_human_review", not result.resolved),
+        ),
+    )
+
+
+def _tool_timeout_record(tool: BaseTool, *, start: float) -> ToolExecutionRecord:
+    return ToolExecutionRecord(
+        tool_name=tool.name,
+        status="error",
+        latency_ms=(perf_counter() - start) * 1000.0,
+        resolved=False,
+        summary=f"{tool.name} timed out before returning a safe result.",
+        error_code="tool_timeout",
+        requires_human_review=True,
+    )
+
+
+def _tool_failure_record(tool: BaseTool, exc: Exception, *, start: float) -> ToolExecutionRecord:
+    return ToolExecutionRecord(
+        tool_name=tool.name,
+        status="error",
+        latency_ms=(perf_counter() - start) * 1000.0,
+        resolved=False,
+        summary=f"{tool.name} failed: {exc}",
+        error_code="tool_failed",
+        requires_human_review=True,
+    )
+
+
 def _invoke_tool_with_timeout(
     *,
     tool: BaseTool,
@@ -402,47 +463,33 @@ def _invoke_tool_with_timeout(
         with ThreadPoolExecutor(max_workers=1) as executor:
             future = executor.submit(tool.invoke, tool_input.model_dump(mode="python"))
             raw_result = future.result(timeout=timeout_ms / 1000.0)
-        elapsed_ms = (perf_counter() - start) * 1000.0
-        result = output_model.model_validate(raw_result)
-        return (
-            result,
-            ToolExecutionRecord(
-                tool_name=tool.name,
-                status="ok",
-                latency_ms=elapsed_ms,
-                resolved=result.resolved,
-                summary=result.summary,
-                requires_human_review=getattr(result, "requires_human_review", not result.resolved),
-            ),
-        )
+        return _tool_success(tool, raw_result, output_model, start=start)
     except FuturesTimeoutError:
-        elapsed_ms = (perf_counter() - start) * 1000.0
-        return (
-            None,
-            ToolExecutionRecord(
-                tool_name=tool.name,
-                status="error",
-                latency_ms=elapsed_ms,
-                resolved=False,
-                summary=f"{tool.name} timed out before returning a safe result.",
-                error_code="tool_timeout",
-                requires_human_review=True,
-            ),
-        )
+        return None, _tool_timeout_record(tool, start=start)
     except Exception as exc:
-        elapsed_ms = (perf_counter() - start) * 1000.0
-        return (
-            None,
-            ToolExecutionRecord(
-                tool_name=tool.name,
-                status="error",
-                latency_ms=elapsed_ms,
-                resolved=False,
-                summary=f"{tool.name} failed: {exc}",
-                error_code="tool_failed",
-                requires_human_review=True,
-            ),
+        return None, _tool_failure_record(tool, exc, start=start)
+
+
+async def _ainvoke_tool_with_timeout(
+    *,
+    tool: BaseTool,
+    tool_input: PolicyRegistryLookupInput | ExceptionLogLookupInput | TavilySearchInput,
+    output_model: type[TToolResult],
+    timeout_ms: int,
+) -> tuple[TToolResult | None, ToolExecutionRecord]:
+    """Async tool call whose deadline cancels the pending call instead of abandoning a thread."""
+
+    start = perf_counter()
+    try:
+        raw_result = await asyncio.wait_for(
+            tool.ainvoke(tool_input.model_dump(mode="python")),
+            timeout=timeout_ms / 1000.0,
         )
+        return _tool_success(tool, raw_result, output_model, start=start)
+    except (TimeoutError, asyncio.TimeoutError):
+        return None, _tool_timeout_record(tool, start=start)
+    except Exception as exc:
+        return None, _tool_failure_record(tool, exc, start=start)
 
 
 def _build_policy_registry_input(
@@ -502,96 +549,211 @@ def _build_tavily_search_input(
     )
 
 
-def _build_tools_node(runtime: Week6WorkflowRuntime):
-    def _tools_node(raw_state: dict[str, Any]) -> dict[str, object]:
-        state = ComplianceAgentState.from_graph_state(raw_state)
-        state.tool_results = []
-        tool_context_lines: list[str] = []
-        error_codes: list[str] = []
-
-        for tool_name in state.tool_plan.planned_tools:
-            raw_args = state.tool_plan.tool_arguments.get(tool_name, {})
-            if tool_name == "policy_registry_lookup":
-                tool_input = _build_policy_registry_input(state=state, raw_args=raw_args)
-                result, execution = _invoke_tool_with_timeout(
+@dataclass(frozen=True)
+class _PlannedToolCall:
+    tool_name: str
+    tool: BaseTool | None
+    tool_input: PolicyRegistryLookupInput | ExceptionLogLookupInput | TavilySearchInput | None
+    output_model: type[Any] | None
+    render: Callable[[Any], str] | None
+
+
+def _plan_tool_calls(
+    runtime: Week6WorkflowRuntime,
+    state: ComplianceAgentState,
+) -> list[_PlannedToolCall]:
+    calls: list[_PlannedToolCall] = []
+    for tool_name in state.tool_plan.planned_tools:
+        raw_args = state.tool_plan.tool_arguments.get(tool_name, {})
+        if tool_name == "policy_registry_lookup":
+            calls.append(
+                _PlannedToolCall(
+                    tool_name=tool_name,
                     tool=runtime.policy_registry_tool,
-                    tool_input=tool_input,
+                    tool_input=_build_policy_registry_input(state=state, raw_args=raw_args),
                     output_model=PolicyRegistryLookupResult,
-                    timeout_ms=runtime.tool_timeout_ms,
+                    render=render_policy_registry_context,
                 )
-                if result is not None:
-                    tool_context_lines.append(render_policy_registry_context(result))
-            elif tool_name == "exception_log_lookup":
-                tool_input = _build_exception_log_input(state=state, raw_args=raw_args)
-                result, execution = _invoke_tool_with_timeout(
+            )
+        elif tool_name == "exception_log_lookup":
+            calls.append(
+                _PlannedToolCall(
+                    tool_name=tool_name,
                     tool=runtime.exception_log_tool,
-                    tool_input=tool_input,
+                    tool_input=_build_exception_log_input(state=state, raw_args=raw_args),
                     output_model=ExceptionLogLookupResult,
-                    timeout_ms=runtime.tool_timeout_ms,
+                    render=render_exception_log_context,
                 )
-                if result is not None:
-                    tool_context_lines.append(render_exception_log_context(result))
-            elif tool_name == "tavily_search" and runtime.tavily_search_tool is not None:
-                tool_input = _build_tavily_search_input(state=state, raw_args=raw_args)
-                result, execution = _invoke_tool_with_timeout(
+            )
+        elif tool_name == "tavily_search" and runtime.tavily_search_tool is not None:
+            calls.append(
+                _PlannedToolCall(
+                    tool_name=tool_name,
                     tool=runtime.tavily_search_tool,
-                    tool_input=tool_input,
+                    tool_input=_build_tavily_search_input(state=state, raw_args=raw_args),
                     output_model=TavilySearchResult,
-                    timeout_ms=runtime.tool_timeout_ms,
+                    render=render_tavily_context,
                 )
-                if result is not None:
-                    tool_context_lines.append(render_tavily_context(result))
-            else:
-                execution = ToolExecutionRecord(
+            )
+        else:
+            calls.append(
+                _PlannedToolCall(
                     tool_name=tool_name,
-                    status="error",
-                    latency_ms=0.0,
-                    resolved=False,
-                    summary=f"Unsupported tool requested: {tool_name}",
-                    error_code="unsupported_tool",
-                    requires_human_review=True,
+                    tool=None,
+                    tool_input=None,
+                    output_model=None,
+                    render=None,
                 )
+            )
+    return calls
+
+
+def _unsupported_tool_record(tool_name: str) -> ToolExecutionRecord:
+    return ToolExecutionRecord(
+        tool_name=tool_name,
+        status="error",
+        latency_ms=0.0,
+        resolved=False,
+        summary=f"Unsupported tool requested: {tool_name}",
+        error_code="unsupported_tool",
+        requires_human_review=True,
+    )
+
 
-            state.tool_results.append(execution)
-            if execution.error_code:
-                error_codes.append(execution.error_code)
-                _append_policy_flag(state, execution.error_code)
-            if execution.requires_human_review:
-                _append_policy_flag(state, f"{execution.tool_name}_review")
+def _apply_tool_outcomes(
+    runtime: Week6WorkflowRuntime,
+    state: ComplianceAgentState,
+    outcomes: list[tuple[_PlannedToolCall, Any, ToolExecutionRecord]],
+) -> dict[str, object]:
+    state.tool_results = []
+    tool_context_lines: list[str] = []
+    error_codes: list[str] = []
+
+    for call, result, execution in outcomes:
+        if result is not None and call.render is not None:
+            tool_context_lines.append(call.render(result))
+        state.tool_results.append(execution)
+        if execution.error_code:
+            error_codes.append(execution.error_code)
+            _append_policy_flag(state, execution.error_code)
+        if execution.requires_human_review:
+            _append_policy_flag(state, f"{execution.tool_name}_review")
+
+    state.tool_context = "\n\n".join(tool_context_lines).strip()
+    state.decision_path.append("tools")
+
+    status = "ok"
+    if any(result.status != "ok" for result in state.tool_results):
+        status = "degraded"
+    elif any(not result.resolved for result in state.tool_results):
+        status = "review_required"
 
-        state.tool_context = "\n\n".join(tool_context_lines).strip()
-        state.decision_path.append("tools")
+    state.audit_events.append(
+        emit_workflow_audit_event(
+            trace_id=state.trace_id,
+            stage="graph.tools",
+            status=status,
+            input_payload={
+                "planned_tools": state.tool_plan.planned_tools,
+                "timeout_ms": runtime.tool_timeout_ms,
+            },
+            output_payload={
+                "tool_results": [result.model_dump(mode="python") for result in state.tool_results],
+                "tool_context_available": bool(state.tool_context),
+            },
+            metadata={
+                "tool_count": len(state.tool_results),
+                "error_codes": ",".join(error_codes) if error_codes else None,
+            },
+        )
+    )
+    return state.as_graph_state()
 
-        status = "ok"
-        if any(result.status != "ok" for result in state.tool_results):
-            status = "degraded"
-        elif any(not result.resolved for result in state.tool_results):
-            status = "review_required"
 
-        state.audit_events.append(
-            emit_workflow_audit_event(
-                trace_id=state.trace_id,
-                stage="graph.tools",
-                status=status,
-                input_payload={
-                    "planned_tools": state.tool_plan.planned_tools,
-                    "timeout_ms": runtime.tool_timeout_ms,
-                },
-                output_payload={
-                    "tool_results": [result.model_dump(mode="python") for result in state.tool_results],
-                    "tool_context_available": bool(state.tool_context),
-                },
-                metadata={
-                    "tool_count": len(state.tool_results),
-                    "error_codes": ",".join(error_codes) if error_codes else None,
-                },
+def _build_tools_node(runtime: Week6WorkflowRuntime):
+    def _tools_node(raw_state: dict[str, Any]) -> dict[str, object]:
+        state = ComplianceAgentState.from_graph_state(raw_state)
+        outcomes: list[tuple[_PlannedToolCall, Any, ToolExecutionRecord]] = []
+        for call in _plan_tool_calls(runtime, state):
+            if call.tool is None or call.tool_input is None or call.output_model is None:
+                outcomes.append((call, None, _unsupported_tool_record(call.tool_name)))
+                continue
+            result, execution = _invoke_tool_with_timeout(
+                tool=call.tool,
+                tool_input=call.tool_input,
+                output_model=call.output_model,
+                timeout_ms=runtime.tool_timeout_ms,
             )
-        )
-        return state.as_graph_state()
+            outcomes.append((call, result, execution))
+        return _apply_tool_outcomes(runtime, state, outcomes)
 
     return _tools_node
 
 
+def _build_async_tools_node(runtime: Week6WorkflowRuntime):
+    async def _atools_node(raw_state: dict[str, Any]) -> dict[str, object]:
+        state = ComplianceAgentState.from_graph_state(raw_state)
+        calls = _plan_tool_calls(runtime, state)
+
+        async def _run(
+            call: _PlannedToolCall,
+        ) -> tuple[_PlannedToolCall, Any, ToolExecutionRecord]:
+            if call.tool is None or call.tool_input is None or call.output_model is None:
+                return call, None, _unsupported_tool_record(call.tool_name)
+            result, execution = await _ainvoke_tool_with_timeout(
+                tool=call.tool,
+                tool_input=call.tool_input,
+                output_model=call.output_model,
+                timeout_ms=runtime.tool_timeout_ms,
+            )
+            return call, result, execution
+
+        outcomes = list(await asyncio.gather(*(_run(call) for call in calls)))
+        return _apply_tool_outcomes(runtime, state, outcomes)
+
+    return _atools_node
+
+
+def _apply_retrieval_response(
+    runtime: Week6WorkflowRuntime,
+    state: ComplianceAgentState,
+    response: RetrievalResponse,
+) -> dict[str, object]:
+    state.normalized_query = response.normalized_query
+    state.retrieval_decision = response.decision
+    state.retrieved_chunks = response.retrieved_chunks
+    state.citations = response.citations
+    state.provider_metrics = response.provider_metrics
+    state.audit_events.extend(response.audit_events)
+    state.decision_path.append("retrieve")
+    if response.decision != DecisionEnum.ANSWERED:
+        _append_policy_flag(state, "retrieval_requires_review")
+
+    state.audit_events.append(
+        emit_workflow_audit_event(
+            trace_id=state.trace_id,
+            stage="graph.retrieve",
+            status="ok",
+            input_payload={
+                "top_k": runtime.top_k,
+                "min_score_for_answer": runtime.min_score_for_answer,
+                "filters": state.retrieval_filters.model_dump(),
+            },
+            output_payload={
+                "retrieval_decision": response.decision.value,
+                "chunk_count": len(response.retrieved_chunks),
+            },
+            metadata={
+                "provider_call_count": len(response.provider_metrics),
+                "provider_error_count": sum(
+                    1 for metric in response.provider_metrics if metric.status != "ok"
+                ),
+            },
+        )
+    )
+    return state.as_graph_state()
+
+
 def _build_retrieve_node(runtime: Week6WorkflowRuntime):
     def _retrieve_node(raw_state: dict[str, Any]) -> dict[str, object]:
         state = ComplianceAgentState.from_graph_state(raw_state)
@@ -604,43 +766,30 @@ def _build_retrieve_node(runtime: Week6WorkflowRuntime):
             top_k=runtime.top_k,
             min_score_for_answer=runtime.min_score_for_answer,
             trace_id=state.trace_id,
+            rerank_payload=runtime.rerank_payload,
         )
+        return _apply_retrieval_response(runtime, state, response)
 
-        state.normalized_query = response.normalized_query
-        state.retrieval_decision = response.decision
-        state.retrieved_chunks = response.retrieved_chunks
-        state.citations = response.citations
-        state.provider_metrics = response.provider_metrics
-        state.audit_events.extend(response.audit_events)
-        state.decision_path.append("retrieve")
-        if response.decision != DecisionEnum.ANSWERED:
-            _append_policy_flag(state, "retrieval_requires_review")
+    return _retrieve_node
 
-        state.audit_events.append(
-            emit_workflow_audit_event(
-                trace_id=state.trace_id,
-                stage="graph.retrieve",
-                status="ok",
-                input_payload={
-                    "top_k": runtime.top_k,
-                    "min_score_for_answer": runtime.min_score_for_answer,
-                    "filters": state.retrieval_filters.model_dump(),
-                },
-                output_payload={
-                    "retrieval_decision": response.decision.value,
-                    "chunk_count": len(response.retrieved_chunks),
-                },
-                metadata={
-                    "provider_call_count": len(response.provider_metrics),
-                    "provider_error_count": sum(
-                        1 for metric in response.provider_metrics if metric.status != "ok"
-                    ),
-                },
-            )
+
+def _build_async_retrieve_node(runtime: Week6WorkflowRuntime):
+    async def _aretrieve_node(raw_state: dict[str, Any]) -> dict[str, object]:
+        state = ComplianceAgentState.from_graph_state(raw_state)
+        response = await arun_retrieval(
+            runtime.index,
+            question=state.normalized_query or state.question,
+            filters=state.retrieval_filters,
+            embedding_provider=runtime.embedding_provider,
+            rerank_provider=runtime.rerank_provider,
+            top_k=runtime.top_k,
+            min_score_for_answer=runtime.min_score_for_answer,
+            trace_id=state.trace_id,
+            rerank_payload=runtime.rerank_payload,
         )
-        return state.as_graph_state()
+        return _apply_retrieval_response(runtime, state, response)
 
-    return _retrieve_node
+    return _aretrieve_node
 
 
 def _build_answer_node(runtime: Week6WorkflowRuntime):
@@ -692,7 +841,10 @@ def _build_answer_node(runtime: Week6WorkflowRuntime):
                 },
                 metadata={
                     "attempt": attempt,
-                    "llm_provider": runtime.llm_provider,
+                    "llm_provider": answer_response.audit_events[-1].metadata.get(
+                        "llm_provider",
+                        runtime.llm_provider,
+                    ),
                     "llm_model": runtime.llm_model,
                 },
             )
@@ -798,8 +950,13 @@ def _finalize_node(raw_state: dict[str, Any]) -> dict[str, object]:
     return state.as_graph_state()
 
 
-def build_week6_workflow(runtime: Week6WorkflowRuntime):
-    """Compile the Week 6 LangGraph workflow."""
+def build_week6_workflow(runtime: Week6WorkflowRuntime, *, use_async: bool = False):
+    """Compile the Week 6 LangGraph workflow.
+
+    With ``use_async`` the tools and retrieve nodes are coroutines (tool calls run
+    concurrently under per-call deadlines, provider I/O is awaited); the compiled
+    graph must then be driven with ``ainvoke``.
+    """
 
     if StateGraph is None or START is None or END is None:
         raise ModuleNotFoundError(
@@ -809,8 +966,12 @@ def build_week6_workflow(runtime: Week6WorkflowRuntime):
     graph = StateGraph(dict)
     graph.add_node("normalize", _normalize_node)
     graph.add_node("tool_plan", _build_tool_plan_node(runtime))
-    graph.add_node("tools", _build_tools_node(runtime))
-    graph.add_node("retrieve", _build_retrieve_node(runtime))
+    if use_async:
+        graph.add_node("tools", _build_async_tools_node(runtime))
+        graph.add_node("retrieve", _build_async_retrieve_node(runtime))
+    else:
+        graph.add_node("tools", _build_tools_node(runtime))
+        graph.add_node("retrieve", _build_retrieve_node(runtime))
     graph.add_node("answer", _build_answer_node(runtime))
     graph.add_node("retry", _retry_node)
     graph.add_node("policy_check", _policy_check_node)
@@ -836,12 +997,12 @@ def build_week6_workflow(runtime: Week6WorkflowRuntime):
 
 def _resolve_runtime(
     *,
-    manifest_path: Path,
-    top_k: int,
-    min_score_for_answer: float,
+    manifest_path: Path | None,
+    top_k: int | None,
+    min_score_for_answer: float | None,
     min_confidence_for_answer: float,
     embedding_provider_mode: str,
-    rerank_provider_mode: str,
+    rerank_provider_mode: str | None,
     llm_provider_mode: str,
     env: Mapping[str, str] | None,
     answer_chain_override: Runnable[Any, GroundedAnswerDraft] | None,
@@ -851,7 +1012,20 @@ def _resolve_runtime(
     policy_registry_tool_override: BaseTool | None,
     exception_log_tool_override: BaseTool | None,
     tavily_search_tool_override: BaseTool | None,
+    embedding_store_path: Path | None = None,
+    live_index: LiveRetrievalIndex | None = None,
+    retriever_config: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
 ) -> Week6WorkflowRuntime:
+    retriever = resolve_retriever_config(
+        retriever_config,
+        top_k=top_k,
+        min_score_for_answer=min_score_for_answer,
+        rerank_mode=rerank_provider_mode,
+        rerank_payload=rerank_payload,
+    )
+    top_k = retriever.top_k
+    min_score_for_answer = retriever.min_score_for_answer
     if top_k < 1:
         raise ValueError("top_k must be >= 1")
     if not 0.0 <= min_score_for_answer <= 1.0:
@@ -862,14 +1036,10 @@ def _resolve_runtime(
         raise ValueError("tool_timeout_ms must be >= 1")
 
     source = env if env is not None else os.environ
-    embedding_provider = resolve_embedding_provider(embedding_provider_mode, env=source)
-    rerank_provider = resolve_rerank_provider(rerank_provider_mode, env=source)
-    llm = resolve_answer_llm(llm_provider_mode, env=source)
-    answer_chain = (
-        answer_chain_override
-        if answer_chain_override is not None
-        else (build_citation_answer_chain(llm) if llm is not None else None)
-    )
+    clients = get_client_registry()
+    embedding_provider = clients.embedding_provider(embedding_provider_mode, env=source)
+    rerank_provider = clients.rerank_provider(retriever.rerank_mode, env=source)
+    llm = shared_answer_llm(llm_provider_mode, env=source)
     llm_model = source.get("SILICONFLOW_MODEL", DEFAULT_SILICONFLOW_MODEL).strip()
     if answer_chain_override is not None:
         resolved_llm_provider = "custom"
@@ -881,8 +1051,27 @@ def _resolve_runtime(
         resolved_llm_provider = "none"
         resolved_llm_model = "fallback"
 
-    manifest = load_manifest(manifest_path)
-    index = build_retrieval_index(manifest, embedding_provider=embedding_provider)
+    if live_index is not None:
+        if manifest_path is not None:
+            raise ValueError("pass manifest_path or live_index, not both")
+        index = live_index.current()
+    elif manifest_path is not None:
+        index = load_cached_retrieval_index(
+            manifest_path,
+            embedding_provider=embedding_provider,
+            embedding_store_path=embedding_store_path,
+        )
+    else:
+        raise ValueError("manifest_path or live_index is required")
+    answer_chain = (
+        answer_chain_override
+        if answer_chain_override is not None
+        else (
+            build_citation_answer_chain(llm, manifest_hash=index.manifest_hash)
+            if llm is not None
+            else None
+        )
+    )
     policy_registry_tool = policy_registry_tool_override or build_policy_registry_tool(index)
     exception_log_tool = exception_log_tool_override or build_exception_log_tool(
         load_exception_log_records(exception_log_path)
@@ -917,6 +1106,7 @@ def _resolve_runtime(
         tavily_search_tool=tavily_search_tool,
         top_k=top_k,
         min_score_for_answer=min_score_for_answer,
+        rerank_payload=retriever.rerank_payload,
         min_confidence_for_answer=min_confidence_for_answer,
         llm_provider=resolved_llm_provider,
         llm_model=resolved_llm_model,
@@ -926,15 +1116,15 @@ def _resolve_runtime(
 
 def run_week6_query(
     *,
-    manifest_path: Path,
+    manifest_path: Path | None = None,
     question: str,
     jurisdiction: str | None = None,
     policy_scope: list[str] | None = None,
-    top_k: int = 4,
-    min_score_for_answer: float = 0.3,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
     min_confidence_for_answer: float = 0.55,
     embedding_provider_mode: str = "auto",
-    rerank_provider_mode: str = "auto",
+    rerank_provider_mode: str | None = None,
     llm_provider_mode: str = "auto",
     trace_id: str | None = None,
     max_answer_retries: int = 1,
@@ -946,8 +1136,18 @@ def run_week6_query(
     policy_registry_tool_override: BaseTool | None = None,
     exception_log_tool_override: BaseTool | None = None,
     tavily_search_tool_override: BaseTool | None = None,
+    embedding_store_path: Path | None = None,
+    live_index: LiveRetrievalIndex | None = None,
+    retriever_config: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
 ) -> ComplianceAgentState:
-    """Run the Week 6 graph workflow end to end."""
+    """Run the Week 6 graph workflow end to end.
+
+    Pass ``live_index`` instead of ``manifest_path`` to run against the index
+    snapshot a watcher last published. ``retriever_config`` names a retriever
+    profile whose ``top_k``, ``min_score_for_answer``, rerank mode and
+    ``rerank_payload`` budget apply unless given explicitly.
+    """
 
     runtime = _resolve_runtime(
         manifest_path=manifest_path,
@@ -965,6 +1165,10 @@ def run_week6_query(
         policy_registry_tool_override=policy_registry_tool_override,
         exception_log_tool_override=exception_log_tool_override,
         tavily_search_tool_override=tavily_search_tool_override,
+        embedding_store_path=embedding_store_path,
+        live_index=live_index,
+        retriever_config=retriever_config,
+        rerank_payload=rerank_payload,
     )
     workflow = build_week6_workflow(runtime)
     initial_state = ComplianceAgentState.from_input(
@@ -980,6 +1184,75 @@ def run_week6_query(
     return ComplianceAgentState.from_graph_state(result)
 
 
+async def arun_week6_query(
+    *,
+    manifest_path: Path | None = None,
+    question: str,
+    jurisdiction: str | None = None,
+    policy_scope: list[str] | None = None,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
+    min_confidence_for_answer: float = 0.55,
+    embedding_provider_mode: str = "auto",
+    rerank_provider_mode: str | None = None,
+    llm_provider_mode: str = "auto",
+    trace_id: str | None = None,
+    max_answer_retries: int = 1,
+    env: Mapping[str, str] | None = None,
+    answer_chain_override: Runnable[Any, GroundedAnswerDraft] | None = None,
+    tool_planner_override: Runnable[Any, Any] | None = None,
+    tool_timeout_ms: int = 250,
+    exception_log_path: Path | None = None,
+    policy_registry_tool_override: BaseTool | None = None,
+    exception_log_tool_override: BaseTool | None = None,
+    tavily_search_tool_override: BaseTool | None = None,
+    embedding_store_path: Path | None = None,
+    live_index: LiveRetrievalIndex | None = None,
+    retriever_config: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
+) -> ComplianceAgentState:
+    """Async variant of :func:`run_week6_query` for callers already in an event loop.
+
+    Index loading runs in a worker thread; tool calls run concurrently and provider
+    I/O is awaited, so request deadlines cancel work instead of orphaning threads.
+    """
+
+    runtime = await asyncio.to_thread(
+        _resolve_runtime,
+        manifest_path=manifest_path,
+        top_k=top_k,
+        min_score_for_answer=min_score_for_answer,
+        min_confidence_for_answer=min_confidence_for_answer,
+        embedding_provider_mode=embedding_provider_mode,
+        rerank_provider_mode=rerank_provider_mode,
+        llm_provider_mode=llm_provider_mode,
+        env=env,
+        answer_chain_override=answer_chain_override,
+        tool_planner_override=tool_planner_override,
+        tool_timeout_ms=tool_timeout_ms,
+        exception_log_path=exception_log_path,
+        policy_registry_tool_override=policy_registry_tool_override,
+        exception_log_tool_override=exception_log_tool_override,
+        tavily_search_tool_override=tavily_search_tool_override,
+        embedding_store_path=embedding_store_path,
+        live_index=live_index,
+        retriever_config=retriever_config,
+        rerank_payload=rerank_payload,
+    )
+    workflow = build_week6_workflow(runtime, use_async=True)
+    initial_state = ComplianceAgentState.from_input(
+        question=question,
+        trace_id=trace_id,
+        retrieval_filters=RetrievalFilters(
+            jurisdiction=jurisdiction,
+            policy_scope=policy_scope or [],
+        ),
+        max_answer_retries=max_answer_retries,
+    )
+    result = await workflow.ainvoke(initial_state.as_graph_state())
+    return ComplianceAgentState.from_graph_state(result)
+
+
 def run_week5_query(**kwargs: Any) -> ComplianceAgentState:
     """Backward-compatible alias for the Week 6 workflow entrypoint."""
 
@@ -995,7 +1268,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "--manifest-path",
         type=Path,
         required=True,
-        help="Path to Week 2 corpus manifest JSON",
+        help="Path to Week 2 corpus manifest (JSON or JSONL)",
     )
     parser.add_argument("--question", type=str, required=True, help="Compliance question")
     parser.add_argument("--jurisdiction", type=str, default=None)
@@ -1006,18 +1279,36 @@ def _build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Policy scope terms (space-separated)",
     )
-    parser.add_argument("--top-k", type=int, default=4)
-    parser.add_argument("--min-score-for-answer", type=float, default=0.3)
+    parser.add_argument(
+        "--retriever-config",
+        type=str,
+        default=None,
+        help="Named retriever profile for top-k, score floor and rerank mode (default: balanced)",
+    )
+    parser.add_argument("--top-k", type=int, default=None, help="Overrides the profile top-k")
+    parser.add_argument(
+        "--min-score-for-answer",
+        type=float,
+        default=None,
+        help="Overrides the profile score floor",
+    )
     parser.add_argument("--min-confidence-for-answer", type=float, default=0.55)
     parser.add_argument(
         "--embedding-provider",
-        choices=("auto", "none", "siliconflow"),
+        choices=EMBEDDING_PROVIDER_MODES,
         default="auto",
     )
     parser.add_argument(
         "--rerank-provider",
-        choices=("auto", "none", "siliconflow"),
-        default="auto",
+        choices=RERANK_PROVIDER_MODES,
+        default=None,
+        help="Overrides the profile rerank mode",
+    )
+    parser.add_argument(
+        "--rerank-budget",
+        type=parse_rerank_budget,
+        default=None,
+        help="Overrides the profile rerank payload budget: full, chars:N, tokens:N",
     )
     parser.add_argument(
         "--llm-provider",
@@ -1033,6 +1324,12 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional path to sanitized exception log JSON",
     )
+    parser.add_argument(
+        "--embedding-store-path",
+        type=Path,
+        default=None,
+        help="Optional SQLite embedding store; only chunks missing from it are embedded",
+    )
     return parser
 
 
@@ -1055,6 +1352,9 @@ def main() -> None:
         max_answer_retries=args.max_answer_retries,
         tool_timeout_ms=args.tool_timeout_ms,
         exception_log_path=args.exception_log_path,
+        embedding_store_path=args.embedding_store_path,
+        retriever_config=args.retriever_config,
+        rerank_payload=args.rerank_budget,
     )
     replay = replay_audit_trace(state.audit_events, trace_id=state.trace_id)
     payload = {
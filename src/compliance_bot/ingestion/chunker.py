@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import ExitStack
 from hashlib import sha256
 from typing import Sequence
 
@@ -9,6 +11,11 @@ from compliance_bot.schemas.ingestion import ChunkRecord, LoadedDocument
 
 DEFAULT_CHUNK_SIZE = 700
 DEFAULT_CHUNK_OVERLAP = 120
+DEFAULT_LARGE_DOCUMENT_CHARS = 1_000_000
+# Below this many characters a process pool costs more than it saves.
+DEFAULT_PARALLEL_MIN_CHARS = 2_000_000
+# Upper bound on the characters of small documents sent to a worker per task.
+DEFAULT_BATCH_CHARS = 500_000
 
 
 def _normalize_text(text: str) -> str:
@@ -17,29 +24,51 @@ def _normalize_text(text: str) -> str:
     return " ".join(text.split())
 
 
-def _split_text(text: str, *, chunk_size: int, chunk_overlap: int) -> list[str]:
-    """Split text into stable fixed-size chunks with overlap."""
-
+def _validate_chunk_params(*, chunk_size: int, chunk_overlap: int) -> None:
     if chunk_size <= 0:
         raise ValueError("chunk_size must be > 0")
     if chunk_overlap < 0 or chunk_overlap >= chunk_size:
         raise ValueError("chunk_overlap must be >= 0 and < chunk_size")
 
+
+def _chunk_windows(total: int, *, chunk_size: int, chunk_overlap: int) -> list[tuple[int, int]]:
+    """Return the ``(start, end)`` slice of every chunk window over normalized text."""
+
+    windows: list[tuple[int, int]] = []
+    start = 0
+    while start < total:
+        end = min(start + chunk_size, total)
+        windows.append((start, end))
+        if end == total:
+            break
+        start = end - chunk_overlap
+    return windows
+
+
+def _is_blank_window(normalized: str, start: int, end: int) -> bool:
+    # Normalized text never holds two spaces in a row, so only a one-character
+    # window can strip down to nothing.
+    return end - start == 1 and normalized[start] == " "
+
+
+def _split_text(text: str, *, chunk_size: int, chunk_overlap: int) -> list[str]:
+    """Split text into stable fixed-size chunks with overlap."""
+
+    _validate_chunk_params(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
     normalized = _normalize_text(text)
     if not normalized:
         return []
 
     chunks: list[str] = []
-    start = 0
-    total = len(normalized)
-    while start < total:
-        end = min(start + chunk_size, total)
+    for start, end in _chunk_windows(
+        len(normalized),
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    ):
         candidate = normalized[start:end].strip()
         if candidate:
             chunks.append(candidate)
-        if end == total:
-            break
-        start = end - chunk_overlap
 
     return chunks
 
@@ -55,24 +84,17 @@ def _build_chunk_id(
     return sha256(raw.encode("utf-8")).hexdigest()[:16]
 
 
-def chunk_document(
-    document: LoadedDocument,
+def _build_chunk_records(
+    text_chunks: Sequence[str],
     *,
+    doc_id: str,
     version_tag: str,
-    chunk_size: int = DEFAULT_CHUNK_SIZE,
-    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    metadata: dict[str, str],
+    first_index: int = 0,
 ) -> list[ChunkRecord]:
-    """Chunk one document into deterministic chunk records."""
-
-    doc_id = document.metadata.get("doc_id", "unknown-doc")
-    text_chunks = _split_text(
-        document.content,
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-    )
-
     records: list[ChunkRecord] = []
-    for index, text_chunk in enumerate(text_chunks):
+    for offset, text_chunk in enumerate(text_chunks):
+        index = first_index + offset
         records.append(
             ChunkRecord(
                 chunk_id=_build_chunk_id(
@@ -85,28 +107,71 @@ def chunk_document(
                 version_tag=version_tag,
                 chunk_index=index,
                 content=text_chunk,
-                metadata={**document.metadata, "source_path": document.source_path},
+                metadata=metadata,
             )
         )
     return records
 
 
-def chunk_corpus(
-    documents: Sequence[LoadedDocument],
+def chunk_document(
+    document: LoadedDocument,
     *,
     version_tag: str,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
 ) -> list[ChunkRecord]:
-    """Chunk a corpus with deterministic document ordering."""
+    """Chunk one document into deterministic chunk records."""
 
-    ordered_documents = sorted(
-        documents,
-        key=lambda item: (item.metadata.get("doc_id", ""), item.source_path),
+    doc_id = document.metadata.get("doc_id", "unknown-doc")
+    text_chunks = _split_text(
+        document.content,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    )
+    return _build_chunk_records(
+        text_chunks,
+        doc_id=doc_id,
+        version_tag=version_tag,
+        metadata={**document.metadata, "source_path": document.source_path},
     )
 
+
+def _chunk_document_segment(
+    segment: str,
+    windows: Sequence[tuple[int, int]],
+    *,
+    doc_id: str,
+    version_tag: str,
+    metadata: dict[str, str],
+    first_index: int,
+) -> list[ChunkRecord]:
+    """Worker: build records for a contiguous run of windows of one large document."""
+
+    text_chunks = [
+        candidate
+        for candidate in (segment[start:end].strip() for start, end in windows)
+        if candidate
+    ]
+    return _build_chunk_records(
+        text_chunks,
+        doc_id=doc_id,
+        version_tag=version_tag,
+        metadata=metadata,
+        first_index=first_index,
+    )
+
+
+def _chunk_document_batch(
+    documents: Sequence[LoadedDocument],
+    *,
+    version_tag: str,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> list[ChunkRecord]:
+    """Worker: chunk a run of small documents in one task."""
+
     records: list[ChunkRecord] = []
-    for document in ordered_documents:
+    for document in documents:
         records.extend(
             chunk_document(
                 document,
@@ -116,3 +181,146 @@ def chunk_corpus(
             )
         )
     return records
+
+
+def _submit_large_document(
+    executor: Executor,
+    document: LoadedDocument,
+    *,
+    version_tag: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    segment_count: int,
+) -> list[Future[list[ChunkRecord]]]:
+    """Split one document on chunk-window boundaries and fan the segments out."""
+
+    normalized = _normalize_text(document.content)
+    windows = _chunk_windows(len(normalized), chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    if not windows:
+        return []
+
+    doc_id = document.metadata.get("doc_id", "unknown-doc")
+    metadata = {**document.metadata, "source_path": document.source_path}
+    per_segment = max(1, -(-len(windows) // segment_count))
+
+    futures: list[Future[list[ChunkRecord]]] = []
+    first_index = 0
+    for offset in range(0, len(windows), per_segment):
+        segment_windows = windows[offset : offset + per_segment]
+        base = segment_windows[0][0]
+        segment = normalized[base : segment_windows[-1][1]]
+        futures.append(
+            executor.submit(
+                _chunk_document_segment,
+                segment,
+                [(start - base, end - base) for start, end in segment_windows],
+                doc_id=doc_id,
+                version_tag=version_tag,
+                metadata=metadata,
+                first_index=first_index,
+            )
+        )
+        first_index += sum(
+            1
+            for start, end in segment_windows
+            if not _is_blank_window(normalized, start, end)
+        )
+    return futures
+
+
+def chunk_corpus(
+    documents: Sequence[LoadedDocument],
+    *,
+    version_tag: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    max_workers: int = 1,
+    large_document_chars: int = DEFAULT_LARGE_DOCUMENT_CHARS,
+    parallel_min_chars: int = DEFAULT_PARALLEL_MIN_CHARS,
+    batch_chars: int = DEFAULT_BATCH_CHARS,
+    executor: Executor | None = None,
+) -> list[ChunkRecord]:
+    """Chunk a corpus with deterministic document ordering.
+
+    With ``max_workers > 1`` and at least ``parallel_min_chars`` characters in
+    total, documents are chunked in a process pool; smaller corpora are chunked
+    serially because pickling and IPC would cost more than the chunking. Small
+    documents are sent to workers in consecutive batches of at most
+    ``batch_chars`` characters (less when needed to give every worker a share),
+    and any document of at least ``large_document_chars`` characters is itself
+    split on chunk-window boundaries across workers. Results are reassembled in
+    ``(doc_id, source_path)`` order and are identical to the serial path.
+    Pass ``executor`` to reuse one pool across calls (e.g. per streamed batch).
+    """
+
+    _validate_chunk_params(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    if batch_chars <= 0:
+        raise ValueError("batch_chars must be > 0")
+
+    ordered_documents = sorted(
+        documents,
+        key=lambda item: (item.metadata.get("doc_id", ""), item.source_path),
+    )
+
+    total_chars = sum(len(document.content) for document in ordered_documents)
+    if max_workers == 1 or total_chars < parallel_min_chars:
+        return _chunk_document_batch(
+            ordered_documents,
+            version_tag=version_tag,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+        )
+
+    small_chars = sum(
+        len(document.content)
+        for document in ordered_documents
+        if len(document.content) < large_document_chars
+    )
+    batch_budget = max(1, min(batch_chars, -(-small_chars // max_workers)))
+    records: list[ChunkRecord] = []
+
+    with ExitStack() as stack:
+        pool = executor or stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+        futures: list[Future[list[ChunkRecord]]] = []
+        batch: list[LoadedDocument] = []
+        pending_chars = 0
+
+        def _flush() -> None:
+            nonlocal pending_chars
+            if batch:
+                futures.append(
+                    pool.submit(
+                        _chunk_document_batch,
+                        list(batch),
+                        version_tag=version_tag,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                    )
+                )
+                batch.clear()
+                pending_chars = 0
+
+        for document in ordered_documents:
+            if len(document.content) >= large_document_chars:
+                _flush()
+                futures.extend(
+                    _submit_large_document(
+                        pool,
+                        document,
+                        version_tag=version_tag,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                        segment_count=max_workers,
+                    )
+                )
+            else:
+                if batch and pending_chars + len(document.content) > batch_budget:
+                    _flush()
+                batch.append(document)
+                pending_chars += len(document.content)
+        _flush()
+        for future in futures:
+            records.extend(future.result())
+    return records
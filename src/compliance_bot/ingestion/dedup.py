@@ -0,0 +1,225 @@
+"""MinHash/LSH near-duplicate chunk detection for ingestion snapshots."""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+from dataclasses import dataclass
+from hashlib import blake2b
+from pathlib import Path
+from typing import Sequence
+
+from compliance_bot.schemas.ingestion import ChunkRecord, DedupReport
+
+DEDUP_MODES = ("flag", "collapse")
+DUPLICATE_OF_KEY = "duplicate_of"
+DUPLICATE_CHUNK_IDS_KEY = "duplicate_chunk_ids"
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 61) - 1
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class DedupConfig:
+    """MinHash/LSH parameters for near-duplicate chunk grouping.
+
+    ``num_perm`` must equal ``bands * rows``; the defaults (16 bands of 8 rows)
+    catch pairs at Jaccard 0.85 with ~99% probability. Candidates are confirmed
+    against exact shingle Jaccard, so LSH only controls recall, never precision.
+    Chunks are only compared within the same ``partition_keys`` metadata values
+    so collapsing never hides a chunk from a metadata-filtered query.
+    """
+
+    mode: str = "flag"
+    threshold: float = 0.85
+    shingle_size: int = 3
+    bands: int = 16
+    rows: int = 8
+    seed: int = 1
+    partition_keys: tuple[str, ...] = ("jurisdiction", "policy_scope")
+
+    def __post_init__(self) -> None:
+        if self.mode not in DEDUP_MODES:
+            raise ValueError(f"mode must be one of {DEDUP_MODES}")
+        if not 0.0 < self.threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if self.shingle_size <= 0 or self.bands <= 0 or self.rows <= 0:
+            raise ValueError("shingle_size, bands and rows must be positive")
+
+    @property
+    def num_perm(self) -> int:
+        return self.bands * self.rows
+
+
+def shingle_set(text: str, *, shingle_size: int) -> frozenset[str]:
+    """Return lowercase word n-gram shingles; short texts become one shingle."""
+
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) <= shingle_size:
+        return frozenset({" ".join(words)})
+    return frozenset(
+        " ".join(words[start : start + shingle_size])
+        for start in range(len(words) - shingle_size + 1)
+    )
+
+
+def _permutations(num_perm: int, seed: int) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    return [
+        (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+        for _ in range(num_perm)
+    ]
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash_signature(
+    shingles: frozenset[str],
+    permutations: Sequence[tuple[int, int]],
+) -> tuple[int, ...]:
+    """Return the MinHash signature of a shingle set under the given permutations."""
+
+    hashed = [_shingle_hash(shingle) & _MAX_HASH for shingle in shingles]
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashed) for a, b in permutations
+    )
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    """Return exact Jaccard similarity of two shingle sets."""
+
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def find_near_duplicates(
+    chunks: Sequence[ChunkRecord],
+    *,
+    config: DedupConfig,
+) -> dict[str, str]:
+    """Map each near-duplicate chunk ID to its canonical chunk ID.
+
+    Chunks are visited in ``(doc_id, chunk_index)`` order and the first member of a
+    group becomes canonical. Only canonical chunks are banded into the LSH table,
+    so groups never chain through intermediate near-matches.
+    """
+
+    permutations = _permutations(config.num_perm, config.seed)
+    buckets: dict[tuple[object, ...], list[int]] = {}
+    canonical_shingles: dict[int, frozenset[str]] = {}
+    duplicate_of: dict[str, str] = {}
+
+    ordered = sorted(chunks, key=lambda item: (item.doc_id, item.chunk_index, item.chunk_id))
+    for position, chunk in enumerate(ordered):
+        shingles = shingle_set(chunk.content, shingle_size=config.shingle_size)
+        signature = minhash_signature(shingles, permutations)
+        partition = tuple(chunk.metadata.get(key, "") for key in config.partition_keys)
+        band_keys = [
+            (partition, band, signature[band * config.rows : (band + 1) * config.rows])
+            for band in range(config.bands)
+        ]
+
+        match: int | None = None
+        seen: set[int] = set()
+        for key in band_keys:
+            for candidate in buckets.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if jaccard(shingles, canonical_shingles[candidate]) >= config.threshold:
+                    match = candidate if match is None else min(match, candidate)
+        if match is not None:
+            duplicate_of[chunk.chunk_id] = ordered[match].chunk_id
+            continue
+
+        canonical_shingles[position] = shingles
+        for key in band_keys:
+            buckets.setdefault(key, []).append(position)
+    return duplicate_of
+
+
+def deduplicate_chunks(
+    chunks: Sequence[ChunkRecord],
+    *,
+    config: DedupConfig | None = None,
+) -> tuple[list[ChunkRecord], DedupReport]:
+    """Flag or collapse near-duplicate chunks and report the savings.
+
+    ``flag`` keeps every chunk and marks duplicates with ``duplicate_of``; they
+    are still indexed and embedded, so the report's savings fields stay 0 and
+    only ``duplicate_chunk_count``/``duplicate_chars`` show what collapsing would
+    save. ``collapse`` drops duplicates and lists their IDs on the canonical
+    chunk under ``duplicate_chunk_ids``.
+    """
+
+    resolved = config or DedupConfig()
+    duplicate_of = find_near_duplicates(chunks, config=resolved)
+
+    members: dict[str, list[str]] = {}
+    for duplicate_id, canonical_id in duplicate_of.items():
+        members.setdefault(canonical_id, []).append(duplicate_id)
+
+    output: list[ChunkRecord] = []
+    for chunk in chunks:
+        if chunk.chunk_id in duplicate_of:
+            if resolved.mode == "flag":
+                output.append(
+                    chunk.model_copy(
+                        update={
+                            "metadata": {
+                                **chunk.metadata,
+                                DUPLICATE_OF_KEY: duplicate_of[chunk.chunk_id],
+                            }
+                        }
+                    )
+                )
+            continue
+        if resolved.mode == "collapse" and chunk.chunk_id in members:
+            chunk = chunk.model_copy(
+                update={
+                    "metadata": {
+                        **chunk.metadata,
+                        DUPLICATE_CHUNK_IDS_KEY: ",".join(sorted(members[chunk.chunk_id])),
+                    }
+                }
+            )
+        output.append(chunk)
+
+    input_chars = sum(len(chunk.content) for chunk in chunks)
+    duplicate_chars = sum(len(chunk.content) for chunk in chunks if chunk.chunk_id in duplicate_of)
+    collapsed = resolved.mode == "collapse"
+    report = DedupReport(
+        mode=resolved.mode,
+        threshold=resolved.threshold,
+        input_chunk_count=len(chunks),
+        output_chunk_count=len(output),
+        duplicate_chunk_count=len(duplicate_of),
+        duplicate_group_count=len(members),
+        input_chars=input_chars,
+        duplicate_chars=duplicate_chars,
+        index_chars_saved_ratio=(
+            round(duplicate_chars / input_chars, 6) if collapsed and input_chars else 0.0
+        ),
+        embedding_inputs_saved=len(duplicate_of) if collapsed else 0,
+    )
+    return output, report
+
+
+def dedup_report_path(output_dir: Path, *, version_tag: str) -> Path:
+    """Return where the dedup report for a snapshot is written."""
+
+    return output_dir / f"dedup-report-{version_tag}.json"
+
+
+def write_dedup_report(report: DedupReport, output_dir: Path, *, version_tag: str) -> Path:
+    """Write the dedup report next to the manifest artifact."""
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = dedup_report_path(output_dir, version_tag=version_tag)
+    path.write_text(json.dumps(report.model_dump(), indent=2, sort_keys=True), encoding="utf-8")
+    return path
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from queue import Empty, Full
+from typing import IO, Any, Callable, Iterator, Sequence
 
 from compliance_bot.schemas.ingestion import LoadedDocument
 
+DEFAULT_LOAD_BATCH_SIZE = 256
+
 
 def _normalize_metadata(raw_metadata: dict[str, Any]) -> dict[str, str]:
     """Normalize metadata values into trimmed strings."""
@@ -15,37 +24,279 @@ def _normalize_metadata(raw_metadata: dict[str, Any]) -> dict[str, str]:
     return {str(key): str(value).strip() for key, value in raw_metadata.items()}
 
 
-def load_policy_documents(source_dir: Path) -> list[LoadedDocument]:
-    """Load all approved policy JSON files from a source directory."""
+def list_policy_files(source_dir: Path) -> list[Path]:
+    """Return policy JSON files in a source directory, skipping manifest artifacts."""
 
     if not source_dir.exists():
         raise FileNotFoundError(f"source directory does not exist: {source_dir}")
 
-    policy_files = sorted(
+    return sorted(
         path
         for path in source_dir.glob("*.json")
         if path.is_file() and not path.name.startswith("manifest-")
     )
+
+
+def _document_from_payload(payload: Any, *, source: str) -> LoadedDocument:
+    if not isinstance(payload, dict):
+        raise ValueError(f"policy file must contain a JSON object: {source}")
+
+    raw_metadata = payload.get("metadata", {})
+    if not isinstance(raw_metadata, dict):
+        raise ValueError(f"metadata must be a JSON object: {source}")
+
+    content = payload.get("content", "")
+    return LoadedDocument(
+        content=str(content),
+        metadata=_normalize_metadata(raw_metadata),
+        source_path=source,
+    )
+
+
+def load_policy_document(path: Path) -> LoadedDocument:
+    """Load one sanitized policy JSON file."""
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return _document_from_payload(payload, source=str(path))
+
+
+def load_policy_documents(source_dir: Path) -> list[LoadedDocument]:
+    """Load all approved policy JSON files from a source directory."""
+
+    policy_files = list_policy_files(source_dir)
     if not policy_files:
         raise ValueError(f"no policy JSON files found in {source_dir}")
 
+    return [load_policy_document(path) for path in policy_files]
+
+
+@dataclass(frozen=True)
+class LoadThroughput:
+    """Document and byte throughput of a bulk load."""
+
+    file_count: int
+    document_count: int
+    bytes_read: int
+    elapsed_seconds: float
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.document_count / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_read / (1024 * 1024) / self.elapsed_seconds
+
+
+def _open_export(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _parse_export_lines(lines: list[tuple[str, str]]) -> list[LoadedDocument]:
+    """Worker: turn ``(source, line)`` pairs into documents."""
+
     documents: list[LoadedDocument] = []
-    for path in policy_files:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if not isinstance(payload, dict):
-            raise ValueError(f"policy file must contain a JSON object: {path}")
-
-        raw_metadata = payload.get("metadata", {})
-        if not isinstance(raw_metadata, dict):
-            raise ValueError(f"metadata must be a JSON object: {path}")
-
-        content = payload.get("content", "")
-        documents.append(
-            LoadedDocument(
-                content=str(content),
-                metadata=_normalize_metadata(raw_metadata),
-                source_path=str(path),
+    for source, line in lines:
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON in policy export: {source}") from exc
+        documents.append(_document_from_payload(payload, source=source))
+    return documents
+
+
+def _iter_export_lines(paths: Sequence[Path]) -> Iterator[tuple[str, str]]:
+    for path in paths:
+        with _open_export(path) as handle:
+            for line_number, line in enumerate(handle, start=1):
+                stripped = line.strip()
+                if stripped:
+                    yield f"{path}#L{line_number}", stripped
+
+
+def iter_jsonl_policy_documents(path: Path) -> Iterator[LoadedDocument]:
+    """Stream documents from a JSONL (or ``.jsonl.gz``) export one line at a time.
+
+    Each line holds the same ``{"content", "metadata"}`` object as a per-file
+    policy; ``source_path`` records the export file and line number.
+    """
+
+    for item in _iter_export_lines([path]):
+        yield from _parse_export_lines([item])
+
+
+def load_jsonl_policy_documents(
+    paths: Sequence[Path],
+    *,
+    max_workers: int = 1,
+    batch_size: int = DEFAULT_LOAD_BATCH_SIZE,
+    on_complete: Callable[[LoadThroughput], None] | None = None,
+) -> Iterator[LoadedDocument]:
+    """Lazily stream documents from JSONL/gzip exports.
+
+    Lines are read and parsed as the iterator is consumed. With
+    ``max_workers > 1`` up to ``max_workers`` export files are read at once,
+    each by one worker process that opens, decompresses, and parses its own
+    file and sends documents back ``batch_size`` at a time, at most two
+    batches ahead of the consumer, so memory stays bounded by the batch size
+    rather than the corpus. Documents come in file order, then line order,
+    whatever ``max_workers`` is. ``on_complete`` receives the load throughput
+    once the last document has been yielded; ``bytes_read`` counts on-disk
+    (compressed) bytes.
+    """
+
+    if max_workers <= 0:
+        raise ValueError("max_workers must be > 0")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+    missing = [path for path in paths if not path.is_file()]
+    if missing:
+        raise FileNotFoundError(f"policy export does not exist: {missing[0]}")
+    if not paths:
+        raise ValueError("no policy export files given")
+    return _stream_exports(
+        list(paths),
+        max_workers=max_workers,
+        batch_size=batch_size,
+        on_complete=on_complete,
+    )
+
+
+# Per-process state of export reader workers, set by ``_init_export_worker``.
+_worker_queues: list[Any] = []
+_worker_stop: Any = None
+_QUEUE_POLL_SECONDS = 0.1
+
+
+def _init_export_worker(queues: list[Any], stop: Any) -> None:
+    global _worker_queues, _worker_stop
+    _worker_queues, _worker_stop = queues, stop
+
+
+def _put(queue: Any, item: Any) -> bool:
+    """Put ``item`` unless the consumer has stopped; returns False once stopped."""
+
+    while not _worker_stop.is_set():
+        try:
+            queue.put(item, timeout=_QUEUE_POLL_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _read_export(slot: int, path: Path, batch_size: int) -> None:
+    """Worker: read, decompress, and parse one export into its slot's queue.
+
+    Sends document batches, then ``None``; a parse error is sent in place of
+    the rest of the file.
+    """
+
+    queue = _worker_queues[slot]
+    batch: list[LoadedDocument] = []
+    try:
+        for item in _iter_export_lines([path]):
+            batch.extend(_parse_export_lines([item]))
+            if len(batch) >= batch_size:
+                if not _put(queue, batch):
+                    return
+                batch = []
+    except (OSError, ValueError) as exc:
+        _put(queue, exc)
+        return
+    if batch and not _put(queue, batch):
+        return
+    _put(queue, None)
+
+
+def _stream_parallel(
+    paths: list[Path],
+    *,
+    max_workers: int,
+    batch_size: int,
+) -> Iterator[list[LoadedDocument]]:
+    context = multiprocessing.get_context()
+    slot_count = min(max_workers, len(paths))
+    queues = [context.Queue(maxsize=2) for _ in range(slot_count)]
+    stop = context.Event()
+    executor = ProcessPoolExecutor(
+        max_workers=slot_count,
+        mp_context=context,
+        initializer=_init_export_worker,
+        initargs=(queues, stop),
+    )
+    in_flight: deque[tuple[int, Future[None]]] = deque()
+    try:
+        for file_index, path in enumerate(paths):
+            # Files are drained in order, so slot ``i % slot_count`` is free again
+            # by the time file ``i`` is submitted.
+            slot = file_index % slot_count
+            in_flight.append((slot, executor.submit(_read_export, slot, path, batch_size)))
+            if len(in_flight) == slot_count:
+                yield from _drain_export(*in_flight.popleft(), queues)
+        while in_flight:
+            yield from _drain_export(*in_flight.popleft(), queues)
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        for queue in queues:
+            queue.close()
+            queue.join_thread()
+
+
+def _drain_export(
+    slot: int,
+    future: Future[None],
+    queues: list[Any],
+) -> Iterator[list[LoadedDocument]]:
+    queue = queues[slot]
+    while True:
+        try:
+            item = queue.get(timeout=_QUEUE_POLL_SECONDS)
+        except Empty:
+            if future.done():
+                future.result()  # Re-raise a crashed worker's error.
+                raise RuntimeError("policy export worker exited without finishing")
+            continue
+        if item is None:
+            future.result()
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def _stream_exports(
+    paths: list[Path],
+    *,
+    max_workers: int,
+    batch_size: int,
+    on_complete: Callable[[LoadThroughput], None] | None,
+) -> Iterator[LoadedDocument]:
+    started = time.perf_counter()
+    document_count = 0
+    if max_workers == 1:
+        for item in _iter_export_lines(paths):
+            document_count += 1
+            yield from _parse_export_lines([item])
+    else:
+        for documents in _stream_parallel(
+            paths,
+            max_workers=max_workers,
+            batch_size=batch_size,
+        ):
+            document_count += len(documents)
+            yield from documents
+    if on_complete is not None:
+        on_complete(
+            LoadThroughput(
+                file_count=len(paths),
+                document_count=document_count,
+                bytes_read=sum(path.stat().st_size for path in paths),
+                elapsed_seconds=time.perf_counter() - started,
             )
         )
-
-    return documents
@@ -5,46 +5,124 @@ from __future__ import annotations
 import json
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Iterable, Mapping, Sequence
 
 from compliance_bot.schemas.ingestion import (
     ChunkRecord,
     CorpusManifest,
+    ManifestDiff,
+    ManifestHeader,
     MetadataCoverageReport,
 )
 
+MANIFEST_FORMATS: tuple[str, ...] = ("json", "jsonl")
+
 
 def _canonical_chunk_payload(chunk: ChunkRecord) -> dict[str, Any]:
-    """Return a stable chunk payload used for manifest hashing."""
+    """Return a stable, version-independent chunk payload used as a Merkle leaf.
+
+    ``chunk_id`` and ``version_tag`` are left out on purpose: the chunk ID is
+    derived from the version tag plus the fields below, and the version tag is
+    folded into the root hash instead. This keeps doc hashes comparable across
+    snapshots that were built under different version tags.
+    """
 
     return {
-        "chunk_id": chunk.chunk_id,
         "doc_id": chunk.doc_id,
-        "version_tag": chunk.version_tag,
         "chunk_index": chunk.chunk_index,
         "content_sha256": sha256(chunk.content.encode("utf-8")).hexdigest(),
         "metadata": chunk.metadata,
     }
 
 
-def _build_manifest_hash(chunks: Sequence[ChunkRecord], *, version_tag: str) -> str:
-    """Compute deterministic manifest hash from canonical chunk payloads."""
+def build_chunk_hash(chunk: ChunkRecord) -> str:
+    """Hash one chunk's canonical payload (Merkle leaf)."""
 
-    canonical_chunks = [
-        _canonical_chunk_payload(chunk)
-        for chunk in sorted(
-            chunks,
-            key=lambda item: (item.doc_id, item.chunk_index, item.chunk_id),
-        )
-    ]
-    payload = {
-        "version_tag": version_tag,
-        "chunks": canonical_chunks,
-    }
-    digest_input = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    digest_input = json.dumps(
+        _canonical_chunk_payload(chunk),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
     return sha256(digest_input.encode("utf-8")).hexdigest()
 
 
+def build_doc_hash(chunks: Sequence[ChunkRecord]) -> str:
+    """Roll the chunk hashes of one document up into a doc hash."""
+
+    digest = sha256()
+    for chunk in sorted(chunks, key=lambda item: (item.chunk_index, item.chunk_id)):
+        digest.update(build_chunk_hash(chunk).encode("ascii"))
+    return digest.hexdigest()
+
+
+def build_doc_hashes(chunks: Iterable[ChunkRecord]) -> dict[str, str]:
+    """Compute one doc hash per document in a chunk collection."""
+
+    grouped: dict[str, list[ChunkRecord]] = {}
+    for chunk in chunks:
+        grouped.setdefault(chunk.doc_id, []).append(chunk)
+    return {doc_id: build_doc_hash(grouped[doc_id]) for doc_id in sorted(grouped)}
+
+
+def build_root_hash(doc_hashes: Mapping[str, str], *, version_tag: str) -> str:
+    """Roll doc hashes up into the manifest root hash."""
+
+    digest = sha256(f"{version_tag}\n".encode("utf-8"))
+    for doc_id in sorted(doc_hashes):
+        digest.update(f"{doc_id}:{doc_hashes[doc_id]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def rehash_documents(
+    doc_hashes: Mapping[str, str],
+    *,
+    changed_chunks: Iterable[ChunkRecord] = (),
+    removed_doc_ids: Iterable[str] = (),
+) -> dict[str, str]:
+    """Return updated doc hashes, rehashing only documents that changed.
+
+    ``changed_chunks`` must contain every chunk of each changed document.
+    """
+
+    updated = dict(doc_hashes)
+    for doc_id in removed_doc_ids:
+        updated.pop(doc_id, None)
+    updated.update(build_doc_hashes(changed_chunks))
+    return {doc_id: updated[doc_id] for doc_id in sorted(updated)}
+
+
+def diff_doc_hashes(
+    old_doc_hashes: Mapping[str, str],
+    new_doc_hashes: Mapping[str, str],
+    *,
+    old_manifest_hash: str,
+    new_manifest_hash: str,
+) -> ManifestDiff:
+    """Compare two snapshots at document granularity using their doc hashes."""
+
+    removed = sorted(doc_id for doc_id in old_doc_hashes if doc_id not in new_doc_hashes)
+    added: list[str] = []
+    changed: list[str] = []
+    unchanged = 0
+    for doc_id, doc_hash in new_doc_hashes.items():
+        previous = old_doc_hashes.get(doc_id)
+        if previous is None:
+            added.append(doc_id)
+        elif previous != doc_hash:
+            changed.append(doc_id)
+        else:
+            unchanged += 1
+
+    return ManifestDiff(
+        old_manifest_hash=old_manifest_hash,
+        new_manifest_hash=new_manifest_hash,
+        added_doc_ids=sorted(added),
+        removed_doc_ids=removed,
+        changed_doc_ids=sorted(changed),
+        unchanged_doc_count=unchanged,
+    )
+
+
 def build_manifest(
     chunks: Sequence[ChunkRecord],
     *,
@@ -58,18 +136,62 @@ def build_manifest(
         key=lambda item: (item.doc_id, item.chunk_index, item.chunk_id),
     )
 
+    doc_hashes = build_doc_hashes(ordered_chunks)
     return CorpusManifest(
         version_tag=version_tag,
-        manifest_hash=_build_manifest_hash(ordered_chunks, version_tag=version_tag),
-        doc_count=len({chunk.doc_id for chunk in ordered_chunks}),
+        manifest_hash=build_root_hash(doc_hashes, version_tag=version_tag),
+        doc_count=len(doc_hashes),
         chunk_count=len(ordered_chunks),
         metadata_coverage=metadata_report.coverage_by_key,
+        doc_hashes=doc_hashes,
         chunks=ordered_chunks,
     )
 
 
-def write_manifest(manifest: CorpusManifest, output_dir: Path) -> Path:
-    """Persist manifest JSON under a deterministic filename."""
+def manifest_header(manifest: CorpusManifest) -> ManifestHeader:
+    """Return the manifest summary fields without chunk payloads."""
+
+    return ManifestHeader.model_validate(manifest.model_dump(exclude={"chunks"}))
+
+
+def write_manifest_jsonl(
+    header: ManifestHeader,
+    chunks: Iterable[ChunkRecord],
+    output_dir: Path,
+) -> Path:
+    """Stream a newline-delimited manifest: one header line, then one chunk per line."""
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"manifest-{header.version_tag}.jsonl"
+
+    written = 0
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps(header.model_dump(), sort_keys=True, separators=(",", ":")))
+        handle.write("\n")
+        for chunk in chunks:
+            handle.write(json.dumps(chunk.model_dump(), sort_keys=True, separators=(",", ":")))
+            handle.write("\n")
+            written += 1
+
+    if written != header.chunk_count:
+        raise ValueError(
+            f"manifest header declares {header.chunk_count} chunks but {written} were written"
+        )
+    return path
+
+
+def write_manifest(
+    manifest: CorpusManifest,
+    output_dir: Path,
+    *,
+    manifest_format: str = "json",
+) -> Path:
+    """Persist manifest JSON or JSONL under a deterministic filename."""
+
+    if manifest_format not in MANIFEST_FORMATS:
+        raise ValueError(f"manifest_format must be one of: {', '.join(MANIFEST_FORMATS)}")
+    if manifest_format == "jsonl":
+        return write_manifest_jsonl(manifest_header(manifest), manifest.chunks, output_dir)
 
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"manifest-{manifest.version_tag}.json"
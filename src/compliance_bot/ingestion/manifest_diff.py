@@ -0,0 +1,65 @@
+"""Document-level diff between two corpus manifest snapshots."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from compliance_bot.ingestion.manifest_builder import build_doc_hashes, diff_doc_hashes
+from compliance_bot.retrieval.indexer import stream_manifest
+from compliance_bot.schemas.ingestion import ManifestDiff
+
+
+def _load_doc_hashes(path: Path) -> tuple[str, dict[str, str]]:
+    """Return manifest hash and doc hashes, reading chunks only for legacy manifests."""
+
+    header, chunks = stream_manifest(path)
+    if header.doc_hashes or header.doc_count == 0:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+        return header.manifest_hash, dict(header.doc_hashes)
+    return header.manifest_hash, build_doc_hashes(chunks)
+
+
+def diff_manifests(old_path: Path, new_path: Path) -> ManifestDiff:
+    """Find added, removed, and changed documents between two manifests."""
+
+    old_hash, old_doc_hashes = _load_doc_hashes(old_path)
+    new_hash, new_doc_hashes = _load_doc_hashes(new_path)
+    return diff_doc_hashes(
+        old_doc_hashes,
+        new_doc_hashes,
+        old_manifest_hash=old_hash,
+        new_manifest_hash=new_hash,
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Diff two corpus manifest snapshots")
+    parser.add_argument(
+        "--old-manifest",
+        type=Path,
+        required=True,
+        help="Path to the earlier manifest (JSON or JSONL)",
+    )
+    parser.add_argument(
+        "--new-manifest",
+        type=Path,
+        required=True,
+        help="Path to the later manifest (JSON or JSONL)",
+    )
+    return parser
+
+
+def main() -> None:
+    """CLI entrypoint for manifest diffs."""
+
+    args = _build_parser().parse_args()
+    diff = diff_manifests(args.old_manifest, args.new_manifest)
+    print(json.dumps(diff.model_dump(mode="json"), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
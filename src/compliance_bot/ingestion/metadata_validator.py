@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import re
-from typing import Mapping, Sequence
+from typing import Iterable, Mapping
 
 from compliance_bot.schemas.ingestion import LoadedDocument, MetadataCoverageReport
 
@@ -49,32 +49,48 @@ def validate_document_metadata(document: LoadedDocument) -> None:
             raise ValueError(f"metadata field '{key}' must not be blank")
 
 
-def build_metadata_coverage_report(
-    documents: Sequence[LoadedDocument],
-) -> MetadataCoverageReport:
-    """Validate corpus metadata and compute required-key coverage."""
+class MetadataCoverageCounter:
+    """Validate documents one at a time and tally required-key coverage.
 
-    total_documents = len(documents)
-    if total_documents == 0:
-        return MetadataCoverageReport(
-            total_documents=0,
-            valid_documents=0,
-            coverage_by_key={key: 0.0 for key in REQUIRED_METADATA_KEYS},
-        )
+    Lets a streaming ingestion run build the coverage report without holding
+    every document in memory.
+    """
 
-    presence_counts = {key: 0 for key in REQUIRED_METADATA_KEYS}
-    for document in documents:
+    def __init__(self) -> None:
+        self.total_documents = 0
+        self.presence_counts = {key: 0 for key in REQUIRED_METADATA_KEYS}
+
+    def add(self, document: LoadedDocument) -> None:
         validate_document_metadata(document)
+        self.total_documents += 1
         for key in REQUIRED_METADATA_KEYS:
             if document.metadata[key].strip():
-                presence_counts[key] += 1
-
-    coverage = {
-        key: round(presence_counts[key] / total_documents, 4)
-        for key in REQUIRED_METADATA_KEYS
-    }
-    return MetadataCoverageReport(
-        total_documents=total_documents,
-        valid_documents=total_documents,
-        coverage_by_key=coverage,
-    )
+                self.presence_counts[key] += 1
+
+    def report(self) -> MetadataCoverageReport:
+        if self.total_documents == 0:
+            return MetadataCoverageReport(
+                total_documents=0,
+                valid_documents=0,
+                coverage_by_key={key: 0.0 for key in REQUIRED_METADATA_KEYS},
+            )
+        coverage = {
+            key: round(self.presence_counts[key] / self.total_documents, 4)
+            for key in REQUIRED_METADATA_KEYS
+        }
+        return MetadataCoverageReport(
+            total_documents=self.total_documents,
+            valid_documents=self.total_documents,
+            coverage_by_key=coverage,
+        )
+
+
+def build_metadata_coverage_report(
+    documents: Iterable[LoadedDocument],
+) -> MetadataCoverageReport:
+    """Validate corpus metadata and compute required-key coverage."""
+
+    counter = MetadataCoverageCounter()
+    for document in documents:
+        counter.add(document)
+    return counter.report()
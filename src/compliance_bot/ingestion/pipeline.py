@@ -3,17 +3,92 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
+from typing import Callable, Iterator, Sequence
 
 from compliance_bot.ingestion.chunker import chunk_corpus
-from compliance_bot.ingestion.loaders import load_policy_documents
-from compliance_bot.ingestion.manifest_builder import build_manifest, write_manifest
-from compliance_bot.ingestion.metadata_validator import build_metadata_coverage_report
-from compliance_bot.schemas.ingestion import CorpusManifest
+from compliance_bot.ingestion.dedup import (
+    DEDUP_MODES,
+    DedupConfig,
+    deduplicate_chunks,
+    write_dedup_report,
+)
+from compliance_bot.ingestion.loaders import (
+    LoadThroughput,
+    load_jsonl_policy_documents,
+    load_policy_documents,
+)
+from compliance_bot.ingestion.manifest_builder import (
+    MANIFEST_FORMATS,
+    build_manifest,
+    write_manifest,
+)
+from compliance_bot.ingestion.metadata_validator import (
+    MetadataCoverageCounter,
+    build_metadata_coverage_report,
+)
+from compliance_bot.ingestion.profiling import (
+    IngestionProfiler,
+    compare_ingestion_profiles,
+    load_ingestion_profile,
+    profile_path,
+    write_ingestion_profile,
+)
+from compliance_bot.schemas.ingestion import (
+    ChunkRecord,
+    CorpusManifest,
+    DedupReport,
+    LoadedDocument,
+    MetadataCoverageReport,
+)
 
 
 DEFAULT_SOURCE_DIR = Path("docs/policies/sanitized")
 DEFAULT_OUTPUT_DIR = Path("artifacts/corpus")
+# Documents validated and chunked together when streaming JSONL exports.
+DEFAULT_STREAM_BATCH_DOCUMENTS = 1_000
+
+
+def _chunk_document_stream(
+    documents: Iterator[LoadedDocument],
+    *,
+    version_tag: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    max_workers: int,
+    batch_documents: int,
+) -> tuple[list[ChunkRecord], MetadataCoverageReport]:
+    """Validate and chunk streamed documents ``batch_documents`` at a time.
+
+    Only one batch of documents is alive at once; chunking reuses one process
+    pool across batches when ``max_workers > 1``.
+    """
+
+    coverage = MetadataCoverageCounter()
+    chunks: list[ChunkRecord] = []
+    with ExitStack() as stack:
+        executor = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+            if max_workers > 1
+            else None
+        )
+        while batch := list(islice(documents, batch_documents)):
+            for document in batch:
+                coverage.add(document)
+            chunks.extend(
+                chunk_corpus(
+                    batch,
+                    version_tag=version_tag,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    max_workers=max_workers,
+                    executor=executor,
+                )
+            )
+    return chunks, coverage.report()
 
 
 def build_corpus_snapshot(
@@ -23,23 +98,105 @@ def build_corpus_snapshot(
     version_tag: str,
     chunk_size: int,
     chunk_overlap: int,
+    manifest_format: str = "json",
+    max_workers: int = 1,
+    dedup: DedupConfig | None = None,
+    profiler: IngestionProfiler | None = None,
+    source_jsonl: Sequence[Path] = (),
+    on_documents_loaded: Callable[[LoadThroughput], None] | None = None,
+    on_dedup_report: Callable[[DedupReport, Path], None] | None = None,
 ) -> tuple[CorpusManifest, Path]:
-    """Run the full Week 2 ingestion flow and write a manifest snapshot."""
-
-    documents = load_policy_documents(source_dir)
-    metadata_report = build_metadata_coverage_report(documents)
-    chunks = chunk_corpus(
-        documents,
-        version_tag=version_tag,
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-    )
-    manifest = build_manifest(
-        chunks,
-        version_tag=version_tag,
-        metadata_report=metadata_report,
-    )
-    manifest_path = write_manifest(manifest, output_dir)
+    """Run the full Week 2 ingestion flow and write a manifest snapshot.
+
+    When ``source_jsonl`` export files are given they replace ``source_dir`` as
+    the document source. They are streamed: documents are parsed ``max_workers``
+    batches at a time and validated and chunked in bounded batches, so only the
+    chunks (not every loaded document) are held in memory. That single pass is
+    profiled as one ``stream`` stage.
+    When ``dedup`` is given, ``on_dedup_report`` receives the dedup report and the
+    path it was written to.
+    When a profiler is given, each stage is timed and the profile is written as
+    ``profile-<version_tag>.json`` next to the manifest.
+    """
+
+    active = profiler or IngestionProfiler(enabled=False)
+
+    if source_jsonl:
+        with active.stage("stream") as counters:
+            loaded: list[LoadThroughput] = []
+
+            def _loaded(throughput: LoadThroughput) -> None:
+                loaded.append(throughput)
+                if on_documents_loaded is not None:
+                    on_documents_loaded(throughput)
+
+            chunks, metadata_report = _chunk_document_stream(
+                load_jsonl_policy_documents(
+                    source_jsonl,
+                    max_workers=max_workers,
+                    on_complete=_loaded,
+                ),
+                version_tag=version_tag,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                max_workers=max_workers,
+                batch_documents=DEFAULT_STREAM_BATCH_DOCUMENTS,
+            )
+            counters.bytes_read = sum(throughput.bytes_read for throughput in loaded)
+            counters.items = len(chunks)
+    else:
+        with active.stage("load") as counters:
+            documents = load_policy_documents(source_dir)
+            if active.enabled:
+                counters.bytes_read = sum(
+                    Path(document.source_path).stat().st_size for document in documents
+                )
+            counters.items = len(documents)
+        with active.stage("validate") as counters:
+            metadata_report = build_metadata_coverage_report(documents)
+            counters.items = len(documents)
+        with active.stage("chunk") as counters:
+            chunks = chunk_corpus(
+                documents,
+                version_tag=version_tag,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                max_workers=max_workers,
+            )
+            counters.items = len(chunks)
+    if dedup is not None:
+        with active.stage("dedup") as counters:
+            chunks, dedup_report = deduplicate_chunks(chunks, config=dedup)
+            report_path = write_dedup_report(dedup_report, output_dir, version_tag=version_tag)
+            counters.items = len(chunks)
+            counters.bytes_written = report_path.stat().st_size
+        if on_dedup_report is not None:
+            on_dedup_report(dedup_report, report_path)
+    with active.stage("hash") as counters:
+        manifest = build_manifest(
+            chunks,
+            version_tag=version_tag,
+            metadata_report=metadata_report,
+        )
+        counters.items = manifest.chunk_count
+    with active.stage("write") as counters:
+        manifest_path = write_manifest(manifest, output_dir, manifest_format=manifest_format)
+        counters.items = manifest.chunk_count
+        counters.bytes_written = manifest_path.stat().st_size
+
+    if profiler is not None:
+        profile = profiler.finish(
+            version_tag=version_tag,
+            run_config={
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "manifest_format": manifest_format,
+                "max_workers": max_workers,
+                "dedup": dedup.mode if dedup is not None else "none",
+            },
+            corpus={"doc_count": manifest.doc_count, "chunk_count": manifest.chunk_count},
+        )
+        write_ingestion_profile(profile, output_dir)
     return manifest, manifest_path
 
 
@@ -51,6 +208,13 @@ def _build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_SOURCE_DIR,
         help="Folder containing sanitized policy JSON documents",
     )
+    parser.add_argument(
+        "--source-jsonl",
+        type=Path,
+        nargs="+",
+        default=(),
+        help="JSONL or .jsonl.gz policy exports to load instead of --source-dir",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -74,24 +238,104 @@ def _build_parser() -> argparse.ArgumentParser:
         default=120,
         help="Chunk overlap in characters",
     )
+    parser.add_argument(
+        "--manifest-format",
+        choices=MANIFEST_FORMATS,
+        default="json",
+        help="Manifest artifact format (jsonl streams one chunk per line)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process pool size for chunking and export loading (1 stays on a single core)",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=("none", *DEDUP_MODES),
+        default="none",
+        help="Near-duplicate chunk handling: flag with duplicate_of, or collapse into one chunk",
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=0.85,
+        help="Shingle Jaccard similarity at which chunks count as near-duplicates",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write per-stage wall/CPU time, peak memory, and I/O to profile-<version-tag>.json",
+    )
+    parser.add_argument(
+        "--profile-baseline",
+        type=Path,
+        default=None,
+        help="Earlier profile JSON to compare against (implies --profile)",
+    )
     return parser
 
 
+def _print_load_throughput(throughput: LoadThroughput) -> None:
+    print(
+        f"load_throughput: files={throughput.file_count} docs={throughput.document_count} "
+        f"docs_per_second={throughput.docs_per_second:.1f} "
+        f"mb_per_second={throughput.mb_per_second:.2f}"
+    )
+
+
 def main() -> None:
     """CLI entrypoint for Week 2 ingestion."""
 
     args = _build_parser().parse_args()
+    dedup = (
+        DedupConfig(mode=args.dedup, threshold=args.dedup_threshold)
+        if args.dedup != "none"
+        else None
+    )
+    profiling = args.profile or args.profile_baseline is not None
+    profiler = IngestionProfiler() if profiling else None
+    dedup_reports: list[tuple[DedupReport, Path]] = []
     manifest, path = build_corpus_snapshot(
         args.source_dir,
         args.output_dir,
         version_tag=args.version_tag,
         chunk_size=args.chunk_size,
         chunk_overlap=args.chunk_overlap,
+        manifest_format=args.manifest_format,
+        max_workers=args.workers,
+        dedup=dedup,
+        profiler=profiler,
+        source_jsonl=args.source_jsonl,
+        on_documents_loaded=_print_load_throughput,
+        on_dedup_report=lambda report, report_path: dedup_reports.append((report, report_path)),
     )
     print(f"manifest_path: {path}")
     print(f"manifest_hash: {manifest.manifest_hash}")
     print(f"doc_count: {manifest.doc_count}")
     print(f"chunk_count: {manifest.chunk_count}")
+    for report, report_path in dedup_reports:
+        print(f"dedup_report_path: {report_path}")
+        print(f"duplicate_chunk_count: {report.duplicate_chunk_count}")
+        print(f"index_chars_saved_ratio: {report.index_chars_saved_ratio:.4f}")
+        print(f"embedding_inputs_saved: {report.embedding_inputs_saved}")
+    if profiler is not None and profiler.profile is not None:
+        profile = profiler.profile
+        print(f"profile_path: {profile_path(args.output_dir, version_tag=args.version_tag)}")
+        for stage in profile.stages:
+            print(
+                f"stage {stage.stage}: wall_ms={stage.wall_ms:.1f} cpu_ms={stage.cpu_ms:.1f} "
+                f"peak_memory_bytes={stage.peak_memory_bytes} "
+                f"bytes_read={stage.bytes_read} bytes_written={stage.bytes_written}"
+            )
+        if args.profile_baseline is not None:
+            regressions = compare_ingestion_profiles(
+                load_ingestion_profile(args.profile_baseline),
+                profile,
+            )
+            print(f"profile_regressions: {len(regressions)}")
+            for regression in regressions:
+                print(f"  {regression}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,160 @@
+"""Per-stage wall time, CPU time, memory, and I/O profiling for ingestion runs."""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping
+
+from compliance_bot.schemas.ingestion import IngestionProfile, IngestionStageProfile
+
+
+@dataclass
+class StageCounters:
+    """Mutable I/O and item counters a stage fills in while it runs."""
+
+    bytes_read: int = 0
+    bytes_written: int = 0
+    items: int = 0
+
+
+class IngestionProfiler:
+    """Collect per-stage resource usage; a disabled profiler records nothing.
+
+    Wall time uses ``perf_counter`` and CPU time uses ``process_time``, so CPU
+    spent in chunking worker processes is not counted. Peak memory is the
+    tracemalloc peak of Python allocations in this process during the stage.
+    The report built by :meth:`finish` is also kept on ``profile``.
+    """
+
+    def __init__(self, *, enabled: bool = True, track_memory: bool = True) -> None:
+        self.enabled = enabled
+        self.track_memory = enabled and track_memory
+        self.stages: list[IngestionStageProfile] = []
+        self.profile: IngestionProfile | None = None
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageCounters]:
+        counters = StageCounters()
+        if not self.enabled:
+            yield counters
+            return
+
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield counters
+        finally:
+            wall_ms = (time.perf_counter() - wall_started) * 1000
+            cpu_ms = (time.process_time() - cpu_started) * 1000
+            peak = tracemalloc.get_traced_memory()[1] if self.track_memory else 0
+            self.stages.append(
+                IngestionStageProfile(
+                    stage=name,
+                    wall_ms=round(wall_ms, 3),
+                    cpu_ms=round(cpu_ms, 3),
+                    peak_memory_bytes=peak,
+                    bytes_read=counters.bytes_read,
+                    bytes_written=counters.bytes_written,
+                    items=counters.items,
+                )
+            )
+
+    def finish(
+        self,
+        *,
+        version_tag: str,
+        run_config: Mapping[str, object] | None = None,
+        corpus: Mapping[str, int] | None = None,
+    ) -> IngestionProfile:
+        """Stop memory tracing (if this profiler started it) and build the report.
+
+        ``run_config`` holds the knobs a baseline must match; ``corpus`` holds input
+        sizes such as document and chunk counts, which are recorded but not compared.
+        """
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.profile = IngestionProfile(
+            version_tag=version_tag,
+            run_config={str(key): str(value) for key, value in (run_config or {}).items()},
+            corpus={str(key): int(value) for key, value in (corpus or {}).items()},
+            stages=list(self.stages),
+            total_wall_ms=round(sum(stage.wall_ms for stage in self.stages), 3),
+            total_cpu_ms=round(sum(stage.cpu_ms for stage in self.stages), 3),
+            peak_memory_bytes=max((stage.peak_memory_bytes for stage in self.stages), default=0),
+        )
+        return self.profile
+
+
+def profile_path(output_dir: Path, *, version_tag: str) -> Path:
+    """Return where the ingestion profile for a snapshot is written."""
+
+    return output_dir / f"profile-{version_tag}.json"
+
+
+def write_ingestion_profile(profile: IngestionProfile, output_dir: Path) -> Path:
+    """Write the profile report next to the manifest artifact."""
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = profile_path(output_dir, version_tag=profile.version_tag)
+    path.write_text(json.dumps(profile.model_dump(), indent=2, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def load_ingestion_profile(path: Path) -> IngestionProfile:
+    """Load a profile report written by :func:`write_ingestion_profile`."""
+
+    return IngestionProfile.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def compare_ingestion_profiles(
+    baseline: IngestionProfile,
+    current: IngestionProfile,
+    *,
+    tolerance: float = 0.25,
+    min_delta_ms: float = 5.0,
+) -> list[str]:
+    """Return human-readable regressions of ``current`` against ``baseline``.
+
+    A stage regresses when its wall or CPU time grows by more than ``tolerance``
+    and by at least ``min_delta_ms`` (so sub-millisecond noise is ignored), or when
+    its peak memory grows by more than ``tolerance``. Differing run configs are
+    reported first because they make the numbers incomparable; corpus sizes are
+    not compared, so a baseline from a different corpus only flags stage growth.
+    """
+
+    regressions: list[str] = []
+    for key in sorted(set(baseline.run_config) | set(current.run_config)):
+        old = baseline.run_config.get(key)
+        new = current.run_config.get(key)
+        if old != new:
+            regressions.append(f"run_config.{key}: {old} -> {new}")
+
+    baseline_stages = {stage.stage: stage for stage in baseline.stages}
+    for stage in current.stages:
+        reference = baseline_stages.get(stage.stage)
+        if reference is None:
+            continue
+        for metric in ("wall_ms", "cpu_ms"):
+            old_value = getattr(reference, metric)
+            new_value = getattr(stage, metric)
+            if new_value - old_value >= min_delta_ms and new_value > old_value * (1 + tolerance):
+                regressions.append(f"{stage.stage}.{metric}: {old_value:.1f} -> {new_value:.1f}")
+        old_peak = reference.peak_memory_bytes
+        if old_peak and stage.peak_memory_bytes > old_peak * (1 + tolerance):
+            regressions.append(
+                f"{stage.stage}.peak_memory_bytes: {old_peak} -> {stage.peak_memory_bytes}"
+            )
+    return regressions
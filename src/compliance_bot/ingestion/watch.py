@@ -0,0 +1,294 @@
+"""Watch mode: incrementally re-ingest edited policies and hot-swap the live index."""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from compliance_bot.ingestion.chunker import (
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_CHUNK_SIZE,
+    chunk_document,
+)
+from compliance_bot.ingestion.loaders import list_policy_files, load_policy_document
+from compliance_bot.ingestion.manifest_builder import (
+    build_doc_hash,
+    build_root_hash,
+    rehash_documents,
+)
+from compliance_bot.providers.provider_registry import (
+    EMBEDDING_PROVIDER_MODES,
+    resolve_embedding_provider,
+)
+from compliance_bot.retrieval.embedding_store import EmbeddingStore
+from compliance_bot.retrieval.indexer import (
+    EmbeddingCache,
+    EmbeddingProvider,
+    RetrievalIndex,
+    update_retrieval_index,
+)
+from compliance_bot.retrieval.live_index import LiveRetrievalIndex
+from compliance_bot.schemas.ingestion import ChunkRecord
+
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+_FileState = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class RefreshResult:
+    """Outcome of one poll that found changes on disk."""
+
+    changed_doc_ids: list[str]
+    removed_doc_ids: list[str]
+    chunk_count: int
+    manifest_hash: str
+    generation: int
+    latency_ms: float
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+class PolicyWatcher:
+    """Poll a policy folder and apply per-document changes to a live index.
+
+    A file counts as changed when its ``(mtime_ns, size)`` differs from the last
+    poll. Changed files are re-chunked on their own; if the resulting doc hash
+    is unchanged (for example after a bare ``touch``) the index is left alone.
+    Files that fail to parse (often a save still in progress) keep their
+    previous chunks and are retried once the file changes again; a failed file
+    that disappears is forgotten.
+    """
+
+    def __init__(
+        self,
+        source_dir: Path,
+        live_index: LiveRetrievalIndex,
+        *,
+        version_tag: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        embedding_provider: EmbeddingProvider | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
+        self.source_dir = source_dir
+        self.live_index = live_index
+        self.version_tag = version_tag
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.embedding_provider = embedding_provider
+        self.embedding_cache = embedding_cache
+        self.doc_hashes: dict[str, str] = {}
+        self._file_states: dict[Path, _FileState] = {}
+        self._failed_states: dict[Path, _FileState] = {}
+        self._path_doc_ids: dict[Path, str] = {}
+
+    @property
+    def manifest_hash(self) -> str:
+        return build_root_hash(self.doc_hashes, version_tag=self.version_tag)
+
+    def _scan(self) -> dict[Path, _FileState]:
+        states: dict[Path, _FileState] = {}
+        for path in list_policy_files(self.source_dir):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            states[path] = (stat.st_mtime_ns, stat.st_size)
+        return states
+
+    def poll_once(self) -> RefreshResult | None:
+        """Apply any on-disk changes since the last poll; return ``None`` when idle."""
+
+        started = time.perf_counter()
+        states = self._scan()
+        for path in [path for path in self._failed_states if path not in states]:
+            del self._failed_states[path]
+        touched = [
+            path
+            for path, state in states.items()
+            if self._file_states.get(path) != state and self._failed_states.get(path) != state
+        ]
+        deleted = [path for path in self._file_states if path not in states]
+        if not touched and not deleted:
+            return None
+
+        errors: dict[str, str] = {}
+        changed_chunks: list[ChunkRecord] = []
+        changed_doc_ids: set[str] = set()
+        removed_doc_ids: set[str] = set()
+
+        for path in deleted:
+            self._file_states.pop(path, None)
+            doc_id = self._path_doc_ids.pop(path, None)
+            if doc_id is not None:
+                removed_doc_ids.add(doc_id)
+
+        for path in touched:
+            try:
+                document = load_policy_document(path)
+            except (OSError, ValueError) as exc:
+                errors[str(path)] = str(exc)
+                self._failed_states[path] = states[path]
+                continue
+            self._failed_states.pop(path, None)
+            self._file_states[path] = states[path]
+            chunks = chunk_document(
+                document,
+                version_tag=self.version_tag,
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap,
+            )
+            doc_id = document.metadata.get("doc_id", "unknown-doc")
+            previous_doc_id = self._path_doc_ids.get(path)
+            self._path_doc_ids[path] = doc_id
+            if previous_doc_id is not None and previous_doc_id != doc_id:
+                removed_doc_ids.add(previous_doc_id)
+            if not chunks:
+                removed_doc_ids.add(doc_id)
+                continue
+            if self.doc_hashes.get(doc_id) == build_doc_hash(chunks):
+                continue
+            changed_doc_ids.add(doc_id)
+            changed_chunks.extend(chunks)
+
+        removed_doc_ids -= changed_doc_ids
+        removed_doc_ids &= set(self.doc_hashes)
+        if not changed_doc_ids and not removed_doc_ids:
+            if not errors:
+                return None
+            return self._result(set(), set(), errors=errors, started=started)
+
+        doc_hashes = rehash_documents(
+            self.doc_hashes,
+            changed_chunks=changed_chunks,
+            removed_doc_ids=removed_doc_ids,
+        )
+
+        def _apply(index: RetrievalIndex) -> RetrievalIndex:
+            return update_retrieval_index(
+                index,
+                changed_chunks=changed_chunks,
+                removed_doc_ids=removed_doc_ids,
+                embedding_provider=self.embedding_provider,
+                embedding_cache=self.embedding_cache,
+                manifest_hash=build_root_hash(doc_hashes, version_tag=self.version_tag),
+            )
+
+        self.live_index.update(_apply)
+        self.doc_hashes = doc_hashes
+        return self._result(changed_doc_ids, removed_doc_ids, errors=errors, started=started)
+
+    def _result(
+        self,
+        changed_doc_ids: set[str],
+        removed_doc_ids: set[str],
+        *,
+        errors: dict[str, str],
+        started: float,
+    ) -> RefreshResult:
+        return RefreshResult(
+            changed_doc_ids=sorted(changed_doc_ids),
+            removed_doc_ids=sorted(removed_doc_ids),
+            chunk_count=len(self.live_index.current().chunks),
+            manifest_hash=self.manifest_hash,
+            generation=self.live_index.generation,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            errors=errors,
+        )
+
+    def run(
+        self,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        stop_event: threading.Event | None = None,
+        on_refresh: Callable[[RefreshResult], None] | None = None,
+    ) -> None:
+        """Poll until ``stop_event`` is set, reporting each refresh."""
+
+        stop = stop_event or threading.Event()
+        while not stop.is_set():
+            result = self.poll_once()
+            if result is not None and on_refresh is not None:
+                on_refresh(result)
+            stop.wait(poll_interval)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Watch a policy folder and keep an in-memory index up to date"
+    )
+    parser.add_argument(
+        "--source-dir",
+        type=Path,
+        default=Path("docs/policies/sanitized"),
+        help="Folder containing sanitized policy JSON documents",
+    )
+    parser.add_argument("--version-tag", required=True, help="Version tag for chunk IDs")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk-overlap", type=int, default=DEFAULT_CHUNK_OVERLAP)
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL_SECONDS,
+        help="Seconds between directory scans",
+    )
+    parser.add_argument(
+        "--embedding-provider",
+        choices=EMBEDDING_PROVIDER_MODES,
+        default="none",
+        help="Embedding provider mode for changed chunks",
+    )
+    parser.add_argument(
+        "--embedding-store-path",
+        type=Path,
+        default=None,
+        help="Optional SQLite embedding store; only chunks missing from it are embedded",
+    )
+    return parser
+
+
+def _print_refresh(result: RefreshResult) -> None:
+    print(
+        f"generation={result.generation} changed={','.join(result.changed_doc_ids) or '-'} "
+        f"removed={','.join(result.removed_doc_ids) or '-'} chunks={result.chunk_count} "
+        f"manifest_hash={result.manifest_hash} latency_ms={result.latency_ms:.1f}",
+        flush=True,
+    )
+    for path, error in result.errors.items():
+        print(f"skipped {path}: {error}", flush=True)
+
+
+def main() -> None:
+    """CLI entrypoint for ingestion watch mode."""
+
+    args = _build_parser().parse_args()
+    embedding_provider = resolve_embedding_provider(args.embedding_provider)
+    store = (
+        EmbeddingStore(args.embedding_store_path)
+        if args.embedding_store_path is not None and embedding_provider is not None
+        else None
+    )
+    watcher = PolicyWatcher(
+        args.source_dir,
+        LiveRetrievalIndex(RetrievalIndex(version_tag=args.version_tag)),
+        version_tag=args.version_tag,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        embedding_provider=embedding_provider,
+        embedding_cache=store,
+    )
+    try:
+        watcher.run(poll_interval=args.poll_interval, on_refresh=_print_refresh)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
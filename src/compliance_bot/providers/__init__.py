@@ -1,9 +1,86 @@
 """Provider adapters for hosted model services."""
 
+from compliance_bot.providers.client_registry import (
+    ClientRegistryStats,
+    ProviderClientRegistry,
+    get_client_registry,
+    refresh_provider_clients,
+    reset_client_registry,
+)
+from compliance_bot.providers.http_transport import (
+    AsyncHTTPTransport,
+    HTTPTransportConfig,
+    PooledHTTPTransport,
+    get_shared_http_transport,
+    load_http_transport_config,
+)
+from compliance_bot.providers.latency import (
+    LatencyHistogram,
+    process_latency_snapshot,
+    record_provider_calls,
+    reset_process_latency,
+    summarize_provider_metrics,
+)
+from compliance_bot.providers.llm_cache import (
+    CachedChatModel,
+    LLMCacheConfig,
+    LLMCacheStats,
+    LLMResponseCache,
+    cache_chat_model,
+    get_llm_cache,
+    load_llm_cache_config,
+    reset_llm_caches,
+    scope_llm_cache,
+    track_llm_cache,
+)
+from compliance_bot.providers.local_embeddings import (
+    LocalEmbeddingConfig,
+    LocalHashEmbeddingProvider,
+    build_local_embedding_provider,
+    load_local_embedding_config,
+)
+from compliance_bot.providers.local_rerank import (
+    LocalRerankConfig,
+    LocalRerankProvider,
+    build_local_rerank_provider,
+)
 from compliance_bot.providers.provider_registry import (
+    EMBEDDING_PROVIDER_MODES,
+    RERANK_PROVIDER_MODES,
     resolve_embedding_provider,
     resolve_rerank_provider,
 )
+from compliance_bot.providers.rate_limit import (
+    AdaptiveRateLimiter,
+    RateLimitConfig,
+    RateLimitedChatModel,
+    RateLimitTimeoutError,
+    get_rate_limiter,
+    load_rate_limit_config,
+    rate_limit_snapshot,
+    reset_rate_limiters,
+)
+from compliance_bot.providers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderGuard,
+    ResilienceConfig,
+    ResilientChatModel,
+    ResilientEmbeddingProvider,
+    ResilientRerankProvider,
+    load_resilience_config,
+    resilience_enabled,
+)
+from compliance_bot.providers.single_flight import (
+    CoalescingChatModel,
+    CoalescingEmbeddingProvider,
+    CoalescingRerankProvider,
+    SingleFlight,
+    SingleFlightStats,
+    single_flight_enabled,
+    single_flight_stats,
+    track_coalescing,
+)
 from compliance_bot.providers.siliconflow_embeddings import (
     DEFAULT_SILICONFLOW_EMBEDDING_MODEL,
     SiliconFlowEmbeddingConfig,
@@ -21,8 +98,67 @@ from compliance_bot.providers.siliconflow_rerank import (
 )
 
 __all__ = [
+    "ClientRegistryStats",
+    "ProviderClientRegistry",
+    "get_client_registry",
+    "refresh_provider_clients",
+    "reset_client_registry",
+    "AsyncHTTPTransport",
+    "HTTPTransportConfig",
+    "PooledHTTPTransport",
+    "get_shared_http_transport",
+    "load_http_transport_config",
+    "LatencyHistogram",
+    "process_latency_snapshot",
+    "record_provider_calls",
+    "reset_process_latency",
+    "summarize_provider_metrics",
+    "CachedChatModel",
+    "LLMCacheConfig",
+    "LLMCacheStats",
+    "LLMResponseCache",
+    "cache_chat_model",
+    "get_llm_cache",
+    "load_llm_cache_config",
+    "reset_llm_caches",
+    "scope_llm_cache",
+    "track_llm_cache",
+    "LocalEmbeddingConfig",
+    "LocalHashEmbeddingProvider",
+    "build_local_embedding_provider",
+    "load_local_embedding_config",
+    "LocalRerankConfig",
+    "LocalRerankProvider",
+    "build_local_rerank_provider",
+    "EMBEDDING_PROVIDER_MODES",
+    "RERANK_PROVIDER_MODES",
     "resolve_embedding_provider",
     "resolve_rerank_provider",
+    "AdaptiveRateLimiter",
+    "RateLimitConfig",
+    "RateLimitedChatModel",
+    "RateLimitTimeoutError",
+    "get_rate_limiter",
+    "load_rate_limit_config",
+    "rate_limit_snapshot",
+    "reset_rate_limiters",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ProviderGuard",
+    "ResilienceConfig",
+    "ResilientChatModel",
+    "ResilientEmbeddingProvider",
+    "ResilientRerankProvider",
+    "load_resilience_config",
+    "resilience_enabled",
+    "CoalescingChatModel",
+    "CoalescingEmbeddingProvider",
+    "CoalescingRerankProvider",
+    "SingleFlight",
+    "SingleFlightStats",
+    "single_flight_enabled",
+    "single_flight_stats",
+    "track_coalescing",
     "DEFAULT_SILICONFLOW_EMBEDDING_MODEL",
     "SiliconFlowEmbeddingConfig",
     "SiliconFlowEmbeddingProvider",
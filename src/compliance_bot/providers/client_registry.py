@@ -0,0 +1,260 @@
+"""Process-wide registry of long-lived provider clients.
+
+``resolve_*`` builds a fresh client (HTTP pool, config parsing, wrappers) on every
+call. Query entrypoints go through this registry instead, which keeps one client
+per kind, mode, and provider-relevant environment, and hands the same instance
+to every caller until it is refreshed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from compliance_bot.providers.local_embeddings import LocalHashEmbeddingProvider
+from compliance_bot.providers.local_rerank import LocalRerankProvider
+from compliance_bot.providers.provider_registry import (
+    RemoteEmbeddingProvider,
+    RemoteRerankProvider,
+    resolve_embedding_provider,
+    resolve_rerank_provider,
+)
+
+CLIENT_ENV_PREFIXES = (
+    "SILICONFLOW_",
+    "COMPLIANCE_PROVIDER_",
+    "COMPLIANCE_HEDGE_",
+    "COMPLIANCE_CIRCUIT_",
+    "COMPLIANCE_LOCAL_",
+    "COMPLIANCE_HTTP_",
+    "COMPLIANCE_LLM_CACHE_",
+)
+
+
+def client_env_fingerprint(env: Mapping[str, str]) -> str:
+    """Digest the environment variables that shape provider clients.
+
+    Rotating ``SILICONFLOW_API_KEY`` or changing a model, timeout, or guard flag
+    yields a new fingerprint, so the registry never hands out a client built
+    from stale settings. Only the digest is kept as a key, not the secrets.
+    """
+
+    digest = hashlib.sha256()
+    for key in sorted(key for key in env if key.startswith(CLIENT_ENV_PREFIXES)):
+        digest.update(f"{key}={env[key].strip()}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ClientRegistryStats:
+    """Counters for one registry: live clients, cache hits, and builds."""
+
+    clients: int
+    hits: int
+    builds: int
+    closed: int
+
+
+def _unwrapped(client: Any) -> list[Any]:
+    layers: list[Any] = []
+    current = client
+    while current is not None and all(current is not layer for layer in layers):
+        layers.append(current)
+        current = getattr(current, "_inner", None)
+    return layers
+
+
+def _close_client(client: Any) -> None:
+    for layer in _unwrapped(client):
+        close = getattr(layer, "close", None)
+        if callable(close):
+            close()
+            continue
+        aclose = getattr(layer, "aclose", None)
+        if callable(aclose) and inspect.iscoroutinefunction(aclose):
+            _run_aclose(aclose)
+
+
+def _run_aclose(aclose: Callable[[], Any]) -> None:
+    """Run an async-only ``aclose`` from sync code, on this thread's loop if one runs."""
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(aclose())
+    else:
+        loop.create_task(aclose())
+
+
+async def _aclose_client(client: Any) -> None:
+    for layer in _unwrapped(client):
+        aclose = getattr(layer, "aclose", None)
+        if callable(aclose) and inspect.iscoroutinefunction(aclose):
+            await aclose()
+            continue
+        close = getattr(layer, "close", None)
+        if callable(close):
+            close()
+
+
+class ProviderClientRegistry:
+    """Thread-safe cache of shared provider clients keyed by kind, mode, and env.
+
+    Callers passing different ``env`` mappings each get their own client, and
+    a client is never closed while another caller may still hold it; clients
+    built from superseded settings stay cached until :meth:`refresh`. Clients
+    are built outside the lock; when two threads race on a cold key the loser's
+    client is closed and both callers receive the winner's.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._builds = 0
+        self._closed = 0
+
+    def get(
+        self,
+        kind: str,
+        mode: str,
+        factory: Callable[[], Any],
+        *,
+        env: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Return the shared client for ``kind``/``mode``, building it once via ``factory``.
+
+        ``None`` results (for example ``auto`` without credentials) are cached too.
+        """
+
+        source = env if env is not None else os.environ
+        key = (kind, mode.strip().lower(), client_env_fingerprint(source))
+        with self._lock:
+            if key in self._clients:
+                self._hits += 1
+                return self._clients[key]
+
+        client = factory()
+        with self._lock:
+            if key in self._clients:
+                self._hits += 1
+                winner = self._clients[key]
+            else:
+                self._builds += 1
+                self._clients[key] = client
+                return client
+        if client is not None:
+            _close_client(client)
+        return winner
+
+    def embedding_provider(
+        self,
+        mode: str = "auto",
+        *,
+        env: Mapping[str, str] | None = None,
+    ) -> RemoteEmbeddingProvider | LocalHashEmbeddingProvider | None:
+        """Shared equivalent of :func:`resolve_embedding_provider`."""
+
+        return self.get(
+            "embedding",
+            mode,
+            lambda: resolve_embedding_provider(mode, env=env),
+            env=env,
+        )
+
+    def rerank_provider(
+        self,
+        mode: str = "auto",
+        *,
+        env: Mapping[str, str] | None = None,
+    ) -> RemoteRerankProvider | LocalRerankProvider | None:
+        """Shared equivalent of :func:`resolve_rerank_provider`."""
+
+        return self.get(
+            "rerank",
+            mode,
+            lambda: resolve_rerank_provider(mode, env=env),
+            env=env,
+        )
+
+    def _evict(self, kind: str | None) -> list[Any]:
+        with self._lock:
+            keys = [key for key in self._clients if kind is None or key[0] == kind]
+            evicted = [self._clients.pop(key) for key in keys]
+            self._closed += len(evicted)
+        return evicted
+
+    def refresh(self, kind: str | None = None) -> int:
+        """Close and drop cached clients (all, or one ``kind``); the next ``get`` rebuilds.
+
+        Call this after rotating credentials in place; it also drops clients
+        built from superseded settings. Returns the number of entries dropped.
+        """
+
+        evicted = self._evict(kind)
+        for client in evicted:
+            _close_client(client)
+        return len(evicted)
+
+    async def arefresh(self, kind: str | None = None) -> int:
+        """Async :meth:`refresh` that also awaits each client's ``aclose``."""
+
+        evicted = self._evict(kind)
+        for client in evicted:
+            await _aclose_client(client)
+        return len(evicted)
+
+    def close(self) -> None:
+        """Close every cached client."""
+
+        self.refresh()
+
+    async def aclose(self) -> None:
+        """Close every cached client, awaiting async transports."""
+
+        await self.arefresh()
+
+    def stats(self) -> ClientRegistryStats:
+        with self._lock:
+            return ClientRegistryStats(
+                clients=len(self._clients),
+                hits=self._hits,
+                builds=self._builds,
+                closed=self._closed,
+            )
+
+
+_registry: ProviderClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ProviderClientRegistry:
+    """Return the process-wide client registry used by query entrypoints."""
+
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ProviderClientRegistry()
+        return _registry
+
+
+def refresh_provider_clients(kind: str | None = None) -> int:
+    """Close and drop process-wide clients, e.g. after rotating ``SILICONFLOW_API_KEY``."""
+
+    return get_client_registry().refresh(kind)
+
+
+def reset_client_registry() -> None:
+    """Close every shared client and start a fresh registry (tests and CLI restarts)."""
+
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
+
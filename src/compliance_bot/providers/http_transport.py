@@ -0,0 +1,432 @@
+"""Pooled keep-alive HTTP transport shared by JSON-over-HTTP provider adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import http.client
+import importlib
+import io
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Mapping
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+DEFAULT_POOL_SIZE = 8
+
+
+@dataclass(frozen=True)
+class HTTPTransportConfig:
+    """Connection pool and request compression settings."""
+
+    max_connections_per_host: int = DEFAULT_POOL_SIZE
+    gzip_requests: bool = False
+    gzip_min_bytes: int = 1024
+
+    def __post_init__(self) -> None:
+        if self.max_connections_per_host <= 0:
+            raise ValueError("max_connections_per_host must be > 0")
+        if self.gzip_min_bytes < 0:
+            raise ValueError("gzip_min_bytes must be >= 0")
+
+
+def load_http_transport_config(env: Mapping[str, str] | None = None) -> HTTPTransportConfig:
+    """Load transport settings from environment."""
+
+    source = env if env is not None else os.environ
+    pool_size = int(source.get("COMPLIANCE_HTTP_POOL_SIZE", str(DEFAULT_POOL_SIZE)).strip())
+    gzip_flag = source.get("COMPLIANCE_HTTP_GZIP_REQUESTS", "").strip().lower()
+    return HTTPTransportConfig(
+        max_connections_per_host=pool_size,
+        gzip_requests=gzip_flag in {"1", "true", "yes", "on"},
+    )
+
+
+_OriginKey = tuple[str, str, int]
+# Target origin plus the proxy URL it is reached through ("" when direct).
+_PoolKey = tuple[str, str, int, str]
+
+
+@dataclass(frozen=True)
+class _Proxy:
+    scheme: str
+    host: str
+    port: int
+    authorization: str | None
+
+
+def _proxy_for(scheme: str, host: str) -> _Proxy | None:
+    """Resolve the proxy for ``scheme``/``host`` like ``urllib.request.urlopen`` does.
+
+    Honors ``HTTP_PROXY``/``HTTPS_PROXY`` (and platform proxy settings) and
+    ``NO_PROXY``.
+    """
+
+    proxy_url = getproxies().get(scheme)
+    if not proxy_url or proxy_bypass(host):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    parts = urlsplit(proxy_url)
+    if not parts.hostname:
+        return None
+    authorization = None
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        authorization = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    proxy_scheme = "https" if parts.scheme == "https" else "http"
+    default_port = 443 if proxy_scheme == "https" else 80
+    return _Proxy(proxy_scheme, parts.hostname, parts.port or default_port, authorization)
+
+
+class _HostPool:
+    """Idle connections for one origin plus a cap on connections in existence."""
+
+    def __init__(self, size: int) -> None:
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle: list[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+
+
+class PooledHTTPTransport:
+    """POST JSON over persistent HTTP/1.1 connections.
+
+    Each origin gets at most ``max_connections_per_host`` open connections;
+    callers beyond that wait for one to be released. A connection goes back to
+    the pool after its response body has been read, unless the server asked to
+    close it. A request that fails on a reused connection before any response
+    arrives (the server dropped an idle keep-alive socket) is retried once on a
+    fresh connection. ``HTTP_PROXY``/``HTTPS_PROXY``/``NO_PROXY`` are honored as
+    by ``urlopen``: plain HTTP is sent to the proxy, HTTPS is tunnelled through
+    it with ``CONNECT``, and each proxy route gets its own pool. Once closed, a
+    transport stops pooling connections, so :func:`get_shared_http_transport`
+    replaces a closed shared transport.
+    """
+
+    def __init__(self, config: HTTPTransportConfig | None = None) -> None:
+        self.config = config or HTTPTransportConfig()
+        self._pools: dict[_PoolKey, _HostPool] = {}
+        self._pools_lock = threading.Lock()
+        self._connections_opened = 0
+        self._closed = False
+
+    @property
+    def connections_opened(self) -> int:
+        """Total connections created since construction (handshakes paid)."""
+
+        return self._connections_opened
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self) -> PooledHTTPTransport:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close idle connections; in-flight ones are closed when released."""
+
+        with self._pools_lock:
+            self._closed = True
+            pools = list(self._pools.values())
+        for pool in pools:
+            with pool.lock:
+                idle, pool.idle = pool.idle, []
+            for connection in idle:
+                connection.close()
+
+    def _pool_for(self, key: _PoolKey) -> _HostPool:
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(self.config.max_connections_per_host)
+                self._pools[key] = pool
+            return pool
+
+    def _new_connection(
+        self,
+        key: _OriginKey,
+        proxy: _Proxy | None,
+        timeout: float,
+    ) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        with self._pools_lock:
+            self._connections_opened += 1
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout)
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+        if scheme == "https":
+            # TLS to the target runs inside a CONNECT tunnel opened on the proxy.
+            connection = http.client.HTTPSConnection(proxy.host, proxy.port, timeout=timeout)
+            tunnel_headers = (
+                {"Proxy-Authorization": proxy.authorization} if proxy.authorization else None
+            )
+            connection.set_tunnel(host, port, headers=tunnel_headers)
+            return connection
+        if proxy.scheme == "https":
+            return http.client.HTTPSConnection(proxy.host, proxy.port, timeout=timeout)
+        return http.client.HTTPConnection(proxy.host, proxy.port, timeout=timeout)
+
+    def _release(
+        self,
+        pool: _HostPool,
+        connection: http.client.HTTPConnection,
+        *,
+        reusable: bool,
+    ) -> None:
+        if reusable and not self._closed:
+            with pool.lock:
+                pool.idle.append(connection)
+        else:
+            connection.close()
+        pool.slots.release()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, Any],
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> dict[str, Any]:
+        """POST ``payload`` as JSON and decode the JSON response.
+
+        ``timeout`` is one deadline for the whole call: time spent waiting for a
+        pooled connection is taken out of the socket timeout of the request.
+        Raises ``urllib.error.HTTPError`` for 4xx/5xx, ``TimeoutError`` on socket
+        timeouts, and ``URLError`` for other connection failures, matching what
+        ``urllib.request.urlopen`` callers already handle.
+        """
+
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise URLError(f"unsupported URL: {url}")
+        key: _OriginKey = (
+            parts.scheme,
+            parts.hostname,
+            parts.port or (443 if parts.scheme == "https" else 80),
+        )
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        proxy = _proxy_for(parts.scheme, parts.hostname)
+
+        body = json.dumps(payload).encode("utf-8")
+        request_headers = {str(name): str(value) for name, value in headers.items()}
+        request_headers.setdefault("Content-Type", "application/json")
+        request_headers["Accept-Encoding"] = "gzip"
+        if self.config.gzip_requests and len(body) >= self.config.gzip_min_bytes:
+            body = gzip.compress(body)
+            request_headers["Content-Encoding"] = "gzip"
+        proxy_route = ""
+        if proxy is not None:
+            proxy_route = f"{proxy.scheme}://{proxy.host}:{proxy.port}"
+            if key[0] == "http":
+                # A forward proxy takes the absolute URL as the request target.
+                target = f"http://{parts.netloc.rpartition('@')[2]}{target}"
+                if proxy.authorization:
+                    request_headers["Proxy-Authorization"] = proxy.authorization
+
+        deadline = time.monotonic() + timeout
+        pool = self._pool_for((*key, proxy_route))
+        if not pool.slots.acquire(timeout=timeout):
+            raise TimeoutError(f"no pooled connection available for {key[1]} within {timeout}s")
+
+        for attempt in range(2):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                pool.slots.release()
+                raise TimeoutError(f"request to {url} exceeded {timeout}s")
+            with pool.lock:
+                connection = pool.idle.pop() if pool.idle else None
+            reused = connection is not None
+            if connection is None:
+                connection = self._new_connection(key, proxy, remaining)
+            connection.timeout = remaining
+            if connection.sock is not None:
+                connection.sock.settimeout(remaining)
+
+            try:
+                connection.request("POST", target, body=body, headers=request_headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as exc:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                pool.slots.release()
+                raise URLError(exc) from exc
+            except TimeoutError:
+                self._release(pool, connection, reusable=False)
+                raise
+            except (OSError, http.client.HTTPException) as exc:
+                self._release(pool, connection, reusable=False)
+                raise URLError(exc) from exc
+
+            try:
+                raw = response.read()
+            except TimeoutError:
+                self._release(pool, connection, reusable=False)
+                raise
+            except (OSError, http.client.HTTPException) as exc:
+                self._release(pool, connection, reusable=False)
+                raise URLError(exc) from exc
+            self._release(pool, connection, reusable=not response.will_close)
+            break
+
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            raw = gzip.decompress(raw)
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, io.BytesIO(raw)
+            )
+        return json.loads(raw.decode("utf-8"))
+
+
+class AsyncHTTPTransport:
+    """Non-blocking counterpart of :class:`PooledHTTPTransport` built on ``httpx``.
+
+    The whole request (connect, send, read) runs under ``asyncio.wait_for`` so a
+    deadline cancels it outright instead of leaving a thread blocked on a socket.
+    Errors map onto the same urllib exception types as the sync transport.
+    The client is created lazily inside the running event loop and recreated if
+    the transport is later used from a different loop (e.g. successive
+    ``asyncio.run`` calls), since pooled connections cannot cross loops. Each
+    client is closed on the loop that owns it: when that loop shuts down its
+    async generators (``asyncio.run`` does on exit), or when the client is
+    replaced while its loop is still alive.
+    """
+
+    def __init__(self, config: HTTPTransportConfig | None = None) -> None:
+        self.config = config or HTTPTransportConfig()
+        self._client: Any = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._closer: AsyncGenerator[None, None] | None = None
+
+    async def _get_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+        try:
+            httpx = importlib.import_module("httpx")
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "Missing dependency 'httpx'. Install with: pip install httpx"
+            ) from exc
+        self._close_on_owner_loop()
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections_per_host,
+            max_keepalive_connections=self.config.max_connections_per_host,
+        )
+        client = httpx.AsyncClient(limits=limits, timeout=None, trust_env=True)
+        closer = _close_at_loop_shutdown(client)
+        # Starting the generator registers it with this loop, so the loop's
+        # ``shutdown_asyncgens`` closes the client before the loop is closed.
+        await closer.__anext__()
+        self._client, self._client_loop, self._closer = client, loop, closer
+        return client
+
+    def _close_on_owner_loop(self) -> None:
+        """Schedule the current client's close on the loop that created it."""
+
+        closer, loop = self._closer, self._client_loop
+        self._client, self._client_loop, self._closer = None, None, None
+        if closer is None or loop is None or loop.is_closed():
+            return  # Already closed by the loop's async generator shutdown.
+        closing = closer.aclose()
+        try:
+            asyncio.run_coroutine_threadsafe(closing, loop)
+        except RuntimeError:
+            closing.close()  # The loop closed meanwhile, after closing the client.
+
+    def close(self) -> None:
+        """Close the client from sync code, on the event loop that owns it."""
+
+        self._close_on_owner_loop()
+
+    async def aclose(self) -> None:
+        if self._closer is not None and self._client_loop is asyncio.get_running_loop():
+            closer = self._closer
+            self._client, self._client_loop, self._closer = None, None, None
+            await closer.aclose()
+        else:
+            self._close_on_owner_loop()
+
+    async def __aenter__(self) -> AsyncHTTPTransport:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, Any],
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> dict[str, Any]:
+        """POST ``payload`` as JSON; cancel and raise ``TimeoutError`` past ``timeout``."""
+
+        body = json.dumps(payload).encode("utf-8")
+        request_headers = {str(name): str(value) for name, value in headers.items()}
+        request_headers.setdefault("Content-Type", "application/json")
+        if self.config.gzip_requests and len(body) >= self.config.gzip_min_bytes:
+            body = gzip.compress(body)
+            request_headers["Content-Encoding"] = "gzip"
+
+        client = await self._get_client()
+        httpx = importlib.import_module("httpx")
+        try:
+            response = await asyncio.wait_for(
+                client.post(url, content=body, headers=request_headers),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"request to {url} exceeded {timeout}s") from None
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(str(exc)) from exc
+        except httpx.HTTPError as exc:
+            raise URLError(exc) from exc
+
+        raw = response.content
+        if response.status_code >= 400:
+            raise HTTPError(
+                url,
+                response.status_code,
+                response.reason_phrase,
+                response.headers,  # type: ignore[arg-type]
+                io.BytesIO(raw),
+            )
+        return json.loads(raw.decode("utf-8"))
+
+
+async def _close_at_loop_shutdown(client: Any) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+_shared_transport: PooledHTTPTransport | None = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_http_transport() -> PooledHTTPTransport:
+    """Return the process-wide transport used by default request functions.
+
+    A shared transport that has been closed is replaced with a new one.
+    """
+
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None or _shared_transport.closed:
+            _shared_transport = PooledHTTPTransport(load_http_transport_config())
+        return _shared_transport
@@ -0,0 +1,144 @@
+"""Per-request and per-process latency histograms for provider calls."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections import deque
+from typing import Iterable, Sequence
+
+from compliance_bot.schemas.retrieval import ProviderCallMetrics, ProviderStageLatency
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+)
+UNKNOWN_STAGE = "unknown"
+
+
+def _bucket_label(index: int) -> str:
+    if index >= len(LATENCY_BUCKETS_MS):
+        return f"gt_{LATENCY_BUCKETS_MS[-1]:g}"
+    return f"le_{LATENCY_BUCKETS_MS[index]:g}"
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(0, int(round(percentile / 100.0 * len(ordered))) - 1)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def payload_bytes(texts: Iterable[str]) -> int:
+    """UTF-8 size of the texts sent to a provider."""
+
+    return sum(len(text.encode("utf-8")) for text in texts)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with a bounded sample window for percentiles."""
+
+    def __init__(self, stage: str, *, sample_window: int = 4096) -> None:
+        self.stage = stage
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._samples: deque[float] = deque(maxlen=sample_window)
+        self._count = 0
+        self._error_count = 0
+        self._coalesced_count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._payload_bytes = 0
+        self._item_count = 0
+
+    def record(self, metrics: ProviderCallMetrics) -> None:
+        latency = metrics.latency_ms
+        with self._lock:
+            self._bucket_counts[bisect_left(LATENCY_BUCKETS_MS, latency)] += 1
+            self._samples.append(latency)
+            self._count += 1
+            self._error_count += int(metrics.status != "ok")
+            self._coalesced_count += int(metrics.coalesced)
+            self._total_ms += latency
+            self._max_ms = max(self._max_ms, latency)
+            self._payload_bytes += metrics.payload_bytes or 0
+            self._item_count += metrics.item_count or 0
+
+    def snapshot(self) -> ProviderStageLatency:
+        with self._lock:
+            ordered = sorted(self._samples)
+            return ProviderStageLatency(
+                stage=self.stage,
+                count=self._count,
+                error_count=self._error_count,
+                coalesced_count=self._coalesced_count,
+                total_ms=self._total_ms,
+                p50_ms=_percentile(ordered, 50.0),
+                p95_ms=_percentile(ordered, 95.0),
+                max_ms=self._max_ms,
+                payload_bytes=self._payload_bytes,
+                item_count=self._item_count,
+                buckets={
+                    _bucket_label(index): count
+                    for index, count in enumerate(self._bucket_counts)
+                    if count
+                },
+            )
+
+
+def summarize_provider_metrics(
+    metrics: Iterable[ProviderCallMetrics],
+) -> list[ProviderStageLatency]:
+    """Aggregate one request's provider calls into per-stage histograms."""
+
+    histograms: dict[str, LatencyHistogram] = {}
+    for item in metrics:
+        stage = item.stage or UNKNOWN_STAGE
+        histogram = histograms.get(stage)
+        if histogram is None:
+            histogram = histograms[stage] = LatencyHistogram(stage)
+        histogram.record(item)
+    return [histograms[stage].snapshot() for stage in sorted(histograms)]
+
+
+_process_histograms: dict[str, LatencyHistogram] = {}
+_process_lock = threading.Lock()
+
+
+def record_provider_calls(metrics: Iterable[ProviderCallMetrics]) -> None:
+    """Add provider calls to the process-wide histograms."""
+
+    for item in metrics:
+        stage = item.stage or UNKNOWN_STAGE
+        with _process_lock:
+            histogram = _process_histograms.get(stage)
+            if histogram is None:
+                histogram = _process_histograms[stage] = LatencyHistogram(stage)
+        histogram.record(item)
+
+
+def process_latency_snapshot() -> list[ProviderStageLatency]:
+    """Return per-stage histograms for every provider call since process start."""
+
+    with _process_lock:
+        histograms = [_process_histograms[stage] for stage in sorted(_process_histograms)]
+    return [histogram.snapshot() for histogram in histograms]
+
+
+def reset_process_latency() -> None:
+    """Drop all process-wide latency history."""
+
+    with _process_lock:
+        _process_histograms.clear()
@@ -0,0 +1,399 @@
+"""Persistent prompt-level cache of chat model responses.
+
+The answer, query-rewrite, and tool-router chains run at temperature 0, so an
+identical rendered prompt sent to the same model yields the same message. The
+wrapper here stores that message in SQLite keyed by model, temperature, chain
+namespace, and a digest of the rendered prompt, so repeats never reach the
+provider. Entries expire after a TTL and the least recently used ones are evicted
+past ``max_entries``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    cache_key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS llm_responses_lru ON llm_responses (last_used_at)"
+
+
+@dataclass(frozen=True)
+class LLMCacheConfig:
+    """Location and eviction limits of the LLM response cache.
+
+    ``ttl_seconds`` of ``0`` keeps entries until they are evicted as least
+    recently used.
+    """
+
+    path: str
+    max_entries: int = 10_000
+    ttl_seconds: float = 86_400.0
+
+    def __post_init__(self) -> None:
+        if not self.path.strip():
+            raise ValueError("path must not be blank")
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if self.ttl_seconds < 0.0:
+            raise ValueError("ttl_seconds must be >= 0")
+
+
+def load_llm_cache_config(env: Mapping[str, str] | None = None) -> LLMCacheConfig | None:
+    """Load cache settings; ``None`` unless ``COMPLIANCE_LLM_CACHE_PATH`` is set.
+
+    ``COMPLIANCE_LLM_CACHE_MAX_ENTRIES`` and ``COMPLIANCE_LLM_CACHE_TTL_SECONDS``
+    override the eviction limits.
+    """
+
+    source = env if env is not None else os.environ
+    path = source.get("COMPLIANCE_LLM_CACHE_PATH", "").strip()
+    if not path:
+        return None
+    return LLMCacheConfig(
+        path=path,
+        max_entries=int(source.get("COMPLIANCE_LLM_CACHE_MAX_ENTRIES", "10000").strip()),
+        ttl_seconds=float(source.get("COMPLIANCE_LLM_CACHE_TTL_SECONDS", "86400").strip()),
+    )
+
+
+@dataclass(frozen=True)
+class LLMCacheStats:
+    """Counters since the cache was opened; ``entries`` is the current row count."""
+
+    entries: int
+    hits: int
+    misses: int
+    expired: int
+    evicted: int
+
+
+class LLMCacheTally:
+    """Mutable count of cache hits made inside a :func:`track_llm_cache` block."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+_active_tally: ContextVar[LLMCacheTally | None] = ContextVar(
+    "compliance_bot_llm_cache_tally",
+    default=None,
+)
+
+
+@contextmanager
+def track_llm_cache() -> Iterator[LLMCacheTally]:
+    """Count LLM cache hits and misses within this block, like ``track_coalescing``."""
+
+    tally = LLMCacheTally()
+    token = _active_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _active_tally.reset(token)
+
+
+class LLMResponseCache:
+    """SQLite store of serialized chat messages with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        config: LLMCacheConfig,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.config = config
+        if config.path != ":memory:":
+            Path(config.path).parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(config.path, check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+        self._connection.execute(_INDEX)
+        self._connection.commit()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> LLMResponseCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _count(self, *, hit: bool) -> None:
+        tally = _active_tally.get()
+        if hit:
+            self._hits += 1
+            if tally is not None:
+                tally.hits += 1
+        else:
+            self._misses += 1
+            if tally is not None:
+                tally.misses += 1
+
+    def get(self, cache_key: str) -> BaseMessage | None:
+        """Return the cached message for ``cache_key`` and mark it recently used."""
+
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is not None and self.config.ttl_seconds and (
+                now - row[1] >= self.config.ttl_seconds
+            ):
+                self._connection.execute(
+                    "DELETE FROM llm_responses WHERE cache_key = ?",
+                    (cache_key,),
+                )
+                self._connection.commit()
+                self._expired += 1
+                row = None
+            if row is None:
+                self._count(hit=False)
+                return None
+            self._connection.execute(
+                "UPDATE llm_responses SET last_used_at = ? WHERE cache_key = ?",
+                (now, cache_key),
+            )
+            self._connection.commit()
+            self._count(hit=True)
+        return messages_from_dict([json.loads(row[0])])[0]
+
+    def put(self, cache_key: str, message: BaseMessage, *, namespace: str, model: str) -> None:
+        """Store ``message`` and evict the least recently used entries over the limit."""
+
+        now = self._clock()
+        encoded = json.dumps(message_to_dict(message), sort_keys=True, ensure_ascii=False)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(cache_key, namespace, model, response, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key, namespace, model, encoded, now, now),
+            )
+            self._evicted += self._connection.execute(
+                "DELETE FROM llm_responses WHERE cache_key IN ("
+                "SELECT cache_key FROM llm_responses "
+                "ORDER BY last_used_at DESC, created_at DESC LIMIT -1 OFFSET ?)",
+                (self.config.max_entries,),
+            ).rowcount
+            self._connection.commit()
+
+    def invalidate(self, namespace: str | None = None) -> int:
+        """Delete every entry (or those of one namespace); return rows removed."""
+
+        with self._lock:
+            if namespace is None:
+                removed = self._connection.execute("DELETE FROM llm_responses").rowcount
+            else:
+                removed = self._connection.execute(
+                    "DELETE FROM llm_responses WHERE namespace = ?",
+                    (namespace,),
+                ).rowcount
+            self._connection.commit()
+        return int(removed)
+
+    def stats(self) -> LLMCacheStats:
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            return LLMCacheStats(
+                entries=int(entries[0]),
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                evicted=self._evicted,
+            )
+
+
+_caches: dict[LLMCacheConfig, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(config: LLMCacheConfig) -> LLMResponseCache:
+    """Return the process-wide cache opened for ``config``."""
+
+    with _caches_lock:
+        cache = _caches.get(config)
+        if cache is None:
+            cache = _caches[config] = LLMResponseCache(config)
+        return cache
+
+
+def reset_llm_caches() -> None:
+    """Close and drop every process-wide LLM response cache."""
+
+    with _caches_lock:
+        caches = list(_caches.values())
+        _caches.clear()
+    for cache in caches:
+        cache.close()
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _rendered_prompt(value: Any) -> Any:
+    to_messages = getattr(value, "to_messages", None)
+    if to_messages is not None:
+        return [message_to_dict(message) for message in to_messages()]
+    if isinstance(value, BaseMessage):
+        return [message_to_dict(value)]
+    if isinstance(value, list) and all(isinstance(item, BaseMessage) for item in value):
+        return [message_to_dict(item) for item in value]
+    return value
+
+
+class CachedChatModel(Runnable[Any, Any]):
+    """Chat model wrapper answering repeated prompts from an :class:`LLMResponseCache`.
+
+    Only message results are stored, so the wrapped chain's output type is
+    unchanged. ``stream`` always reaches the model. Use :meth:`with_namespace`
+    to keep one chain's entries apart from another's (and to drop them together).
+    """
+
+    def __init__(
+        self,
+        inner: Runnable[Any, Any],
+        cache: LLMResponseCache,
+        *,
+        model: str,
+        temperature: float,
+        namespace: str = "default",
+        tools_digest: str = "",
+    ) -> None:
+        self._inner = inner
+        self.cache = cache
+        self.model = model
+        self.temperature = temperature
+        self.namespace = namespace
+        self._tools_digest = tools_digest
+
+    @property
+    def circuit_state(self) -> str | None:
+        return getattr(self._inner, "circuit_state", None)
+
+    def with_namespace(self, namespace: str) -> CachedChatModel:
+        return CachedChatModel(
+            self._inner,
+            self.cache,
+            model=self.model,
+            temperature=self.temperature,
+            namespace=namespace,
+            tools_digest=self._tools_digest,
+        )
+
+    def cache_key(self, value: Any, kwargs: Mapping[str, Any]) -> str:
+        return _digest(
+            {
+                "model": self.model,
+                "temperature": self.temperature,
+                "namespace": self.namespace,
+                "tools": self._tools_digest,
+                "prompt_sha256": _digest(_rendered_prompt(value)),
+                "kwargs": kwargs,
+            }
+        )
+
+    def _store(self, cache_key: str, result: Any) -> Any:
+        if isinstance(result, BaseMessage):
+            self.cache.put(cache_key, result, namespace=self.namespace, model=self.model)
+        return result
+
+    def invoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        cache_key = self.cache_key(input, kwargs)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self._store(cache_key, self._inner.invoke(input, config, **kwargs))
+
+    async def ainvoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Async :meth:`invoke`; SQLite reads and writes run off the event loop."""
+
+        cache_key = self.cache_key(input, kwargs)
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is not None:
+            return cached
+        result = await self._inner.ainvoke(input, config, **kwargs)
+        return await asyncio.to_thread(self._store, cache_key, result)
+
+    def stream(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Pass streams straight through; streamed answers are neither read nor stored."""
+
+        yield from self._inner.stream(input, config, **kwargs)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> CachedChatModel:
+        schemas = [convert_to_openai_tool(tool) for tool in tools]
+        return CachedChatModel(
+            self._inner.bind_tools(tools, **kwargs),
+            self.cache,
+            model=self.model,
+            temperature=self.temperature,
+            namespace=self.namespace,
+            tools_digest=_digest({"tools": schemas, "kwargs": kwargs}),
+        )
+
+
+def cache_chat_model(
+    inner: Runnable[Any, Any],
+    config: LLMCacheConfig,
+    *,
+    model: str,
+    temperature: float,
+) -> CachedChatModel:
+    return CachedChatModel(inner, get_llm_cache(config), model=model, temperature=temperature)
+
+
+def scope_llm_cache(llm: Runnable[Any, Any], namespace: str) -> Runnable[Any, Any]:
+    """Give a cached ``llm`` its own namespace; other runnables are returned unchanged."""
+
+    if isinstance(llm, CachedChatModel):
+        return llm.with_namespace(namespace)
+    return llm
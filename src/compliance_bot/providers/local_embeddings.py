@@ -0,0 +1,172 @@
+"""Offline hashed n-gram embedding provider for network-free dense retrieval."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_PROJECTION_CACHE_LIMIT = 200_000
+
+
+@dataclass(frozen=True)
+class LocalEmbeddingConfig:
+    """Hashed n-gram embedder settings.
+
+    Word unigrams/bigrams and within-word character n-grams are hashed into a
+    sparse feature space, weighted by sublinear term frequency, and projected to
+    ``dim`` dimensions with a sparse random projection (each feature adds a
+    signed unit to ``projections_per_feature`` output coordinates). Vectors are
+    L2-normalised. No corpus statistics are used, so a text always maps to the
+    same vector and cached vectors stay valid across index rebuilds.
+    """
+
+    dim: int = 256
+    char_ngram: int = 3
+    projections_per_feature: int = 4
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.seed < 0:
+            raise ValueError("seed must be >= 0")
+        if self.dim < 8:
+            raise ValueError("dim must be >= 8")
+        if self.char_ngram < 2:
+            raise ValueError("char_ngram must be >= 2")
+        if not 1 <= self.projections_per_feature <= self.dim:
+            raise ValueError("projections_per_feature must be within [1, dim]")
+
+    @property
+    def model(self) -> str:
+        return (
+            f"local-hash-ngram-v1-d{self.dim}-c{self.char_ngram}"
+            f"-p{self.projections_per_feature}-s{self.seed}"
+        )
+
+
+def load_local_embedding_config(env: Mapping[str, str] | None = None) -> LocalEmbeddingConfig:
+    """Load local embedder settings from environment."""
+
+    source = env if env is not None else os.environ
+    return LocalEmbeddingConfig(
+        dim=int(source.get("COMPLIANCE_LOCAL_EMBEDDING_DIM", "256").strip()),
+        seed=int(source.get("COMPLIANCE_LOCAL_EMBEDDING_SEED", "0").strip()),
+    )
+
+
+def _load_numpy() -> Any | None:
+    try:
+        return importlib.import_module("numpy")
+    except ModuleNotFoundError:
+        return None
+
+
+def extract_features(text: str, *, char_ngram: int = 3) -> Counter[str]:
+    """Return word unigram/bigram and character n-gram counts for ``text``."""
+
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    features: Counter[str] = Counter()
+    for token in tokens:
+        features[f"w:{token}"] += 1
+        padded = f"<{token}>"
+        for start in range(max(1, len(padded) - char_ngram + 1)):
+            features[f"c:{padded[start:start + char_ngram]}"] += 1
+    for left, right in zip(tokens, tokens[1:]):
+        features[f"b:{left}_{right}"] += 1
+    return features
+
+
+class LocalHashEmbeddingProvider:
+    """CPU-only embedder implementing the embedding provider protocols.
+
+    Batches are vectorised with NumPy when it is installed; otherwise the same
+    projection runs in pure Python and yields the same vectors up to float rounding.
+    """
+
+    provider_name = "local"
+
+    def __init__(self, config: LocalEmbeddingConfig | None = None) -> None:
+        self.config = config or LocalEmbeddingConfig()
+        self.model = self.config.model
+        self._numpy = _load_numpy()
+        self._projection_cache: dict[str, tuple[tuple[int, float], ...]] = {}
+
+    def _projection(self, feature: str) -> tuple[tuple[int, float], ...]:
+        cached = self._projection_cache.get(feature)
+        if cached is not None:
+            return cached
+        digest = hashlib.blake2b(
+            feature.encode("utf-8"),
+            digest_size=4 * self.config.projections_per_feature,
+            salt=self.config.seed.to_bytes(8, "little"),
+        ).digest()
+        scale = 1.0 / math.sqrt(self.config.projections_per_feature)
+        entries: list[tuple[int, float]] = []
+        for offset in range(0, len(digest), 4):
+            value = int.from_bytes(digest[offset : offset + 4], "little")
+            sign = scale if value & 1 else -scale
+            entries.append(((value >> 1) % self.config.dim, sign))
+        projection = tuple(entries)
+        if len(self._projection_cache) >= _PROJECTION_CACHE_LIMIT:
+            self._projection_cache.clear()
+        self._projection_cache[feature] = projection
+        return projection
+
+    def _sparse_rows(self, texts: list[str]) -> list[list[tuple[int, float]]]:
+        rows: list[list[tuple[int, float]]] = []
+        for text in texts:
+            row: list[tuple[int, float]] = []
+            features = extract_features(text, char_ngram=self.config.char_ngram)
+            for feature, count in features.items():
+                weight = 1.0 + math.log(count)
+                row.extend((column, sign * weight) for column, sign in self._projection(feature))
+            rows.append(row)
+        return rows
+
+    def _project_numpy(self, rows: list[list[tuple[int, float]]]) -> list[list[float]]:
+        np = self._numpy
+        matrix = np.zeros((len(rows), self.config.dim), dtype=np.float64)
+        row_index = np.repeat(np.arange(len(rows)), [len(row) for row in rows])
+        flat = [entry for row in rows for entry in row]
+        if flat:
+            columns = np.fromiter((column for column, _ in flat), dtype=np.int64, count=len(flat))
+            values = np.fromiter((value for _, value in flat), dtype=np.float64, count=len(flat))
+            np.add.at(matrix, (row_index, columns), values)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return (matrix / norms).tolist()
+
+    def _project_python(self, rows: list[list[tuple[int, float]]]) -> list[list[float]]:
+        vectors: list[list[float]] = []
+        for row in rows:
+            vector = [0.0] * self.config.dim
+            for column, value in row:
+                vector[column] += value
+            norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+            vectors.append([value / norm for value in vector])
+        return vectors
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        rows = self._sparse_rows(texts)
+        if self._numpy is not None:
+            return self._project_numpy(rows)
+        return self._project_python(rows)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def build_local_embedding_provider(
+    config: LocalEmbeddingConfig | None = None,
+) -> LocalHashEmbeddingProvider:
+    """Create the offline hashed n-gram embedding provider."""
+
+    return LocalHashEmbeddingProvider(config or load_local_embedding_config())
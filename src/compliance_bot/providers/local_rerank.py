@@ -0,0 +1,187 @@
+"""In-process lexical reranker implementing the rerank provider protocol."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Mapping
+
+from compliance_bot.schemas.retrieval import ProviderCallMetrics, RerankResult
+
+LOCAL_RERANK_MODEL = "local-bm25-proximity-v1"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class LocalRerankConfig:
+    """Scoring weights for the local reranker.
+
+    A candidate's score is ``coverage * (0.5 + 0.5 * blend)`` where ``coverage``
+    is the fraction of distinct query terms it contains (the same scale as the
+    retriever's lexical score, so ``min_score_for_answer`` keeps its meaning) and
+    ``blend`` mixes saturated BM25, term proximity, and metadata field matches,
+    each already in [0, 1].
+    """
+
+    k1: float = 1.2
+    b: float = 0.75
+    bm25_weight: float = 0.6
+    proximity_weight: float = 0.25
+    field_weight: float = 0.15
+    boost_fields: tuple[str, ...] = ("title", "section", "policy_scope")
+
+    def __post_init__(self) -> None:
+        if self.k1 <= 0.0:
+            raise ValueError("k1 must be > 0")
+        if not 0.0 <= self.b <= 1.0:
+            raise ValueError("b must be within [0, 1]")
+        weights = (self.bm25_weight, self.proximity_weight, self.field_weight)
+        if any(weight < 0.0 for weight in weights) or not math.isclose(sum(weights), 1.0):
+            raise ValueError("bm25, proximity, and field weights must be >= 0 and sum to 1")
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _proximity(positions: Mapping[str, list[int]]) -> float:
+    """Distinct matched terms divided by the shortest token span containing them all."""
+
+    if len(positions) <= 1:
+        return 1.0 if positions else 0.0
+
+    events = sorted((position, term) for term, items in positions.items() for position in items)
+    needed = len(positions)
+    counts: Counter[str] = Counter()
+    covered = 0
+    best_span = math.inf
+    left = 0
+    for right_position, term in events:
+        if counts[term] == 0:
+            covered += 1
+        counts[term] += 1
+        while covered == needed:
+            left_position, left_term = events[left]
+            best_span = min(best_span, right_position - left_position + 1)
+            counts[left_term] -= 1
+            if counts[left_term] == 0:
+                covered -= 1
+            left += 1
+    return needed / best_span
+
+
+class LocalRerankProvider:
+    """BM25 over the candidate window plus proximity and field boosts, no network.
+
+    IDF is computed over the candidates being reranked, so common terms in the
+    window carry little weight. Pass ``candidate_fields`` (one metadata mapping
+    per candidate) to enable section/title boosts.
+    """
+
+    provider_name = "local"
+    uses_candidate_fields = True
+
+    def __init__(self, config: LocalRerankConfig | None = None) -> None:
+        self.config = config or LocalRerankConfig()
+        self.model = LOCAL_RERANK_MODEL
+
+    def score(
+        self,
+        query: str,
+        candidates: list[str],
+        *,
+        candidate_fields: list[Mapping[str, str]] | None = None,
+    ) -> list[float]:
+        """Return a calibrated [0, 1] score per candidate."""
+
+        query_terms = list(dict.fromkeys(_tokenize(query)))
+        if not query_terms or not candidates:
+            return [0.0 for _ in candidates]
+
+        documents = [_tokenize(candidate) for candidate in candidates]
+        term_counts = [Counter(tokens) for tokens in documents]
+        avg_length = (sum(len(tokens) for tokens in documents) / len(documents)) or 1.0
+        total = len(documents)
+        document_frequency = {
+            term: sum(1 for counts in term_counts if term in counts) for term in query_terms
+        }
+        idf = {
+            term: math.log(1.0 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+        idf_total = sum(idf.values()) or 1.0
+        k1 = self.config.k1
+
+        scores: list[float] = []
+        for position, (tokens, counts) in enumerate(zip(documents, term_counts, strict=True)):
+            matched = [term for term in query_terms if term in counts]
+            if not matched:
+                scores.append(0.0)
+                continue
+
+            length_norm = 1.0 - self.config.b + self.config.b * len(tokens) / avg_length
+            bm25 = sum(
+                idf[term] * counts[term] / (counts[term] + k1 * length_norm) for term in matched
+            )
+            bm25_normalized = bm25 / idf_total
+
+            term_positions: dict[str, list[int]] = {}
+            for token_position, token in enumerate(tokens):
+                if token in idf:
+                    term_positions.setdefault(token, []).append(token_position)
+            proximity = _proximity(term_positions)
+
+            field_score = 0.0
+            if candidate_fields is not None:
+                fields = candidate_fields[position]
+                field_terms: set[str] = set()
+                for name in self.config.boost_fields:
+                    field_terms.update(_tokenize(str(fields.get(name, ""))))
+                field_score = sum(1 for term in query_terms if term in field_terms) / len(
+                    query_terms
+                )
+
+            blend = (
+                self.config.bm25_weight * bm25_normalized
+                + self.config.proximity_weight * proximity
+                + self.config.field_weight * field_score
+            )
+            coverage = len(matched) / len(query_terms)
+            scores.append(max(0.0, min(1.0, coverage * (0.5 + 0.5 * blend))))
+        return scores
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None = None,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
+        if top_n <= 0:
+            raise ValueError("top_n must be > 0")
+        if candidate_fields is not None and len(candidate_fields) != len(candidates):
+            raise ValueError("candidate_fields must align with candidates")
+
+        start = perf_counter()
+        scores = self.score(query, candidates, candidate_fields=candidate_fields)
+        ranked = sorted(range(len(candidates)), key=lambda index: (-scores[index], index))
+        results = [
+            RerankResult(candidate_index=index, score=scores[index]) for index in ranked[:top_n]
+        ]
+        return results, ProviderCallMetrics(
+            provider=self.provider_name,
+            model=self.model,
+            latency_ms=(perf_counter() - start) * 1000.0,
+            status="ok",
+        )
+
+
+def build_local_rerank_provider(config: LocalRerankConfig | None = None) -> LocalRerankProvider:
+    """Create the in-process local reranker."""
+
+    return LocalRerankProvider(config)
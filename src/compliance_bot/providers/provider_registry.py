@@ -5,6 +5,30 @@ from __future__ import annotations
 import os
 from typing import Mapping
 
+from compliance_bot.providers.local_embeddings import (
+    LocalHashEmbeddingProvider,
+    build_local_embedding_provider,
+    load_local_embedding_config,
+)
+from compliance_bot.providers.local_rerank import (
+    LocalRerankProvider,
+    build_local_rerank_provider,
+)
+from compliance_bot.providers.resilience import (
+    ResilientEmbeddingProvider,
+    ResilientRerankProvider,
+    load_resilience_config,
+    resilience_enabled,
+    wrap_embedding_provider,
+    wrap_rerank_provider,
+)
+from compliance_bot.providers.single_flight import (
+    CoalescingEmbeddingProvider,
+    CoalescingRerankProvider,
+    coalesce_embedding_provider,
+    coalesce_rerank_provider,
+    single_flight_enabled,
+)
 from compliance_bot.providers.siliconflow_embeddings import (
     SiliconFlowEmbeddingProvider,
     build_siliconflow_embedding_provider,
@@ -16,33 +40,84 @@ from compliance_bot.providers.siliconflow_rerank import (
     load_siliconflow_rerank_config,
 )
 
+EMBEDDING_PROVIDER_MODES = ("auto", "none", "siliconflow", "local")
+RERANK_PROVIDER_MODES = ("auto", "none", "siliconflow", "local")
+
 
 def _has_siliconflow_key(env: Mapping[str, str]) -> bool:
     return bool(env.get("SILICONFLOW_API_KEY", "").strip())
 
 
+RemoteEmbeddingProvider = (
+    SiliconFlowEmbeddingProvider | ResilientEmbeddingProvider | CoalescingEmbeddingProvider
+)
+RemoteRerankProvider = (
+    SiliconFlowRerankProvider | ResilientRerankProvider | CoalescingRerankProvider
+)
+
+
+def _guard_embedding_provider(
+    provider: SiliconFlowEmbeddingProvider,
+    env: Mapping[str, str],
+) -> RemoteEmbeddingProvider:
+    guarded: RemoteEmbeddingProvider = provider
+    if resilience_enabled(env):
+        guarded = wrap_embedding_provider(provider, load_resilience_config(env))
+    if single_flight_enabled(env):
+        guarded = coalesce_embedding_provider(guarded)
+    return guarded
+
+
+def _guard_rerank_provider(
+    provider: SiliconFlowRerankProvider,
+    env: Mapping[str, str],
+) -> RemoteRerankProvider:
+    guarded: RemoteRerankProvider = provider
+    if resilience_enabled(env):
+        guarded = wrap_rerank_provider(
+            provider,
+            load_resilience_config(env),
+            fallback=build_local_rerank_provider(),
+        )
+    if single_flight_enabled(env):
+        guarded = coalesce_rerank_provider(guarded)
+    return guarded
+
+
 def resolve_embedding_provider(
     mode: str = "auto",
     *,
     env: Mapping[str, str] | None = None,
-) -> SiliconFlowEmbeddingProvider | None:
-    """Resolve embedding provider from mode and environment."""
+) -> RemoteEmbeddingProvider | LocalHashEmbeddingProvider | None:
+    """Resolve embedding provider from mode and environment.
+
+    ``local`` selects the offline hashed n-gram embedder. With
+    ``COMPLIANCE_PROVIDER_RESILIENCE=1`` the provider is wrapped with hedged query
+    embeddings and a circuit breaker; with ``COMPLIANCE_PROVIDER_SINGLE_FLIGHT=1``
+    identical concurrent calls are coalesced.
+    """
 
     source = env if env is not None else os.environ
     normalized_mode = mode.strip().lower()
-    if normalized_mode not in {"auto", "none", "siliconflow"}:
-        raise ValueError("embedding provider mode must be one of: auto, none, siliconflow")
+    if normalized_mode not in EMBEDDING_PROVIDER_MODES:
+        raise ValueError(
+            "embedding provider mode must be one of: " + ", ".join(EMBEDDING_PROVIDER_MODES)
+        )
 
     if normalized_mode == "none":
         return None
+    if normalized_mode == "local":
+        return build_local_embedding_provider(load_local_embedding_config(source))
     if normalized_mode == "siliconflow":
-        return build_siliconflow_embedding_provider(
-            load_siliconflow_embedding_config(source)
+        return _guard_embedding_provider(
+            build_siliconflow_embedding_provider(load_siliconflow_embedding_config(source)),
+            source,
         )
 
     if _has_siliconflow_key(source):
-        return build_siliconflow_embedding_provider(
-            load_siliconflow_embedding_config(source)
+        return _guard_embedding_provider(
+            build_siliconflow_embedding_provider(load_siliconflow_embedding_config(source)),
+            source,
         )
     return None
 
@@ -51,19 +126,35 @@ def resolve_rerank_provider(
     mode: str = "auto",
     *,
     env: Mapping[str, str] | None = None,
-) -> SiliconFlowRerankProvider | None:
-    """Resolve rerank provider from mode and environment."""
+) -> RemoteRerankProvider | LocalRerankProvider | None:
+    """Resolve rerank provider from mode and environment.
+
+    ``local`` selects the in-process BM25/proximity reranker. With
+    ``COMPLIANCE_PROVIDER_RESILIENCE=1`` the remote provider is wrapped with hedged
+    requests and a circuit breaker that falls back to the local reranker while open;
+    with ``COMPLIANCE_PROVIDER_SINGLE_FLIGHT=1`` identical concurrent calls are coalesced.
+    """
 
     source = env if env is not None else os.environ
     normalized_mode = mode.strip().lower()
-    if normalized_mode not in {"auto", "none", "siliconflow"}:
-        raise ValueError("rerank provider mode must be one of: auto, none, siliconflow")
+    if normalized_mode not in RERANK_PROVIDER_MODES:
+        raise ValueError(
+            "rerank provider mode must be one of: " + ", ".join(RERANK_PROVIDER_MODES)
+        )
 
     if normalized_mode == "none":
         return None
+    if normalized_mode == "local":
+        return build_local_rerank_provider()
     if normalized_mode == "siliconflow":
-        return build_siliconflow_rerank_provider(load_siliconflow_rerank_config(source))
+        return _guard_rerank_provider(
+            build_siliconflow_rerank_provider(load_siliconflow_rerank_config(source)),
+            source,
+        )
 
     if _has_siliconflow_key(source):
-        return build_siliconflow_rerank_provider(load_siliconflow_rerank_config(source))
+        return _guard_rerank_provider(
+            build_siliconflow_rerank_provider(load_siliconflow_rerank_config(source)),
+            source,
+        )
     return None
@@ -0,0 +1,528 @@
+"""Client-side token-bucket rate limiting with AIMD concurrency control for SiliconFlow."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterator, Mapping, TypeVar
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from compliance_bot.schemas.retrieval import RateLimitMetrics
+
+T = TypeVar("T")
+
+# Environment prefixes per call kind, mirroring SILICONFLOW_MODEL,
+# SILICONFLOW_EMBEDDING_MODEL, and SILICONFLOW_RERANK_MODEL.
+RATE_LIMIT_ENV_PREFIXES = {
+    "chat": "SILICONFLOW",
+    "embedding": "SILICONFLOW_EMBEDDING",
+    "rerank": "SILICONFLOW_RERANK",
+}
+
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class RateLimitTimeoutError(TimeoutError):
+    """Raised when no request slot frees up within ``acquire_timeout_seconds``."""
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Token bucket and AIMD concurrency settings for one provider model.
+
+    ``requests_per_second`` of ``0`` disables the token bucket. The concurrency
+    limit starts at ``max_concurrency``, grows by about one slot per window of
+    successful calls, and is multiplied by ``decrease_factor`` (at most once per
+    ``backoff_seconds``) on HTTP 429 or timeout. A 429 also pauses new requests
+    for its ``Retry-After`` (or ``backoff_seconds``). 429s, 5xx responses, and
+    connection errors are retried up to ``max_retries`` times through the
+    limiter (5xx and connection errors after an exponential backoff starting at
+    ``backoff_seconds``, since provider clients run with their own retries off);
+    timeouts are not retried.
+    """
+
+    requests_per_second: float = 0.0
+    burst: int = 1
+    max_concurrency: int = 16
+    min_concurrency: int = 1
+    decrease_factor: float = 0.5
+    backoff_seconds: float = 1.0
+    max_retries: int = 2
+    acquire_timeout_seconds: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.requests_per_second < 0.0:
+            raise ValueError("requests_per_second must be >= 0")
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+        if not 1 <= self.min_concurrency <= self.max_concurrency:
+            raise ValueError("min_concurrency must be within [1, max_concurrency]")
+        if not 0.0 < self.decrease_factor < 1.0:
+            raise ValueError("decrease_factor must be within (0, 1)")
+        if self.backoff_seconds < 0.0:
+            raise ValueError("backoff_seconds must be >= 0")
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if self.acquire_timeout_seconds <= 0.0:
+            raise ValueError("acquire_timeout_seconds must be > 0")
+
+
+def load_rate_limit_config(
+    kind: str,
+    env: Mapping[str, str] | None = None,
+) -> RateLimitConfig:
+    """Load limiter settings for ``kind`` (chat, embedding, rerank) from environment.
+
+    Reads ``<PREFIX>_RPS``, ``<PREFIX>_BURST``, ``<PREFIX>_MAX_CONCURRENCY``,
+    ``<PREFIX>_MIN_CONCURRENCY``, and ``<PREFIX>_MAX_RETRIES`` where the prefix
+    is ``SILICONFLOW`` for chat, ``SILICONFLOW_EMBEDDING`` for embeddings, and
+    ``SILICONFLOW_RERANK`` for rerank.
+    """
+
+    if kind not in RATE_LIMIT_ENV_PREFIXES:
+        raise ValueError("rate limit kind must be one of: " + ", ".join(RATE_LIMIT_ENV_PREFIXES))
+    source = env if env is not None else os.environ
+    prefix = RATE_LIMIT_ENV_PREFIXES[kind]
+    requests_per_second = float(source.get(f"{prefix}_RPS", "0").strip())
+    default_burst = str(max(1, math.ceil(requests_per_second)))
+    return RateLimitConfig(
+        requests_per_second=requests_per_second,
+        burst=int(source.get(f"{prefix}_BURST", default_burst).strip()),
+        max_concurrency=int(source.get(f"{prefix}_MAX_CONCURRENCY", "16").strip()),
+        min_concurrency=int(source.get(f"{prefix}_MIN_CONCURRENCY", "1").strip()),
+        max_retries=int(source.get(f"{prefix}_MAX_RETRIES", "2").strip()),
+    )
+
+
+def _status_code(error: BaseException) -> int | None:
+    for attribute in ("status_code", "code", "status"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_rate_limited_error(error: BaseException) -> bool:
+    """True for HTTP 429 from urllib, httpx, or the OpenAI client."""
+
+    return _status_code(error) == 429 or type(error).__name__ == "RateLimitError"
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """True for socket, asyncio, httpx, and OpenAI client timeouts."""
+
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """True for HTTP 5xx and connection failures that are worth retrying."""
+
+    status = _status_code(error)
+    if status is not None:
+        return status >= 500
+    if is_timeout_error(error):
+        return False
+    # urllib wraps a refused or reset connection in URLError.reason.
+    cause = getattr(error, "reason", error)
+    if isinstance(cause, BaseException) and is_timeout_error(cause):
+        return False
+    return isinstance(cause, ConnectionError) or "Connect" in type(error).__name__
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Parse a numeric ``Retry-After`` header from an HTTP error, if present."""
+
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = float(headers.get("Retry-After", ""))
+    except (TypeError, ValueError):
+        return None
+    return min(max(value, 0.0), _MAX_RETRY_AFTER_SECONDS)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket plus AIMD concurrency gate shared by every call to one model.
+
+    Threaded callers block on a condition variable. Async callers sleep until
+    the next token refill or pause ends, or await a wake-up from :meth:`release`
+    when every slot is taken, so the event loop is never blocked or busy-polled.
+    Both draw from the same tokens and slots.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        model: str,
+        config: RateLimitConfig,
+        *,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.kind = kind
+        self.model = model
+        self.config = config
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._tokens = float(config.burst)
+        self._refilled_at = clock()
+        self._limit = float(config.max_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = -math.inf
+        self._throttled = 0
+        self._rate_limited = 0
+        self._timeouts = 0
+        self._retries = 0
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    @property
+    def concurrency_limit(self) -> float:
+        with self._condition:
+            return self._limit
+
+    def reconfigure(self, config: RateLimitConfig) -> None:
+        """Apply new settings in place, keeping in-flight counts and the learned limit."""
+
+        with self._condition:
+            now = self._clock()
+            self._refill(now)
+            self.config = config
+            self._tokens = min(self._tokens, float(config.burst))
+            self._limit = min(
+                float(config.max_concurrency),
+                max(float(config.min_concurrency), self._limit),
+            )
+            self._notify()
+
+    def _notify(self) -> None:
+        # Caller holds self._condition.
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # The waiter's loop has closed; nothing is awaiting it.
+
+    def _refill(self, now: float) -> None:
+        rate = self.config.requests_per_second
+        if rate > 0.0:
+            elapsed = max(0.0, now - self._refilled_at)
+            self._tokens = min(float(self.config.burst), self._tokens + elapsed * rate)
+        self._refilled_at = now
+
+    def _try_acquire(self) -> float | None:
+        """Take a slot and a token; else return seconds to wait (``None``: until a release)."""
+
+        # Caller holds self._condition.
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= max(1, int(self._limit)):
+            return None
+        if self.config.requests_per_second > 0.0:
+            self._refill(now)
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self.config.requests_per_second
+            self._tokens -= 1.0
+        self._in_flight += 1
+        return 0.0
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+
+        deadline = self._clock() + self.config.acquire_timeout_seconds
+        waited = False
+        with self._condition:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0.0:
+                    self._throttled += int(waited)
+                    return
+                remaining = deadline - self._clock()
+                if remaining <= 0.0:
+                    raise RateLimitTimeoutError(
+                        f"{self.kind} rate limiter for {self.model} had no free slot "
+                        f"within {self.config.acquire_timeout_seconds}s"
+                    )
+                waited = True
+                self._condition.wait(remaining if wait is None else min(wait, remaining))
+
+    async def aacquire(self) -> None:
+        """Async :meth:`acquire`."""
+
+        loop = asyncio.get_running_loop()
+        deadline = self._clock() + self.config.acquire_timeout_seconds
+        waited = False
+        while True:
+            waiter: asyncio.Future[None] | None = None
+            with self._condition:
+                wait = self._try_acquire()
+                if wait == 0.0:
+                    self._throttled += int(waited)
+                    return
+                if wait is None:
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+            remaining = deadline - self._clock()
+            if remaining <= 0.0:
+                self._discard_waiter(waiter)
+                raise RateLimitTimeoutError(
+                    f"{self.kind} rate limiter for {self.model} had no free slot "
+                    f"within {self.config.acquire_timeout_seconds}s"
+                )
+            waited = True
+            if waiter is None:
+                await asyncio.sleep(min(wait or 0.0, remaining))
+                continue
+            try:
+                await asyncio.wait({waiter}, timeout=remaining)
+            finally:
+                self._discard_waiter(waiter)
+
+    def _discard_waiter(self, waiter: asyncio.Future[None] | None) -> None:
+        if waiter is None:
+            return
+        with self._condition:
+            self._async_waiters = [item for item in self._async_waiters if item[1] is not waiter]
+
+    def release(self, error: BaseException | None = None) -> bool:
+        """Free the slot and adapt limits; returns True when ``error`` should be retried.
+
+        429s, 5xx responses, and connection errors are retryable; timeouts are not.
+        """
+
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            now = self._clock()
+            retry = False
+            if error is None:
+                self._limit = min(
+                    float(self.config.max_concurrency),
+                    self._limit + 1.0 / max(self._limit, 1.0),
+                )
+            elif is_rate_limited_error(error):
+                self._rate_limited += 1
+                self._decrease(now)
+                pause = retry_after_seconds(error)
+                self._paused_until = max(
+                    self._paused_until,
+                    now + (self.config.backoff_seconds if pause is None else pause),
+                )
+                retry = True
+            elif is_timeout_error(error):
+                self._timeouts += 1
+                self._decrease(now)
+            elif is_transient_error(error):
+                retry = True
+            self._notify()
+            return retry
+
+    def abandon(self) -> None:
+        """Free the slot of a call that was cancelled or interrupted, without adapting limits.
+
+        Such a call says nothing about the provider's capacity, so it neither
+        grows the concurrency limit like a success nor shrinks it like a 429.
+        """
+
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._notify()
+
+    def _decrease(self, now: float) -> None:
+        # Concurrent failures from one overload episode only shrink the limit once.
+        if now - self._last_decrease < self.config.backoff_seconds:
+            return
+        self._last_decrease = now
+        self._limit = max(
+            float(self.config.min_concurrency),
+            self._limit * self.config.decrease_factor,
+        )
+
+    def _count_retry(self, error: BaseException, attempt: int) -> float:
+        """Count a retry and return how long to back off before it."""
+
+        with self._condition:
+            self._retries += 1
+        if is_rate_limited_error(error):
+            return 0.0  # release() already paused the whole limiter.
+        return min(self.config.backoff_seconds * 2.0**attempt, _MAX_RETRY_AFTER_SECONDS)
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run ``fn`` under the limiter, retrying rate-limited attempts.
+
+        The slot is always released; ``KeyboardInterrupt`` and other
+        non-``Exception`` exits go through :meth:`abandon`.
+        """
+
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = fn()
+            except BaseException as exc:
+                if not isinstance(exc, Exception):
+                    self.abandon()
+                    raise
+                if not self.release(exc) or attempt >= self.config.max_retries:
+                    raise
+                delay = self._count_retry(exc, attempt)
+                attempt += 1
+                if delay > 0.0:
+                    time.sleep(delay)
+                continue
+            self.release()
+            return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async :meth:`call`; a cancelled call frees its slot through :meth:`abandon`."""
+
+        attempt = 0
+        while True:
+            await self.aacquire()
+            try:
+                result = await fn()
+            except BaseException as exc:
+                if not isinstance(exc, Exception):
+                    # Cancelled (e.g. by a caller's timeout) or interrupted.
+                    self.abandon()
+                    raise
+                if not self.release(exc) or attempt >= self.config.max_retries:
+                    raise
+                delay = self._count_retry(exc, attempt)
+                attempt += 1
+                if delay > 0.0:
+                    await asyncio.sleep(delay)
+                continue
+            self.release()
+            return result
+
+    def snapshot(self) -> RateLimitMetrics:
+        with self._condition:
+            now = self._clock()
+            self._refill(now)
+            return RateLimitMetrics(
+                kind=self.kind,
+                model=self.model,
+                requests_per_second=self.config.requests_per_second,
+                burst=self.config.burst,
+                available_tokens=(
+                    self._tokens
+                    if self.config.requests_per_second > 0.0
+                    else float(self.config.burst)
+                ),
+                concurrency_limit=self._limit,
+                max_concurrency=self.config.max_concurrency,
+                in_flight=self._in_flight,
+                paused_ms=max(0.0, self._paused_until - now) * 1000.0,
+                throttled_count=self._throttled,
+                rate_limited_count=self._rate_limited,
+                timeout_count=self._timeouts,
+                retry_count=self._retries,
+            )
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_limiters: dict[tuple[str, str], AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(kind: str, model: str, config: RateLimitConfig) -> AdaptiveRateLimiter:
+    """Return the process-wide limiter for one SiliconFlow model.
+
+    Providers are rebuilt per request, so tokens, slots, and the learned
+    concurrency limit live here to be shared by every caller of the model. A
+    changed ``config`` is applied to the existing limiter in place.
+    """
+
+    key = (kind, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(kind, model, config)
+            _limiters[key] = limiter
+        elif limiter.config != config:
+            limiter.reconfigure(config)
+        return limiter
+
+
+def rate_limit_snapshot() -> list[RateLimitMetrics]:
+    """Return current limits and counters for every process-wide limiter."""
+
+    with _limiters_lock:
+        limiters = [_limiters[key] for key in sorted(_limiters)]
+    return [limiter.snapshot() for limiter in limiters]
+
+
+def reset_rate_limiters() -> None:
+    """Drop all process-wide limiters (tests and CLI restarts)."""
+
+    with _limiters_lock:
+        _limiters.clear()
+
+
+class RateLimitedChatModel(Runnable[Any, Any]):
+    """Chat model wrapper sending every ``invoke`` and ``stream`` through a rate limiter."""
+
+    def __init__(self, inner: Runnable[Any, Any], limiter: AdaptiveRateLimiter) -> None:
+        self._inner = inner
+        self.limiter = limiter
+
+    def invoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        return self.limiter.call(lambda: self._inner.invoke(input, config, **kwargs))
+
+    async def ainvoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        return await self.limiter.acall(lambda: self._inner.ainvoke(input, config, **kwargs))
+
+    def stream(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Stream while holding one slot; streams are not retried once started."""
+
+        self.limiter.acquire()
+        error: Exception | None = None
+        try:
+            yield from self._inner.stream(input, config, **kwargs)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self.limiter.release(error)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> RateLimitedChatModel:
+        return RateLimitedChatModel(self._inner.bind_tools(tools, **kwargs), self.limiter)
+
+
+def rate_limit_chat_model(
+    inner: Runnable[Any, Any],
+    config: RateLimitConfig,
+    *,
+    model: str,
+) -> RateLimitedChatModel:
+    return RateLimitedChatModel(inner, get_rate_limiter("chat", model, config))
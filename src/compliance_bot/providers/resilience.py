@@ -0,0 +1,673 @@
+"""Hedged requests and circuit breaking for hosted provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from time import monotonic, perf_counter
+from typing import Any, Awaitable, Callable, Iterator, Mapping, TypeVar
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from compliance_bot.schemas.retrieval import ProviderCallMetrics
+
+T = TypeVar("T")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the provider while its circuit breaker is open."""
+
+
+@dataclass(frozen=True)
+class ResilienceConfig:
+    """Hedging and circuit breaker settings shared by provider wrappers."""
+
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    hedge_min_delay_ms: float = 50.0
+    latency_window: int = 200
+    failure_threshold: int = 5
+    reset_timeout_seconds: float = 30.0
+    hedge_llm: bool = False
+    hedge_max_in_flight: int = 4
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.hedge_percentile <= 100.0:
+            raise ValueError("hedge_percentile must be within (0, 100]")
+        if self.hedge_min_samples < 1:
+            raise ValueError("hedge_min_samples must be >= 1")
+        if self.hedge_min_delay_ms < 0.0:
+            raise ValueError("hedge_min_delay_ms must be >= 0")
+        if self.latency_window < self.hedge_min_samples:
+            raise ValueError("latency_window must be >= hedge_min_samples")
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if self.reset_timeout_seconds <= 0.0:
+            raise ValueError("reset_timeout_seconds must be > 0")
+        if self.hedge_max_in_flight < 1:
+            raise ValueError("hedge_max_in_flight must be >= 1")
+
+
+def resilience_enabled(env: Mapping[str, str] | None = None) -> bool:
+    """Return True when provider wrappers should be applied."""
+
+    source = env if env is not None else os.environ
+    return source.get("COMPLIANCE_PROVIDER_RESILIENCE", "").strip().lower() in _TRUE_VALUES
+
+
+def load_resilience_config(env: Mapping[str, str] | None = None) -> ResilienceConfig:
+    """Load hedging and circuit breaker settings from environment."""
+
+    source = env if env is not None else os.environ
+    return ResilienceConfig(
+        hedge_percentile=float(source.get("COMPLIANCE_HEDGE_PERCENTILE", "95").strip()),
+        hedge_min_samples=int(source.get("COMPLIANCE_HEDGE_MIN_SAMPLES", "20").strip()),
+        hedge_min_delay_ms=float(source.get("COMPLIANCE_HEDGE_MIN_DELAY_MS", "50").strip()),
+        failure_threshold=int(source.get("COMPLIANCE_CIRCUIT_FAILURE_THRESHOLD", "5").strip()),
+        reset_timeout_seconds=float(
+            source.get("COMPLIANCE_CIRCUIT_RESET_SECONDS", "30").strip()
+        ),
+        hedge_llm=source.get("COMPLIANCE_HEDGE_LLM", "").strip().lower() in _TRUE_VALUES,
+        hedge_max_in_flight=int(source.get("COMPLIANCE_HEDGE_MAX_IN_FLIGHT", "4").strip()),
+    )
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe after ``reset_timeout``."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def reconfigure(self, *, failure_threshold: int, reset_timeout_seconds: float) -> None:
+        """Change thresholds without resetting the current state or failure count."""
+
+        with self._lock:
+            self._failure_threshold = failure_threshold
+            self._reset_timeout = reset_timeout_seconds
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == CIRCUIT_OPEN and self._reset_elapsed():
+                return CIRCUIT_HALF_OPEN
+            return self._state
+
+    def _reset_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self._reset_timeout
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed; claims the probe slot when half-open."""
+
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return True
+            if self._state == CIRCUIT_OPEN:
+                if not self._reset_elapsed():
+                    return False
+                self._state = CIRCUIT_HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CIRCUIT_CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if (
+                self._state == CIRCUIT_HALF_OPEN
+                or self._consecutive_failures >= self._failure_threshold
+            ):
+                self._state = CIRCUIT_OPEN
+                self._opened_at = self._clock()
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies."""
+
+    def __init__(self, window: int) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def resize(self, window: int) -> None:
+        """Change the window size, keeping the most recent samples."""
+
+        with self._lock:
+            self._samples = deque(self._samples, maxlen=window)
+
+    def record(self, latency_ms: float) -> None:
+        with self._lock:
+            self._samples.append(latency_ms)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Nearest-rank percentile, or ``None`` when no samples exist."""
+
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return None
+        rank = max(0, min(len(ordered) - 1, int(round(percentile / 100.0 * len(ordered))) - 1))
+        return ordered[rank]
+
+
+@dataclass(frozen=True)
+class CallOutcome:
+    """How one guarded call was served."""
+
+    circuit_state: str
+    hedged: bool
+    latency_ms: float
+
+
+class ProviderGuard:
+    """Circuit breaker plus latency-percentile hedging for one provider/model pair.
+
+    A call that has not returned after the configured percentile of recent
+    successful latencies gets one duplicate request; whichever answers first
+    wins. Async hedges cancel the slower request. Sync hedges stop waiting on
+    it; a request already running on a thread cannot be interrupted and
+    finishes (bounded by its provider timeout) in the background with its
+    result discarded. Hedging only starts once ``hedge_min_samples`` latencies
+    have been observed.
+
+    At most ``hedge_max_in_flight`` calls per guard may hedge at once; a call
+    that finds no free slot runs without a hedge (inline on the caller's thread
+    for sync calls) instead of queueing, so hedging never adds load while the
+    provider is already saturated. Hedge threads start immediately, never
+    behind a queue, and run in a copy of the caller's context.
+    """
+
+    def __init__(
+        self,
+        config: ResilienceConfig,
+        *,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.config = config
+        self.breaker = CircuitBreaker(
+            failure_threshold=config.failure_threshold,
+            reset_timeout_seconds=config.reset_timeout_seconds,
+            clock=clock,
+        )
+        self.latencies = LatencyTracker(config.latency_window)
+        self._hedge_slots = threading.BoundedSemaphore(config.hedge_max_in_flight)
+
+    @property
+    def circuit_state(self) -> str:
+        return self.breaker.state
+
+    def reconfigure(self, config: ResilienceConfig) -> None:
+        """Apply new settings in place, keeping breaker state and latency history."""
+
+        self.breaker.reconfigure(
+            failure_threshold=config.failure_threshold,
+            reset_timeout_seconds=config.reset_timeout_seconds,
+        )
+        self.latencies.resize(config.latency_window)
+        if config.hedge_max_in_flight != self.config.hedge_max_in_flight:
+            # Hedges in flight release into the semaphore they acquired from.
+            self._hedge_slots = threading.BoundedSemaphore(config.hedge_max_in_flight)
+        self.config = config
+
+    def hedge_delay_seconds(self) -> float | None:
+        """Delay before the duplicate request, or ``None`` while too few samples exist."""
+
+        if len(self.latencies) < self.config.hedge_min_samples:
+            return None
+        observed = self.latencies.percentile(self.config.hedge_percentile)
+        if observed is None:
+            return None
+        return max(observed, self.config.hedge_min_delay_ms) / 1000.0
+
+    def admit(self) -> str:
+        """Claim permission for one call; raises :class:`CircuitOpenError` when open.
+
+        Every admitted call must be followed by exactly one :meth:`record`.
+        Returns the circuit state seen on admission.
+        """
+
+        state = self.breaker.state
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"provider circuit is {CIRCUIT_OPEN}")
+        return state
+
+    def record(self, *, ok: bool, latency_ms: float | None = None) -> None:
+        """Report an admitted call's outcome; ``latency_ms`` feeds the hedging window."""
+
+        if ok:
+            self.breaker.record_success()
+            if latency_ms is not None:
+                self.latencies.record(latency_ms)
+        else:
+            self.breaker.record_failure()
+
+    def _settle(self, *, ok: bool, start: float) -> float:
+        latency_ms = (perf_counter() - start) * 1000.0
+        self.record(ok=ok, latency_ms=latency_ms)
+        return latency_ms
+
+    def call(self, fn: Callable[[], T], *, hedge: bool = True) -> tuple[T, CallOutcome]:
+        """Run ``fn`` under the breaker, hedging it when it is slower than usual."""
+
+        self.admit()
+        delay = self.hedge_delay_seconds() if hedge else None
+        start = perf_counter()
+        hedged = False
+        try:
+            if delay is None:
+                result = fn()
+            else:
+                result, hedged = _call_hedged(fn, delay, self._hedge_slots)
+        except Exception:
+            self._settle(ok=False, start=start)
+            raise
+        latency_ms = self._settle(ok=True, start=start)
+        return result, CallOutcome(self.circuit_state, hedged, latency_ms)
+
+    async def acall(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        hedge: bool = True,
+    ) -> tuple[T, CallOutcome]:
+        """Async :meth:`call`; the losing request of a hedge is cancelled."""
+
+        self.admit()
+        delay = self.hedge_delay_seconds() if hedge else None
+        start = perf_counter()
+        hedged = False
+        try:
+            if delay is None:
+                result = await fn()
+            else:
+                result, hedged = await _acall_hedged(fn, delay, self._hedge_slots)
+        except Exception:
+            self._settle(ok=False, start=start)
+            raise
+        latency_ms = self._settle(ok=True, start=start)
+        return result, CallOutcome(self.circuit_state, hedged, latency_ms)
+
+
+def _start_thread(fn: Callable[[], T]) -> Future[T]:
+    """Run ``fn`` on a new thread in a copy of the caller's context."""
+
+    future: Future[T] = Future()
+    context = contextvars.copy_context()
+
+    def _run() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            result = context.run(fn)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=_run, name="provider-hedge", daemon=True).start()
+    return future
+
+
+def _call_hedged(
+    fn: Callable[[], T],
+    delay: float,
+    slots: threading.BoundedSemaphore,
+) -> tuple[T, bool]:
+    if not slots.acquire(blocking=False):
+        return fn(), False
+
+    hedge: Future[T] | None = None
+    try:
+        primary = _start_thread(fn)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result(), False
+
+        hedge = _start_thread(fn)
+        # The slot is held until the hedge itself finishes, even if it loses.
+        hedge.add_done_callback(lambda _: slots.release())
+        pending: set[Future[T]] = {primary, hedge}
+        first_error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result(), True
+                first_error = first_error or error
+        assert first_error is not None
+        raise first_error
+    finally:
+        if hedge is None:
+            slots.release()
+
+
+async def _acall_hedged(
+    fn: Callable[[], Awaitable[T]],
+    delay: float,
+    slots: threading.BoundedSemaphore,
+) -> tuple[T, bool]:
+    primary = asyncio.ensure_future(fn())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result(), False
+    if not slots.acquire(blocking=False):
+        return await primary, False
+
+    pending = {primary, asyncio.ensure_future(fn())}
+    first_error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    return task.result(), True
+                first_error = first_error or error
+    finally:
+        for task in pending:
+            task.cancel()
+        slots.release()
+    assert first_error is not None
+    raise first_error
+
+
+_guards: dict[tuple[str, str, str], ProviderGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_provider_guard(
+    kind: str,
+    provider: str,
+    model: str,
+    config: ResilienceConfig,
+) -> ProviderGuard:
+    """Return the process-wide guard for one provider endpoint.
+
+    Providers are rebuilt per request by the registry, so breaker state and
+    latency history live here to survive across queries. A changed ``config``
+    is applied to the existing guard, so an open breaker stays open.
+    """
+
+    key = (kind, provider, model)
+    with _guards_lock:
+        guard = _guards.get(key)
+        if guard is None:
+            guard = ProviderGuard(config)
+            _guards[key] = guard
+        elif guard.config != config:
+            guard.reconfigure(config)
+        return guard
+
+
+def reset_provider_guards() -> None:
+    """Forget all breaker state and latency history (tests and CLI restarts)."""
+
+    with _guards_lock:
+        _guards.clear()
+
+
+class ResilientEmbeddingProvider:
+    """Embedding provider wrapper with circuit breaking and hedged query embeddings.
+
+    Document batches go through the breaker but are not hedged, since a duplicate
+    batch doubles the heaviest request the provider serves.
+    """
+
+    def __init__(self, inner: Any, guard: ProviderGuard) -> None:
+        self._inner = inner
+        self.guard = guard
+        self.provider_name = getattr(inner, "provider_name", "embedding-provider")
+        self.model = getattr(inner, "model", "unknown")
+
+    @property
+    def circuit_state(self) -> str:
+        return self.guard.circuit_state
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        vectors, _ = self.guard.call(lambda: self._inner.embed_documents(texts), hedge=False)
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        vector, _ = self.guard.call(lambda: self._inner.embed_query(text))
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        aembed_query = getattr(self._inner, "aembed_query", None)
+        if aembed_query is None:
+            return await asyncio.to_thread(self.embed_query, text)
+        vector, _ = await self.guard.acall(lambda: aembed_query(text))
+        return vector
+
+
+class ResilientRerankProvider:
+    """Rerank provider wrapper that reports breaker state and hedging in its metrics.
+
+    With a ``fallback`` provider (e.g. the in-process local reranker), calls made
+    while the circuit is open are answered by the fallback instead of raising
+    :class:`CircuitOpenError`.
+    """
+
+    def __init__(self, inner: Any, guard: ProviderGuard, *, fallback: Any | None = None) -> None:
+        self._inner = inner
+        self._fallback = fallback
+        self.guard = guard
+        self.provider_name = getattr(inner, "provider_name", "rerank-provider")
+        self.model = getattr(inner, "model", "unknown")
+        self.uses_candidate_fields = bool(getattr(fallback, "uses_candidate_fields", False))
+
+    @property
+    def circuit_state(self) -> str:
+        return self.guard.circuit_state
+
+    @staticmethod
+    def _annotate(
+        metrics: ProviderCallMetrics,
+        outcome: CallOutcome,
+    ) -> ProviderCallMetrics:
+        update: dict[str, Any] = {"circuit_state": outcome.circuit_state, "hedged": outcome.hedged}
+        if outcome.hedged:
+            update["latency_ms"] = outcome.latency_ms
+        return metrics.model_copy(update=update)
+
+    def _rerank_fallback(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None,
+    ) -> tuple[list[Any], ProviderCallMetrics]:
+        kwargs: dict[str, Any] = {"query": query, "candidates": candidates, "top_n": top_n}
+        if self.uses_candidate_fields and candidate_fields is not None:
+            kwargs["candidate_fields"] = candidate_fields
+        results, metrics = self._fallback.rerank(**kwargs)
+        return results, metrics.model_copy(
+            update={"circuit_state": CIRCUIT_OPEN, "error_code": "circuit_open"}
+        )
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None = None,
+    ) -> tuple[list[Any], ProviderCallMetrics]:
+        try:
+            (results, metrics), outcome = self.guard.call(
+                lambda: self._inner.rerank(query=query, candidates=candidates, top_n=top_n)
+            )
+        except CircuitOpenError:
+            if self._fallback is None:
+                raise
+            return self._rerank_fallback(
+                query=query,
+                candidates=candidates,
+                top_n=top_n,
+                candidate_fields=candidate_fields,
+            )
+        return results, self._annotate(metrics, outcome)
+
+    async def arerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None = None,
+    ) -> tuple[list[Any], ProviderCallMetrics]:
+        arerank = getattr(self._inner, "arerank", None)
+        if arerank is None:
+            return await asyncio.to_thread(
+                self.rerank,
+                query=query,
+                candidates=candidates,
+                top_n=top_n,
+                candidate_fields=candidate_fields,
+            )
+        try:
+            (results, metrics), outcome = await self.guard.acall(
+                lambda: arerank(query=query, candidates=candidates, top_n=top_n)
+            )
+        except CircuitOpenError:
+            if self._fallback is None:
+                raise
+            return self._rerank_fallback(
+                query=query,
+                candidates=candidates,
+                top_n=top_n,
+                candidate_fields=candidate_fields,
+            )
+        return results, self._annotate(metrics, outcome)
+
+
+class ResilientChatModel(Runnable[Any, Any]):
+    """Chat model wrapper guarding invoke and stream; ``hedge_llm`` opts in to hedging."""
+
+    def __init__(self, inner: Runnable[Any, Any], guard: ProviderGuard) -> None:
+        self._inner = inner
+        self.guard = guard
+
+    @property
+    def circuit_state(self) -> str:
+        return self.guard.circuit_state
+
+    def invoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        result, _ = self.guard.call(
+            lambda: self._inner.invoke(input, config, **kwargs),
+            hedge=self.guard.config.hedge_llm,
+        )
+        return result
+
+    async def ainvoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        result, _ = await self.guard.acall(
+            lambda: self._inner.ainvoke(input, config, **kwargs),
+            hedge=self.guard.config.hedge_llm,
+        )
+        return result
+
+    def stream(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Stream under the circuit breaker; streams are never hedged.
+
+        A stream closed early by the caller counts as a success. Stream durations
+        are not fed into the hedging latency window.
+        """
+
+        self.guard.admit()
+        ok = False
+        try:
+            yield from self._inner.stream(input, config, **kwargs)
+            ok = True
+        except GeneratorExit:
+            ok = True
+            raise
+        finally:
+            self.guard.record(ok=ok)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> ResilientChatModel:
+        return ResilientChatModel(self._inner.bind_tools(tools, **kwargs), self.guard)
+
+
+def wrap_embedding_provider(inner: Any, config: ResilienceConfig) -> ResilientEmbeddingProvider:
+    guard = get_provider_guard(
+        "embedding",
+        getattr(inner, "provider_name", "embedding-provider"),
+        getattr(inner, "model", "unknown"),
+        config,
+    )
+    return ResilientEmbeddingProvider(inner, guard)
+
+
+def wrap_rerank_provider(
+    inner: Any,
+    config: ResilienceConfig,
+    *,
+    fallback: Any | None = None,
+) -> ResilientRerankProvider:
+    guard = get_provider_guard(
+        "rerank",
+        getattr(inner, "provider_name", "rerank-provider"),
+        getattr(inner, "model", "unknown"),
+        config,
+    )
+    return ResilientRerankProvider(inner, guard, fallback=fallback)
+
+
+def wrap_chat_model(
+    inner: Runnable[Any, Any],
+    config: ResilienceConfig,
+    *,
+    model: str,
+) -> ResilientChatModel:
+    return ResilientChatModel(inner, get_provider_guard("llm", "siliconflow", model, config))
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import importlib
 import os
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Mapping, TypeVar
 
 from compliance_bot.llms.siliconflow import DEFAULT_SILICONFLOW_BASE_URL
+from compliance_bot.providers.rate_limit import (
+    AdaptiveRateLimiter,
+    RateLimitConfig,
+    get_rate_limiter,
+    load_rate_limit_config,
+)
+
+T = TypeVar("T")
 
 DEFAULT_SILICONFLOW_EMBEDDING_MODEL = "BAAI/bge-m3"
 
@@ -21,6 +29,7 @@ class SiliconFlowEmbeddingConfig:
     base_url: str = DEFAULT_SILICONFLOW_BASE_URL
     timeout: float = 30.0
     max_retries: int = 2
+    rate_limit: RateLimitConfig = RateLimitConfig()
 
 
 def load_siliconflow_embedding_config(
@@ -46,6 +55,7 @@ def load_siliconflow_embedding_config(
         base_url=base_url or DEFAULT_SILICONFLOW_BASE_URL,
         timeout=timeout,
         max_retries=max_retries,
+        rate_limit=load_rate_limit_config("embedding", source),
     )
 
 
@@ -54,23 +64,46 @@ class SiliconFlowEmbeddingProvider:
 
     provider_name = "siliconflow"
 
-    def __init__(self, client: Any, *, model: str) -> None:
+    def __init__(
+        self,
+        client: Any,
+        *,
+        model: str,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+    ) -> None:
         self._client = client
         self.model = model
+        self.rate_limiter = rate_limiter
+
+    def _send(self, fn: Callable[[], T]) -> T:
+        if self.rate_limiter is None:
+            return fn()
+        return self.rate_limiter.call(fn)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
-        return [list(vector) for vector in self._client.embed_documents(texts)]
+        vectors = self._send(lambda: self._client.embed_documents(texts))
+        return [list(vector) for vector in vectors]
 
     def embed_query(self, text: str) -> list[float]:
-        return list(self._client.embed_query(text))
+        return list(self._send(lambda: self._client.embed_query(text)))
+
+    async def aembed_query(self, text: str) -> list[float]:
+        if self.rate_limiter is None:
+            return list(await self._client.aembed_query(text))
+        return list(await self.rate_limiter.acall(lambda: self._client.aembed_query(text)))
 
 
 def build_siliconflow_embedding_provider(
     config: SiliconFlowEmbeddingConfig | None = None,
 ) -> SiliconFlowEmbeddingProvider:
-    """Create SiliconFlow embedding provider using langchain-openai client."""
+    """Create SiliconFlow embedding provider using langchain-openai client.
+
+    The client's own retries are disabled; 429s, 5xx responses, and connection
+    errors are retried up to ``max_retries`` times through the shared per-model
+    rate limiter instead. Texts are sent as raw strings, not tiktoken token IDs.
+    """
 
     resolved = config or load_siliconflow_embedding_config()
     try:
@@ -89,6 +122,13 @@ def build_siliconflow_embedding_provider(
         api_key=resolved.api_key,
         base_url=resolved.base_url,
         timeout=resolved.timeout,
-        max_retries=resolved.max_retries,
+        max_retries=0,
+        # SiliconFlow models take raw strings; tiktoken pre-tokenisation is OpenAI-only.
+        check_embedding_ctx_length=False,
+    )
+    limiter = get_rate_limiter(
+        "embedding",
+        resolved.model,
+        replace(resolved.rate_limit, max_retries=resolved.max_retries),
     )
-    return SiliconFlowEmbeddingProvider(client, model=resolved.model)
+    return SiliconFlowEmbeddingProvider(client, model=resolved.model, rate_limiter=limiter)
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Any, Callable, Mapping
-from urllib import request
+from typing import Any, Awaitable, Callable, Mapping
 
 from compliance_bot.llms.siliconflow import DEFAULT_SILICONFLOW_BASE_URL
+from compliance_bot.providers.http_transport import (
+    AsyncHTTPTransport,
+    PooledHTTPTransport,
+    get_shared_http_transport,
+    load_http_transport_config,
+)
+from compliance_bot.providers.rate_limit import (
+    AdaptiveRateLimiter,
+    RateLimitConfig,
+    get_rate_limiter,
+    load_rate_limit_config,
+)
 from compliance_bot.schemas.retrieval import ProviderCallMetrics, RerankResult
 
 DEFAULT_SILICONFLOW_RERANK_MODEL = "BAAI/bge-reranker-v2-m3"
@@ -24,6 +35,7 @@ class SiliconFlowRerankConfig:
     base_url: str = DEFAULT_SILICONFLOW_BASE_URL
     path: str = "/rerank"
     timeout: float = 30.0
+    rate_limit: RateLimitConfig = RateLimitConfig()
 
 
 class RerankProviderError(RuntimeError):
@@ -31,6 +43,9 @@ class RerankProviderError(RuntimeError):
 
 
 RerankRequestFn = Callable[[str, dict[str, Any], dict[str, str], float], dict[str, Any]]
+AsyncRerankRequestFn = Callable[
+    [str, dict[str, Any], dict[str, str], float], Awaitable[dict[str, Any]]
+]
 
 
 def load_siliconflow_rerank_config(
@@ -54,6 +69,7 @@ def load_siliconflow_rerank_config(
         base_url=base_url or DEFAULT_SILICONFLOW_BASE_URL,
         path=path,
         timeout=timeout,
+        rate_limit=load_rate_limit_config("rerank", source),
     )
 
 
@@ -63,11 +79,7 @@ def _default_rerank_request(
     headers: dict[str, str],
     timeout: float,
 ) -> dict[str, Any]:
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, headers=headers, method="POST")
-    with request.urlopen(req, timeout=timeout) as response:
-        raw = response.read().decode("utf-8")
-    return json.loads(raw)
+    return get_shared_http_transport().post_json(url, payload, headers, timeout)
 
 
 class SiliconFlowRerankProvider:
@@ -80,32 +92,39 @@ class SiliconFlowRerankProvider:
         config: SiliconFlowRerankConfig,
         *,
         request_fn: RerankRequestFn | None = None,
+        transport: PooledHTTPTransport | None = None,
+        async_request_fn: AsyncRerankRequestFn | None = None,
+        async_transport: AsyncHTTPTransport | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
     ) -> None:
         self._config = config
+        self.rate_limiter = rate_limiter
+        if request_fn is None and transport is not None:
+            request_fn = transport.post_json
         self._request_fn = request_fn or _default_rerank_request
+        self._async_transport = async_transport
+        self._async_request_fn = async_request_fn
 
     @property
     def model(self) -> str:
         return self._config.model
 
-    def rerank(
+    def _empty_metrics(self) -> ProviderCallMetrics:
+        return ProviderCallMetrics(
+            provider=self.provider_name,
+            model=self._config.model,
+            latency_ms=0.0,
+            status="ok",
+            error_code=None,
+        )
+
+    def _build_request(
         self,
         *,
         query: str,
         candidates: list[str],
         top_n: int,
-    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
-        if top_n <= 0:
-            raise ValueError("top_n must be > 0")
-        if not candidates:
-            return [], ProviderCallMetrics(
-                provider=self.provider_name,
-                model=self._config.model,
-                latency_ms=0.0,
-                status="ok",
-                error_code=None,
-            )
-
+    ) -> tuple[str, dict[str, Any], dict[str, str]]:
         payload = {
             "model": self._config.model,
             "query": query,
@@ -117,22 +136,14 @@ class SiliconFlowRerankProvider:
             "Content-Type": "application/json",
         }
         url = f"{self._config.base_url.rstrip('/')}{self._config.path}"
+        return url, payload, headers
 
-        start = perf_counter()
-        try:
-            response_payload = self._request_fn(url, payload, headers, self._config.timeout)
-        except TimeoutError as exc:
-            latency = (perf_counter() - start) * 1000.0
-            raise RerankProviderError(
-                f"siliconflow rerank timeout after {latency:.2f}ms"
-            ) from exc
-        except Exception as exc:  # pragma: no cover - defensive path
-            latency = (perf_counter() - start) * 1000.0
-            raise RerankProviderError(
-                f"siliconflow rerank request failed after {latency:.2f}ms: {exc}"
-            ) from exc
-
-        latency = (perf_counter() - start) * 1000.0
+    def _parse_response(
+        self,
+        response_payload: dict[str, Any],
+        *,
+        latency: float,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
         items = response_payload.get("results", [])
         if not isinstance(items, list):
             raise RerankProviderError("siliconflow rerank response missing 'results' list")
@@ -160,15 +171,118 @@ class SiliconFlowRerankProvider:
         )
         return results, metrics
 
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
+        if top_n <= 0:
+            raise ValueError("top_n must be > 0")
+        if not candidates:
+            return [], self._empty_metrics()
+
+        url, payload, headers = self._build_request(
+            query=query, candidates=candidates, top_n=top_n
+        )
+        start = perf_counter()
+        try:
+            if self.rate_limiter is None:
+                response_payload = self._request_fn(url, payload, headers, self._config.timeout)
+            else:
+                response_payload = self.rate_limiter.call(
+                    lambda: self._request_fn(url, payload, headers, self._config.timeout)
+                )
+        except TimeoutError as exc:
+            latency = (perf_counter() - start) * 1000.0
+            raise RerankProviderError(
+                f"siliconflow rerank timeout after {latency:.2f}ms"
+            ) from exc
+        except Exception as exc:  # pragma: no cover - defensive path
+            latency = (perf_counter() - start) * 1000.0
+            raise RerankProviderError(
+                f"siliconflow rerank request failed after {latency:.2f}ms: {exc}"
+            ) from exc
+
+        return self._parse_response(response_payload, latency=(perf_counter() - start) * 1000.0)
+
+    async def arerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
+        """Async :meth:`rerank`; the configured timeout cancels the request outright."""
+
+        if top_n <= 0:
+            raise ValueError("top_n must be > 0")
+        if not candidates:
+            return [], self._empty_metrics()
+
+        url, payload, headers = self._build_request(
+            query=query, candidates=candidates, top_n=top_n
+        )
+        request_fn = self._async_request_fn
+        if request_fn is None:
+            if self._async_transport is None:
+                self._async_transport = AsyncHTTPTransport(load_http_transport_config())
+            request_fn = self._async_transport.post_json
+
+        start = perf_counter()
+        try:
+
+            async def send() -> dict[str, Any]:
+                return await asyncio.wait_for(
+                    request_fn(url, payload, headers, self._config.timeout),
+                    timeout=self._config.timeout,
+                )
+
+            if self.rate_limiter is None:
+                response_payload = await send()
+            else:
+                response_payload = await self.rate_limiter.acall(send)
+        except (TimeoutError, asyncio.TimeoutError) as exc:
+            latency = (perf_counter() - start) * 1000.0
+            raise RerankProviderError(
+                f"siliconflow rerank timeout after {latency:.2f}ms"
+            ) from exc
+        except Exception as exc:
+            latency = (perf_counter() - start) * 1000.0
+            raise RerankProviderError(
+                f"siliconflow rerank request failed after {latency:.2f}ms: {exc}"
+            ) from exc
+
+        return self._parse_response(response_payload, latency=(perf_counter() - start) * 1000.0)
+
+    def close(self) -> None:
+        """Close the async transport this provider created, if any, from sync code."""
+
+        if self._async_transport is not None:
+            self._async_transport.close()
+
+    async def aclose(self) -> None:
+        """Close the async transport this provider created, if any."""
+
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
 
 def build_siliconflow_rerank_provider(
     config: SiliconFlowRerankConfig | None = None,
     *,
     request_fn: RerankRequestFn | None = None,
+    transport: PooledHTTPTransport | None = None,
+    async_request_fn: AsyncRerankRequestFn | None = None,
 ) -> SiliconFlowRerankProvider:
-    """Create SiliconFlow rerank provider."""
+    """Create SiliconFlow rerank provider sharing the per-model rate limiter."""
 
+    resolved = config or load_siliconflow_rerank_config()
     return SiliconFlowRerankProvider(
-        config or load_siliconflow_rerank_config(),
+        resolved,
         request_fn=request_fn,
+        transport=transport,
+        async_request_fn=async_request_fn,
+        rate_limiter=get_rate_limiter("rerank", resolved.model, resolved.rate_limit),
     )
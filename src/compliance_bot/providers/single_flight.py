@@ -0,0 +1,390 @@
+"""Single-flight coalescing of identical concurrent provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, Iterator, Mapping, TypeVar
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from compliance_bot.schemas.retrieval import ProviderCallMetrics
+
+T = TypeVar("T")
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def single_flight_enabled(env: Mapping[str, str] | None = None) -> bool:
+    """Return True when identical concurrent provider calls should be coalesced."""
+
+    source = env if env is not None else os.environ
+    return source.get("COMPLIANCE_PROVIDER_SINGLE_FLIGHT", "").strip().lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Counters for one coalescing group.
+
+    ``calls`` is every request made through the group, ``executions`` the ones
+    that actually reached the provider, and ``coalesced`` the ones that waited
+    on an identical in-flight call instead.
+    """
+
+    calls: int
+    executions: int
+    coalesced: int
+
+
+class CoalescingTally:
+    """Mutable count of coalesced calls made inside a :func:`track_coalescing` block."""
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+
+
+_active_tally: ContextVar[CoalescingTally | None] = ContextVar(
+    "compliance_bot_coalescing_tally",
+    default=None,
+)
+
+
+@contextmanager
+def track_coalescing() -> Iterator[CoalescingTally]:
+    """Count calls coalesced by any single-flight group within this block.
+
+    The tally is carried in a context variable, so it also sees calls made from
+    copied contexts (LangChain runnables, ``asyncio.to_thread``, child tasks).
+    """
+
+    tally = CoalescingTally()
+    token = _active_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _active_tally.reset(token)
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key.
+
+    Threaded callers wait on the leader's future. Async callers share one task
+    per event loop; each awaits it through :func:`asyncio.shield`, so a caller
+    that is cancelled (e.g. by a timeout) does not cancel the call for the rest.
+    Results are not cached: once the call settles, the next caller starts a new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future[Any]] = {}
+        self._async_inflight: dict[tuple[int, Hashable], asyncio.Task[Any]] = {}
+        self._calls = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(self._calls, self._executions, self._coalesced)
+
+    def _count(self, *, leader: bool) -> None:
+        # Caller holds self._lock.
+        self._calls += 1
+        if leader:
+            self._executions += 1
+            return
+        self._coalesced += 1
+        tally = _active_tally.get()
+        if tally is not None:
+            tally.coalesced += 1
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Run ``fn`` or join the identical call in flight; returns ``(result, coalesced)``."""
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if pending is None:
+                pending = self._inflight[key] = Future()
+            self._count(leader=leader)
+
+        if not leader:
+            return pending.result(), True
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            del self._inflight[key]
+        pending.set_result(result)
+        return result, False
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Async :meth:`do`; coalesces callers running on the same event loop."""
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._async_inflight.get(flight_key)
+            leader = task is None
+            if task is None:
+                task = self._async_inflight[flight_key] = loop.create_task(
+                    _await_call(fn)
+                )
+                task.add_done_callback(partial(self._release, flight_key))
+            self._count(leader=leader)
+
+        return await asyncio.shield(task), not leader
+
+    def _release(self, flight_key: tuple[int, Hashable], task: asyncio.Task[Any]) -> None:
+        with self._lock:
+            if self._async_inflight.get(flight_key) is task:
+                del self._async_inflight[flight_key]
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller was cancelled meanwhile.
+            task.exception()
+
+
+async def _await_call(fn: Callable[[], Awaitable[T]]) -> T:
+    return await fn()
+
+
+_flights: dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(kind: str) -> SingleFlight:
+    """Return the process-wide coalescing group for ``kind`` (embedding, rerank, llm)."""
+
+    with _flights_lock:
+        flight = _flights.get(kind)
+        if flight is None:
+            flight = _flights[kind] = SingleFlight()
+        return flight
+
+
+def single_flight_stats() -> dict[str, SingleFlightStats]:
+    """Return counters for every process-wide coalescing group."""
+
+    with _flights_lock:
+        flights = dict(_flights)
+    return {kind: flights[kind].stats() for kind in sorted(flights)}
+
+
+def reset_single_flights() -> None:
+    """Drop all process-wide coalescing groups and their counters."""
+
+    with _flights_lock:
+        _flights.clear()
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CoalescingEmbeddingProvider:
+    """Embedding provider wrapper sharing identical in-flight embedding requests."""
+
+    def __init__(self, inner: Any, flight: SingleFlight) -> None:
+        self._inner = inner
+        self.flight = flight
+        self.provider_name = getattr(inner, "provider_name", "embedding-provider")
+        self.model = getattr(inner, "model", "unknown")
+
+    @property
+    def circuit_state(self) -> str | None:
+        return getattr(self._inner, "circuit_state", None)
+
+    def _key(self, operation: str, payload: Any) -> tuple[str, str, str, str]:
+        return (operation, self.provider_name, self.model, _digest(payload))
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        vectors, _ = self.flight.do(
+            self._key("embed_documents", texts),
+            lambda: self._inner.embed_documents(texts),
+        )
+        return [list(vector) for vector in vectors]
+
+    def embed_query(self, text: str) -> list[float]:
+        vector, _ = self.flight.do(
+            self._key("embed_query", text),
+            lambda: self._inner.embed_query(text),
+        )
+        return list(vector)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        async def call() -> list[float]:
+            aembed_query = getattr(self._inner, "aembed_query", None)
+            if aembed_query is None:
+                return await asyncio.to_thread(self._inner.embed_query, text)
+            return await aembed_query(text)
+
+        vector, _ = await self.flight.ado(self._key("embed_query", text), call)
+        return list(vector)
+
+
+class CoalescingRerankProvider:
+    """Rerank provider wrapper sharing identical in-flight rerank requests.
+
+    Callers that joined another request get its results with ``coalesced=True``
+    set on the returned metrics.
+    """
+
+    def __init__(self, inner: Any, flight: SingleFlight) -> None:
+        self._inner = inner
+        self.flight = flight
+        self.provider_name = getattr(inner, "provider_name", "rerank-provider")
+        self.model = getattr(inner, "model", "unknown")
+        self.uses_candidate_fields = bool(getattr(inner, "uses_candidate_fields", False))
+
+    @property
+    def circuit_state(self) -> str | None:
+        return getattr(self._inner, "circuit_state", None)
+
+    def _request(
+        self,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None,
+    ) -> tuple[Hashable, dict[str, Any]]:
+        kwargs: dict[str, Any] = {"query": query, "candidates": candidates, "top_n": top_n}
+        if self.uses_candidate_fields and candidate_fields is not None:
+            kwargs["candidate_fields"] = candidate_fields
+        return ("rerank", self.provider_name, self.model, _digest(kwargs)), kwargs
+
+    @staticmethod
+    def _annotate(
+        outcome: tuple[list[Any], ProviderCallMetrics],
+        coalesced: bool,
+    ) -> tuple[list[Any], ProviderCallMetrics]:
+        results, metrics = outcome
+        if not coalesced:
+            return list(results), metrics
+        return list(results), metrics.model_copy(update={"coalesced": True})
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None = None,
+    ) -> tuple[list[Any], ProviderCallMetrics]:
+        key, kwargs = self._request(query, candidates, top_n, candidate_fields)
+        outcome, coalesced = self.flight.do(key, lambda: self._inner.rerank(**kwargs))
+        return self._annotate(outcome, coalesced)
+
+    async def arerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+        candidate_fields: list[Mapping[str, str]] | None = None,
+    ) -> tuple[list[Any], ProviderCallMetrics]:
+        key, kwargs = self._request(query, candidates, top_n, candidate_fields)
+
+        async def call() -> tuple[list[Any], ProviderCallMetrics]:
+            arerank = getattr(self._inner, "arerank", None)
+            if arerank is None:
+                return await asyncio.to_thread(lambda: self._inner.rerank(**kwargs))
+            return await arerank(**kwargs)
+
+        outcome, coalesced = await self.flight.ado(key, call)
+        return self._annotate(outcome, coalesced)
+
+
+def _chat_input_key(value: Any) -> Any:
+    to_messages = getattr(value, "to_messages", None)
+    if to_messages is not None:
+        return [(message.type, message.content) for message in to_messages()]
+    return value
+
+
+class CoalescingChatModel(Runnable[Any, Any]):
+    """Chat model wrapper sharing identical in-flight prompts.
+
+    Joined callers receive the leader's message; their own callbacks in
+    ``config`` are not invoked for the shared call.
+    """
+
+    def __init__(self, inner: Runnable[Any, Any], flight: SingleFlight, *, scope: str) -> None:
+        self._inner = inner
+        self.flight = flight
+        self._scope = scope
+
+    @property
+    def circuit_state(self) -> str | None:
+        return getattr(self._inner, "circuit_state", None)
+
+    def _key(self, value: Any, kwargs: Mapping[str, Any]) -> tuple[str, str]:
+        return (self._scope, _digest({"input": _chat_input_key(value), "kwargs": kwargs}))
+
+    def invoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        result, _ = self.flight.do(
+            self._key(input, kwargs),
+            lambda: self._inner.invoke(input, config, **kwargs),
+        )
+        return result
+
+    async def ainvoke(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        result, _ = await self.flight.ado(
+            self._key(input, kwargs),
+            lambda: self._inner.ainvoke(input, config, **kwargs),
+        )
+        return result
+
+    def stream(
+        self,
+        input: Any,  # noqa: A002 - Runnable signature
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Pass streams straight through; chunks are not shared between callers."""
+
+        yield from self._inner.stream(input, config, **kwargs)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> CoalescingChatModel:
+        names = sorted(str(getattr(tool, "name", tool)) for tool in tools)
+        return CoalescingChatModel(
+            self._inner.bind_tools(tools, **kwargs),
+            self.flight,
+            scope=f"{self._scope}|tools={','.join(names)}",
+        )
+
+
+def coalesce_embedding_provider(inner: Any) -> CoalescingEmbeddingProvider:
+    return CoalescingEmbeddingProvider(inner, get_single_flight("embedding"))
+
+
+def coalesce_rerank_provider(inner: Any) -> CoalescingRerankProvider:
+    return CoalescingRerankProvider(inner, get_single_flight("rerank"))
+
+
+def coalesce_chat_model(inner: Runnable[Any, Any], *, model: str) -> CoalescingChatModel:
+    return CoalescingChatModel(inner, get_single_flight("llm"), scope=model)
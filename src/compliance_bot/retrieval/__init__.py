@@ -1,29 +1,85 @@
 """Week 3 retrieval foundation modules."""
 
-from compliance_bot.retrieval.indexer import RetrievalIndex, build_retrieval_index, load_manifest
+from compliance_bot.retrieval.embedding_store import (
+    EmbeddingStore,
+    load_cached_retrieval_index,
+    referenced_content_hashes,
+)
+from compliance_bot.retrieval.indexer import (
+    EmbeddingCache,
+    EmbeddingJobConfig,
+    EmbeddingJobError,
+    EmbeddingJobProgress,
+    RetrievalIndex,
+    build_retrieval_index,
+    build_retrieval_index_from_chunks,
+    load_manifest,
+    load_retrieval_index,
+    plan_embedding_batches,
+    read_manifest_header,
+    run_embedding_job,
+    stream_manifest,
+    update_retrieval_index,
+)
+from compliance_bot.retrieval.live_index import LiveRetrievalIndex
 from compliance_bot.retrieval.query_rewriter import (
+    arewrite_query,
     build_query_rewriter_chain,
     fallback_query_rewrite,
     invoke_query_rewriter,
     rewrite_query,
 )
+from compliance_bot.retrieval.rerank_payload import (
+    RerankPayload,
+    RerankPayloadConfig,
+    build_rerank_payload,
+    expand_rerank_results,
+    parse_rerank_budget,
+    trim_candidate_text,
+)
 from compliance_bot.retrieval.retriever import (
     MetadataKeywordRetriever,
     RETRIEVER_CONFIG_REGISTRY,
+    arun_retrieval,
     get_retriever_config,
+    resolve_retriever_config,
     run_retrieval,
 )
 
 __all__ = [
     "RetrievalIndex",
     "load_manifest",
+    "stream_manifest",
+    "read_manifest_header",
     "build_retrieval_index",
+    "build_retrieval_index_from_chunks",
+    "load_retrieval_index",
+    "update_retrieval_index",
+    "LiveRetrievalIndex",
+    "EmbeddingCache",
+    "EmbeddingJobConfig",
+    "EmbeddingJobError",
+    "EmbeddingJobProgress",
+    "plan_embedding_batches",
+    "run_embedding_job",
+    "EmbeddingStore",
+    "load_cached_retrieval_index",
+    "referenced_content_hashes",
     "build_query_rewriter_chain",
     "fallback_query_rewrite",
     "invoke_query_rewriter",
     "rewrite_query",
+    "arewrite_query",
+    "RerankPayload",
+    "RerankPayloadConfig",
+    "build_rerank_payload",
+    "expand_rerank_results",
+    "parse_rerank_budget",
+    "trim_candidate_text",
     "MetadataKeywordRetriever",
     "RETRIEVER_CONFIG_REGISTRY",
     "get_retriever_config",
+    "resolve_retriever_config",
     "run_retrieval",
+    "arun_retrieval",
 ]
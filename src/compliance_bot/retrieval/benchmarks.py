@@ -4,23 +4,56 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+from contextlib import ExitStack
 from pathlib import Path
-from statistics import mean
+from statistics import mean, median
 from time import perf_counter
+from typing import Any, Mapping
 
+from langchain_core.runnables import Runnable
+
+from compliance_bot.chains.citation_chain import (
+    build_citation_answer_chain,
+    resolve_answer_llm,
+    run_citation_answer,
+    run_speculative_answer,
+)
+from compliance_bot.providers.latency import summarize_provider_metrics
 from compliance_bot.providers.provider_registry import (
+    EMBEDDING_PROVIDER_MODES,
+    RERANK_PROVIDER_MODES,
     resolve_embedding_provider,
     resolve_rerank_provider,
 )
-from compliance_bot.retrieval.indexer import RetrievalIndex, build_retrieval_index, load_manifest
-from compliance_bot.retrieval.retriever import run_retrieval
+from compliance_bot.providers.rate_limit import rate_limit_snapshot
+from compliance_bot.devtools.siliconflow_standin import (
+    STAND_IN_ENDPOINTS,
+    SiliconFlowStandIn,
+    StandInConfig,
+    parse_latency_profile,
+)
+from compliance_bot.retrieval.embedding_store import load_cached_retrieval_index
+from compliance_bot.retrieval.indexer import (
+    EmbeddingJobConfig,
+    EmbeddingJobProgress,
+    RetrievalIndex,
+)
+from compliance_bot.retrieval.rerank_payload import RerankPayloadConfig, parse_rerank_budget
+from compliance_bot.retrieval.retriever import get_retriever_config, run_retrieval
+from compliance_bot.schemas.answer import SpeculationBenchmarkReport
 from compliance_bot.schemas.retrieval import (
+    ProviderCallMetrics,
     RetrievalBenchmarkCase,
     RetrievalBenchmarkReport,
     RetrievalBenchmarkResult,
 )
 
 
+_SPECULATION_EXCLUDED_ENV = ("COMPLIANCE_LLM_CACHE_PATH", "COMPLIANCE_PROVIDER_SINGLE_FLIGHT")
+
+
 def _reciprocal_rank(expected_doc_ids: list[str], ranked_doc_ids: list[str]) -> float:
     expected = set(expected_doc_ids)
     if not expected:
@@ -59,6 +92,7 @@ def run_retrieval_benchmarks(
     latency_ceiling_ms: float = 60.0,
     rerank_provider: object | None = None,
     embedding_provider: object | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
 ) -> RetrievalBenchmarkReport:
     """Run recall/latency benchmark cases and return aggregate quality gate result."""
 
@@ -69,6 +103,7 @@ def run_retrieval_benchmarks(
     latencies: list[float] = []
     recalls: list[float] = []
     reciprocal_ranks: list[float] = []
+    provider_metrics: list[ProviderCallMetrics] = []
 
     for case in cases:
         start = perf_counter()
@@ -79,8 +114,10 @@ def run_retrieval_benchmarks(
             top_k=top_k,
             rerank_provider=rerank_provider,  # type: ignore[arg-type]
             embedding_provider=embedding_provider,  # type: ignore[arg-type]
+            rerank_payload=rerank_payload,
         )
         latency_ms = (perf_counter() - start) * 1000.0
+        provider_metrics.extend(response.provider_metrics)
 
         ranked_doc_ids = [chunk.doc_id for chunk in response.retrieved_chunks]
         recall = _recall_at_k(case.expected_doc_ids, ranked_doc_ids)
@@ -105,12 +142,15 @@ def run_retrieval_benchmarks(
     avg_rr = mean(reciprocal_ranks) if reciprocal_ranks else 0.0
     p95_latency = _p95(latencies)
     meets_gate = avg_recall >= recall_floor and p95_latency <= latency_ceiling_ms
+    stage_summaries = summarize_provider_metrics(provider_metrics)
 
     return RetrievalBenchmarkReport(
         top_k=top_k,
         avg_recall_at_k=avg_recall,
         avg_reciprocal_rank=avg_rr,
         p95_latency_ms=p95_latency,
+        stage_p95_latency_ms={item.stage: item.p95_ms for item in stage_summaries},
+        stage_payload_bytes={item.stage: item.payload_bytes for item in stage_summaries},
         recall_floor=recall_floor,
         latency_ceiling_ms=latency_ceiling_ms,
         meets_quality_gate=meets_gate,
@@ -118,6 +158,151 @@ def run_retrieval_benchmarks(
     )
 
 
+def compare_rerank_providers(
+    index: RetrievalIndex,
+    *,
+    cases: list[RetrievalBenchmarkCase],
+    rerank_providers: Mapping[str, object | None],
+    top_k: int = 4,
+    recall_floor: float = 0.6,
+    latency_ceiling_ms: float = 60.0,
+    embedding_provider: object | None = None,
+) -> dict[str, RetrievalBenchmarkReport]:
+    """Run the same cases once per rerank provider, keyed by label."""
+
+    return {
+        label: run_retrieval_benchmarks(
+            index,
+            cases=cases,
+            top_k=top_k,
+            recall_floor=recall_floor,
+            latency_ceiling_ms=latency_ceiling_ms,
+            rerank_provider=rerank_provider,
+            embedding_provider=embedding_provider,
+        )
+        for label, rerank_provider in rerank_providers.items()
+    }
+
+
+def compare_rerank_budgets(
+    index: RetrievalIndex,
+    *,
+    cases: list[RetrievalBenchmarkCase],
+    budgets: list[RerankPayloadConfig],
+    rerank_provider: object | None,
+    top_k: int = 4,
+    recall_floor: float = 0.6,
+    latency_ceiling_ms: float = 60.0,
+    embedding_provider: object | None = None,
+) -> dict[str, RetrievalBenchmarkReport]:
+    """Run the same cases once per rerank payload budget, keyed by budget label."""
+
+    return {
+        budget.label: run_retrieval_benchmarks(
+            index,
+            cases=cases,
+            top_k=top_k,
+            recall_floor=recall_floor,
+            latency_ceiling_ms=latency_ceiling_ms,
+            rerank_provider=rerank_provider,
+            embedding_provider=embedding_provider,
+            rerank_payload=budget,
+        )
+        for budget in budgets
+    }
+
+
+def compare_speculative_answering(
+    index: RetrievalIndex,
+    *,
+    cases: list[RetrievalBenchmarkCase],
+    answer_chain: Runnable[Any, Any] | None,
+    rerank_provider: object | None,
+    top_k: int = 4,
+    embedding_provider: object | None = None,
+    min_confidence_for_answer: float = 0.55,
+) -> SpeculationBenchmarkReport:
+    """Answer each case sequentially and speculatively; report latency saved vs tokens.
+
+    ``answer_chain`` must not cache or coalesce LLM calls, or the second pass is
+    served from the first; build it with :func:`speculation_answer_llm`.
+    """
+
+    baseline_latencies: list[float] = []
+    speculative_latencies: list[float] = []
+    outcomes: list[dict[str, Any]] = []
+    for case in cases:
+        start = perf_counter()
+        run_citation_answer(
+            run_retrieval(
+                index,
+                question=case.question,
+                filters=case.filters,
+                top_k=top_k,
+                rerank_provider=rerank_provider,  # type: ignore[arg-type]
+                embedding_provider=embedding_provider,  # type: ignore[arg-type]
+            ),
+            answer_chain=answer_chain,
+            min_confidence_for_answer=min_confidence_for_answer,
+        )
+        baseline_latencies.append((perf_counter() - start) * 1000.0)
+
+        start = perf_counter()
+        response = run_speculative_answer(
+            index,
+            question=case.question,
+            filters=case.filters,
+            top_k=top_k,
+            rerank_provider=rerank_provider,
+            embedding_provider=embedding_provider,
+            answer_chain=answer_chain,
+            min_confidence_for_answer=min_confidence_for_answer,
+        )
+        speculative_latencies.append((perf_counter() - start) * 1000.0)
+        outcomes.extend(
+            event.metadata for event in response.audit_events if event.stage == "answer_speculation"
+        )
+
+    hit_count = sum(1 for item in outcomes if item["speculation"] == "hit")
+    latency_saved_ms = sum(float(item["latency_saved_ms"] or 0.0) for item in outcomes)
+    wasted_tokens = sum(int(item["wasted_tokens"] or 0) for item in outcomes)
+    return SpeculationBenchmarkReport(
+        case_count=len(cases),
+        speculated_count=len(outcomes),
+        hit_count=hit_count,
+        miss_count=len(outcomes) - hit_count,
+        hit_rate=hit_count / len(outcomes) if outcomes else 0.0,
+        baseline_p50_latency_ms=median(baseline_latencies) if cases else 0.0,
+        baseline_p95_latency_ms=_p95(baseline_latencies),
+        speculative_p50_latency_ms=median(speculative_latencies) if cases else 0.0,
+        speculative_p95_latency_ms=_p95(speculative_latencies),
+        latency_saved_ms=latency_saved_ms,
+        wasted_tokens=wasted_tokens,
+        wasted_tokens_per_second_saved=(
+            wasted_tokens / (latency_saved_ms / 1000.0) if latency_saved_ms > 0.0 else 0.0
+        ),
+    )
+
+
+def speculation_answer_llm(
+    mode: str = "auto",
+    *,
+    env: Mapping[str, str] | None = None,
+) -> Runnable[Any, Any] | None:
+    """Build a dedicated answer LLM for :func:`compare_speculative_answering`.
+
+    The LLM response cache and single-flight settings are dropped from ``env`` and
+    the client is not taken from the shared registry, so neither pass can reuse
+    the other's responses.
+    """
+
+    source = env if env is not None else os.environ
+    return resolve_answer_llm(
+        mode,
+        env={key: value for key, value in source.items() if key not in _SPECULATION_EXCLUDED_ENV},
+    )
+
+
 def load_benchmark_cases(path: Path) -> list[RetrievalBenchmarkCase]:
     """Load benchmark case definitions from JSON."""
 
@@ -133,7 +318,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "--manifest-path",
         type=Path,
         required=True,
-        help="Path to manifest JSON generated by Week 2 pipeline",
+        help="Path to manifest JSON or JSONL generated by Week 2 pipeline",
     )
     parser.add_argument(
         "--cases-path",
@@ -141,33 +326,137 @@ def _build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Path to benchmark case JSON file",
     )
-    parser.add_argument("--top-k", type=int, default=1)
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        help="Candidates kept per case (default: the profile's top-k, else 1)",
+    )
     parser.add_argument("--recall-floor", type=float, default=0.75)
     parser.add_argument("--latency-ceiling-ms", type=float, default=60.0)
     parser.add_argument(
         "--embedding-provider",
-        choices=("auto", "none", "siliconflow"),
+        choices=EMBEDDING_PROVIDER_MODES,
         default="auto",
         help="Embedding provider mode for practical retrieval scoring",
     )
     parser.add_argument(
         "--rerank-provider",
+        choices=RERANK_PROVIDER_MODES,
+        default=None,
+        help="Rerank provider mode for practical retrieval scoring (default: profile, else auto)",
+    )
+    parser.add_argument(
+        "--retriever-config",
+        type=str,
+        default=None,
+        help="Named retriever profile; supplies --top-k and --rerank-provider when not given",
+    )
+    parser.add_argument(
+        "--compare-rerank",
+        nargs="+",
+        choices=RERANK_PROVIDER_MODES,
+        default=None,
+        help="Also benchmark each listed rerank mode and print their metrics side by side",
+    )
+    parser.add_argument(
+        "--rerank-budget",
+        type=parse_rerank_budget,
+        default=RerankPayloadConfig(),
+        help="Per-candidate rerank payload budget: full, chars:N, tokens:N, or chars:N+tokens:M",
+    )
+    parser.add_argument(
+        "--compare-rerank-budgets",
+        nargs="+",
+        type=parse_rerank_budget,
+        default=None,
+        help="Also benchmark each listed rerank payload budget (e.g. full chars:400 tokens:48)",
+    )
+    parser.add_argument(
+        "--compare-speculation",
+        action="store_true",
+        help="Also answer each case with and without speculative drafting during rerank",
+    )
+    parser.add_argument(
+        "--llm-provider",
         choices=("auto", "none", "siliconflow"),
         default="auto",
-        help="Rerank provider mode for practical retrieval scoring",
+        help="Answer LLM mode for --compare-speculation",
+    )
+    parser.add_argument(
+        "--embedding-store-path",
+        type=Path,
+        default=None,
+        help="Optional SQLite embedding store; only chunks missing from it are embedded",
+    )
+    parser.add_argument("--embedding-batch-size", type=int, default=64)
+    parser.add_argument("--embedding-batch-chars", type=int, default=32_000)
+    parser.add_argument("--embedding-concurrency", type=int, default=4)
+    parser.add_argument("--embedding-max-attempts", type=int, default=3)
+    parser.add_argument(
+        "--siliconflow-stand-in",
+        action="store_true",
+        help="Serve SiliconFlow providers from an in-process local stand-in server",
+    )
+    parser.add_argument(
+        "--stand-in-latency",
+        type=parse_latency_profile,
+        default=None,
+        help="Stand-in latency for every endpoint, e.g. lognormal:40:20",
     )
     return parser
 
 
+def _print_embedding_progress(progress: EmbeddingJobProgress) -> None:
+    print(
+        f"embedding batches {progress.completed_batches}/{progress.total_batches} "
+        f"chunks {progress.embedded_chunks}/{progress.total_chunks} "
+        f"retries {progress.retries} "
+        f"({progress.chunks_per_second:.1f} chunks/s)",
+        file=sys.stderr,
+    )
+
+
 def main() -> None:
     """CLI entrypoint for Week 3 retrieval quality checks."""
 
     args = _build_parser().parse_args()
-    embedding_provider = resolve_embedding_provider(args.embedding_provider)
-    rerank_provider = resolve_rerank_provider(args.rerank_provider)
-
-    manifest = load_manifest(args.manifest_path)
-    index = build_retrieval_index(manifest, embedding_provider=embedding_provider)
+    with ExitStack() as stack:
+        env: dict[str, str] = dict(os.environ)
+        if args.siliconflow_stand_in:
+            latency = (
+                {endpoint: args.stand_in_latency for endpoint in STAND_IN_ENDPOINTS}
+                if args.stand_in_latency is not None
+                else {}
+            )
+            stand_in = stack.enter_context(SiliconFlowStandIn(StandInConfig(latency=latency)))
+            env.update(stand_in.env(env.get("SILICONFLOW_API_KEY") or "stand-in"))
+            print(f"stand_in_base_url: {stand_in.base_url}")
+        _run_benchmark_cli(args, env)
+
+
+def _run_benchmark_cli(args: argparse.Namespace, env: Mapping[str, str]) -> None:
+    if args.retriever_config is not None:
+        profile = get_retriever_config(args.retriever_config)
+        args.top_k = args.top_k if args.top_k is not None else profile.top_k
+        args.rerank_provider = args.rerank_provider or profile.rerank_mode
+    args.top_k = args.top_k if args.top_k is not None else 1
+    args.rerank_provider = args.rerank_provider or "auto"
+    embedding_provider = resolve_embedding_provider(args.embedding_provider, env=env)
+    rerank_provider = resolve_rerank_provider(args.rerank_provider, env=env)
+
+    index = load_cached_retrieval_index(
+        args.manifest_path,
+        embedding_provider=embedding_provider,
+        embedding_store_path=args.embedding_store_path,
+        embedding_job=EmbeddingJobConfig(
+            max_batch_items=args.embedding_batch_size,
+            max_batch_chars=args.embedding_batch_chars,
+            max_concurrency=args.embedding_concurrency,
+            max_attempts=args.embedding_max_attempts,
+            progress_callback=_print_embedding_progress,
+        ),
+    )
     cases = load_benchmark_cases(args.cases_path)
 
     report = run_retrieval_benchmarks(
@@ -178,6 +467,7 @@ def main() -> None:
         latency_ceiling_ms=args.latency_ceiling_ms,
         embedding_provider=embedding_provider,
         rerank_provider=rerank_provider,
+        rerank_payload=args.rerank_budget,
     )
     resolved_embedding_backend = (
         f"{embedding_provider.provider_name}:{embedding_provider.model}"
@@ -193,11 +483,94 @@ def main() -> None:
     print(f"rerank_provider: {args.rerank_provider}")
     print(f"resolved_embedding_backend: {resolved_embedding_backend}")
     print(f"resolved_rerank_backend: {resolved_rerank_backend}")
+    print(f"rerank_budget: {args.rerank_budget.label}")
     print(f"avg_recall_at_k: {report.avg_recall_at_k:.4f}")
     print(f"avg_reciprocal_rank: {report.avg_reciprocal_rank:.4f}")
     print(f"p95_latency_ms: {report.p95_latency_ms:.2f}")
+    for stage, stage_p95 in report.stage_p95_latency_ms.items():
+        print(f"p95_latency_ms.{stage}: {stage_p95:.2f}")
+    for stage, stage_bytes in report.stage_payload_bytes.items():
+        print(f"payload_bytes.{stage}: {stage_bytes}")
+    for limits in rate_limit_snapshot():
+        prefix = f"rate_limit.{limits.kind}"
+        print(f"{prefix}.model: {limits.model}")
+        print(f"{prefix}.concurrency_limit: {limits.concurrency_limit:.2f}")
+        print(f"{prefix}.throttled_count: {limits.throttled_count}")
+        print(f"{prefix}.rate_limited_count: {limits.rate_limited_count}")
+        print(f"{prefix}.retry_count: {limits.retry_count}")
     print(f"meets_quality_gate: {report.meets_quality_gate}")
 
+    if args.compare_rerank:
+        comparison = compare_rerank_providers(
+            index,
+            cases=cases,
+            rerank_providers={
+                mode: resolve_rerank_provider(mode, env=env)
+                for mode in dict.fromkeys(args.compare_rerank)
+            },
+            top_k=args.top_k,
+            recall_floor=args.recall_floor,
+            latency_ceiling_ms=args.latency_ceiling_ms,
+            embedding_provider=embedding_provider,
+        )
+        for mode, mode_report in comparison.items():
+            print(f"compare.{mode}.avg_recall_at_k: {mode_report.avg_recall_at_k:.4f}")
+            print(f"compare.{mode}.avg_reciprocal_rank: {mode_report.avg_reciprocal_rank:.4f}")
+            print(f"compare.{mode}.p95_latency_ms: {mode_report.p95_latency_ms:.2f}")
+            print(f"compare.{mode}.meets_quality_gate: {mode_report.meets_quality_gate}")
+
+    if args.compare_rerank_budgets:
+        budget_reports = compare_rerank_budgets(
+            index,
+            cases=cases,
+            budgets=list({budget.label: budget for budget in args.compare_rerank_budgets}.values()),
+            rerank_provider=rerank_provider,
+            top_k=args.top_k,
+            recall_floor=args.recall_floor,
+            latency_ceiling_ms=args.latency_ceiling_ms,
+            embedding_provider=embedding_provider,
+        )
+        for label, budget_report in budget_reports.items():
+            prefix = f"budget.{label}"
+            print(f"{prefix}.avg_recall_at_k: {budget_report.avg_recall_at_k:.4f}")
+            print(f"{prefix}.avg_reciprocal_rank: {budget_report.avg_reciprocal_rank:.4f}")
+            print(f"{prefix}.p95_latency_ms: {budget_report.p95_latency_ms:.2f}")
+            rerank_p95 = budget_report.stage_p95_latency_ms.get("rerank", 0.0)
+            print(f"{prefix}.p95_latency_ms.rerank: {rerank_p95:.2f}")
+            rerank_bytes = budget_report.stage_payload_bytes.get("rerank", 0)
+            print(f"{prefix}.payload_bytes.rerank: {rerank_bytes}")
+
+    if args.compare_speculation:
+        llm = speculation_answer_llm(args.llm_provider, env=env)
+        speculation = compare_speculative_answering(
+            index,
+            cases=cases,
+            answer_chain=(
+                build_citation_answer_chain(llm, manifest_hash=index.manifest_hash)
+                if llm is not None
+                else None
+            ),
+            rerank_provider=rerank_provider,
+            top_k=args.top_k,
+            embedding_provider=embedding_provider,
+        )
+        print(f"speculation.speculated_count: {speculation.speculated_count}")
+        print(f"speculation.hit_rate: {speculation.hit_rate:.4f}")
+        print(f"speculation.baseline_p50_latency_ms: {speculation.baseline_p50_latency_ms:.2f}")
+        print(f"speculation.baseline_p95_latency_ms: {speculation.baseline_p95_latency_ms:.2f}")
+        print(
+            f"speculation.speculative_p50_latency_ms: {speculation.speculative_p50_latency_ms:.2f}"
+        )
+        print(
+            f"speculation.speculative_p95_latency_ms: {speculation.speculative_p95_latency_ms:.2f}"
+        )
+        print(f"speculation.latency_saved_ms: {speculation.latency_saved_ms:.2f}")
+        print(f"speculation.wasted_tokens: {speculation.wasted_tokens}")
+        print(
+            "speculation.wasted_tokens_per_second_saved: "
+            f"{speculation.wasted_tokens_per_second_saved:.1f}"
+        )
+
 
 if __name__ == "__main__":
     main()
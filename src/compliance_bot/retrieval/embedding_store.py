@@ -0,0 +1,276 @@
+"""Content-addressed embedding store so unchanged chunks are never re-embedded."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+from compliance_bot.retrieval.indexer import (
+    EmbeddingJobConfig,
+    EmbeddingProvider,
+    RetrievalIndex,
+    content_sha256,
+    load_retrieval_index,
+    stream_manifest,
+)
+
+_SQLITE_MAX_VARIABLES = 500
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    content_sha256 TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, content_sha256)
+)
+"""
+
+
+def _encode_vector(vector: Sequence[float]) -> bytes:
+    return array("d", vector).tobytes()
+
+
+def _decode_vector(blob: bytes) -> list[float]:
+    values = array("d")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+def _batched(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class EmbeddingStore:
+    """SQLite-backed vector store keyed by ``(model, sha256(content))``."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> EmbeddingStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def count(self, model: str | None = None) -> int:
+        """Return the number of stored vectors, optionally for one model."""
+
+        with self._lock:
+            if model is None:
+                row = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT COUNT(*) FROM embeddings WHERE model = ?",
+                    (model,),
+                ).fetchone()
+        return int(row[0])
+
+    def get_many(self, model: str, content_hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return stored vectors for the given content hashes (misses are omitted)."""
+
+        unique_hashes = sorted(set(content_hashes))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for batch in _batched(unique_hashes, _SQLITE_MAX_VARIABLES):
+                placeholders = ",".join("?" for _ in batch)
+                rows = self._connection.execute(
+                    "SELECT content_sha256, vector FROM embeddings "
+                    f"WHERE model = ? AND content_sha256 IN ({placeholders})",
+                    (model, *batch),
+                ).fetchall()
+                for content_hash, blob in rows:
+                    found[content_hash] = _decode_vector(blob)
+        return found
+
+    def put_many(self, model: str, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Insert or replace vectors for one model."""
+
+        rows = [
+            (model, content_hash, len(vector), _encode_vector(vector))
+            for content_hash, vector in vectors.items()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, content_sha256, dim, vector) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def export_jsonl(self, path: Path, *, model: str | None = None) -> int:
+        """Write stored vectors as JSONL and return the number of records."""
+
+        query = "SELECT model, content_sha256, vector FROM embeddings"
+        params: tuple[str, ...] = ()
+        if model is not None:
+            query += " WHERE model = ?"
+            params = (model,)
+        query += " ORDER BY model, content_sha256"
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with self._lock, path.open("w", encoding="utf-8") as handle:
+            for row_model, content_hash, blob in self._connection.execute(query, params):
+                record = {
+                    "model": row_model,
+                    "content_sha256": content_hash,
+                    "vector": _decode_vector(blob),
+                }
+                handle.write(json.dumps(record, sort_keys=True, separators=(",", ":")))
+                handle.write("\n")
+                written += 1
+        return written
+
+    def import_jsonl(self, path: Path, *, batch_size: int = 1000) -> int:
+        """Load vectors exported by :meth:`export_jsonl` and return the record count."""
+
+        imported = 0
+        pending: dict[str, dict[str, list[float]]] = {}
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                record = json.loads(stripped)
+                pending.setdefault(str(record["model"]), {})[str(record["content_sha256"])] = [
+                    float(value) for value in record["vector"]
+                ]
+                imported += 1
+                if imported % batch_size == 0:
+                    for model, vectors in pending.items():
+                        self.put_many(model, vectors)
+                    pending = {}
+        for model, vectors in pending.items():
+            self.put_many(model, vectors)
+        return imported
+
+    def garbage_collect(
+        self,
+        referenced_hashes: Iterable[str],
+        *,
+        model: str | None = None,
+    ) -> int:
+        """Delete vectors whose content hash is not referenced; return rows removed."""
+
+        with self._lock:
+            self._connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS referenced (content_sha256 TEXT PRIMARY KEY)"
+            )
+            self._connection.execute("DELETE FROM referenced")
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO referenced (content_sha256) VALUES (?)",
+                ((content_hash,) for content_hash in referenced_hashes),
+            )
+            query = (
+                "DELETE FROM embeddings WHERE content_sha256 NOT IN "
+                "(SELECT content_sha256 FROM referenced)"
+            )
+            params: tuple[str, ...] = ()
+            if model is not None:
+                query += " AND model = ?"
+                params = (model,)
+            removed = self._connection.execute(query, params).rowcount
+            self._connection.execute("DELETE FROM referenced")
+            self._connection.commit()
+        return int(removed)
+
+
+def referenced_content_hashes(manifest_paths: Iterable[Path]) -> set[str]:
+    """Collect content hashes of every chunk referenced by the given manifests."""
+
+    hashes: set[str] = set()
+    for path in manifest_paths:
+        _, chunks = stream_manifest(path)
+        hashes.update(content_sha256(chunk.content) for chunk in chunks)
+    return hashes
+
+
+def load_cached_retrieval_index(
+    manifest_path: Path,
+    *,
+    embedding_provider: EmbeddingProvider | None = None,
+    embedding_store_path: Path | None = None,
+    embedding_job: EmbeddingJobConfig | None = None,
+) -> RetrievalIndex:
+    """Load a retrieval index, reusing stored vectors when a store path is given."""
+
+    if embedding_provider is None or embedding_store_path is None:
+        return load_retrieval_index(
+            manifest_path,
+            embedding_provider=embedding_provider,
+            embedding_job=embedding_job,
+        )
+
+    with EmbeddingStore(embedding_store_path) as store:
+        return load_retrieval_index(
+            manifest_path,
+            embedding_provider=embedding_provider,
+            embedding_cache=store,
+            embedding_job=embedding_job,
+        )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Manage the content-addressed embedding store")
+    parser.add_argument("--store-path", type=Path, required=True, help="SQLite store file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export vectors to JSONL")
+    export_parser.add_argument("--output-path", type=Path, required=True)
+    export_parser.add_argument("--model", type=str, default=None)
+
+    import_parser = subparsers.add_parser("import", help="Import vectors from JSONL")
+    import_parser.add_argument("--input-path", type=Path, required=True)
+
+    gc_parser = subparsers.add_parser("gc", help="Drop vectors not referenced by any manifest")
+    gc_parser.add_argument(
+        "--manifest-path",
+        type=Path,
+        nargs="+",
+        required=True,
+        help="Manifests (JSON or JSONL) whose chunks must be kept",
+    )
+    gc_parser.add_argument("--model", type=str, default=None)
+    return parser
+
+
+def main() -> None:
+    """CLI entrypoint for embedding store maintenance."""
+
+    args = _build_parser().parse_args()
+    with EmbeddingStore(args.store_path) as store:
+        if args.command == "export":
+            count = store.export_jsonl(args.output_path, model=args.model)
+            print(f"exported: {count}")
+        elif args.command == "import":
+            count = store.import_jsonl(args.input_path)
+            print(f"imported: {count}")
+        else:
+            removed = store.garbage_collect(
+                referenced_content_hashes(args.manifest_path),
+                model=args.model,
+            )
+            print(f"removed: {removed}")
+        print(f"stored: {store.count()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from hashlib import sha256
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Callable, Iterable, Iterator, Mapping, Protocol, Sequence
 
 from pydantic import BaseModel, Field
 
-from compliance_bot.schemas.ingestion import ChunkRecord, CorpusManifest
+from compliance_bot.providers.latency import payload_bytes, record_provider_calls
+from compliance_bot.schemas.ingestion import ChunkRecord, CorpusManifest, ManifestHeader
+from compliance_bot.schemas.retrieval import ProviderCallMetrics
 
 _TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
 
@@ -35,6 +41,7 @@ class RetrievalIndex(BaseModel):
     token_to_chunk_ids: dict[str, list[str]] = Field(default_factory=dict)
     chunk_lookup: dict[str, IndexedChunk] = Field(default_factory=dict)
     vector_dim: int = Field(default=0, ge=0)
+    manifest_hash: str | None = None
 
 
 class EmbeddingProvider(Protocol):
@@ -47,14 +54,105 @@ class EmbeddingProvider(Protocol):
         """Return one embedding vector per text."""
 
 
+class EmbeddingCache(Protocol):
+    """Vector cache keyed by model and content hash, consulted before embedding."""
+
+    def get_many(self, model: str, content_hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return cached vectors for the given content hashes."""
+
+    def put_many(self, model: str, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store freshly embedded vectors."""
+
+
+def content_sha256(text: str) -> str:
+    """Return the content address used to key cached embeddings."""
+
+    return sha256(text.encode("utf-8")).hexdigest()
+
+
 def tokenize(text: str) -> list[str]:
     """Tokenize plain text into lowercase alphanumeric terms."""
 
     return _TOKEN_PATTERN.findall(text.lower())
 
 
+def token_spans(text: str) -> list[tuple[int, int, str]]:
+    """Return ``(start, end, term)`` for each :func:`tokenize` term in ``text``."""
+
+    return [
+        (match.start(), match.end(), match.group())
+        for match in _TOKEN_PATTERN.finditer(text.lower())
+    ]
+
+
+def _is_jsonl_manifest(path: Path) -> bool:
+    return path.suffix.lower() == ".jsonl"
+
+
+def _iter_jsonl_objects(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            payload = json.loads(stripped)
+            if not isinstance(payload, dict):
+                raise ValueError(f"manifest line {line_number} must be a JSON object: {path}")
+            yield payload
+
+
+def _iter_counted_chunks(
+    records: Iterator[dict[str, Any]],
+    *,
+    header: ManifestHeader,
+    path: Path,
+) -> Iterator[ChunkRecord]:
+    count = 0
+    for record in records:
+        count += 1
+        yield ChunkRecord.model_validate(record)
+    if count != header.chunk_count:
+        raise ValueError(
+            f"manifest header declares {header.chunk_count} chunks but {count} were read: {path}"
+        )
+
+
+def stream_manifest(path: Path) -> tuple[ManifestHeader, Iterator[ChunkRecord]]:
+    """Open a manifest and return its header plus a lazy chunk iterator.
+
+    JSONL manifests are read line by line so chunks never need to be held
+    in memory all at once. JSON manifests are parsed in full for compatibility.
+    """
+
+    if _is_jsonl_manifest(path):
+        records = _iter_jsonl_objects(path)
+        try:
+            header = ManifestHeader.model_validate(next(records))
+        except StopIteration as exc:
+            raise ValueError(f"manifest is empty: {path}") from exc
+        return header, _iter_counted_chunks(records, header=header, path=path)
+
+    manifest = load_manifest(path)
+    header = ManifestHeader.model_validate(manifest.model_dump(exclude={"chunks"}))
+    return header, iter(manifest.chunks)
+
+
+def read_manifest_header(path: Path) -> ManifestHeader:
+    """Read only the manifest summary fields (first line for JSONL manifests)."""
+
+    header, chunks = stream_manifest(path)
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+    return header
+
+
 def load_manifest(path: Path) -> CorpusManifest:
-    """Load a Week 2 manifest artifact from disk."""
+    """Load a Week 2 manifest artifact (JSON or JSONL) from disk."""
+
+    if _is_jsonl_manifest(path):
+        header, chunks = stream_manifest(path)
+        return CorpusManifest(**header.model_dump(), chunks=list(chunks))
 
     payload = json.loads(path.read_text(encoding="utf-8"))
     return CorpusManifest.model_validate(payload)
@@ -74,33 +172,323 @@ def _to_indexed_chunk(chunk: ChunkRecord, *, vector: list[float] | None = None)
     )
 
 
+@dataclass(frozen=True)
+class EmbeddingJobProgress:
+    """Progress snapshot emitted after each embedding batch completes."""
+
+    completed_batches: int
+    total_batches: int
+    embedded_chunks: int
+    total_chunks: int
+    retries: int
+    elapsed_seconds: float
+
+    @property
+    def chunks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.embedded_chunks / self.elapsed_seconds
+
+
+@dataclass(frozen=True)
+class EmbeddingJobConfig:
+    """Batching, concurrency, and retry limits for document embedding.
+
+    ``max_attempts`` applies only to providers without a rate limiter; a
+    limiter-backed provider already retries 429s, 5xx, and connection errors
+    itself, so its batches are attempted once here to avoid stacked retries.
+    """
+
+    max_batch_items: int = 64
+    max_batch_chars: int = 32_000
+    max_concurrency: int = 4
+    max_attempts: int = 3
+    backoff_seconds: float = 0.5
+    progress_callback: Callable[[EmbeddingJobProgress], None] | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_batch_items <= 0:
+            raise ValueError("max_batch_items must be positive")
+        if self.max_batch_chars <= 0:
+            raise ValueError("max_batch_chars must be positive")
+        if self.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if self.max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        if self.backoff_seconds < 0:
+            raise ValueError("backoff_seconds must be non-negative")
+
+
+class EmbeddingJobError(RuntimeError):
+    """Raised when embedding batches fail after retries; keeps completed vectors."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        partial_vectors: dict[int, list[float]],
+        failed_batches: list[tuple[int, int]],
+    ) -> None:
+        super().__init__(message)
+        self.partial_vectors = partial_vectors
+        self.failed_batches = failed_batches
+
+
+def plan_embedding_batches(
+    texts: Sequence[str],
+    *,
+    max_batch_items: int,
+    max_batch_chars: int,
+) -> list[tuple[int, int]]:
+    """Split texts into contiguous ``[start, end)`` batches under both caps.
+
+    A single text longer than ``max_batch_chars`` still gets a batch of its own.
+    """
+
+    batches: list[tuple[int, int]] = []
+    start = 0
+    chars = 0
+    for position, text in enumerate(texts):
+        items = position - start
+        if items and (items >= max_batch_items or chars + len(text) > max_batch_chars):
+            batches.append((start, position))
+            start = position
+            chars = 0
+        chars += len(text)
+    if start < len(texts):
+        batches.append((start, len(texts)))
+    return batches
+
+
+def _record_embed_documents_call(
+    embedding_provider: EmbeddingProvider,
+    texts: Sequence[str],
+    size: int,
+    start: float,
+    *,
+    status: str,
+) -> None:
+    record_provider_calls(
+        [
+            ProviderCallMetrics(
+                provider=getattr(embedding_provider, "provider_name", "embedding-provider"),
+                model=getattr(embedding_provider, "model", "unknown"),
+                latency_ms=(time.perf_counter() - start) * 1000.0,
+                status=status,
+                error_code=None if status == "ok" else "embed_documents_failed",
+                stage="embed_documents",
+                payload_bytes=size,
+                item_count=len(texts),
+            )
+        ]
+    )
+
+
+def _is_rate_limited_provider(provider: Any) -> bool:
+    """True when ``provider`` (or a layer it wraps) retries through a rate limiter."""
+
+    seen: list[Any] = []
+    current = provider
+    while current is not None and all(current is not layer for layer in seen):
+        if getattr(current, "rate_limiter", None) is not None:
+            return True
+        seen.append(current)
+        current = getattr(current, "_inner", None)
+    return False
+
+
+def _embed_batch_with_retry(
+    embedding_provider: EmbeddingProvider,
+    texts: Sequence[str],
+    *,
+    config: EmbeddingJobConfig,
+    sleep_fn: Callable[[float], None],
+) -> tuple[list[list[float]], int]:
+    attempt = 0
+    max_attempts = 1 if _is_rate_limited_provider(embedding_provider) else config.max_attempts
+    size = payload_bytes(texts)
+    while True:
+        attempt += 1
+        start = time.perf_counter()
+        try:
+            raw_vectors = embedding_provider.embed_documents(list(texts))
+            if len(raw_vectors) != len(texts):
+                raise ValueError("embedding provider returned unexpected vector count")
+            _record_embed_documents_call(embedding_provider, texts, size, start, status="ok")
+            return [list(vector) for vector in raw_vectors], attempt - 1
+        except Exception:
+            _record_embed_documents_call(embedding_provider, texts, size, start, status="error")
+            if attempt >= max_attempts:
+                raise
+            sleep_fn(config.backoff_seconds * (2 ** (attempt - 1)))
+
+
+def run_embedding_job(
+    embedding_provider: EmbeddingProvider,
+    texts: Sequence[str],
+    *,
+    config: EmbeddingJobConfig | None = None,
+    sleep_fn: Callable[[float], None] = time.sleep,
+) -> list[list[float]]:
+    """Embed texts in size-capped batches with bounded concurrency and retries.
+
+    Batches that succeed are kept even when others fail; the failure is raised as
+    :class:`EmbeddingJobError` carrying the vectors embedded so far.
+    """
+
+    resolved = config or EmbeddingJobConfig()
+    batches = plan_embedding_batches(
+        texts,
+        max_batch_items=resolved.max_batch_items,
+        max_batch_chars=resolved.max_batch_chars,
+    )
+    vectors: dict[int, list[float]] = {}
+    failed: list[tuple[int, int]] = []
+    errors: list[BaseException] = []
+    retries = 0
+    completed = 0
+    started = time.perf_counter()
+
+    max_workers = min(resolved.max_concurrency, max(len(batches), 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                _embed_batch_with_retry,
+                embedding_provider,
+                texts[start:end],
+                config=resolved,
+                sleep_fn=sleep_fn,
+            ): (start, end)
+            for start, end in batches
+        }
+        for future in as_completed(futures):
+            start, end = futures[future]
+            try:
+                batch_vectors, batch_retries = future.result()
+            except Exception as exc:
+                failed.append((start, end))
+                errors.append(exc)
+                retries += resolved.max_attempts - 1
+            else:
+                vectors.update(zip(range(start, end), batch_vectors))
+                retries += batch_retries
+            completed += 1
+            if resolved.progress_callback is not None:
+                resolved.progress_callback(
+                    EmbeddingJobProgress(
+                        completed_batches=completed,
+                        total_batches=len(batches),
+                        embedded_chunks=len(vectors),
+                        total_chunks=len(texts),
+                        retries=retries,
+                        elapsed_seconds=time.perf_counter() - started,
+                    )
+                )
+
+    if failed:
+        failed.sort()
+        raise EmbeddingJobError(
+            f"{len(failed)} of {len(batches)} embedding batches failed: {errors[0]}",
+            partial_vectors=vectors,
+            failed_batches=failed,
+        ) from errors[0]
+    return [vectors[position] for position in range(len(texts))]
+
+
+def _embed_documents(
+    embedding_provider: EmbeddingProvider,
+    texts: list[str],
+    *,
+    embedding_cache: EmbeddingCache | None,
+    embedding_job: EmbeddingJobConfig | None = None,
+) -> list[list[float]]:
+    """Embed texts, asking the provider only for vectors missing from the cache."""
+
+    if embedding_cache is None:
+        return run_embedding_job(embedding_provider, texts, config=embedding_job)
+
+    model = embedding_provider.model
+    content_hashes = [content_sha256(text) for text in texts]
+    vectors = embedding_cache.get_many(model, content_hashes)
+
+    missing: dict[str, str] = {}
+    for content_hash, text in zip(content_hashes, texts, strict=True):
+        if content_hash not in vectors and content_hash not in missing:
+            missing[content_hash] = text
+
+    if missing:
+        missing_hashes = list(missing)
+        try:
+            raw_vectors = run_embedding_job(
+                embedding_provider,
+                list(missing.values()),
+                config=embedding_job,
+            )
+        except EmbeddingJobError as exc:
+            partial = {
+                missing_hashes[position]: vector
+                for position, vector in exc.partial_vectors.items()
+            }
+            embedding_cache.put_many(model, partial)
+            raise
+        embedded = dict(zip(missing_hashes, raw_vectors, strict=True))
+        embedding_cache.put_many(model, embedded)
+        vectors.update(embedded)
+
+    return [vectors[content_hash] for content_hash in content_hashes]
+
+
 def build_retrieval_index(
     manifest: CorpusManifest,
     *,
     embedding_provider: EmbeddingProvider | None = None,
+    embedding_cache: EmbeddingCache | None = None,
+    embedding_job: EmbeddingJobConfig | None = None,
 ) -> RetrievalIndex:
     """Build deterministic in-memory retrieval index from a corpus manifest."""
 
-    ordered_chunks = sorted(
+    index = build_retrieval_index_from_chunks(
         manifest.chunks,
+        version_tag=manifest.version_tag,
+        embedding_provider=embedding_provider,
+        embedding_cache=embedding_cache,
+        embedding_job=embedding_job,
+    )
+    index.manifest_hash = manifest.manifest_hash
+    return index
+
+
+def build_retrieval_index_from_chunks(
+    chunks: Iterable[ChunkRecord],
+    *,
+    version_tag: str,
+    embedding_provider: EmbeddingProvider | None = None,
+    embedding_cache: EmbeddingCache | None = None,
+    embedding_job: EmbeddingJobConfig | None = None,
+) -> RetrievalIndex:
+    """Build a retrieval index from chunk records consumed one at a time."""
+
+    indexed_chunks = sorted(
+        (_to_indexed_chunk(chunk) for chunk in chunks),
         key=lambda item: (item.doc_id, item.chunk_index, item.chunk_id),
     )
 
-    vectors: list[list[float] | None]
-    if embedding_provider is None:
-        vectors = [None] * len(ordered_chunks)
-    else:
-        raw_vectors = embedding_provider.embed_documents(
-            [chunk.content for chunk in ordered_chunks]
+    if embedding_provider is not None:
+        vectors = _embed_documents(
+            embedding_provider,
+            [chunk.content for chunk in indexed_chunks],
+            embedding_cache=embedding_cache,
+            embedding_job=embedding_job,
         )
-        if len(raw_vectors) != len(ordered_chunks):
-            raise ValueError("embedding provider returned unexpected vector count")
-        vectors = [list(vector) for vector in raw_vectors]
+        for chunk, vector in zip(indexed_chunks, vectors, strict=True):
+            chunk.vector = vector
+
+    return _assemble_index(indexed_chunks, version_tag=version_tag)
+
+
+def _assemble_index(indexed_chunks: list[IndexedChunk], *, version_tag: str) -> RetrievalIndex:
+    """Build token and chunk lookups over chunks already sorted in index order."""
 
-    indexed_chunks = [
-        _to_indexed_chunk(chunk, vector=vector)
-        for chunk, vector in zip(ordered_chunks, vectors, strict=True)
-    ]
     token_to_chunk_ids: dict[str, list[str]] = {}
     chunk_lookup: dict[str, IndexedChunk] = {}
 
@@ -113,9 +501,74 @@ def build_retrieval_index(
         chunk_ids.sort()
 
     return RetrievalIndex(
-        version_tag=manifest.version_tag,
+        version_tag=version_tag,
         chunks=indexed_chunks,
         token_to_chunk_ids=token_to_chunk_ids,
         chunk_lookup=chunk_lookup,
         vector_dim=len(indexed_chunks[0].vector) if indexed_chunks and indexed_chunks[0].vector else 0,
     )
+
+
+def update_retrieval_index(
+    index: RetrievalIndex,
+    *,
+    changed_chunks: Iterable[ChunkRecord] = (),
+    removed_doc_ids: Iterable[str] = (),
+    embedding_provider: EmbeddingProvider | None = None,
+    embedding_cache: EmbeddingCache | None = None,
+    embedding_job: EmbeddingJobConfig | None = None,
+    manifest_hash: str | None = None,
+) -> RetrievalIndex:
+    """Return a new index with changed documents replaced and removed ones dropped.
+
+    ``changed_chunks`` must contain every chunk of each changed document. Chunks
+    of untouched documents are reused as-is, so only changed chunks are tokenized
+    and embedded. The input index is never mutated. The new index carries
+    ``manifest_hash`` when given; otherwise it keeps the input's hash only if no
+    document changed.
+    """
+
+    fresh_chunks = [_to_indexed_chunk(chunk) for chunk in changed_chunks]
+    replaced_doc_ids = {chunk.doc_id for chunk in fresh_chunks} | set(removed_doc_ids)
+
+    if embedding_provider is not None and fresh_chunks:
+        vectors = _embed_documents(
+            embedding_provider,
+            [chunk.content for chunk in fresh_chunks],
+            embedding_cache=embedding_cache,
+            embedding_job=embedding_job,
+        )
+        for chunk, vector in zip(fresh_chunks, vectors, strict=True):
+            chunk.vector = vector
+
+    merged = sorted(
+        [chunk for chunk in index.chunks if chunk.doc_id not in replaced_doc_ids] + fresh_chunks,
+        key=lambda item: (item.doc_id, item.chunk_index, item.chunk_id),
+    )
+    updated = _assemble_index(merged, version_tag=index.version_tag)
+    if manifest_hash is not None:
+        updated.manifest_hash = manifest_hash
+    elif not replaced_doc_ids:
+        updated.manifest_hash = index.manifest_hash
+    return updated
+
+
+def load_retrieval_index(
+    manifest_path: Path,
+    *,
+    embedding_provider: EmbeddingProvider | None = None,
+    embedding_cache: EmbeddingCache | None = None,
+    embedding_job: EmbeddingJobConfig | None = None,
+) -> RetrievalIndex:
+    """Stream a manifest from disk straight into a retrieval index."""
+
+    header, chunks = stream_manifest(manifest_path)
+    index = build_retrieval_index_from_chunks(
+        chunks,
+        version_tag=header.version_tag,
+        embedding_provider=embedding_provider,
+        embedding_cache=embedding_cache,
+        embedding_job=embedding_job,
+    )
+    index.manifest_hash = header.manifest_hash
+    return index
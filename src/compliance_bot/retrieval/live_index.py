@@ -0,0 +1,53 @@
+"""Atomically swappable retrieval index for long-running processes."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from compliance_bot.retrieval.indexer import RetrievalIndex
+
+
+class LiveRetrievalIndex:
+    """Holder for the index that queries should use right now.
+
+    Readers call :meth:`current` once per query and keep using that snapshot, so
+    a concurrent refresh can never hand them a half-updated index. Writers build
+    a complete replacement off to the side and publish it with a single reference
+    assignment; :meth:`update` serializes writers so no refresh is lost.
+    """
+
+    def __init__(self, index: RetrievalIndex) -> None:
+        self._index = index
+        self._generation = 0
+        self._write_lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Number of swaps published since construction."""
+
+        return self._generation
+
+    def current(self) -> RetrievalIndex:
+        """Return the latest fully built index snapshot."""
+
+        return self._index
+
+    def swap(self, index: RetrievalIndex) -> int:
+        """Publish a replacement index and return the new generation."""
+
+        with self._write_lock:
+            return self._publish(index)
+
+    def update(self, build: Callable[[RetrievalIndex], RetrievalIndex]) -> RetrievalIndex:
+        """Build a replacement from the current index under the writer lock and publish it."""
+
+        with self._write_lock:
+            replacement = build(self._index)
+            self._publish(replacement)
+            return replacement
+
+    def _publish(self, index: RetrievalIndex) -> int:
+        self._index = index
+        self._generation += 1
+        return self._generation
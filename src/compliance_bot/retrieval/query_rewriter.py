@@ -8,6 +8,7 @@ from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable, RunnableLambda
 
+from compliance_bot.providers.llm_cache import scope_llm_cache
 from compliance_bot.schemas.retrieval import QueryRewriteOutput
 
 
@@ -49,7 +50,7 @@ def build_query_rewriter_chain(
         ]
     ).partial(format_instructions=parser.get_format_instructions())
 
-    return prompt | llm | RunnableLambda(_to_text) | parser
+    return prompt | scope_llm_cache(llm, "query_rewrite") | RunnableLambda(_to_text) | parser
 
 
 def fallback_query_rewrite(question: str) -> QueryRewriteOutput:
@@ -89,3 +90,18 @@ def rewrite_query(
     if chain is None:
         return fallback_query_rewrite(question)
     return invoke_query_rewriter(chain, question=question)
+
+
+async def arewrite_query(
+    question: str,
+    *,
+    chain: Runnable[Any, QueryRewriteOutput] | None = None,
+) -> QueryRewriteOutput:
+    """Async :func:`rewrite_query`; the LCEL chain is awaited via ``ainvoke``."""
+
+    if chain is None:
+        return fallback_query_rewrite(question)
+    normalized = " ".join(question.split())
+    if not normalized:
+        raise ValueError("question must not be blank")
+    return await chain.ainvoke({"question": normalized})
@@ -0,0 +1,198 @@
+"""Token-budgeted rerank payloads: trimmed, deduplicated candidate texts.
+
+The rerank window holds up to ``2 * top_k`` full chunks, so request size and
+reranker compute grow with chunk length. The builder here trims each candidate
+to a character and/or token budget around the terms that matched the query,
+sends identical texts once, and maps results back to every original candidate.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from compliance_bot.retrieval.indexer import token_spans, tokenize
+from compliance_bot.schemas.retrieval import RerankResult, RetrievedChunk
+
+
+@dataclass(frozen=True)
+class RerankPayloadConfig:
+    """Per-candidate budget for rerank requests.
+
+    ``max_tokens`` counts the same lowercase alphanumeric terms as
+    :func:`~compliance_bot.retrieval.indexer.tokenize`. ``None`` leaves that
+    dimension unbounded; with both unset only deduplication applies.
+    """
+
+    max_chars: int | None = None
+    max_tokens: int | None = None
+    dedupe: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_chars is not None and self.max_chars < 1:
+            raise ValueError("max_chars must be >= 1")
+        if self.max_tokens is not None and self.max_tokens < 1:
+            raise ValueError("max_tokens must be >= 1")
+
+    @property
+    def label(self) -> str:
+        parts = []
+        if self.max_chars is not None:
+            parts.append(f"chars:{self.max_chars}")
+        if self.max_tokens is not None:
+            parts.append(f"tokens:{self.max_tokens}")
+        return "+".join(parts) or "full"
+
+
+def parse_rerank_budget(spec: str) -> RerankPayloadConfig:
+    """Parse ``full``, ``chars:N``, ``tokens:N``, or ``chars:N+tokens:M``."""
+
+    normalized = spec.strip().lower()
+    if normalized == "full":
+        return RerankPayloadConfig()
+
+    limits: dict[str, int] = {}
+    for part in normalized.split("+"):
+        name, _, raw = part.partition(":")
+        if name not in {"chars", "tokens"} or name in limits:
+            raise ValueError(f"invalid rerank budget '{spec}'; expected chars:N and/or tokens:N")
+        try:
+            limits[name] = int(raw)
+        except ValueError as exc:
+            raise ValueError(f"invalid rerank budget '{spec}': {raw!r} is not an integer") from exc
+    return RerankPayloadConfig(max_chars=limits.get("chars"), max_tokens=limits.get("tokens"))
+
+
+@dataclass(frozen=True)
+class RerankPayload:
+    """Provider request plus the mapping from sent texts back to candidates."""
+
+    request: dict[str, Any]
+    candidate_groups: tuple[tuple[int, ...], ...]
+    trimmed_count: int = 0
+    deduplicated_count: int = 0
+
+
+def trim_candidate_text(
+    text: str,
+    focus_terms: set[str],
+    *,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+) -> str:
+    """Cut ``text`` to the budget, keeping the densest run of ``focus_terms`` centred.
+
+    The window always starts and ends on term boundaries. Without any focus term
+    in the text the leading window is kept.
+    """
+
+    if (max_chars is None or len(text) <= max_chars) and max_tokens is None:
+        return text
+    terms = token_spans(text)
+    spans = [(start, end) for start, end, _ in terms]
+    if not spans:
+        return text[:max_chars] if max_chars is not None else text
+    if (max_chars is None or len(text) <= max_chars) and (
+        max_tokens is None or len(spans) <= max_tokens
+    ):
+        return text
+
+    def fits(lo: int, hi: int) -> bool:
+        if max_tokens is not None and hi - lo + 1 > max_tokens:
+            return False
+        return max_chars is None or spans[hi][1] - spans[lo][0] <= max_chars
+
+    hits = [position for position, (_, _, term) in enumerate(terms) if term in focus_terms]
+    center = 0
+    if hits:
+        best_count = 0
+        for left, first_hit in enumerate(hits):
+            right = left
+            while right + 1 < len(hits) and fits(first_hit, hits[right + 1]):
+                right += 1
+            if right - left + 1 > best_count:
+                best_count = right - left + 1
+                center = (first_hit + hits[right]) // 2
+
+    lo = hi = center
+    if not fits(lo, hi):
+        start = spans[center][0]
+        return text[start : start + (max_chars or len(text))]
+    grew = True
+    while grew:
+        grew = False
+        if hi + 1 < len(spans) and fits(lo, hi + 1):
+            hi += 1
+            grew = True
+        if lo > 0 and fits(lo - 1, hi):
+            lo -= 1
+            grew = True
+    return text[spans[lo][0] : spans[hi][1]]
+
+
+def build_rerank_payload(
+    query: str,
+    candidates: list[RetrievedChunk],
+    *,
+    top_n: int,
+    config: RerankPayloadConfig | None = None,
+    include_fields: bool = False,
+) -> RerankPayload:
+    """Build the rerank request for ``candidates`` under ``config``'s budget.
+
+    Each candidate is trimmed around its matched terms (or the query terms when
+    it was retrieved by vector score alone). With ``dedupe`` identical trimmed
+    texts are sent once; ``top_n`` is capped at the number of texts sent.
+    """
+
+    resolved = config or RerankPayloadConfig()
+    query_terms = set(tokenize(query))
+    texts: list[str] = []
+    fields: list[dict[str, str]] = []
+    groups: list[list[int]] = []
+    position_by_text: dict[str, int] = {}
+    trimmed_count = 0
+
+    for candidate_index, chunk in enumerate(candidates):
+        text = trim_candidate_text(
+            chunk.content,
+            set(chunk.matched_terms) or query_terms,
+            max_chars=resolved.max_chars,
+            max_tokens=resolved.max_tokens,
+        )
+        if text != chunk.content:
+            trimmed_count += 1
+        existing = position_by_text.get(text) if resolved.dedupe else None
+        if existing is not None:
+            groups[existing].append(candidate_index)
+            continue
+        position_by_text[text] = len(texts)
+        texts.append(text)
+        fields.append(chunk.metadata)
+        groups.append([candidate_index])
+
+    request: dict[str, Any] = {
+        "query": query,
+        "candidates": texts,
+        "top_n": max(1, min(top_n, len(texts))),
+    }
+    if include_fields:
+        request["candidate_fields"] = fields
+    return RerankPayload(
+        request=request,
+        candidate_groups=tuple(tuple(group) for group in groups),
+        trimmed_count=trimmed_count,
+        deduplicated_count=len(candidates) - len(texts),
+    )
+
+
+def expand_rerank_results(payload: RerankPayload, results: list[Any]) -> list[RerankResult]:
+    """Map results on sent texts back to every candidate that shared the text."""
+
+    expanded: list[RerankResult] = []
+    for result in results:
+        if result.candidate_index < 0 or result.candidate_index >= len(payload.candidate_groups):
+            continue
+        for candidate_index in payload.candidate_groups[result.candidate_index]:
+            expanded.append(RerankResult(candidate_index=candidate_index, score=result.score))
+    return expanded
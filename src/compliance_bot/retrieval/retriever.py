@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from dataclasses import dataclass, field
 from math import sqrt
-from typing import Any, Protocol
+from time import perf_counter
+from typing import Any, Callable, Protocol
 from uuid import uuid4
 
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
@@ -13,10 +16,23 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 
+from compliance_bot.providers.latency import (
+    payload_bytes,
+    record_provider_calls,
+    summarize_provider_metrics,
+)
+from compliance_bot.providers.resilience import CircuitOpenError
+from compliance_bot.providers.single_flight import track_coalescing
 from compliance_bot.providers.siliconflow_rerank import RerankProviderError
 from compliance_bot.retrieval.indexer import IndexedChunk, RetrievalIndex, tokenize
-from compliance_bot.retrieval.query_rewriter import rewrite_query
-from compliance_bot.schemas.audit import build_audit_event
+from compliance_bot.retrieval.query_rewriter import arewrite_query, rewrite_query
+from compliance_bot.retrieval.rerank_payload import (
+    RerankPayload,
+    RerankPayloadConfig,
+    build_rerank_payload,
+    expand_rerank_results,
+)
+from compliance_bot.schemas.audit import AuditEvent, build_audit_event
 from compliance_bot.schemas.query import DecisionEnum
 from compliance_bot.schemas.retrieval import (
     Citation,
@@ -55,11 +71,13 @@ class RerankProvider(Protocol):
 
 
 class RetrieverConfig(BaseModel):
-    """Named retriever config entry used for labs and benchmarks."""
+    """Named retriever config entry used for labs, benchmarks and query entrypoints."""
 
     name: str = Field(..., min_length=1)
     top_k: int = Field(..., ge=1)
     min_score_for_answer: float = Field(..., ge=0.0, le=1.0)
+    rerank_mode: str = Field(default="auto", min_length=1)
+    rerank_payload: RerankPayloadConfig = Field(default_factory=RerankPayloadConfig)
 
 
 RETRIEVER_CONFIG_REGISTRY: dict[str, RetrieverConfig] = {
@@ -69,7 +87,12 @@ RETRIEVER_CONFIG_REGISTRY: dict[str, RetrieverConfig] = {
         top_k=6,
         min_score_for_answer=0.2,
     ),
-    "low-latency": RetrieverConfig(name="low-latency", top_k=3, min_score_for_answer=0.35),
+    "low-latency": RetrieverConfig(
+        name="low-latency",
+        top_k=3,
+        min_score_for_answer=0.35,
+        rerank_mode="local",
+    ),
 }
 
 
@@ -83,6 +106,28 @@ def get_retriever_config(name: str = "balanced") -> RetrieverConfig:
         raise ValueError(f"unknown retriever config '{name}'. available: {available}") from exc
 
 
+def resolve_retriever_config(
+    name: str | None = None,
+    *,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
+    rerank_mode: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
+) -> RetrieverConfig:
+    """Resolve profile ``name`` (default ``balanced``); explicit settings take precedence."""
+
+    profile = get_retriever_config(name or "balanced")
+    overrides = {
+        "top_k": top_k,
+        "min_score_for_answer": min_score_for_answer,
+        "rerank_mode": rerank_mode,
+        "rerank_payload": rerank_payload,
+    }
+    return profile.model_copy(
+        update={key: value for key, value in overrides.items() if value is not None}
+    )
+
+
 def _parse_policy_scope(raw: str | None) -> set[str]:
     if not raw:
         return set()
@@ -258,90 +303,135 @@ def _choose_decision(
 
 
 def _default_provider_metrics(
-    *, provider: str, model: str, status: str, error_code: str | None = None
+    *,
+    provider: str,
+    model: str,
+    status: str,
+    error_code: str | None = None,
+    circuit_state: str | None = None,
+    latency_ms: float = 0.0,
+    stage: str | None = None,
+    payload_size: int | None = None,
+    item_count: int | None = None,
+    coalesced: bool = False,
 ) -> ProviderCallMetrics:
     return ProviderCallMetrics(
         provider=provider,
         model=model,
-        latency_ms=0.0,
+        latency_ms=latency_ms,
         status=status,
         error_code=error_code,
+        circuit_state=circuit_state,
+        stage=stage,
+        payload_bytes=payload_size,
+        item_count=item_count,
+        coalesced=coalesced,
     )
 
 
-def run_retrieval(
-    index: RetrievalIndex,
-    *,
-    question: str,
-    filters: RetrievalFilters | None = None,
-    query_rewriter: Runnable[Any, QueryRewriteOutput] | None = None,
-    embedding_provider: QueryEmbeddingProvider | None = None,
-    rerank_provider: RerankProvider | None = None,
-    top_k: int | None = None,
-    min_score_for_answer: float | None = None,
-    trace_id: str | None = None,
-) -> RetrievalResponse:
-    """Run Week 3 retrieval with provider-backed scoring and safe fallbacks."""
+@dataclass
+class _RetrievalRun:
+    """Resolved inputs and accumulated records shared by sync and async retrieval."""
+
+    trace_id: str
+    question: str
+    filters: RetrievalFilters
+    top_k: int
+    min_score: float
+    rewrite_output: QueryRewriteOutput
+    query_variants: list[str]
+    rerank_payload: RerankPayloadConfig = field(default_factory=RerankPayloadConfig)
+    rerank_trimmed: int = 0
+    rerank_deduplicated: int = 0
+    provider_metrics: list[ProviderCallMetrics] = field(default_factory=list)
+    audit_events: list[AuditEvent] = field(default_factory=list)
 
+
+def _normalize_question(question: str) -> str:
     normalized_question = " ".join(question.split())
     if not normalized_question:
         raise ValueError("question must not be blank")
+    return normalized_question
 
-    resolved_trace_id = trace_id or str(uuid4())
-    resolved_filters = filters or RetrievalFilters()
+
+def _start_retrieval(
+    normalized_question: str,
+    rewrite_output: QueryRewriteOutput,
+    *,
+    filters: RetrievalFilters | None,
+    top_k: int | None,
+    min_score_for_answer: float | None,
+    trace_id: str | None,
+    rerank_payload: RerankPayloadConfig | None,
+) -> _RetrievalRun:
     config = get_retriever_config()
-    resolved_top_k = top_k if top_k is not None else config.top_k
-    resolved_min_score = (
-        min_score_for_answer
-        if min_score_for_answer is not None
-        else config.min_score_for_answer
+    resolved_trace_id = trace_id or str(uuid4())
+    return _RetrievalRun(
+        trace_id=resolved_trace_id,
+        question=normalized_question,
+        filters=filters or RetrievalFilters(),
+        top_k=top_k if top_k is not None else config.top_k,
+        min_score=(
+            min_score_for_answer
+            if min_score_for_answer is not None
+            else config.min_score_for_answer
+        ),
+        rewrite_output=rewrite_output,
+        query_variants=_dedupe_queries(rewrite_output),
+        rerank_payload=rerank_payload or config.rerank_payload,
+        audit_events=[
+            build_audit_event(
+                trace_id=resolved_trace_id,
+                stage="query_rewrite",
+                actor="retrieval.query_rewriter",
+                status="ok",
+                input_payload=normalized_question,
+                output_payload=json.dumps(rewrite_output.model_dump(), sort_keys=True),
+            )
+        ],
     )
 
-    rewrite_output = rewrite_query(
-        normalized_question,
-        chain=query_rewriter,
+
+def _embedding_metrics(
+    embedding_provider: QueryEmbeddingProvider,
+    *,
+    text: str,
+    latency_ms: float,
+    coalesced: bool = False,
+    error: Exception | None = None,
+) -> ProviderCallMetrics:
+    if error is None:
+        error_code = None
+    elif isinstance(error, CircuitOpenError):
+        error_code = "circuit_open"
+    else:
+        error_code = "embed_query_failed"
+    return _default_provider_metrics(
+        provider=getattr(embedding_provider, "provider_name", "embedding-provider"),
+        model=getattr(embedding_provider, "model", "unknown"),
+        status="ok" if error is None else "error",
+        error_code=error_code,
+        circuit_state=getattr(embedding_provider, "circuit_state", None),
+        latency_ms=latency_ms,
+        stage="embed_query",
+        payload_size=payload_bytes([text]),
+        item_count=1,
+        coalesced=coalesced,
     )
-    query_variants = _dedupe_queries(rewrite_output)
 
-    provider_metrics: list[ProviderCallMetrics] = []
-    audit_events = [
-        build_audit_event(
-            trace_id=resolved_trace_id,
-            stage="query_rewrite",
-            actor="retrieval.query_rewriter",
-            status="ok",
-            input_payload=normalized_question,
-            output_payload=json.dumps(rewrite_output.model_dump(), sort_keys=True),
-        )
-    ]
+
+def _collect_candidates(
+    index: RetrievalIndex,
+    run: _RetrievalRun,
+    query_vectors: list[list[float] | None],
+) -> list[RetrievedChunk]:
+    """Score every filtered chunk against each query variant; best score per chunk wins."""
 
     best_by_chunk: dict[str, RetrievedChunk] = {}
-    for query_variant in query_variants:
+    for query_variant, query_vector in zip(run.query_variants, query_vectors, strict=True):
         query_tokens = set(tokenize(query_variant))
-        query_vector: list[float] | None = None
-
-        if embedding_provider is not None and index.vector_dim > 0:
-            try:
-                query_vector = embedding_provider.embed_query(query_variant)
-                provider_metrics.append(
-                    _default_provider_metrics(
-                        provider=getattr(embedding_provider, "provider_name", "embedding-provider"),
-                        model=getattr(embedding_provider, "model", "unknown"),
-                        status="ok",
-                    )
-                )
-            except Exception:
-                provider_metrics.append(
-                    _default_provider_metrics(
-                        provider=getattr(embedding_provider, "provider_name", "embedding-provider"),
-                        model=getattr(embedding_provider, "model", "unknown"),
-                        status="error",
-                        error_code="embed_query_failed",
-                    )
-                )
-
         for chunk in index.chunks:
-            if not _matches_filters(chunk, resolved_filters):
+            if not _matches_filters(chunk, run.filters):
                 continue
 
             lexical_score, matched_terms = _score_chunk_lexical(chunk, query_tokens)
@@ -359,60 +449,125 @@ def run_retrieval(
             if current is None or candidate.retrieval_score > current.retrieval_score:
                 best_by_chunk[candidate.chunk_id] = candidate
 
-    pre_rerank_chunks = sorted(
+    return sorted(
         best_by_chunk.values(),
         key=lambda item: (-item.retrieval_score, item.doc_id, item.chunk_index),
     )
 
-    retrieved_chunks = pre_rerank_chunks[:resolved_top_k]
-    if rerank_provider is not None and pre_rerank_chunks:
-        rerank_candidates = pre_rerank_chunks[: max(resolved_top_k * 2, resolved_top_k)]
-        try:
-            rerank_results, rerank_metrics = rerank_provider.rerank(
-                query=rewrite_output.normalized_query,
-                candidates=[chunk.content for chunk in rerank_candidates],
-                top_n=resolved_top_k,
-            )
-            provider_metrics.append(rerank_metrics)
-            ordered_by_rerank: list[RetrievedChunk] = []
-            for result in rerank_results:
-                if result.candidate_index < 0 or result.candidate_index >= len(rerank_candidates):
-                    continue
-                chunk = rerank_candidates[result.candidate_index]
-                ordered_by_rerank.append(
-                    chunk.model_copy(update={"retrieval_score": max(0.0, min(1.0, float(result.score)))})
-                )
 
-            deduped: dict[str, RetrievedChunk] = {chunk.chunk_id: chunk for chunk in ordered_by_rerank}
-            if deduped:
-                retrieved_chunks = list(deduped.values())[:resolved_top_k]
-        except (RerankProviderError, TimeoutError, ValueError):
-            provider_metrics.append(
-                _default_provider_metrics(
-                    provider=getattr(rerank_provider, "provider_name", "rerank-provider"),
-                    model=getattr(rerank_provider, "model", "unknown"),
-                    status="error",
-                    error_code="rerank_failed",
-                )
-            )
+def _rerank_window(pre_rerank_chunks: list[RetrievedChunk], top_k: int) -> list[RetrievedChunk]:
+    return pre_rerank_chunks[: max(top_k * 2, top_k)]
+
+
+def _rerank_request(
+    rerank_provider: RerankProvider,
+    run: _RetrievalRun,
+    rerank_candidates: list[RetrievedChunk],
+) -> RerankPayload:
+    payload = build_rerank_payload(
+        run.rewrite_output.normalized_query,
+        rerank_candidates,
+        top_n=run.top_k,
+        config=run.rerank_payload,
+        # In-process rerankers can boost matches on section/title metadata.
+        include_fields=getattr(rerank_provider, "uses_candidate_fields", False),
+    )
+    run.rerank_trimmed = payload.trimmed_count
+    run.rerank_deduplicated = payload.deduplicated_count
+    return payload
+
+
+def _apply_rerank_results(
+    rerank_candidates: list[RetrievedChunk],
+    rerank_results: list[Any],
+    *,
+    top_k: int,
+) -> list[RetrievedChunk] | None:
+    """Reorder candidates by rerank results; ``None`` when nothing usable came back."""
+
+    ordered_by_rerank: list[RetrievedChunk] = []
+    for result in rerank_results:
+        if result.candidate_index < 0 or result.candidate_index >= len(rerank_candidates):
+            continue
+        chunk = rerank_candidates[result.candidate_index]
+        ordered_by_rerank.append(
+            chunk.model_copy(update={"retrieval_score": max(0.0, min(1.0, float(result.score)))})
+        )
+
+    deduped: dict[str, RetrievedChunk] = {chunk.chunk_id: chunk for chunk in ordered_by_rerank}
+    if not deduped:
+        return None
+    return list(deduped.values())[:top_k]
+
+
+def _rerank_payload_size(request: dict[str, Any]) -> int:
+    return payload_bytes([request["query"], *request["candidates"]])
+
+
+def _rerank_success_metrics(
+    metrics: ProviderCallMetrics,
+    request: dict[str, Any],
+) -> ProviderCallMetrics:
+    return metrics.model_copy(
+        update={
+            "stage": metrics.stage or "rerank",
+            "payload_bytes": (
+                metrics.payload_bytes
+                if metrics.payload_bytes is not None
+                else _rerank_payload_size(request)
+            ),
+            "item_count": (
+                metrics.item_count
+                if metrics.item_count is not None
+                else len(request["candidates"])
+            ),
+        }
+    )
+
+
+def _rerank_failure_metrics(
+    rerank_provider: RerankProvider,
+    request: dict[str, Any],
+    *,
+    latency_ms: float,
+    error_code: str = "rerank_failed",
+) -> ProviderCallMetrics:
+    return _default_provider_metrics(
+        provider=getattr(rerank_provider, "provider_name", "rerank-provider"),
+        model=getattr(rerank_provider, "model", "unknown"),
+        status="error",
+        error_code=error_code,
+        circuit_state=getattr(rerank_provider, "circuit_state", None),
+        latency_ms=latency_ms,
+        stage="rerank",
+        payload_size=_rerank_payload_size(request),
+        item_count=len(request["candidates"]),
+    )
+
 
+def _finish_retrieval(
+    run: _RetrievalRun,
+    retrieved_chunks: list[RetrievedChunk],
+) -> RetrievalResponse:
     decision = _choose_decision(
         retrieved_chunks,
-        min_score_for_answer=resolved_min_score,
+        min_score_for_answer=run.min_score,
     )
     citations = [_to_citation(chunk) for chunk in retrieved_chunks]
+    provider_latency = summarize_provider_metrics(run.provider_metrics)
+    record_provider_calls(run.provider_metrics)
 
-    audit_events.append(
+    run.audit_events.append(
         build_audit_event(
-            trace_id=resolved_trace_id,
+            trace_id=run.trace_id,
             stage="retrieval_rank",
             actor="retrieval.retriever",
             status="ok",
             input_payload=json.dumps(
                 {
-                    "queries": query_variants,
-                    "top_k": resolved_top_k,
-                    "filters": resolved_filters.model_dump(),
+                    "queries": run.query_variants,
+                    "top_k": run.top_k,
+                    "filters": run.filters.model_dump(),
                 },
                 sort_keys=True,
             ),
@@ -424,19 +579,250 @@ def run_retrieval(
                 sort_keys=True,
             ),
             metadata={
-                "provider_call_count": len(provider_metrics),
-                "provider_errors": sum(1 for item in provider_metrics if item.status != "ok"),
+                "provider_call_count": len(run.provider_metrics),
+                "provider_errors": sum(1 for item in run.provider_metrics if item.status != "ok"),
+                "coalesced_calls": sum(1 for item in run.provider_metrics if item.coalesced),
+                "rerank_trimmed": run.rerank_trimmed,
+                "rerank_deduplicated": run.rerank_deduplicated,
+                **{f"{item.stage}_latency_ms": round(item.total_ms, 3) for item in provider_latency},
             },
         )
     )
 
     return RetrievalResponse(
-        trace_id=resolved_trace_id,
-        question=normalized_question,
-        normalized_query=rewrite_output.normalized_query,
+        trace_id=run.trace_id,
+        question=run.question,
+        normalized_query=run.rewrite_output.normalized_query,
         decision=decision,
         citations=citations,
         retrieved_chunks=retrieved_chunks,
-        provider_metrics=provider_metrics,
-        audit_events=audit_events,
+        provider_metrics=run.provider_metrics,
+        provider_latency=provider_latency,
+        audit_events=run.audit_events,
+    )
+
+
+def _provisional_response(
+    run: _RetrievalRun,
+    retrieved_chunks: list[RetrievedChunk],
+) -> RetrievalResponse:
+    """First-stage result as a response, without audit or latency side effects."""
+
+    return RetrievalResponse(
+        trace_id=run.trace_id,
+        question=run.question,
+        normalized_query=run.rewrite_output.normalized_query,
+        decision=_choose_decision(retrieved_chunks, min_score_for_answer=run.min_score),
+        citations=[_to_citation(chunk) for chunk in retrieved_chunks],
+        retrieved_chunks=retrieved_chunks,
+        provider_metrics=list(run.provider_metrics),
+        audit_events=list(run.audit_events),
+    )
+
+
+def run_retrieval(
+    index: RetrievalIndex,
+    *,
+    question: str,
+    filters: RetrievalFilters | None = None,
+    query_rewriter: Runnable[Any, QueryRewriteOutput] | None = None,
+    embedding_provider: QueryEmbeddingProvider | None = None,
+    rerank_provider: RerankProvider | None = None,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
+    trace_id: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
+    on_pre_rerank: Callable[[RetrievalResponse], None] | None = None,
+) -> RetrievalResponse:
+    """Run Week 3 retrieval with provider-backed scoring and safe fallbacks.
+
+    ``rerank_payload`` trims each rerank candidate to a character/token budget;
+    by default candidates are sent whole, and identical texts only once.
+    ``on_pre_rerank`` receives the first-stage top-k just before the rerank call
+    (it is not called when no rerank runs), e.g. to start answering speculatively.
+    """
+
+    normalized_question = _normalize_question(question)
+    run = _start_retrieval(
+        normalized_question,
+        rewrite_query(normalized_question, chain=query_rewriter),
+        filters=filters,
+        top_k=top_k,
+        min_score_for_answer=min_score_for_answer,
+        trace_id=trace_id,
+        rerank_payload=rerank_payload,
+    )
+
+    query_vectors: list[list[float] | None] = []
+    for query_variant in run.query_variants:
+        query_vector: list[float] | None = None
+        if embedding_provider is not None and index.vector_dim > 0:
+            start = perf_counter()
+            with track_coalescing() as tally:
+                try:
+                    query_vector = embedding_provider.embed_query(query_variant)
+                    error: Exception | None = None
+                except Exception as exc:
+                    error = exc
+            run.provider_metrics.append(
+                _embedding_metrics(
+                    embedding_provider,
+                    text=query_variant,
+                    latency_ms=(perf_counter() - start) * 1000.0,
+                    coalesced=tally.coalesced > 0,
+                    error=error,
+                )
+            )
+        query_vectors.append(query_vector)
+
+    pre_rerank_chunks = _collect_candidates(index, run, query_vectors)
+    retrieved_chunks = pre_rerank_chunks[: run.top_k]
+    if rerank_provider is not None and pre_rerank_chunks:
+        rerank_candidates = _rerank_window(pre_rerank_chunks, run.top_k)
+        payload = _rerank_request(rerank_provider, run, rerank_candidates)
+        request = payload.request
+        if on_pre_rerank is not None:
+            on_pre_rerank(_provisional_response(run, retrieved_chunks))
+        start = perf_counter()
+        try:
+            rerank_results, rerank_metrics = rerank_provider.rerank(**request)
+            run.provider_metrics.append(_rerank_success_metrics(rerank_metrics, request))
+            reranked = _apply_rerank_results(
+                rerank_candidates,
+                expand_rerank_results(payload, rerank_results),
+                top_k=run.top_k,
+            )
+            if reranked is not None:
+                retrieved_chunks = reranked
+        except CircuitOpenError:
+            run.provider_metrics.append(
+                _rerank_failure_metrics(
+                    rerank_provider,
+                    request,
+                    latency_ms=(perf_counter() - start) * 1000.0,
+                    error_code="circuit_open",
+                )
+            )
+        except (RerankProviderError, TimeoutError, ValueError):
+            run.provider_metrics.append(
+                _rerank_failure_metrics(
+                    rerank_provider,
+                    request,
+                    latency_ms=(perf_counter() - start) * 1000.0,
+                )
+            )
+
+    return _finish_retrieval(run, retrieved_chunks)
+
+
+async def _aembed_query(
+    embedding_provider: QueryEmbeddingProvider,
+    text: str,
+) -> tuple[list[float] | None, ProviderCallMetrics]:
+    start = perf_counter()
+    vector: list[float] | None = None
+    error: Exception | None = None
+    with track_coalescing() as tally:
+        try:
+            aembed_query = getattr(embedding_provider, "aembed_query", None)
+            if aembed_query is not None:
+                vector = await aembed_query(text)
+            else:
+                vector = await asyncio.to_thread(embedding_provider.embed_query, text)
+        except Exception as exc:
+            error = exc
+    metrics = _embedding_metrics(
+        embedding_provider,
+        text=text,
+        latency_ms=(perf_counter() - start) * 1000.0,
+        coalesced=tally.coalesced > 0,
+        error=error,
     )
+    return vector, metrics
+
+
+async def _arerank(
+    rerank_provider: RerankProvider,
+    request: dict[str, Any],
+) -> tuple[list[Any], ProviderCallMetrics]:
+    arerank = getattr(rerank_provider, "arerank", None)
+    if arerank is not None:
+        return await arerank(**request)
+    return await asyncio.to_thread(lambda: rerank_provider.rerank(**request))
+
+
+async def arun_retrieval(
+    index: RetrievalIndex,
+    *,
+    question: str,
+    filters: RetrievalFilters | None = None,
+    query_rewriter: Runnable[Any, QueryRewriteOutput] | None = None,
+    embedding_provider: QueryEmbeddingProvider | None = None,
+    rerank_provider: RerankProvider | None = None,
+    top_k: int | None = None,
+    min_score_for_answer: float | None = None,
+    trace_id: str | None = None,
+    rerank_payload: RerankPayloadConfig | None = None,
+) -> RetrievalResponse:
+    """Async :func:`run_retrieval` with identical scoring, fallbacks, and audit events.
+
+    Query variants are embedded concurrently. Providers exposing ``aembed_query``
+    or ``arerank`` are awaited natively; sync-only providers run in a worker thread.
+    """
+
+    normalized_question = _normalize_question(question)
+    run = _start_retrieval(
+        normalized_question,
+        await arewrite_query(normalized_question, chain=query_rewriter),
+        filters=filters,
+        top_k=top_k,
+        min_score_for_answer=min_score_for_answer,
+        trace_id=trace_id,
+        rerank_payload=rerank_payload,
+    )
+
+    query_vectors: list[list[float] | None] = [None] * len(run.query_variants)
+    if embedding_provider is not None and index.vector_dim > 0:
+        outcomes = await asyncio.gather(
+            *(_aembed_query(embedding_provider, variant) for variant in run.query_variants)
+        )
+        for position, (vector, metrics) in enumerate(outcomes):
+            query_vectors[position] = vector
+            run.provider_metrics.append(metrics)
+
+    pre_rerank_chunks = _collect_candidates(index, run, query_vectors)
+    retrieved_chunks = pre_rerank_chunks[: run.top_k]
+    if rerank_provider is not None and pre_rerank_chunks:
+        rerank_candidates = _rerank_window(pre_rerank_chunks, run.top_k)
+        payload = _rerank_request(rerank_provider, run, rerank_candidates)
+        request = payload.request
+        start = perf_counter()
+        try:
+            rerank_results, rerank_metrics = await _arerank(rerank_provider, request)
+            run.provider_metrics.append(_rerank_success_metrics(rerank_metrics, request))
+            reranked = _apply_rerank_results(
+                rerank_candidates,
+                expand_rerank_results(payload, rerank_results),
+                top_k=run.top_k,
+            )
+            if reranked is not None:
+                retrieved_chunks = reranked
+        except CircuitOpenError:
+            run.provider_metrics.append(
+                _rerank_failure_metrics(
+                    rerank_provider,
+                    request,
+                    latency_ms=(perf_counter() - start) * 1000.0,
+                    error_code="circuit_open",
+                )
+            )
+        except (RerankProviderError, TimeoutError, ValueError):
+            run.provider_metrics.append(
+                _rerank_failure_metrics(
+                    rerank_provider,
+                    request,
+                    latency_ms=(perf_counter() - start) * 1000.0,
+                )
+            )
+
+    return _finish_retrieval(run, retrieved_chunks)
@@ -1,11 +1,23 @@
 """Pydantic schemas for the compliance bot."""
 
 from compliance_bot.schemas.audit import AuditEvent
-from compliance_bot.schemas.answer import GroundedAnswerDraft, GroundedAnswerResponse
+from compliance_bot.schemas.answer import (
+    AnswerStreamEvent,
+    BatchAnswerSummary,
+    BatchQuestion,
+    GroundedAnswerDraft,
+    GroundedAnswerResponse,
+    SpeculationBenchmarkReport,
+)
 from compliance_bot.schemas.ingestion import (
     ChunkRecord,
     CorpusManifest,
+    DedupReport,
+    IngestionProfile,
+    IngestionStageProfile,
     LoadedDocument,
+    ManifestDiff,
+    ManifestHeader,
     MetadataCoverageReport,
 )
 from compliance_bot.schemas.query import (
@@ -16,7 +28,9 @@ from compliance_bot.schemas.query import (
 from compliance_bot.schemas.retrieval import (
     Citation,
     ProviderCallMetrics,
+    ProviderStageLatency,
     QueryRewriteOutput,
+    RateLimitMetrics,
     RerankResult,
     RetrievedChunk,
     RetrievalBenchmarkCase,
@@ -48,11 +62,18 @@ __all__ = [
     "ChunkRecord",
     "MetadataCoverageReport",
     "CorpusManifest",
+    "ManifestHeader",
+    "ManifestDiff",
+    "DedupReport",
+    "IngestionStageProfile",
+    "IngestionProfile",
     "RetrievalFilters",
     "QueryRewriteOutput",
+    "RateLimitMetrics",
     "Citation",
     "RerankResult",
     "ProviderCallMetrics",
+    "ProviderStageLatency",
     "RetrievedChunk",
     "RetrievalResponse",
     "RetrievalBenchmarkCase",
@@ -60,6 +81,10 @@ __all__ = [
     "RetrievalBenchmarkReport",
     "GroundedAnswerDraft",
     "GroundedAnswerResponse",
+    "AnswerStreamEvent",
+    "BatchQuestion",
+    "BatchAnswerSummary",
+    "SpeculationBenchmarkReport",
     "ToolPlan",
     "PolicyRegistryLookupInput",
     "PolicyRegistryMatch",
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from compliance_bot.schemas.audit import AuditEvent
@@ -10,11 +12,15 @@ from compliance_bot.schemas.retrieval import Citation, RetrievedChunk
 
 
 class GroundedAnswerDraft(BaseModel):
-    """Structured LLM draft output before grounding policy enforcement."""
+    """Structured LLM draft output before grounding policy enforcement.
+
+    ``decision`` is declared first so models emit it first, letting a streamed
+    abstention stop generation before any answer text is written.
+    """
 
+    decision: DecisionEnum
     answer: str = Field(..., min_length=1)
     confidence: float = Field(..., ge=0.0, le=1.0)
-    decision: DecisionEnum
     citations: list[Citation] = Field(default_factory=list)
 
     @field_validator("answer")
@@ -51,3 +57,80 @@ class GroundedAnswerResponse(BaseModel):
         if self.decision == DecisionEnum.ANSWERED and not self.citations:
             raise ValueError("ANSWERED response must include at least one citation")
         return self
+
+
+class AnswerStreamEvent(BaseModel):
+    """One incremental update from streaming grounded answer generation."""
+
+    event: Literal["decision", "answer_delta", "citation", "done"]
+    elapsed_ms: float = Field(..., ge=0.0)
+    decision: DecisionEnum | None = None
+    text: str | None = None
+    citation: Citation | None = None
+    citation_valid: bool | None = None
+    response: GroundedAnswerResponse | None = None
+
+
+class BatchQuestion(BaseModel):
+    """One line of a batch answering input file."""
+
+    question: str = Field(..., min_length=1)
+    trace_id: str | None = None
+    jurisdiction: str | None = None
+    policy_scope: list[str] = Field(default_factory=list)
+
+    @field_validator("question")
+    @classmethod
+    def validate_question(cls, value: str) -> str:
+        normalized = " ".join(value.split())
+        if not normalized:
+            raise ValueError("question must not be blank")
+        return normalized
+
+
+class BatchAnswerSummary(BaseModel):
+    """Throughput, latency percentiles, and outcomes of one batch answering run.
+
+    Per-question latency is retrieval plus answer time for that question; queueing
+    behind ``max_concurrency`` shows up in ``elapsed_ms`` and throughput instead.
+    Retrieval and answering overlap across questions, so ``retrieval_elapsed_ms``
+    and ``answer_elapsed_ms`` sum each stage's time over all questions. Questions
+    that raised are counted in ``error_count`` and left out of ``throughput_qps``
+    (answered questions per second of ``elapsed_ms``), the latency percentiles,
+    and ``answer_elapsed_ms``.
+    """
+
+    question_count: int = Field(..., ge=0)
+    max_concurrency: int = Field(..., ge=1)
+    elapsed_ms: float = Field(..., ge=0.0)
+    retrieval_elapsed_ms: float = Field(..., ge=0.0)
+    answer_elapsed_ms: float = Field(..., ge=0.0)
+    error_count: int = Field(default=0, ge=0)
+    throughput_qps: float = Field(..., ge=0.0)
+    p50_latency_ms: float = Field(..., ge=0.0)
+    p95_latency_ms: float = Field(..., ge=0.0)
+    p99_latency_ms: float = Field(..., ge=0.0)
+    decision_counts: dict[str, int] = Field(default_factory=dict)
+    abstention_reasons: dict[str, int] = Field(default_factory=dict)
+
+
+class SpeculationBenchmarkReport(BaseModel):
+    """Latency saved against extra tokens spent by speculative answer drafting.
+
+    Each case is answered once sequentially (retrieve, rerank, then answer) and
+    once speculatively. ``latency_saved_ms`` sums the rerank/answer overlap of hits;
+    ``wasted_tokens`` sums the tokens misses spent on discarded drafts.
+    """
+
+    case_count: int = Field(..., ge=0)
+    speculated_count: int = Field(..., ge=0)
+    hit_count: int = Field(..., ge=0)
+    miss_count: int = Field(..., ge=0)
+    hit_rate: float = Field(..., ge=0.0, le=1.0)
+    baseline_p50_latency_ms: float = Field(..., ge=0.0)
+    baseline_p95_latency_ms: float = Field(..., ge=0.0)
+    speculative_p50_latency_ms: float = Field(..., ge=0.0)
+    speculative_p95_latency_ms: float = Field(..., ge=0.0)
+    latency_saved_ms: float = Field(..., ge=0.0)
+    wasted_tokens: int = Field(..., ge=0)
+    wasted_tokens_per_second_saved: float = Field(..., ge=0.0)
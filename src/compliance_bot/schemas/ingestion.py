@@ -40,6 +40,17 @@ class MetadataCoverageReport(BaseModel):
     coverage_by_key: dict[str, float] = Field(default_factory=dict)
 
 
+class ManifestHeader(BaseModel):
+    """Manifest summary fields written as the first line of a JSONL manifest."""
+
+    version_tag: str = Field(..., min_length=1)
+    manifest_hash: str = Field(..., min_length=32)
+    doc_count: int = Field(..., ge=0)
+    chunk_count: int = Field(..., ge=0)
+    metadata_coverage: dict[str, float] = Field(default_factory=dict)
+    doc_hashes: dict[str, str] = Field(default_factory=dict)
+
+
 class CorpusManifest(BaseModel):
     """Deterministic corpus manifest for versioned snapshots."""
 
@@ -48,4 +59,55 @@ class CorpusManifest(BaseModel):
     doc_count: int = Field(..., ge=0)
     chunk_count: int = Field(..., ge=0)
     metadata_coverage: dict[str, float] = Field(default_factory=dict)
+    doc_hashes: dict[str, str] = Field(default_factory=dict)
     chunks: list[ChunkRecord] = Field(default_factory=list)
+
+
+class ManifestDiff(BaseModel):
+    """Document-level difference between two manifest snapshots."""
+
+    old_manifest_hash: str = Field(..., min_length=32)
+    new_manifest_hash: str = Field(..., min_length=32)
+    added_doc_ids: list[str] = Field(default_factory=list)
+    removed_doc_ids: list[str] = Field(default_factory=list)
+    changed_doc_ids: list[str] = Field(default_factory=list)
+    unchanged_doc_count: int = Field(default=0, ge=0)
+
+
+class DedupReport(BaseModel):
+    """Near-duplicate chunk summary with the index and embedding cost it saves."""
+
+    mode: str = Field(..., min_length=1)
+    threshold: float = Field(..., ge=0.0, le=1.0)
+    input_chunk_count: int = Field(..., ge=0)
+    output_chunk_count: int = Field(..., ge=0)
+    duplicate_chunk_count: int = Field(default=0, ge=0)
+    duplicate_group_count: int = Field(default=0, ge=0)
+    input_chars: int = Field(default=0, ge=0)
+    duplicate_chars: int = Field(default=0, ge=0)
+    index_chars_saved_ratio: float = Field(default=0.0, ge=0.0, le=1.0)
+    embedding_inputs_saved: int = Field(default=0, ge=0)
+
+
+class IngestionStageProfile(BaseModel):
+    """Resource usage for one ingestion stage."""
+
+    stage: str = Field(..., min_length=1)
+    wall_ms: float = Field(..., ge=0.0)
+    cpu_ms: float = Field(..., ge=0.0)
+    peak_memory_bytes: int = Field(default=0, ge=0)
+    bytes_read: int = Field(default=0, ge=0)
+    bytes_written: int = Field(default=0, ge=0)
+    items: int = Field(default=0, ge=0)
+
+
+class IngestionProfile(BaseModel):
+    """Per-stage ingestion profile written next to the manifest."""
+
+    version_tag: str = Field(..., min_length=1)
+    run_config: dict[str, str] = Field(default_factory=dict)
+    corpus: dict[str, int] = Field(default_factory=dict)
+    stages: list[IngestionStageProfile] = Field(default_factory=list)
+    total_wall_ms: float = Field(default=0.0, ge=0.0)
+    total_cpu_ms: float = Field(default=0.0, ge=0.0)
+    peak_memory_bytes: int = Field(default=0, ge=0)
@@ -88,6 +88,46 @@ class ProviderCallMetrics(BaseModel):
     latency_ms: float = Field(..., ge=0.0)
     status: str = Field(..., min_length=1)
     error_code: str | None = None
+    circuit_state: str | None = None
+    hedged: bool = False
+    coalesced: bool = False
+    stage: str | None = None
+    payload_bytes: int | None = Field(default=None, ge=0)
+    item_count: int | None = Field(default=None, ge=0)
+
+
+class ProviderStageLatency(BaseModel):
+    """Latency histogram summary for one provider stage (e.g. ``embed_query``)."""
+
+    stage: str = Field(..., min_length=1)
+    count: int = Field(..., ge=0)
+    error_count: int = Field(default=0, ge=0)
+    coalesced_count: int = Field(default=0, ge=0)
+    total_ms: float = Field(..., ge=0.0)
+    p50_ms: float = Field(..., ge=0.0)
+    p95_ms: float = Field(..., ge=0.0)
+    max_ms: float = Field(..., ge=0.0)
+    payload_bytes: int = Field(default=0, ge=0)
+    item_count: int = Field(default=0, ge=0)
+    buckets: dict[str, int] = Field(default_factory=dict)
+
+
+class RateLimitMetrics(BaseModel):
+    """Current client-side limits and throttling counters for one provider model."""
+
+    kind: str = Field(..., min_length=1)
+    model: str = Field(..., min_length=1)
+    requests_per_second: float = Field(..., ge=0.0)
+    burst: int = Field(..., ge=1)
+    available_tokens: float = Field(..., ge=0.0)
+    concurrency_limit: float = Field(..., ge=0.0)
+    max_concurrency: int = Field(..., ge=1)
+    in_flight: int = Field(..., ge=0)
+    paused_ms: float = Field(default=0.0, ge=0.0)
+    throttled_count: int = Field(default=0, ge=0)
+    rate_limited_count: int = Field(default=0, ge=0)
+    timeout_count: int = Field(default=0, ge=0)
+    retry_count: int = Field(default=0, ge=0)
 
 
 class RetrievedChunk(BaseModel):
@@ -113,6 +153,7 @@ class RetrievalResponse(BaseModel):
     citations: list[Citation] = Field(default_factory=list)
     retrieved_chunks: list[RetrievedChunk] = Field(default_factory=list)
     provider_metrics: list[ProviderCallMetrics] = Field(default_factory=list)
+    provider_latency: list[ProviderStageLatency] = Field(default_factory=list)
     audit_events: list[AuditEvent] = Field(default_factory=list)
 
 
@@ -146,4 +187,6 @@ class RetrievalBenchmarkReport(BaseModel):
     recall_floor: float = Field(..., ge=0.0, le=1.0)
     latency_ceiling_ms: float = Field(..., ge=0.0)
     meets_quality_gate: bool
+    stage_p95_latency_ms: dict[str, float] = Field(default_factory=dict)
+    stage_payload_bytes: dict[str, int] = Field(default_factory=dict)
     results: list[RetrievalBenchmarkResult] = Field(default_factory=list)
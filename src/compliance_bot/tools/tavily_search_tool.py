@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from dataclasses import dataclass
-from typing import Any, Callable, Mapping
+from typing import Any, Awaitable, Callable, Mapping
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 from langchain_core.tools import BaseTool, StructuredTool
 
+from compliance_bot.providers.http_transport import (
+    AsyncHTTPTransport,
+    get_shared_http_transport,
+    load_http_transport_config,
+)
 from compliance_bot.schemas.tools import (
     TavilySearchInput,
     TavilySearchResult,
@@ -24,6 +28,9 @@ DEFAULT_TAVILY_TIMEOUT_SECONDS = 10.0
 DEFAULT_TAVILY_MAX_RESULTS = 3
 
 RequestFn = Callable[[str, dict[str, str], dict[str, Any], float], dict[str, Any]]
+AsyncRequestFn = Callable[
+    [str, dict[str, str], dict[str, Any], float], Awaitable[dict[str, Any]]
+]
 
 
 @dataclass(frozen=True)
@@ -76,20 +83,14 @@ def _default_request(
     payload: dict[str, Any],
     timeout: float,
 ) -> dict[str, Any]:
-    data = json.dumps(payload).encode("utf-8")
-    request = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(request, timeout=timeout) as response:
-        return json.loads(response.read().decode("utf-8"))
+    return get_shared_http_transport().post_json(url, payload, headers, timeout)
 
 
-def search_tavily(
+def _build_tavily_request(
     tool_input: TavilySearchInput,
     *,
     config: TavilySearchConfig,
-    request_fn: RequestFn | None = None,
-) -> TavilySearchResult:
-    """Call Tavily search and map the response into a stable schema."""
-
+) -> tuple[dict[str, str], dict[str, Any]]:
     payload: dict[str, Any] = {
         "query": tool_input.question,
         "topic": tool_input.topic or config.topic,
@@ -104,14 +105,10 @@ def search_tavily(
         "Authorization": f"Bearer {config.api_key}",
         "Content-Type": "application/json",
     }
-    caller = request_fn or _default_request
-    try:
-        raw = caller(config.base_url, headers, payload, config.timeout_seconds)
-    except TimeoutError as exc:
-        raise TimeoutError("tavily search timed out") from exc
-    except (HTTPError, URLError, OSError) as exc:
-        raise RuntimeError(f"tavily search failed: {exc}") from exc
+    return headers, payload
 
+
+def _map_tavily_response(raw: dict[str, Any], *, payload: dict[str, Any]) -> TavilySearchResult:
     raw_results = raw.get("results", [])
     sources = [
         TavilySearchSource(
@@ -145,6 +142,68 @@ def search_tavily(
     )
 
 
+def search_tavily(
+    tool_input: TavilySearchInput,
+    *,
+    config: TavilySearchConfig,
+    request_fn: RequestFn | None = None,
+) -> TavilySearchResult:
+    """Call Tavily search and map the response into a stable schema."""
+
+    headers, payload = _build_tavily_request(tool_input, config=config)
+    caller = request_fn or _default_request
+    try:
+        raw = caller(config.base_url, headers, payload, config.timeout_seconds)
+    except TimeoutError as exc:
+        raise TimeoutError("tavily search timed out") from exc
+    except (HTTPError, URLError, OSError) as exc:
+        raise RuntimeError(f"tavily search failed: {exc}") from exc
+    return _map_tavily_response(raw, payload=payload)
+
+
+def _async_transport_request(transport: AsyncHTTPTransport) -> AsyncRequestFn:
+    async def _request(
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+        timeout: float,
+    ) -> dict[str, Any]:
+        return await transport.post_json(url, payload, headers, timeout)
+
+    return _request
+
+
+async def asearch_tavily(
+    tool_input: TavilySearchInput,
+    *,
+    config: TavilySearchConfig,
+    request_fn: AsyncRequestFn | None = None,
+    transport: AsyncHTTPTransport | None = None,
+) -> TavilySearchResult:
+    """Async :func:`search_tavily`; ``timeout_seconds`` cancels the request outright."""
+
+    headers, payload = _build_tavily_request(tool_input, config=config)
+    owned_transport: AsyncHTTPTransport | None = None
+    if request_fn is None:
+        if transport is None:
+            owned_transport = transport = AsyncHTTPTransport(load_http_transport_config())
+        request_fn = _async_transport_request(transport)
+
+    try:
+        raw = await asyncio.wait_for(
+            request_fn(config.base_url, headers, payload, config.timeout_seconds),
+            timeout=config.timeout_seconds,
+        )
+    except (TimeoutError, asyncio.TimeoutError) as exc:
+        raise TimeoutError("tavily search timed out") from exc
+    except (HTTPError, URLError, OSError) as exc:
+        raise RuntimeError(f"tavily search failed: {exc}") from exc
+    finally:
+        if owned_transport is not None:
+            await owned_transport.aclose()
+    return _map_tavily_response(raw, payload=payload)
+
+
 def render_tavily_context(result: TavilySearchResult) -> str:
     """Render search output into compact workflow context."""
 
@@ -172,10 +231,16 @@ def build_tavily_search_tool(
     config: TavilySearchConfig | None = None,
     *,
     request_fn: RequestFn | None = None,
+    async_request_fn: AsyncRequestFn | None = None,
 ) -> BaseTool:
-    """Create a LangChain tool wrapper for Tavily search."""
+    """Create a LangChain tool wrapper for Tavily search.
+
+    The tool supports ``ainvoke`` natively through :func:`asearch_tavily`, sharing
+    one async transport across calls made from the same event loop.
+    """
 
     resolved_config = config or load_tavily_search_config()
+    async_transport = AsyncHTTPTransport(load_http_transport_config())
 
     def _tool_fn(
         question: str,
@@ -197,8 +262,30 @@ def build_tavily_search_tool(
         )
         return result.model_dump(mode="python")
 
+    async def _atool_fn(
+        question: str,
+        topic: str = DEFAULT_TAVILY_TOPIC,
+        max_results: int = DEFAULT_TAVILY_MAX_RESULTS,
+        search_depth: str = DEFAULT_TAVILY_SEARCH_DEPTH,
+        days: int | None = None,
+    ) -> dict[str, Any]:
+        result = await asearch_tavily(
+            TavilySearchInput(
+                question=question,
+                topic=topic,
+                max_results=max_results,
+                search_depth=search_depth,
+                days=days,
+            ),
+            config=resolved_config,
+            request_fn=async_request_fn,
+            transport=async_transport,
+        )
+        return result.model_dump(mode="python")
+
     return StructuredTool.from_function(
         func=_tool_fn,
+        coroutine=_atool_fn,
         name="tavily_search",
         description=(
             "Search the public web for latest or real-time compliance developments when local "
@@ -0,0 +1,155 @@
+"""Streaming grounded answer tests."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableGenerator
+
+from compliance_bot.chains.answer_stream_parser import IncrementalAnswerParser
+from compliance_bot.chains.citation_chain import (
+    build_citation_stream_chain,
+    stream_citation_answer,
+)
+from compliance_bot.schemas.answer import GroundedAnswerDraft
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import RetrievedChunk, RetrievalResponse
+
+_CITATION = {
+    "doc_id": "expense-policy-v1",
+    "section": "4.2",
+    "chunk_id": "chunk-expense-0",
+    "quote_span": "Expense reimbursement requires manager approval",
+    "retrieval_score": 0.82,
+    "version": "week-04-v1",
+}
+
+
+def _retrieval_response() -> RetrievalResponse:
+    return RetrievalResponse(
+        trace_id="trace-stream-001",
+        question="Who approves expense reimbursements?",
+        normalized_query="who approves expense reimbursements",
+        decision=DecisionEnum.ANSWERED,
+        retrieved_chunks=[
+            RetrievedChunk(
+                chunk_id="chunk-expense-0",
+                doc_id="expense-policy-v1",
+                version_tag="week-04-v1",
+                chunk_index=0,
+                content="Expense reimbursement requires manager approval with receipt evidence.",
+                retrieval_score=0.82,
+                metadata={"section": "4.2"},
+            )
+        ],
+    )
+
+
+def _pieces(payload: dict[str, Any], size: int = 7) -> list[str]:
+    text = json.dumps(payload)
+    return [text[offset : offset + size] for offset in range(0, len(text), size)]
+
+
+def _streaming_llm(pieces: list[str], sent: list[str]) -> RunnableGenerator:
+    def _generate(prompts: Iterator[Any]) -> Iterator[AIMessageChunk]:
+        for _ in prompts:
+            pass
+        for piece in pieces:
+            sent.append(piece)
+            yield AIMessageChunk(content=piece)
+
+    return RunnableGenerator(_generate)
+
+
+def test_parser_reports_fields_only_once_they_are_complete() -> None:
+    second = dict(_CITATION, chunk_id="chunk-expense-1")
+    text = json.dumps(
+        {
+            "decision": "ANSWERED",
+            "answer": "Managers approve.",
+            "confidence": 0.8,
+            "citations": [_CITATION, second],
+        }
+    )
+    parser = IncrementalAnswerParser()
+    decisions, answer, citation_offsets = [], "", []
+    for offset, char in enumerate(text):
+        progress = parser.feed(char)
+        if progress.decision is not None:
+            decisions.append((offset, progress.decision))
+        answer += progress.answer_delta
+        citation_offsets.extend(offset for _ in progress.citations)
+
+    assert decisions == [(text.index('"ANSWERED"') + len('"ANSWERED"') - 1, DecisionEnum.ANSWERED)]
+    assert answer == "Managers approve."
+    assert citation_offsets == [text.index("}, {"), len(text) - 3]
+    assert [citation.chunk_id for citation in parser.citations] == [
+        "chunk-expense-0",
+        "chunk-expense-1",
+    ]
+    assert parser.finish().citations == parser.citations
+
+
+def test_stream_surfaces_events_and_measures_time_to_first_token() -> None:
+    sent: list[str] = []
+    payload = {
+        "decision": "ANSWERED",
+        "answer": "Manager approval is required for expense reimbursement.",
+        "confidence": 0.8,
+        "citations": [_CITATION],
+    }
+    chain = build_citation_stream_chain(_streaming_llm(_pieces(payload), sent))
+
+    events = list(
+        stream_citation_answer(_retrieval_response(), stream_chain=chain, llm_provider="fake")
+    )
+
+    kinds = [event.event for event in events]
+    assert kinds[0] == "decision" and kinds[-1] == "done"
+    assert kinds.count("answer_delta") > 1
+    assert "".join(event.text or "" for event in events) == payload["answer"]
+    [citation_event] = [event for event in events if event.event == "citation"]
+    assert citation_event.citation_valid is True
+    response = events[-1].response
+    assert response is not None and response.decision == DecisionEnum.ANSWERED
+    metadata = response.audit_events[-1].metadata
+    assert metadata["streamed"] is True and metadata["stopped_early"] is False
+    assert 0.0 < metadata["ttft_ms"] <= metadata["latency_ms"]
+
+
+def test_stream_stops_generation_once_model_abstains() -> None:
+    sent: list[str] = []
+    payload = {
+        "decision": "ABSTAINED",
+        "answer": "The evidence does not cover this request " * 20,
+        "confidence": 0.1,
+        "citations": [],
+    }
+    pieces = _pieces(payload)
+    chain = build_citation_stream_chain(_streaming_llm(pieces, sent))
+
+    events = list(stream_citation_answer(_retrieval_response(), stream_chain=chain))
+
+    assert [event.event for event in events] == ["decision", "done"]
+    assert len(sent) < len(pieces) // 4
+    response = events[-1].response
+    assert response is not None and response.decision == DecisionEnum.ABSTAINED
+    assert response.abstention_reason == "llm_abstained_or_escalated"
+    assert response.audit_events[-1].metadata["stopped_early"] is True
+
+
+def test_parser_decodes_escapes_split_across_chunks_and_schema_puts_decision_first() -> None:
+    answer = 'Managers say "yes" — see \U0001F4C4 clause\n4.2\\b.'
+    text = json.dumps(
+        {"decision": "ANSWERED", "answer": answer, "confidence": 0.8, "citations": [_CITATION]}
+    )
+    parser = IncrementalAnswerParser()
+    streamed = "".join(
+        parser.feed(text[offset : offset + 3]).answer_delta for offset in range(0, len(text), 3)
+    )
+
+    assert streamed == parser.answer_text == answer
+    assert [citation.chunk_id for citation in parser.citations] == ["chunk-expense-0"]
+    assert next(iter(GroundedAnswerDraft.model_json_schema()["properties"])) == "decision"
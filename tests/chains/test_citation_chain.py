@@ -4,16 +4,23 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
+import pytest
 from langchain_core.runnables import RunnableLambda
 
+from compliance_bot.chains import citation_chain
 from compliance_bot.chains.citation_chain import (
     build_citation_answer_chain,
     citations_are_grounded,
     invoke_citation_answer_chain,
+    load_batch_questions,
     run_citation_answer,
+    run_week4_batch,
     run_week4_query,
 )
+from compliance_bot.retrieval.rerank_payload import RerankPayloadConfig
+from compliance_bot.schemas.answer import BatchQuestion
 from compliance_bot.schemas.query import DecisionEnum
 from compliance_bot.schemas.retrieval import RetrievedChunk, RetrievalResponse
 
@@ -144,7 +151,7 @@ def test_fallback_answer_has_grounded_citations_when_not_abstained() -> None:
     )
 
 
-def test_run_week4_query_integrates_retrieval_and_grounded_answer(tmp_path: Path) -> None:
+def _write_week4_manifest(tmp_path: Path) -> Path:
     manifest_path = Path(tmp_path) / "manifest-week-04-v1.json"
     manifest_payload = {
         "version_tag": "week-04-v1",
@@ -168,9 +175,12 @@ def test_run_week4_query_integrates_retrieval_and_grounded_answer(tmp_path: Path
         ],
     }
     manifest_path.write_text(json.dumps(manifest_payload), encoding="utf-8")
+    return manifest_path
+
 
+def test_run_week4_query_integrates_retrieval_and_grounded_answer(tmp_path: Path) -> None:
     response = run_week4_query(
-        manifest_path=manifest_path,
+        manifest_path=_write_week4_manifest(tmp_path),
         question="Who approves expense reimbursement requests?",
         jurisdiction="US",
         policy_scope=["expense"],
@@ -186,3 +196,119 @@ def test_run_week4_query_integrates_retrieval_and_grounded_answer(tmp_path: Path
         response.citations,
         retrieved_chunks=response.retrieved_chunks,
     )
+
+
+def test_run_week4_query_applies_the_retriever_profile_unless_overridden(tmp_path: Path) -> None:
+    manifest_path = _write_week4_manifest(tmp_path)
+
+    def _retrieval_metadata(**overrides: Any) -> dict[str, Any]:
+        response = run_week4_query(
+            manifest_path=manifest_path,
+            question="Who approves expense reimbursement requests?",
+            embedding_provider_mode="none",
+            llm_provider_mode="none",
+            retriever_config="low-latency",
+            **overrides,
+        )
+        return next(
+            event.metadata for event in response.audit_events if "rerank_trimmed" in event.metadata
+        )
+
+    profiled = _retrieval_metadata()
+    assert "rerank_latency_ms" in profiled and profiled["rerank_trimmed"] == 0
+    assert "rerank_latency_ms" not in _retrieval_metadata(rerank_provider_mode="none")
+    assert _retrieval_metadata(rerank_payload=RerankPayloadConfig(max_chars=24))["rerank_trimmed"]
+
+
+def test_run_week4_batch_writes_every_answer_and_summarizes_the_run(tmp_path: Path) -> None:
+    questions_path = tmp_path / "questions.jsonl"
+    questions_path.write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {
+                        "question": "Who approves expense reimbursement requests?",
+                        "trace_id": "batch-q-1",
+                        "jurisdiction": "US",
+                        "policy_scope": ["expense"],
+                    }
+                ),
+                "",
+                json.dumps({"question": "Who approves expense reimbursement requests?"}),
+                json.dumps({"question": "How are quantum teleporters licensed?"}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "out" / "answers.jsonl"
+
+    summary = run_week4_batch(
+        manifest_path=_write_week4_manifest(tmp_path),
+        questions=load_batch_questions(questions_path),
+        output_path=output_path,
+        max_concurrency=2,
+        min_confidence_for_answer=0.5,
+        embedding_provider_mode="none",
+        rerank_provider_mode="none",
+        llm_provider_mode="none",
+    )
+
+    records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(record["index"] for record in records) == [0, 1, 2]
+    by_index = {record["index"]: record["response"] for record in records}
+    assert by_index[0]["trace_id"] == "batch-q-1"
+    assert by_index[0]["decision"] == "ANSWERED"
+    assert by_index[2]["decision"] == "ABSTAINED"
+    assert summary.question_count == 3
+    assert summary.decision_counts == {"ABSTAINED": 1, "ANSWERED": 2}
+    assert summary.abstention_reasons == {"retrieval_insufficient_evidence": 1}
+    assert summary.p50_latency_ms <= summary.p95_latency_ms <= summary.p99_latency_ms
+    assert summary.throughput_qps > 0.0
+
+    questions_path.write_text('{"question": "   "}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="questions.jsonl:1"):
+        load_batch_questions(questions_path)
+
+
+def test_run_week4_batch_writes_an_error_row_and_keeps_the_rest(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_run_retrieval = citation_chain.run_retrieval
+
+    def _flaky_run_retrieval(index: Any, *, question: str, **kwargs: Any) -> RetrievalResponse:
+        if "quantum" in question:
+            raise RuntimeError("embedding endpoint unavailable")
+        return real_run_retrieval(index, question=question, **kwargs)
+
+    monkeypatch.setattr(citation_chain, "run_retrieval", _flaky_run_retrieval)
+    output_path = tmp_path / "answers.jsonl"
+    summary = run_week4_batch(
+        manifest_path=_write_week4_manifest(tmp_path),
+        questions=[
+            BatchQuestion(question="Who approves expense reimbursement requests?"),
+            BatchQuestion(question="How are quantum teleporters licensed?", trace_id="q-2"),
+            BatchQuestion(question="Who approves expense reimbursement requests?"),
+        ],
+        output_path=output_path,
+        max_concurrency=2,
+        min_confidence_for_answer=0.5,
+        embedding_provider_mode="none",
+        rerank_provider_mode="none",
+        llm_provider_mode="none",
+    )
+
+    records = {
+        record["index"]: record
+        for record in map(json.loads, output_path.read_text(encoding="utf-8").splitlines())
+    }
+    assert sorted(records) == [0, 1, 2]
+    assert records[1]["error"] == {
+        "type": "RuntimeError",
+        "message": "embedding endpoint unavailable",
+    }
+    assert records[1]["trace_id"] == "q-2" and "response" not in records[1]
+    assert records[0]["response"]["decision"] == records[2]["response"]["decision"] == "ANSWERED"
+    assert summary.error_count == 1
+    assert summary.decision_counts == {"ANSWERED": 2}
+    assert summary.throughput_qps == pytest.approx(2 / (summary.elapsed_ms / 1000.0))
@@ -0,0 +1,137 @@
+"""Evidence packing tests: adjacent-chunk merging, deduplication, and budgets."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from compliance_bot.chains.citation_chain import build_citation_answer_chain, run_citation_answer
+from compliance_bot.chains.evidence_packer import (
+    EvidencePackingConfig,
+    format_evidence_chunks,
+    pack_evidence,
+    parse_evidence_budget,
+)
+from compliance_bot.ingestion.chunker import chunk_document
+from compliance_bot.schemas.ingestion import LoadedDocument
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import RetrievedChunk, RetrievalResponse
+
+_POLICY = " ".join(
+    f"Clause {number}: expense reimbursement above {number * 50} dollars requires "
+    f"manager approval, itemised receipts, and a cost centre code within 30 days."
+    for number in range(1, 31)
+)
+
+
+def _retrieved() -> list[RetrievedChunk]:
+    records = chunk_document(
+        LoadedDocument(
+            content=_POLICY,
+            metadata={"doc_id": "expense-policy-v1", "section": "4"},
+            source_path="expense.txt",
+        ),
+        version_tag="v1",
+    )
+    ranked = [records[1], records[0], records[2]]
+    duplicate = RetrievedChunk(
+        chunk_id="chunk-copy-000",
+        doc_id="expense-policy-copy",
+        version_tag="v1",
+        chunk_index=0,
+        content=records[0].content,
+        retrieval_score=0.5,
+    )
+    return [
+        RetrievedChunk(
+            chunk_id=record.chunk_id,
+            doc_id=record.doc_id,
+            version_tag=record.version_tag,
+            chunk_index=record.chunk_index,
+            content=record.content,
+            retrieval_score=0.9 - position / 10,
+            metadata=record.metadata,
+            matched_terms=["receipts"],
+        )
+        for position, record in enumerate(ranked)
+    ] + [duplicate]
+
+
+def test_adjacent_chunks_merge_without_repeating_the_overlap() -> None:
+    chunks = _retrieved()
+
+    packed = pack_evidence(chunks, question="Who approves expense reimbursement?")
+
+    assert packed.chunk_ids == tuple(chunk.chunk_id for chunk in chunks)
+    assert (packed.merged_count, packed.deduplicated_count) == (2, 1)
+    assert packed.overlap_chars_removed >= 2 * 100
+    assert packed.tokens < packed.unpacked_tokens
+    assert packed.tokens_saved == packed.unpacked_tokens - packed.tokens
+    assert packed.text.count("doc_id: expense-policy-v1") == 1
+    assert packed.text.index(chunks[1].chunk_id) < packed.text.index(chunks[0].chunk_id)
+    assert f"content: identical to chunk_id {chunks[1].chunk_id}" in packed.text
+    for chunk in chunks[:3]:
+        shown = packed.text.split(f"chunk_id: {chunk.chunk_id}", 1)[1]
+        content = shown.split("content: ", 1)[1].split("\n", 1)[0]
+        assert content in chunk.content
+
+    unmerged = pack_evidence(chunks[:1], config=EvidencePackingConfig(merge_adjacent=False))
+    assert unmerged.text == format_evidence_chunks(chunks[:1])
+
+
+def test_budget_trims_then_drops_lowest_ranked_chunks_and_citations_still_validate() -> None:
+    chunks = _retrieved()
+    budget = parse_evidence_budget("tokens:260")
+
+    packed = pack_evidence(chunks, question="receipts", config=budget)
+
+    assert packed.tokens <= 260
+    assert packed.chunk_ids == (chunks[0].chunk_id, chunks[1].chunk_id)
+    assert (packed.trimmed_count, packed.dropped_count) == (1, 2)
+    assert f"content: {chunks[0].content}" in packed.text
+    assert parse_evidence_budget("full") == EvidencePackingConfig()
+    with pytest.raises(ValueError):
+        parse_evidence_budget("chars:100")
+
+    prompts: list[str] = []
+    reply = {
+        "decision": "ANSWERED",
+        "answer": "Receipts and manager approval are required.",
+        "confidence": 0.8,
+        "citations": [
+            {
+                "doc_id": chunks[0].doc_id,
+                "section": "4",
+                "chunk_id": chunks[0].chunk_id,
+                "quote_span": "requires manager approval, itemised receipts",
+                "retrieval_score": 0.9,
+                "version": "v1",
+            }
+        ],
+    }
+
+    def _model(prompt: object) -> str:
+        prompts.append(str(prompt))
+        return json.dumps(reply)
+
+    response = run_citation_answer(
+        RetrievalResponse(
+            trace_id="trace-pack-001",
+            question="What does reimbursement require?",
+            normalized_query="what does reimbursement require",
+            decision=DecisionEnum.ANSWERED,
+            retrieved_chunks=chunks,
+        ),
+        answer_chain=build_citation_answer_chain(RunnableLambda(_model)),
+        llm_provider="fake",
+        evidence_packing=budget,
+    )
+
+    assert response.decision == DecisionEnum.ANSWERED
+    metadata = response.audit_events[-1].metadata
+    assert metadata["citations_valid"] is True
+    assert metadata["evidence_tokens"] <= 260
+    assert metadata["evidence_tokens_saved"] == packed.tokens_saved
+    assert f"Allowed chunk_ids: {chunks[0].chunk_id}, {chunks[1].chunk_id}" in prompts[0]
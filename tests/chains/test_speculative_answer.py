@@ -0,0 +1,205 @@
+"""Speculative answer drafting overlapped with rerank."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from typing import Any
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from compliance_bot.chains import citation_chain
+from compliance_bot.chains.citation_chain import (
+    build_citation_answer_chain,
+    draft_citation_answer,
+    run_speculative_answer,
+)
+from compliance_bot.retrieval.indexer import RetrievalIndex, build_retrieval_index_from_chunks
+from compliance_bot.schemas.ingestion import ChunkRecord
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import ProviderCallMetrics, RerankResult
+
+_QUESTION = "Does expense reimbursement require manager approval?"
+
+
+def _index() -> RetrievalIndex:
+    chunks = [
+        ChunkRecord(
+            chunk_id=f"chunk-policy-{position}",
+            doc_id=f"policy-{position}",
+            version_tag="v1",
+            chunk_index=0,
+            content=f"Rule {position}: expense reimbursement requires manager approval.",
+            metadata={"jurisdiction": "US"},
+        )
+        for position in range(4)
+    ]
+    return build_retrieval_index_from_chunks(chunks, version_tag="v1")
+
+
+class _OrderedRerankProvider:
+    """Ranks candidates in the given ``order``, optionally waiting for the LLM first."""
+
+    provider_name = "ordered"
+    model = "ordered-v1"
+
+    def __init__(self, order: list[int], *, wait_for: threading.Event | None = None) -> None:
+        self.order = order
+        self.wait_for = wait_for
+        self.overlapped = False
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
+        if self.wait_for is not None:
+            self.overlapped = self.wait_for.wait(timeout=5.0)
+        results = [
+            RerankResult(candidate_index=candidate, score=0.9 - rank / 10)
+            for rank, candidate in enumerate(self.order[:top_n])
+        ]
+        return results, ProviderCallMetrics(
+            provider=self.provider_name,
+            model=self.model,
+            latency_ms=1.0,
+            status="ok",
+        )
+
+
+def _citing_llm(prompts: list[str], started: threading.Event) -> RunnableLambda:
+    def _model(prompt: Any) -> AIMessage:
+        text = prompt.to_string()
+        prompts.append(text)
+        started.set()
+        match = re.search(r"Allowed chunk_ids: ([\w-]+)", text)
+        assert match is not None
+        chunk_id = match.group(1)
+        citation = {
+            "doc_id": chunk_id.replace("chunk-", ""),
+            "section": "0",
+            "chunk_id": chunk_id,
+            "quote_span": "requires manager approval",
+            "retrieval_score": 0.9,
+            "version": "v1",
+        }
+        return AIMessage(
+            content=json.dumps(
+                {
+                    "decision": "ANSWERED",
+                    "answer": "Yes, manager approval is required.",
+                    "confidence": 0.8,
+                    "citations": [citation],
+                }
+            )
+        )
+
+    return RunnableLambda(_model)
+
+
+def test_speculative_draft_is_used_when_rerank_keeps_the_chunk_set() -> None:
+    prompts: list[str] = []
+    started = threading.Event()
+    rerank = _OrderedRerankProvider([1, 0, 2, 3], wait_for=started)
+
+    response = run_speculative_answer(
+        _index(),
+        question=_QUESTION,
+        rerank_provider=rerank,
+        answer_chain=build_citation_answer_chain(_citing_llm(prompts, started)),
+        top_k=2,
+        llm_provider="fake",
+    )
+
+    assert rerank.overlapped is True
+    assert len(prompts) == 1
+    assert response.decision == DecisionEnum.ANSWERED
+    assert [chunk.chunk_id for chunk in response.retrieved_chunks] == [
+        "chunk-policy-1",
+        "chunk-policy-0",
+    ]
+    speculation = next(
+        event for event in response.audit_events if event.stage == "answer_speculation"
+    )
+    assert speculation.status == "hit"
+    assert speculation.metadata["latency_saved_ms"] > 0.0
+    assert speculation.metadata["wasted_tokens"] == 0
+    assert response.audit_events[-1].stage == "answer_grounding"
+    assert response.audit_events[-1].metadata["citations_valid"] is True
+
+
+def test_speculative_draft_is_discarded_when_rerank_changes_the_chunk_set() -> None:
+    prompts: list[str] = []
+    started = threading.Event()
+    rerank = _OrderedRerankProvider([3, 2, 1, 0], wait_for=started)
+
+    response = run_speculative_answer(
+        _index(),
+        question=_QUESTION,
+        rerank_provider=rerank,
+        answer_chain=build_citation_answer_chain(_citing_llm(prompts, started)),
+        top_k=2,
+        llm_provider="fake",
+    )
+
+    assert len(prompts) == 2
+    assert "chunk-policy-3" in prompts[1] and "chunk-policy-3" not in prompts[0]
+    assert response.decision == DecisionEnum.ANSWERED
+    assert [citation.chunk_id for citation in response.citations] == ["chunk-policy-3"]
+    speculation = next(
+        event for event in response.audit_events if event.stage == "answer_speculation"
+    )
+    assert speculation.status == "miss"
+    assert speculation.metadata["latency_saved_ms"] == 0.0
+    assert speculation.metadata["wasted_tokens"] > 0
+
+
+def test_abandoned_draft_makes_no_new_calls_and_blocks_further_speculation() -> None:
+    prompts: list[str] = []
+    started = threading.Event()
+    release = threading.Event()
+    llm = _citing_llm(prompts, started)
+
+    def _slow_first_call(prompt: Any) -> AIMessage:
+        if not prompts:
+            llm.invoke(prompt)
+            release.wait(timeout=5.0)
+            return llm.invoke(prompt)
+        return llm.invoke(prompt)
+
+    chain = build_citation_answer_chain(RunnableLambda(_slow_first_call))
+    first = run_speculative_answer(
+        _index(),
+        question=_QUESTION,
+        rerank_provider=_OrderedRerankProvider([3, 2, 1, 0], wait_for=started),
+        answer_chain=chain,
+        top_k=2,
+    )
+    second = run_speculative_answer(
+        _index(),
+        question=_QUESTION,
+        rerank_provider=_OrderedRerankProvider([3, 2, 1, 0]),
+        answer_chain=chain,
+        top_k=2,
+    )
+    release.set()
+    deadline = time.monotonic() + 5.0
+    while citation_chain._has_abandoned_drafts() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    [speculation] = [event for event in first.audit_events if event.stage == "answer_speculation"]
+    assert speculation.status == "miss"
+    assert speculation.metadata["speculation_cancelled"] is False
+    assert not any(event.stage == "answer_speculation" for event in second.audit_events)
+    assert second.decision == DecisionEnum.ANSWERED
+    assert not citation_chain._has_abandoned_drafts()
+
+    cancel = threading.Event()
+    cancel.set()
+    attempt = draft_citation_answer(first, answer_chain=chain, cancel=cancel)
+    assert (attempt.draft, attempt.error_code) == (None, "speculation_cancelled")
@@ -0,0 +1,170 @@
+"""End-to-end provider tests against the local SiliconFlow stand-in server."""
+
+from __future__ import annotations
+
+import json
+import random
+from urllib.error import HTTPError
+
+import pytest
+
+from compliance_bot.chains.citation_chain import (
+    build_citation_answer_chain,
+    citations_are_grounded,
+    resolve_answer_llm,
+    run_citation_answer,
+)
+from compliance_bot.chains.evidence_packer import pack_evidence
+from compliance_bot.providers.http_transport import PooledHTTPTransport
+from compliance_bot.providers.provider_registry import (
+    resolve_embedding_provider,
+    resolve_rerank_provider,
+)
+from compliance_bot.providers.rate_limit import RateLimitConfig, reset_rate_limiters
+from compliance_bot.providers.siliconflow_rerank import (
+    RerankProviderError,
+    SiliconFlowRerankConfig,
+    build_siliconflow_rerank_provider,
+)
+from compliance_bot.devtools.siliconflow_standin import (
+    SiliconFlowStandIn,
+    StandInConfig,
+    parse_latency_profile,
+    stand_in_chat_reply,
+)
+from compliance_bot.retrieval.indexer import build_retrieval_index_from_chunks
+from compliance_bot.retrieval.retriever import run_retrieval
+from compliance_bot.schemas.ingestion import ChunkRecord
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import Citation, RetrievedChunk
+
+pytest.importorskip("langchain_openai")
+
+
+def _chunks() -> list[ChunkRecord]:
+    return [
+        ChunkRecord(
+            chunk_id="chunk-expense-0",
+            doc_id="expense-policy-v1",
+            version_tag="v1",
+            chunk_index=0,
+            content="Expense reimbursement requires manager approval with receipt evidence.",
+            metadata={"jurisdiction": "US", "policy_scope": "expense", "section": "4.2"},
+        ),
+        ChunkRecord(
+            chunk_id="chunk-vendor-0",
+            doc_id="vendor-policy-v1",
+            version_tag="v1",
+            chunk_index=0,
+            content="Vendor data sharing requires a DPA and legal review.",
+            metadata={"jurisdiction": "US", "policy_scope": "vendor", "section": "7.1"},
+        ),
+    ]
+
+
+def test_full_stack_runs_against_stand_in() -> None:
+    reset_rate_limiters()
+    with SiliconFlowStandIn(StandInConfig(embedding_dim=64)) as stand_in:
+        env = stand_in.env()
+        embedding_provider = resolve_embedding_provider("siliconflow", env=env)
+        index = build_retrieval_index_from_chunks(
+            _chunks(), version_tag="v1", embedding_provider=embedding_provider
+        )
+        retrieval = run_retrieval(
+            index,
+            question="Who approves expense reimbursement?",
+            embedding_provider=embedding_provider,
+            rerank_provider=resolve_rerank_provider("siliconflow", env=env),
+            top_k=1,
+        )
+        llm = resolve_answer_llm("siliconflow", env=env)
+        assert llm is not None
+        answer = run_citation_answer(
+            retrieval,
+            answer_chain=build_citation_answer_chain(llm),
+            llm_provider="siliconflow",
+        )
+        streamed = "".join(str(chunk.content) for chunk in llm.stream("Say hello"))
+        stats = stand_in.stats()
+
+    assert index.vector_dim == 64
+    assert retrieval.retrieved_chunks[0].chunk_id == "chunk-expense-0"
+    assert {item.stage for item in retrieval.provider_metrics} == {"embed_query", "rerank"}
+    assert answer.decision == DecisionEnum.ANSWERED
+    assert answer.citations[0].chunk_id == "chunk-expense-0"
+    assert streamed.startswith("Stand-in reply")
+    assert stats["requests.chat"] == 2
+    assert stats["requests.rerank"] == 1
+    reset_rate_limiters()
+
+
+def test_grounded_reply_quotes_only_the_first_chunk_of_a_merged_run() -> None:
+    chunks = [
+        RetrievedChunk(
+            chunk_id=f"chunk-expense-{index}",
+            doc_id="expense-policy-v1",
+            version_tag="v1",
+            chunk_index=index,
+            content=content,
+            retrieval_score=0.9 - index / 10,
+            metadata={"section": "4.2"},
+        )
+        for index, content in enumerate(
+            [
+                "Expense reimbursement requires manager approval with receipt evidence.",
+                "with receipt evidence. Claims above 500 USD also need director signoff.",
+            ]
+        )
+    ]
+    packed = pack_evidence(chunks)
+    assert "continued by:" in packed.text
+
+    reply = json.loads(
+        stand_in_chat_reply(
+            [{"role": "user", "content": f"Evidence:\n{packed.text}\n\nAllowed chunk_ids: x"}]
+        )
+    )
+
+    citations = [Citation.model_validate(item) for item in reply["citations"]]
+    assert citations[0].quote_span == chunks[0].content
+    assert citations_are_grounded(citations, retrieved_chunks=chunks)
+
+
+def test_stand_in_injects_rate_limits_and_errors() -> None:
+    config = StandInConfig(rate_limit_rps=0.5, rate_limit_burst=1, retry_after_seconds=2)
+    headers = {"Authorization": "Bearer stand-in"}
+    payload = {"model": "m", "query": "q", "documents": ["a"]}
+    with SiliconFlowStandIn(config) as stand_in, PooledHTTPTransport() as transport:
+        url = f"{stand_in.base_url}/rerank"
+        assert transport.post_json(url, payload, headers, 5.0)["results"][0]["index"] == 0
+        with pytest.raises(HTTPError) as exc_info:
+            transport.post_json(url, payload, headers, 5.0)
+    assert exc_info.value.code == 429
+    assert exc_info.value.headers["Retry-After"] == "2"
+
+    with SiliconFlowStandIn(StandInConfig(error_rate=1.0)) as stand_in:
+        provider = build_siliconflow_rerank_provider(
+            SiliconFlowRerankConfig(
+                api_key="k",
+                model="err-model",
+                base_url=stand_in.base_url,
+                rate_limit=RateLimitConfig(backoff_seconds=0.01),
+            )
+        )
+        with pytest.raises(RerankProviderError, match="503"):
+            provider.rerank(query="q", candidates=["a"], top_n=1)
+        # A 503 is retried through the rate limiter (two retries by default).
+        assert stand_in.stats() == {"errors.rerank": 3, "requests.rerank": 3}
+    reset_rate_limiters()
+
+
+def test_latency_profiles_follow_configured_distribution() -> None:
+    rng = random.Random(0)
+    profile = parse_latency_profile("lognormal:100:50")
+    samples = sorted(profile.sample_ms(rng) for _ in range(2000))
+
+    assert 90.0 < samples[1000] < 110.0
+    assert 135.0 < samples[1900] < 165.0
+    assert parse_latency_profile("fixed:25").sample_ms(rng) == 25.0
+    with pytest.raises(ValueError):
+        parse_latency_profile("gamma:1")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from pathlib import Path
@@ -15,7 +16,7 @@ pytest.importorskip("langgraph")
 
 from compliance_bot.audit.replay import replay_audit_trace
 from compliance_bot.chains.citation_chain import build_citation_answer_chain
-from compliance_bot.graph.workflow import run_week6_query
+from compliance_bot.graph.workflow import arun_week6_query, run_week6_query
 from compliance_bot.schemas.query import DecisionEnum
 from compliance_bot.schemas.tools import PolicyRegistryLookupInput, TavilySearchInput
 
@@ -280,3 +281,30 @@ def test_week6_retry_preserves_trace_and_audit_continuity(tmp_path: Path) -> Non
     assert any(step == "retry_answer" for step in state.decision_path)
     assert replay.decision_path == state.decision_path
     assert all(event.trace_id == state.trace_id for event in state.audit_events)
+
+
+def test_async_week6_workflow_matches_sync_path(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest-week-06-v1.json"
+    _write_manifest(manifest_path)
+    options = dict(
+        manifest_path=manifest_path,
+        question="Which policy section covers expense reimbursement?",
+        jurisdiction="US",
+        policy_scope=["expense"],
+        min_confidence_for_answer=0.5,
+        embedding_provider_mode="none",
+        rerank_provider_mode="none",
+        llm_provider_mode="none",
+    )
+
+    sync_state = run_week6_query(**options)
+    async_state = asyncio.run(arun_week6_query(**options))
+
+    assert async_state.final_decision == sync_state.final_decision
+    assert async_state.decision_path == sync_state.decision_path
+    assert [chunk.chunk_id for chunk in async_state.retrieved_chunks] == [
+        chunk.chunk_id for chunk in sync_state.retrieved_chunks
+    ]
+    assert [result.tool_name for result in async_state.tool_results] == [
+        result.tool_name for result in sync_state.tool_results
+    ]
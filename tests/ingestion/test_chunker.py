@@ -0,0 +1,83 @@
+"""Week 2 chunker tests."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from compliance_bot.ingestion.chunker import chunk_corpus
+from compliance_bot.schemas.ingestion import LoadedDocument
+
+
+def _document(doc_id: str, content: str) -> LoadedDocument:
+    return LoadedDocument(
+        content=content,
+        metadata={"doc_id": doc_id, "jurisdiction": "US"},
+        source_path=f"/policies/{doc_id}.json",
+    )
+
+
+def test_parallel_chunking_matches_serial_chunk_ids() -> None:
+    documents = [
+        _document("policy-b", "Retention period is seven years for tax records. " * 40),
+        _document("policy-a", "Vendor data sharing needs   legal approval.\n" * 3),
+        _document("policy-c", " ".join(f"clause-{index} requires review" for index in range(500))),
+    ]
+
+    serial = chunk_corpus(documents, version_tag="week-02-v1", chunk_size=90, chunk_overlap=15)
+    parallel = chunk_corpus(
+        documents,
+        version_tag="week-02-v1",
+        chunk_size=90,
+        chunk_overlap=15,
+        max_workers=3,
+        large_document_chars=1000,
+        parallel_min_chars=0,
+        batch_chars=200,
+    )
+
+    assert [chunk.doc_id for chunk in serial][:1] == ["policy-a"]
+    assert [chunk.model_dump() for chunk in parallel] == [chunk.model_dump() for chunk in serial]
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.tasks = 0
+
+    def submit(self, *args, **kwargs):  # type: ignore[no-untyped-def, override]
+        self.tasks += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_small_documents_are_batched_and_small_corpora_stay_serial() -> None:
+    documents = [
+        _document(f"policy-{index:02d}", "Approval is required. " * 10) for index in range(20)
+    ]
+    serial = chunk_corpus(documents, version_tag="week-02-v1", chunk_size=90, chunk_overlap=15)
+
+    with _CountingExecutor() as executor:
+        below_threshold = chunk_corpus(
+            documents,
+            version_tag="week-02-v1",
+            chunk_size=90,
+            chunk_overlap=15,
+            max_workers=2,
+            executor=executor,
+        )
+        assert executor.tasks == 0
+
+        batched = chunk_corpus(
+            documents,
+            version_tag="week-02-v1",
+            chunk_size=90,
+            chunk_overlap=15,
+            max_workers=2,
+            parallel_min_chars=0,
+            batch_chars=1000,
+            executor=executor,
+        )
+        # 4,400 characters in batches of at most 1,000 (four documents each).
+        assert executor.tasks == 5
+
+    assert below_threshold == serial
+    assert batched == serial
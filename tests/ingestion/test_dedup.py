@@ -0,0 +1,95 @@
+"""Near-duplicate chunk detection tests."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from compliance_bot.ingestion.dedup import DedupConfig, deduplicate_chunks
+from compliance_bot.ingestion.pipeline import build_corpus_snapshot
+from compliance_bot.schemas.ingestion import ChunkRecord, DedupReport
+
+_FOOTER = (
+    "This policy is confidential and intended for internal use only. Questions about this "
+    "policy should be directed to the compliance office. Violations may result in "
+    "disciplinary action up to and including termination of employment."
+)
+
+
+def _chunk(chunk_id: str, doc_id: str, content: str, jurisdiction: str = "US") -> ChunkRecord:
+    return ChunkRecord(
+        chunk_id=chunk_id,
+        doc_id=doc_id,
+        version_tag="week-02-v1",
+        chunk_index=0,
+        content=content,
+        metadata={"jurisdiction": jurisdiction},
+    )
+
+
+def _corpus() -> list[ChunkRecord]:
+    return [
+        _chunk("chunk-a000", "doc-a", _FOOTER),
+        _chunk("chunk-b000", "doc-b", _FOOTER.replace("termination of employment", "termination")),
+        _chunk("chunk-c000", "doc-c", "Expense approvals above 500 USD require director signoff."),
+        _chunk("chunk-d000", "doc-d", _FOOTER, jurisdiction="EU"),
+    ]
+
+
+def test_flag_mode_marks_near_duplicates_within_partition() -> None:
+    chunks, report = deduplicate_chunks(_corpus(), config=DedupConfig(mode="flag", threshold=0.8))
+
+    by_id = {chunk.chunk_id: chunk for chunk in chunks}
+    assert len(chunks) == 4
+    assert by_id["chunk-b000"].metadata["duplicate_of"] == "chunk-a000"
+    assert "duplicate_of" not in by_id["chunk-d000"].metadata
+    assert report.duplicate_chunk_count == 1
+    assert report.output_chunk_count == 4
+    assert report.duplicate_chars > 0
+    assert report.embedding_inputs_saved == 0
+    assert report.index_chars_saved_ratio == 0.0
+
+
+def test_collapse_mode_drops_duplicates_and_keeps_back_references() -> None:
+    chunks, report = deduplicate_chunks(
+        _corpus(), config=DedupConfig(mode="collapse", threshold=0.8)
+    )
+
+    assert [chunk.chunk_id for chunk in chunks] == ["chunk-a000", "chunk-c000", "chunk-d000"]
+    assert chunks[0].metadata["duplicate_chunk_ids"] == "chunk-b000"
+    assert report.output_chunk_count == 3
+    assert report.duplicate_group_count == 1
+    assert 0.0 < report.index_chars_saved_ratio < 1.0
+    assert report.embedding_inputs_saved == 1
+
+
+def test_snapshot_hands_back_the_report_it_wrote(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    for doc_id in ("policy-a", "policy-b"):
+        payload = {
+            "content": _FOOTER,
+            "metadata": {
+                "doc_id": doc_id,
+                "effective_date": "2026-02-01",
+                "owner": "compliance-team",
+                "jurisdiction": "US",
+            },
+        }
+        (source_dir / f"{doc_id}.json").write_text(json.dumps(payload), encoding="utf-8")
+    received: list[tuple[DedupReport, Path]] = []
+
+    build_corpus_snapshot(
+        source_dir,
+        tmp_path / "out",
+        version_tag="week-02-v1",
+        chunk_size=400,
+        chunk_overlap=0,
+        dedup=DedupConfig(mode="collapse", threshold=0.8),
+        on_dedup_report=lambda report, path: received.append((report, path)),
+    )
+
+    [(report, path)] = received
+    assert report.duplicate_chunk_count == 1
+    assert report.embedding_inputs_saved == 1
+    assert DedupReport.model_validate_json(path.read_text(encoding="utf-8")) == report
@@ -0,0 +1,122 @@
+"""Bulk JSONL export loader tests."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from compliance_bot.ingestion.loaders import LoadThroughput, load_jsonl_policy_documents
+from compliance_bot.ingestion.pipeline import build_corpus_snapshot
+from compliance_bot.schemas.ingestion import CorpusManifest
+
+
+def _policy_line(doc_id: str) -> str:
+    return json.dumps(
+        {
+            "content": f"Policy text for {doc_id}.",
+            "metadata": {"doc_id": doc_id, "jurisdiction": "US"},
+        }
+    )
+
+
+def test_jsonl_and_gzip_exports_load_in_order_with_throughput(tmp_path: Path) -> None:
+    plain = tmp_path / "export-1.jsonl"
+    plain.write_text(f"{_policy_line('doc-1')}\n\n{_policy_line('doc-2')}\n", encoding="utf-8")
+    compressed = tmp_path / "export-2.jsonl.gz"
+    with gzip.open(compressed, "wt", encoding="utf-8") as handle:
+        handle.write(f"{_policy_line('doc-3')}\n")
+
+    reported: list[LoadThroughput] = []
+    stream = load_jsonl_policy_documents([plain, compressed], on_complete=reported.append)
+    first = next(stream)
+    assert first.metadata["doc_id"] == "doc-1" and reported == []
+    serial = [first, *stream]
+    parallel = list(
+        load_jsonl_policy_documents([plain, compressed], max_workers=2, batch_size=1)
+    )
+
+    assert [document.metadata["doc_id"] for document in serial] == ["doc-1", "doc-2", "doc-3"]
+    assert parallel == serial
+    assert serial[1].source_path == f"{plain}#L3"
+    [throughput] = reported
+    assert throughput.file_count == 2
+    assert throughput.document_count == 3
+    assert throughput.bytes_read == plain.stat().st_size + compressed.stat().st_size
+
+
+def test_invalid_export_line_reports_location(tmp_path: Path) -> None:
+    export = tmp_path / "export.jsonl"
+    export.write_text(f"{_policy_line('doc-1')}\n{{broken\n", encoding="utf-8")
+
+    stream = load_jsonl_policy_documents([export])
+    assert next(stream).metadata["doc_id"] == "doc-1"
+    with pytest.raises(ValueError, match=r"export\.jsonl#L2"):
+        next(stream)
+
+
+def test_parallel_reader_keeps_file_order_and_stops_cleanly(tmp_path: Path) -> None:
+    paths = []
+    for file_number in range(5):
+        path = tmp_path / f"export-{file_number}.jsonl.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            for line_number in range(7):
+                handle.write(f"{_policy_line(f'doc-{file_number}-{line_number}')}\n")
+        paths.append(path)
+    expected = [f"doc-{file}-{line}" for file in range(5) for line in range(7)]
+
+    streamed = load_jsonl_policy_documents(paths, max_workers=3, batch_size=2)
+    assert [document.metadata["doc_id"] for document in streamed] == expected
+
+    early = load_jsonl_policy_documents(paths, max_workers=3, batch_size=2)
+    assert next(early).metadata["doc_id"] == "doc-0-0"
+    early.close()
+
+    broken = tmp_path / "export-broken.jsonl"
+    broken.write_text(f"{_policy_line('doc-x')}\n{{broken\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=r"export-broken\.jsonl#L2"):
+        list(load_jsonl_policy_documents([paths[0], broken], max_workers=2))
+
+
+def test_streamed_export_builds_the_same_chunks_as_the_source_folder(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    export = tmp_path / "export.jsonl"
+    lines = []
+    for number in range(5):
+        payload = {
+            "content": f"Policy {number}: gifts above {number * 10} USD must be declared. " * 8,
+            "metadata": {
+                "doc_id": f"policy-{number}",
+                "effective_date": "2026-02-01",
+                "owner": "compliance-team",
+                "jurisdiction": "US",
+            },
+        }
+        (source_dir / f"policy-{number}.json").write_text(json.dumps(payload), encoding="utf-8")
+        lines.append(json.dumps(payload))
+    export.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def _build(**options: object) -> CorpusManifest:
+        manifest, _ = build_corpus_snapshot(
+            source_dir,
+            tmp_path / f"out-{len(list(tmp_path.iterdir()))}",
+            version_tag="v1",
+            chunk_size=120,
+            chunk_overlap=20,
+            **options,
+        )
+        return manifest
+
+    folder = _build()
+    streamed = _build(source_jsonl=[export])
+    parallel = _build(source_jsonl=[export], max_workers=2)
+
+    assert (streamed.doc_count, streamed.chunk_count) == (folder.doc_count, folder.chunk_count)
+    assert streamed.metadata_coverage == folder.metadata_coverage
+    assert [chunk.content for chunk in streamed.chunks] == [
+        chunk.content for chunk in folder.chunks
+    ]
+    assert parallel.manifest_hash == streamed.manifest_hash
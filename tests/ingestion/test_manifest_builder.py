@@ -5,7 +5,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from compliance_bot.ingestion.manifest_builder import build_root_hash, rehash_documents
+from compliance_bot.ingestion.manifest_diff import diff_manifests
 from compliance_bot.ingestion.pipeline import build_corpus_snapshot
+from compliance_bot.retrieval.indexer import load_manifest, read_manifest_header
 
 
 def _write_policy(path: Path, *, doc_id: str, content: str) -> None:
@@ -61,3 +64,79 @@ def test_same_corpus_produces_same_manifest_hash(tmp_path: Path) -> None:
     assert path_b.name == "manifest-week-02-v1.json"
     assert path_a.exists()
     assert path_b.exists()
+
+
+def test_jsonl_manifest_round_trips_with_json_manifest(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    _write_policy(
+        source_dir / "policy-a.json",
+        doc_id="policy-a",
+        content="Vendor data sharing needs legal approval and DPA execution. " * 4,
+    )
+
+    json_manifest, json_path = build_corpus_snapshot(
+        source_dir,
+        tmp_path / "out-json",
+        version_tag="week-02-v1",
+        chunk_size=80,
+        chunk_overlap=10,
+    )
+    jsonl_manifest, jsonl_path = build_corpus_snapshot(
+        source_dir,
+        tmp_path / "out-jsonl",
+        version_tag="week-02-v1",
+        chunk_size=80,
+        chunk_overlap=10,
+        manifest_format="jsonl",
+    )
+
+    lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+    assert jsonl_path.name == "manifest-week-02-v1.jsonl"
+    assert len(lines) == jsonl_manifest.chunk_count + 1
+    assert "chunks" not in json.loads(lines[0])
+    assert read_manifest_header(jsonl_path).manifest_hash == json_manifest.manifest_hash
+    assert load_manifest(jsonl_path) == load_manifest(json_path)
+
+
+def test_manifest_diff_reports_only_changed_documents(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    _write_policy(source_dir / "policy-a.json", doc_id="policy-a", content="Vendor review.")
+    _write_policy(source_dir / "policy-b.json", doc_id="policy-b", content="Retain tax records.")
+    old_manifest, old_path = build_corpus_snapshot(
+        source_dir,
+        tmp_path / "old",
+        version_tag="week-02-v1",
+        chunk_size=80,
+        chunk_overlap=10,
+        manifest_format="jsonl",
+    )
+
+    _write_policy(source_dir / "policy-b.json", doc_id="policy-b", content="Retain for 7 years.")
+    _write_policy(source_dir / "policy-c.json", doc_id="policy-c", content="Travel approvals.")
+    new_manifest, new_path = build_corpus_snapshot(
+        source_dir,
+        tmp_path / "new",
+        version_tag="week-02-v2",
+        chunk_size=80,
+        chunk_overlap=10,
+    )
+
+    diff = diff_manifests(old_path, new_path)
+
+    assert diff.added_doc_ids == ["policy-c"]
+    assert diff.changed_doc_ids == ["policy-b"]
+    assert diff.removed_doc_ids == []
+    assert diff.unchanged_doc_count == 1
+    assert new_manifest.manifest_hash == build_root_hash(
+        rehash_documents(
+            old_manifest.doc_hashes,
+            changed_chunks=[
+                chunk
+                for chunk in new_manifest.chunks
+                if chunk.doc_id in {"policy-b", "policy-c"}
+            ],
+        ),
+        version_tag="week-02-v2",
+    )
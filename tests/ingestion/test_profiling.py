@@ -0,0 +1,64 @@
+"""Ingestion profiling tests."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from compliance_bot.ingestion.pipeline import build_corpus_snapshot
+from compliance_bot.ingestion.profiling import (
+    IngestionProfiler,
+    compare_ingestion_profiles,
+    load_ingestion_profile,
+    profile_path,
+)
+
+
+def test_profiled_snapshot_writes_comparable_stage_report(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "policy-a.json").write_text(
+        json.dumps(
+            {
+                "content": "Vendor data sharing needs legal approval and DPA execution.",
+                "metadata": {
+                    "doc_id": "policy-a",
+                    "effective_date": "2026-02-01",
+                    "owner": "compliance-team",
+                    "jurisdiction": "US",
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "out"
+    profiler = IngestionProfiler()
+
+    _, manifest_path = build_corpus_snapshot(
+        source_dir,
+        output_dir,
+        version_tag="week-02-v1",
+        chunk_size=40,
+        chunk_overlap=5,
+        profiler=profiler,
+    )
+
+    profile = load_ingestion_profile(profile_path(output_dir, version_tag="week-02-v1"))
+    assert profiler.profile == profile
+    stages = {stage.stage: stage for stage in profile.stages}
+    assert list(stages) == ["load", "validate", "chunk", "hash", "write"]
+    assert stages["load"].bytes_read == (source_dir / "policy-a.json").stat().st_size
+    assert stages["write"].bytes_written == manifest_path.stat().st_size
+    assert stages["chunk"].items == profile.corpus["chunk_count"]
+    assert "chunk_count" not in profile.run_config
+    assert profile.peak_memory_bytes > 0
+    assert compare_ingestion_profiles(profile, profile) == []
+
+    slower = profile.model_copy(deep=True)
+    slower.stages[2].wall_ms = profile.stages[2].wall_ms * 3 + 50
+    slower.run_config["max_workers"] = "4"
+    slower.corpus["doc_count"] = 40
+    regressions = compare_ingestion_profiles(profile, slower)
+    assert regressions[0] == "run_config.max_workers: 1 -> 4"
+    assert regressions[1].startswith("chunk.wall_ms:")
+    assert not any("doc_count" in regression for regression in regressions)
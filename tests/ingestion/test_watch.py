@@ -0,0 +1,128 @@
+"""Watch mode incremental refresh tests."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from compliance_bot.chains.citation_chain import run_week4_query
+from compliance_bot.ingestion.pipeline import build_corpus_snapshot
+from compliance_bot.ingestion.watch import PolicyWatcher
+from compliance_bot.retrieval.indexer import RetrievalIndex
+from compliance_bot.retrieval.live_index import LiveRetrievalIndex
+from compliance_bot.schemas.query import DecisionEnum
+
+
+def _write_policy(path: Path, *, doc_id: str, content: str, mtime_ns: int) -> None:
+    payload = {
+        "content": content,
+        "metadata": {
+            "doc_id": doc_id,
+            "effective_date": "2026-02-01",
+            "owner": "compliance-team",
+            "jurisdiction": "US",
+        },
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_watcher_applies_only_changed_documents_and_swaps_index(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    contents = {
+        "policy-a": "Vendor data sharing needs legal approval.",
+        "policy-b": "Retention period is seven years for tax records.",
+        "policy-c": "Gifts above 50 USD must be declared.",
+    }
+    for doc_id, content in contents.items():
+        _write_policy(
+            source_dir / f"{doc_id}.json", doc_id=doc_id, content=content, mtime_ns=1_000
+        )
+    live = LiveRetrievalIndex(RetrievalIndex(version_tag="week-02-v1"))
+    watcher = PolicyWatcher(
+        source_dir, live, version_tag="week-02-v1", chunk_size=80, chunk_overlap=10
+    )
+
+    first = watcher.poll_once()
+    assert first is not None
+    assert first.changed_doc_ids == ["policy-a", "policy-b", "policy-c"]
+    assert watcher.poll_once() is None
+    snapshot = live.current()
+    untouched = next(chunk for chunk in snapshot.chunks if chunk.doc_id == "policy-b")
+
+    _write_policy(
+        source_dir / "policy-a.json",
+        doc_id="policy-a",
+        content="Vendor data sharing needs legal approval and DPA execution.",
+        mtime_ns=2_000,
+    )
+    (source_dir / "policy-c.json").unlink()
+    (source_dir / "policy-d.json").write_text("{not json", encoding="utf-8")
+    os.utime(source_dir / "policy-d.json", ns=(2_000, 2_000))
+
+    second = watcher.poll_once()
+    assert second is not None
+    assert second.changed_doc_ids == ["policy-a"]
+    assert second.removed_doc_ids == ["policy-c"]
+    assert list(second.errors) == [str(source_dir / "policy-d.json")]
+    assert second.generation == 2
+    assert "dpa" in live.current().token_to_chunk_ids
+    assert live.current().chunk_lookup[untouched.chunk_id] is untouched
+    assert {chunk.doc_id for chunk in live.current().chunks} == {"policy-a", "policy-b"}
+    assert "dpa" not in snapshot.token_to_chunk_ids
+    assert live.current().manifest_hash == watcher.manifest_hash == second.manifest_hash
+    assert watcher.poll_once() is None
+
+    (source_dir / "policy-d.json").unlink()
+    assert watcher.poll_once() is None
+    # A deleted broken file is forgotten, so an identical one is reported again.
+    (source_dir / "policy-d.json").write_text("{not json", encoding="utf-8")
+    os.utime(source_dir / "policy-d.json", ns=(2_000, 2_000))
+    third = watcher.poll_once()
+    assert third is not None and list(third.errors) == [str(source_dir / "policy-d.json")]
+
+    (source_dir / "policy-d.json").unlink()
+    expected, _ = build_corpus_snapshot(
+        source_dir,
+        tmp_path / "out",
+        version_tag="week-02-v1",
+        chunk_size=80,
+        chunk_overlap=10,
+    )
+    assert watcher.manifest_hash == expected.manifest_hash
+
+
+def test_queries_on_a_live_index_see_edits_without_a_restart(tmp_path: Path) -> None:
+    policy_path = tmp_path / "policy-a.json"
+    _write_policy(
+        policy_path,
+        doc_id="policy-a",
+        content="Vendor data sharing needs legal approval.",
+        mtime_ns=1_000,
+    )
+    live = LiveRetrievalIndex(RetrievalIndex(version_tag="week-02-v1"))
+    watcher = PolicyWatcher(tmp_path, live, version_tag="week-02-v1")
+    watcher.poll_once()
+
+    def _ask() -> str:
+        response = run_week4_query(
+            live_index=live,
+            question="Who approves vendor data sharing?",
+            embedding_provider_mode="none",
+            rerank_provider_mode="none",
+            llm_provider_mode="none",
+        )
+        assert response.decision == DecisionEnum.ANSWERED
+        return response.retrieved_chunks[0].content
+
+    assert "DPA" not in _ask()
+    _write_policy(
+        policy_path,
+        doc_id="policy-a",
+        content="Vendor data sharing needs legal approval and DPA execution.",
+        mtime_ns=2_000,
+    )
+    watcher.poll_once()
+    assert "DPA" in _ask()
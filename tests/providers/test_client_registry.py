@@ -0,0 +1,110 @@
+"""Tests for the process-wide provider client registry."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from compliance_bot.chains.citation_chain import shared_answer_llm
+from compliance_bot.providers.client_registry import (
+    ClientRegistryStats,
+    ProviderClientRegistry,
+    get_client_registry,
+    refresh_provider_clients,
+    reset_client_registry,
+)
+from compliance_bot.providers.local_rerank import LocalRerankProvider
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _AsyncOnlyClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _WrappedClient:
+    def __init__(self) -> None:
+        self._inner = _Transport()
+
+
+def test_clients_are_shared_per_mode_and_env_until_refreshed() -> None:
+    registry = ProviderClientRegistry()
+    env = {"SILICONFLOW_API_KEY": "old-key", "COMPLIANCE_LOCAL_EMBEDDING_DIM": "32"}
+
+    embedding = registry.embedding_provider("local", env=env)
+    assert registry.embedding_provider(" LOCAL ", env=dict(env, UNRELATED="x")) is embedding
+    assert embedding.config.dim == 32
+    assert registry.rerank_provider("none", env=env) is None
+    assert registry.rerank_provider("none", env=env) is None
+    assert isinstance(registry.rerank_provider("local", env=env), LocalRerankProvider)
+
+    rotated = dict(env, SILICONFLOW_API_KEY="new-key")
+    assert registry.embedding_provider("local", env=rotated) is not embedding
+    # Another caller's env gets its own client; neither is closed under the other.
+    stale = registry.get("chat", "siliconflow", _WrappedClient, env=env)
+    current = registry.get("chat", "siliconflow", _WrappedClient, env=rotated)
+    assert registry.get("chat", "siliconflow", _WrappedClient, env=env) is stale
+    assert stale._inner.closed is False and current._inner.closed is False
+    assert registry.refresh("chat") == 2
+    assert stale._inner.closed is True and current._inner.closed is True
+
+    client = registry.get("chat", "siliconflow", _WrappedClient, env=env)
+    assert registry.get("chat", "siliconflow", _WrappedClient, env=env) is client
+    assert registry.refresh("chat") == 1
+    assert client._inner.closed is True
+    assert registry.get("chat", "siliconflow", _WrappedClient, env=env) is not client
+    assert registry.stats() == ClientRegistryStats(clients=5, hits=4, builds=8, closed=3)
+
+
+def test_concurrent_cold_lookups_return_one_client_and_close_the_rest() -> None:
+    registry = ProviderClientRegistry()
+    built: list[_WrappedClient] = []
+    barrier = threading.Barrier(4)
+
+    def _factory() -> _WrappedClient:
+        client = _WrappedClient()
+        built.append(client)
+        barrier.wait(timeout=5.0)
+        return client
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        clients = list(
+            pool.map(lambda _: registry.get("rerank", "siliconflow", _factory, env={}), range(4))
+        )
+
+    assert len(built) == 4
+    assert all(client is clients[0] for client in clients)
+    assert sorted(client._inner.closed for client in built) == [False, True, True, True]
+    assert registry.stats().clients == 1
+
+
+def test_shared_answer_llm_reuses_process_wide_client() -> None:
+    reset_client_registry()
+    env = {"SILICONFLOW_API_KEY": "k", "SILICONFLOW_BASE_URL": "http://127.0.0.1:9/v1"}
+
+    llm = shared_answer_llm("siliconflow", env=env)
+    assert llm is not None
+    assert shared_answer_llm("siliconflow", env=env) is llm
+    assert shared_answer_llm("none", env=env) is None
+    assert refresh_provider_clients("chat") == 2
+    assert shared_answer_llm("siliconflow", env=env) is not llm
+    assert get_client_registry().stats().builds == 3
+    reset_client_registry()
+
+
+def test_sync_refresh_closes_clients_that_only_have_aclose() -> None:
+    registry = ProviderClientRegistry()
+    client = registry.get("rerank", "siliconflow", _AsyncOnlyClient, env={})
+
+    assert registry.refresh() == 1
+    assert client.closed is True
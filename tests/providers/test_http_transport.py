@@ -0,0 +1,236 @@
+"""Pooled HTTP transport tests against a local stand-in server."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from compliance_bot.providers.http_transport import (
+    AsyncHTTPTransport,
+    HTTPTransportConfig,
+    PooledHTTPTransport,
+    get_shared_http_transport,
+)
+from compliance_bot.providers.siliconflow_rerank import (
+    RerankProviderError,
+    SiliconFlowRerankConfig,
+    build_siliconflow_rerank_provider,
+)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+    content_encodings: list[str] = []
+    request_targets: list[tuple[str, str | None]] = []
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        type(self).client_ports.append(self.client_address[1])
+        type(self).request_targets.append((self.path, self.headers.get("Proxy-Authorization")))
+        raw = self.rfile.read(int(self.headers["Content-Length"]))
+        encoding = self.headers.get("Content-Encoding", "")
+        type(self).content_encodings.append(encoding)
+        payload = json.loads(gzip.decompress(raw) if encoding == "gzip" else raw)
+
+        if self.path.endswith("/slow"):
+            time.sleep(0.4)
+        if self.path.endswith("/fail"):
+            status, body = 503, {"error": "unavailable"}
+        else:
+            documents = payload.get("documents", [])
+            status, body = 200, {
+                "results": [
+                    {"index": index, "relevance_score": 1.0 / (index + 1)}
+                    for index in range(len(documents))
+                ]
+            }
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+@pytest.fixture
+def stand_in_url() -> Iterator[str]:
+    _StandInHandler.client_ports = []
+    _StandInHandler.content_encodings = []
+    _StandInHandler.request_targets = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rerank_calls_reuse_one_keep_alive_connection(stand_in_url: str) -> None:
+    with PooledHTTPTransport(HTTPTransportConfig(max_connections_per_host=2)) as transport:
+        provider = build_siliconflow_rerank_provider(
+            SiliconFlowRerankConfig(api_key="test", base_url=stand_in_url),
+            transport=transport,
+        )
+        for _ in range(3):
+            results, metrics = provider.rerank(query="q", candidates=["a", "b"], top_n=2)
+            assert [result.candidate_index for result in results] == [0, 1]
+            assert metrics.status == "ok"
+
+        with pytest.raises(HTTPError) as exc_info:
+            transport.post_json(f"{stand_in_url}/fail", {"query": "q"}, {}, 5.0)
+        assert exc_info.value.code == 503
+
+        assert transport.connections_opened == 1
+    assert len(set(_StandInHandler.client_ports)) == 1
+
+
+def test_pooled_transport_honors_proxy_environment(
+    stand_in_url: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for name in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    proxy_host = stand_in_url.removeprefix("http://")
+    monkeypatch.setenv("http_proxy", f"http://user:p%40ss@{proxy_host}")
+    monkeypatch.setenv("no_proxy", "direct.internal")
+
+    with PooledHTTPTransport() as transport:
+        # The upstream name does not resolve; only the proxy can answer it.
+        response = transport.post_json(
+            "http://rerank.upstream.invalid/v1/rerank?x=1", {"documents": ["a"]}, {}, 5.0
+        )
+        assert response["results"][0]["index"] == 0
+        with pytest.raises(URLError):
+            transport.post_json("http://direct.internal/v1/rerank", {"documents": []}, {}, 5.0)
+
+    assert _StandInHandler.request_targets == [
+        ("http://rerank.upstream.invalid/v1/rerank?x=1", "Basic dXNlcjpwQHNz"),
+    ]
+
+
+def test_waiting_for_a_pooled_connection_counts_against_the_timeout(stand_in_url: str) -> None:
+    with PooledHTTPTransport(HTTPTransportConfig(max_connections_per_host=1)) as transport:
+        holder = threading.Thread(
+            target=transport.post_json, args=(f"{stand_in_url}/slow", {}, {}, 5.0)
+        )
+        holder.start()
+        time.sleep(0.05)
+        started = time.monotonic()
+        # The slot frees after ~0.35s, leaving less than the 0.4s the server takes.
+        with pytest.raises(TimeoutError):
+            transport.post_json(f"{stand_in_url}/slow", {}, {}, 0.6)
+        assert time.monotonic() - started < 0.9
+        holder.join()
+
+
+def test_shared_transport_is_rebuilt_after_close() -> None:
+    transport = get_shared_http_transport()
+    transport.close()
+
+    replacement = get_shared_http_transport()
+    assert replacement is not transport
+    assert not replacement.closed
+    assert get_shared_http_transport() is replacement
+
+
+def test_gzip_request_bodies_above_threshold(stand_in_url: str) -> None:
+    config = HTTPTransportConfig(gzip_requests=True, gzip_min_bytes=64)
+    with PooledHTTPTransport(config) as transport:
+        transport.post_json(f"{stand_in_url}/rerank", {"documents": ["x"]}, {}, 5.0)
+        response = transport.post_json(
+            f"{stand_in_url}/rerank", {"documents": ["policy text " * 20]}, {}, 5.0
+        )
+
+    assert response["results"][0]["index"] == 0
+    assert _StandInHandler.content_encodings == ["", "gzip"]
+
+
+def test_async_rerank_against_stand_in_server(stand_in_url: str) -> None:
+    async def _run() -> list[list[int]]:
+        async with AsyncHTTPTransport() as transport:
+            provider = build_siliconflow_rerank_provider(
+                SiliconFlowRerankConfig(api_key="test", base_url=stand_in_url),
+                async_request_fn=transport.post_json,
+            )
+            batches = await asyncio.gather(
+                *(provider.arerank(query="q", candidates=["a", "b"], top_n=2) for _ in range(3))
+            )
+        return [[result.candidate_index for result in results] for results, _ in batches]
+
+    assert asyncio.run(_run()) == [[0, 1]] * 3
+
+
+def test_async_rerank_timeout_cancels_pending_request() -> None:
+    cancelled: list[bool] = []
+
+    async def _slow_request(
+        url: str,
+        payload: dict[str, object],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> dict[str, object]:
+        del url, payload, headers, timeout
+        try:
+            await asyncio.sleep(5.0)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return {"results": []}
+
+    provider = build_siliconflow_rerank_provider(
+        SiliconFlowRerankConfig(api_key="test", timeout=0.05),
+        async_request_fn=_slow_request,
+    )
+
+    with pytest.raises(RerankProviderError, match="timeout"):
+        asyncio.run(provider.arerank(query="q", candidates=["a"], top_n=1))
+    assert cancelled == [True]
+
+
+def test_async_client_is_closed_when_its_event_loop_finishes(stand_in_url: str) -> None:
+    transport = AsyncHTTPTransport()
+    clients: list[object] = []
+
+    async def _query() -> None:
+        await transport.post_json(f"{stand_in_url}/rerank", {"documents": ["a"]}, {}, 5.0)
+        clients.append(transport._client)
+
+    asyncio.run(_query())
+    asyncio.run(_query())
+
+    assert clients[0] is not clients[1]
+    assert clients[0].is_closed is True  # type: ignore[attr-defined]
+    assert clients[1].is_closed is True  # type: ignore[attr-defined]
+
+
+def test_sync_close_closes_the_client_on_its_owning_loop(stand_in_url: str) -> None:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    transport = AsyncHTTPTransport()
+    try:
+        asyncio.run_coroutine_threadsafe(
+            transport.post_json(f"{stand_in_url}/rerank", {"documents": ["a"]}, {}, 5.0), loop
+        ).result(timeout=5.0)
+        client = transport._client
+
+        transport.close()
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(timeout=5.0)
+        assert client.is_closed is True
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5.0)
+        loop.close()
@@ -0,0 +1,64 @@
+"""Tests for provider latency histograms."""
+
+from __future__ import annotations
+
+from compliance_bot.providers.latency import (
+    LatencyHistogram,
+    payload_bytes,
+    process_latency_snapshot,
+    record_provider_calls,
+    reset_process_latency,
+    summarize_provider_metrics,
+)
+from compliance_bot.schemas.retrieval import ProviderCallMetrics
+
+
+def _metrics(stage: str | None, latency_ms: float, *, status: str = "ok") -> ProviderCallMetrics:
+    return ProviderCallMetrics(
+        provider="siliconflow",
+        model="mock-model",
+        latency_ms=latency_ms,
+        status=status,
+        stage=stage,
+        payload_bytes=10,
+        item_count=1,
+    )
+
+
+def test_histogram_tracks_buckets_and_percentiles() -> None:
+    histogram = LatencyHistogram("embed_query")
+    for latency in [4.0, 8.0, 12.0, 40.0, 900.0]:
+        histogram.record(_metrics("embed_query", latency))
+    histogram.record(_metrics("embed_query", 45000.0, status="error"))
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.count == 6
+    assert snapshot.error_count == 1
+    assert snapshot.p50_ms == 12.0
+    assert snapshot.p95_ms == 45000.0
+    assert snapshot.max_ms == 45000.0
+    assert snapshot.payload_bytes == 60
+    assert snapshot.buckets == {
+        "le_5": 1,
+        "le_10": 1,
+        "le_25": 1,
+        "le_50": 1,
+        "le_1000": 1,
+        "gt_30000": 1,
+    }
+
+
+def test_summaries_group_by_stage_and_feed_process_histograms() -> None:
+    reset_process_latency()
+    calls = [_metrics("rerank", 20.0), _metrics("embed_query", 3.0), _metrics(None, 1.0)]
+
+    summary = summarize_provider_metrics(calls)
+    record_provider_calls(calls)
+    record_provider_calls(calls[:1])
+
+    assert [item.stage for item in summary] == ["embed_query", "rerank", "unknown"]
+    process = {item.stage: item for item in process_latency_snapshot()}
+    assert process["rerank"].count == 2
+    assert payload_bytes(["ab", "é"]) == 4
+    reset_process_latency()
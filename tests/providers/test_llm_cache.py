@@ -0,0 +1,174 @@
+"""Tests for the persistent LLM response cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from compliance_bot.chains.citation_chain import build_citation_answer_chain, run_citation_answer
+from compliance_bot.providers.llm_cache import (
+    CachedChatModel,
+    LLMCacheConfig,
+    LLMCacheStats,
+    LLMResponseCache,
+    load_llm_cache_config,
+    track_llm_cache,
+)
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import RetrievedChunk, RetrievalResponse
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    clock = _Clock()
+    config = LLMCacheConfig(path=str(tmp_path / "llm.sqlite"), max_entries=2, ttl_seconds=60.0)
+    routed = AIMessage(
+        content="",
+        tool_calls=[{"name": "policy_registry_lookup", "args": {"query": "gifts"}, "id": "c1"}],
+    )
+
+    with LLMResponseCache(config, clock=clock) as cache:
+        cache.put("a", routed, namespace="tool_router", model="m")
+        clock.now += 1
+        cache.put("b", AIMessage(content="b"), namespace="answer:h1", model="m")
+        clock.now += 1
+        assert cache.get("a") == routed
+        clock.now += 1
+        cache.put("c", AIMessage(content="c"), namespace="answer:h1", model="m")
+
+        assert cache.get("b") is None
+        clock.now += 59
+        assert cache.get("a") is None
+        assert cache.get("c") == AIMessage(content="c")
+        assert cache.invalidate("answer:h1") == 1
+        assert cache.stats() == LLMCacheStats(entries=0, hits=2, misses=2, expired=1, evicted=1)
+
+    with LLMResponseCache(config, clock=clock) as reopened:
+        reopened.put("d", AIMessage(content="d"), namespace="answer", model="m")
+    with LLMResponseCache(config, clock=clock) as reopened:
+        assert reopened.get("d") == AIMessage(content="d")
+
+    assert load_llm_cache_config({}) is None
+    assert load_llm_cache_config(
+        {"COMPLIANCE_LLM_CACHE_PATH": "x.sqlite", "COMPLIANCE_LLM_CACHE_TTL_SECONDS": "0"}
+    ) == LLMCacheConfig(path="x.sqlite", ttl_seconds=0.0)
+
+
+def _retrieval_response() -> RetrievalResponse:
+    return RetrievalResponse(
+        trace_id="trace-cache-001",
+        question="Who approves expense reimbursements?",
+        normalized_query="who approves expense reimbursements",
+        decision=DecisionEnum.ANSWERED,
+        retrieved_chunks=[
+            RetrievedChunk(
+                chunk_id="chunk-expense-0",
+                doc_id="expense-policy-v1",
+                version_tag="week-04-v1",
+                chunk_index=0,
+                content="Expense reimbursement requires manager approval with receipt evidence.",
+                retrieval_score=0.82,
+                metadata={"section": "4.2"},
+            )
+        ],
+    )
+
+
+def test_answer_chain_serves_repeats_from_cache_per_manifest_hash() -> None:
+    prompts: list[Any] = []
+    reply = json.dumps(
+        {
+            "decision": "ANSWERED",
+            "answer": "Manager approval is required.",
+            "confidence": 0.8,
+            "citations": [
+                {
+                    "doc_id": "expense-policy-v1",
+                    "section": "4.2",
+                    "chunk_id": "chunk-expense-0",
+                    "quote_span": "Expense reimbursement requires manager approval",
+                    "retrieval_score": 0.82,
+                    "version": "week-04-v1",
+                }
+            ],
+        }
+    )
+
+    def _model(prompt: Any) -> AIMessage:
+        prompts.append(prompt)
+        return AIMessage(content=reply)
+
+    cache = LLMResponseCache(LLMCacheConfig(path=":memory:"))
+    llm = CachedChatModel(RunnableLambda(_model), cache, model="m", temperature=0.0)
+
+    def _answer(manifest_hash: str) -> Any:
+        return run_citation_answer(
+            _retrieval_response(),
+            answer_chain=build_citation_answer_chain(llm, manifest_hash=manifest_hash),
+            llm_provider="siliconflow",
+            llm_model="m",
+        )
+
+    first = _answer("hash-one")
+    second = _answer("hash-one")
+    rebuilt = _answer("hash-two")
+
+    assert len(prompts) == 2
+    assert first.answer == second.answer == "Manager approval is required."
+    assert second.decision == DecisionEnum.ANSWERED
+    metadata = [response.audit_events[-1].metadata for response in (first, second, rebuilt)]
+    assert [(item["llm_provider"], item["llm_cache_hit"]) for item in metadata] == [
+        ("siliconflow", False),
+        ("siliconflow:cache", True),
+        ("siliconflow", False),
+    ]
+    assert cache.stats().entries == 2
+
+
+def test_async_invoke_keeps_sqlite_off_the_event_loop() -> None:
+    class _ThreadRecordingCache(LLMResponseCache):
+        def __init__(self) -> None:
+            super().__init__(LLMCacheConfig(path=":memory:"))
+            self.threads: list[int] = []
+
+        def get(self, cache_key: str) -> Any:
+            self.threads.append(threading.get_ident())
+            return super().get(cache_key)
+
+        def put(self, cache_key: str, message: Any, *, namespace: str, model: str) -> None:
+            self.threads.append(threading.get_ident())
+            super().put(cache_key, message, namespace=namespace, model=model)
+
+    cache = _ThreadRecordingCache()
+    calls: list[Any] = []
+
+    async def _model(prompt: Any) -> AIMessage:
+        calls.append(prompt)
+        return AIMessage(content="cached answer")
+
+    llm = CachedChatModel(RunnableLambda(_model), cache, model="m", temperature=0.0)
+
+    async def _run() -> tuple[list[Any], int, int]:
+        with track_llm_cache() as tally:
+            replies = [await llm.ainvoke("same prompt") for _ in range(2)]
+        return replies, threading.get_ident(), tally.hits
+
+    replies, loop_thread, hits = asyncio.run(_run())
+
+    assert replies[0] == replies[1] == AIMessage(content="cached answer")
+    assert len(calls) == 1 and hits == 1
+    assert len(cache.threads) == 3
+    assert loop_thread not in cache.threads
@@ -0,0 +1,83 @@
+"""Tests for the offline hashed n-gram embedding provider."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from compliance_bot.providers.local_embeddings import (
+    LocalEmbeddingConfig,
+    LocalHashEmbeddingProvider,
+)
+from compliance_bot.providers.provider_registry import resolve_embedding_provider
+from compliance_bot.retrieval.indexer import build_retrieval_index_from_chunks
+from compliance_bot.retrieval.retriever import run_retrieval
+from compliance_bot.schemas.ingestion import ChunkRecord
+
+
+def _dot(left: list[float], right: list[float]) -> float:
+    return sum(a * b for a, b in zip(left, right, strict=True))
+
+
+def test_local_embeddings_are_deterministic_unit_vectors() -> None:
+    provider = LocalHashEmbeddingProvider(LocalEmbeddingConfig(dim=64))
+    texts = [
+        "Expense reimbursement requires manager approval.",
+        "Managers approve reimbursement of expenses.",
+        "Vendor data sharing in the EU requires a DPA.",
+    ]
+
+    first = provider.embed_documents(texts)
+    second = LocalHashEmbeddingProvider(LocalEmbeddingConfig(dim=64)).embed_documents(texts)
+
+    assert first == second
+    assert all(len(vector) == 64 for vector in first)
+    assert all(math.isclose(_dot(vector, vector), 1.0) for vector in first)
+    assert _dot(first[0], first[1]) > _dot(first[0], first[2])
+    assert provider.embed_query(texts[0]) == first[0]
+
+
+def test_numpy_and_python_projections_agree() -> None:
+    pytest.importorskip("numpy")
+    provider = LocalHashEmbeddingProvider()
+    rows = provider._sparse_rows(["Travel expenses above threshold", ""])
+
+    for fast, slow in zip(provider._project_numpy(rows), provider._project_python(rows)):
+        assert fast == pytest.approx(slow)
+
+
+def test_local_mode_enables_dense_retrieval_without_network() -> None:
+    provider = resolve_embedding_provider("local", env={})
+    chunks = [
+        ChunkRecord(
+            chunk_id="chunk-expense-0",
+            doc_id="expense-policy-v1",
+            version_tag="v1",
+            chunk_index=0,
+            content="Reimbursements need sign-off from the employee's manager.",
+            metadata={"jurisdiction": "US", "policy_scope": "expense"},
+        ),
+        ChunkRecord(
+            chunk_id="chunk-vendor-0",
+            doc_id="vendor-policy-v1",
+            version_tag="v1",
+            chunk_index=0,
+            content="Vendor contracts require a data processing agreement.",
+            metadata={"jurisdiction": "US", "policy_scope": "vendor"},
+        ),
+    ]
+    index = build_retrieval_index_from_chunks(
+        chunks, version_tag="v1", embedding_provider=provider
+    )
+
+    response = run_retrieval(
+        index,
+        question="Who signs off on reimbursement?",
+        embedding_provider=provider,
+        top_k=1,
+    )
+
+    assert index.vector_dim == 256
+    assert response.retrieved_chunks[0].chunk_id == "chunk-expense-0"
+    assert response.provider_metrics[0].provider == "local"
@@ -0,0 +1,74 @@
+"""Tests for the in-process local reranker."""
+
+from __future__ import annotations
+
+from compliance_bot.providers.local_rerank import LocalRerankProvider
+from compliance_bot.providers.provider_registry import resolve_rerank_provider
+from compliance_bot.providers.resilience import (
+    ProviderGuard,
+    ResilienceConfig,
+    ResilientRerankProvider,
+)
+
+
+def test_local_rerank_scores_are_calibrated_and_ordered() -> None:
+    provider = resolve_rerank_provider("local", env={})
+    candidates = [
+        "Vendor onboarding requires legal review.",
+        "Managers must approve expense reimbursement requests within five days.",
+        "Expense policies exist. Separately, reimbursement of travel may require approval.",
+    ]
+
+    results, metrics = provider.rerank(
+        query="approve expense reimbursement",
+        candidates=candidates,
+        top_n=3,
+    )
+
+    assert isinstance(provider, LocalRerankProvider)
+    assert [result.candidate_index for result in results] == [1, 2, 0]
+    assert all(0.0 <= result.score <= 1.0 for result in results)
+    assert results[-1].score == 0.0
+    assert metrics.provider == "local"
+    assert metrics.status == "ok"
+
+
+def test_field_boost_breaks_ties_on_section_metadata() -> None:
+    provider = LocalRerankProvider()
+    candidates = ["Approval is required for reimbursement."] * 2
+
+    results, _ = provider.rerank(
+        query="travel reimbursement approval",
+        candidates=candidates,
+        top_n=2,
+        candidate_fields=[{"section": "4.2"}, {"policy_scope": "expense,travel"}],
+    )
+
+    assert results[0].candidate_index == 1
+    assert results[0].score > results[1].score
+
+
+def test_open_remote_circuit_falls_back_to_local_reranker() -> None:
+    class _DownRerank:
+        provider_name = "siliconflow"
+        model = "remote"
+
+        def rerank(self, *, query: str, candidates: list[str], top_n: int):
+            raise TimeoutError("remote rerank unavailable")
+
+    provider = ResilientRerankProvider(
+        _DownRerank(),
+        ProviderGuard(ResilienceConfig(failure_threshold=1)),
+        fallback=LocalRerankProvider(),
+    )
+
+    try:
+        provider.rerank(query="expense", candidates=["expense policy"], top_n=1)
+    except TimeoutError:
+        pass
+    results, metrics = provider.rerank(query="expense", candidates=["expense policy"], top_n=1)
+
+    assert results[0].candidate_index == 0
+    assert metrics.provider == "local"
+    assert metrics.circuit_state == "open"
+    assert metrics.error_code == "circuit_open"
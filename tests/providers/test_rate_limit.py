@@ -0,0 +1,209 @@
+"""Tests for the adaptive SiliconFlow rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from urllib.error import HTTPError
+
+from compliance_bot.providers.rate_limit import (
+    AdaptiveRateLimiter,
+    RateLimitConfig,
+    get_rate_limiter,
+    load_rate_limit_config,
+    rate_limit_snapshot,
+    reset_rate_limiters,
+)
+from compliance_bot.providers.siliconflow_rerank import (
+    SiliconFlowRerankConfig,
+    build_siliconflow_rerank_provider,
+)
+
+
+def _http_error(status: int, message: str) -> HTTPError:
+    return HTTPError("https://stand-in/rerank", status, message, Message(), io.BytesIO())
+
+
+def _too_many_requests(retry_after: str = "0") -> HTTPError:
+    headers = Message()
+    headers["Retry-After"] = retry_after
+    return HTTPError("https://stand-in/rerank", 429, "Too Many Requests", headers, io.BytesIO())
+
+
+def test_aimd_limit_shrinks_on_overload_and_regrows_on_success() -> None:
+    now = [0.0]
+    limiter = AdaptiveRateLimiter(
+        "rerank",
+        "mock-model",
+        RateLimitConfig(max_concurrency=8, backoff_seconds=1.0),
+        clock=lambda: now[0],
+    )
+
+    limiter.acquire()
+    assert limiter.release(_too_many_requests()) is True
+    limiter.acquire()
+    assert limiter.release(TimeoutError("slow")) is False
+    assert limiter.concurrency_limit == 4.0
+
+    now[0] = 2.0
+    limiter.acquire()
+    limiter.release(TimeoutError("slow"))
+    assert limiter.concurrency_limit == 2.0
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+    snapshot = limiter.snapshot()
+    assert 3.0 < snapshot.concurrency_limit < 4.0
+    assert snapshot.rate_limited_count == 1
+    assert snapshot.timeout_count == 2
+    assert load_rate_limit_config("embedding", {"SILICONFLOW_EMBEDDING_RPS": "2.5"}).burst == 3
+
+
+def test_concurrency_gate_and_token_bucket_throttle_callers() -> None:
+    limiter = AdaptiveRateLimiter("embedding", "mock-model", RateLimitConfig(max_concurrency=2))
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def _work() -> None:
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda _: limiter.call(_work), range(6)))
+
+    assert active[1] == 2
+    assert limiter.snapshot().throttled_count >= 1
+
+    paced = AdaptiveRateLimiter(
+        "chat",
+        "mock-model",
+        RateLimitConfig(requests_per_second=50.0, burst=1),
+    )
+
+    async def _three_calls() -> float:
+        async def _noop() -> None:
+            return None
+
+        start = time.perf_counter()
+        for _ in range(3):
+            await paced.acall(_noop)
+        return time.perf_counter() - start
+
+    assert asyncio.run(_three_calls()) >= 0.035
+
+
+def test_rerank_provider_retries_rate_limited_request_through_limiter() -> None:
+    reset_rate_limiters()
+    attempts: list[int] = []
+
+    def _request(url: str, payload: dict, headers: dict, timeout: float) -> dict:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise _too_many_requests()
+        return {"results": [{"index": 0, "relevance_score": 0.9}]}
+
+    provider = build_siliconflow_rerank_provider(
+        SiliconFlowRerankConfig(api_key="k", model="mock-rerank-model"),
+        request_fn=_request,
+    )
+    results, metrics = provider.rerank(query="approval", candidates=["a"], top_n=1)
+
+    assert len(attempts) == 2
+    assert results[0].score == 0.9
+    assert metrics.status == "ok"
+    [snapshot] = rate_limit_snapshot()
+    assert (snapshot.kind, snapshot.model) == ("rerank", "mock-rerank-model")
+    assert snapshot.retry_count == 1
+    assert 8.0 <= snapshot.concurrency_limit < 9.0
+    reset_rate_limiters()
+
+
+def test_server_and_connection_errors_are_retried_with_backoff() -> None:
+    limiter = AdaptiveRateLimiter(
+        "chat",
+        "mock-model",
+        RateLimitConfig(backoff_seconds=0.01, max_retries=2),
+    )
+    failures = [_http_error(503, "Service Unavailable"), ConnectionResetError("reset")]
+
+    def _flaky() -> str:
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+
+    assert limiter.call(_flaky) == "ok"
+    snapshot = limiter.snapshot()
+    assert snapshot.retry_count == 2
+    assert snapshot.concurrency_limit >= 8.0
+    limiter.acquire()
+    assert limiter.release(_http_error(400, "Bad Request")) is False
+
+
+def test_async_waiter_wakes_on_release_and_reconfigure_keeps_state() -> None:
+    gated = AdaptiveRateLimiter("chat", "mock-model", RateLimitConfig(max_concurrency=1))
+
+    async def _wait_for_slot() -> float:
+        gated.acquire()
+        waiter = asyncio.create_task(gated.aacquire())
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+        start = time.perf_counter()
+        gated.release()
+        await waiter
+        gated.release()
+        return time.perf_counter() - start
+
+    assert asyncio.run(_wait_for_slot()) < 0.01
+
+    reset_rate_limiters()
+    limiter = get_rate_limiter("chat", "mock-model", RateLimitConfig(max_concurrency=8))
+    limiter.acquire()
+    assert limiter.release(_too_many_requests()) is True
+    limiter.acquire()
+
+    same = get_rate_limiter("chat", "mock-model", RateLimitConfig(max_concurrency=16))
+    assert same is limiter
+    assert same.config.max_concurrency == 16
+    assert same.concurrency_limit == 4.0
+    assert same.snapshot().in_flight == 1
+    same.release()
+    reset_rate_limiters()
+
+
+def test_cancelled_and_interrupted_calls_free_the_slot_without_growing_the_limit() -> None:
+    limiter = AdaptiveRateLimiter("chat", "mock-model", RateLimitConfig(max_concurrency=8))
+    limiter.acquire()
+    limiter.release(_too_many_requests())
+    assert limiter.concurrency_limit == 4.0
+
+    async def _cancelled() -> None:
+        async def _slow() -> None:
+            await asyncio.sleep(5.0)
+
+        try:
+            await asyncio.wait_for(limiter.acall(_slow), timeout=0.01)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(_cancelled())
+
+    def _interrupted() -> None:
+        raise KeyboardInterrupt
+
+    try:
+        limiter.call(_interrupted)
+    except KeyboardInterrupt:
+        pass
+
+    snapshot = limiter.snapshot()
+    assert snapshot.in_flight == 0
+    assert snapshot.concurrency_limit == 4.0
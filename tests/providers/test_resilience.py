@@ -0,0 +1,174 @@
+"""Tests for hedged provider calls and circuit breaking."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+
+import pytest
+from langchain_core.runnables import RunnableGenerator
+
+from compliance_bot.providers.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderGuard,
+    ResilienceConfig,
+    ResilientChatModel,
+    ResilientRerankProvider,
+    get_provider_guard,
+    reset_provider_guards,
+)
+from compliance_bot.schemas.retrieval import ProviderCallMetrics, RerankResult
+
+
+def test_circuit_breaker_opens_then_probes_after_reset() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10.0, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    assert breaker.allow() is False
+
+    now[0] = 10.0
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # only one probe in flight
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+
+    now[0] = 20.0
+    assert breaker.allow() is True
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_slow_call_is_hedged_and_fast_duplicate_wins() -> None:
+    guard = ProviderGuard(
+        ResilienceConfig(hedge_min_samples=1, latency_window=10, hedge_min_delay_ms=20.0)
+    )
+    guard.latencies.record(1.0)
+    calls = []
+    lock = threading.Lock()
+
+    def _call() -> str:
+        with lock:
+            calls.append(len(calls))
+            attempt = len(calls)
+        if attempt == 1:
+            time.sleep(1.0)
+            return "slow"
+        return "fast"
+
+    start = time.perf_counter()
+    result, outcome = guard.call(_call)
+
+    assert result == "fast"
+    assert outcome.hedged is True
+    assert outcome.circuit_state == CIRCUIT_CLOSED
+    assert time.perf_counter() - start < 0.5
+
+
+def test_hedges_are_bounded_and_keep_the_callers_context() -> None:
+    tenant: contextvars.ContextVar[str] = contextvars.ContextVar("tenant", default="none")
+    guard = ProviderGuard(
+        ResilienceConfig(
+            hedge_min_samples=1,
+            latency_window=10,
+            hedge_min_delay_ms=20.0,
+            hedge_max_in_flight=1,
+        )
+    )
+    guard.latencies.record(1.0)
+    seen: list[tuple[int, str]] = []
+    lock = threading.Lock()
+
+    def _call() -> str:
+        with lock:
+            seen.append((threading.get_ident(), tenant.get()))
+            attempt = len(seen)
+        if attempt == 1:
+            time.sleep(0.3)
+            return "slow"
+        return "fast"
+
+    tenant.set("acme")
+    result, outcome = guard.call(_call)
+    assert (result, outcome.hedged) == ("fast", True)
+    assert [value for _, value in seen] == ["acme", "acme"]
+
+    # With the only slot taken by another hedging call, a slow call is not
+    # hedged and runs inline on the caller's thread instead of queueing.
+    seen.clear()
+    assert guard._hedge_slots.acquire(blocking=False) is True
+    try:
+        result, outcome = guard.call(_call)
+    finally:
+        guard._hedge_slots.release()
+    assert (result, outcome.hedged) == ("slow", False)
+    assert seen == [(threading.get_ident(), "acme")]
+
+
+def test_open_circuit_fails_fast_and_reports_state() -> None:
+    class _FailingRerank:
+        provider_name = "siliconflow"
+        model = "rerank-model"
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def rerank(self, *, query: str, candidates: list[str], top_n: int):
+            self.calls += 1
+            if self.calls > 1:
+                raise TimeoutError("slow provider")
+            return [RerankResult(candidate_index=0, score=0.9)], ProviderCallMetrics(
+                provider="siliconflow", model="rerank-model", latency_ms=3.0, status="ok"
+            )
+
+    inner = _FailingRerank()
+    provider = ResilientRerankProvider(
+        inner,
+        ProviderGuard(ResilienceConfig(failure_threshold=1, reset_timeout_seconds=60.0)),
+    )
+
+    _, metrics = provider.rerank(query="q", candidates=["a"], top_n=1)
+    assert metrics.circuit_state == CIRCUIT_CLOSED
+    assert metrics.hedged is False
+
+    with pytest.raises(TimeoutError):
+        provider.rerank(query="q", candidates=["a"], top_n=1)
+    with pytest.raises(CircuitOpenError):
+        provider.rerank(query="q", candidates=["a"], top_n=1)
+    assert inner.calls == 2
+    assert provider.circuit_state == CIRCUIT_OPEN
+
+
+def test_reconfigured_guard_keeps_open_breaker_and_streams_use_public_api() -> None:
+    reset_provider_guards()
+    config = ResilienceConfig(failure_threshold=1, reset_timeout_seconds=60.0)
+    guard = get_provider_guard("llm", "siliconflow", "chat-model", config)
+    guard.latencies.record(5.0)
+
+    def _failing_stream(_: object):
+        yield "partial"
+        raise RuntimeError("dropped stream")
+
+    chat = ResilientChatModel(RunnableGenerator(_failing_stream), guard)
+    with pytest.raises(RuntimeError):
+        list(chat.stream("hi"))
+    assert guard.circuit_state == CIRCUIT_OPEN
+
+    updated = ResilienceConfig(failure_threshold=3, reset_timeout_seconds=60.0, hedge_llm=True)
+    same = get_provider_guard("llm", "siliconflow", "chat-model", updated)
+    assert same is guard
+    assert same.config == updated
+    assert same.circuit_state == CIRCUIT_OPEN
+    assert len(same.latencies) == 1
+    with pytest.raises(CircuitOpenError):
+        same.admit()
+    reset_provider_guards()
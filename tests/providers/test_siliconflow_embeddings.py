@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import importlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import SimpleNamespace
 
 import pytest
@@ -58,3 +61,52 @@ def test_build_embedding_provider_passes_config(monkeypatch: pytest.MonkeyPatch)
     assert provider.model == "BAAI/bge-m3"
     assert provider.embed_query("x") == [0.3, 0.4]
     assert provider.embed_documents(["a", "b"]) == [[0.1, 0.2], [0.1, 0.2]]
+
+
+def test_embedding_requests_send_raw_strings() -> None:
+    pytest.importorskip("langchain_openai")
+    inputs: list[object] = []
+
+    class _EmbeddingsHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            texts = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+            inputs.extend(texts)
+            body = json.dumps(
+                {
+                    "object": "list",
+                    "model": payload["model"],
+                    "data": [
+                        {"object": "embedding", "index": index, "embedding": [0.1, 0.2]}
+                        for index in range(len(texts))
+                    ],
+                    "usage": {"prompt_tokens": 1, "total_tokens": 1},
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EmbeddingsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        provider = build_siliconflow_embedding_provider(
+            SiliconFlowEmbeddingConfig(
+                api_key="key",
+                base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+            )
+        )
+        provider.embed_documents(["Vendor data sharing needs a DPA."])
+        provider.embed_query("Who approves expenses?")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Token-ID arrays would mean the client pre-tokenised the text with tiktoken.
+    assert inputs == ["Vendor data sharing needs a DPA.", "Who approves expenses?"]
@@ -0,0 +1,163 @@
+"""Tests for single-flight coalescing of provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.runnables import RunnableLambda
+
+from compliance_bot.chains.citation_chain import build_citation_answer_chain, run_citation_answer
+from compliance_bot.providers.single_flight import (
+    CoalescingChatModel,
+    CoalescingEmbeddingProvider,
+    CoalescingRerankProvider,
+    SingleFlight,
+    SingleFlightStats,
+)
+from compliance_bot.schemas.query import DecisionEnum
+from compliance_bot.schemas.retrieval import (
+    ProviderCallMetrics,
+    RerankResult,
+    RetrievedChunk,
+    RetrievalResponse,
+)
+
+_CALLERS = 6
+
+
+def _wait_for_callers(flight: SingleFlight, expected: int) -> None:
+    deadline = time.monotonic() + 5.0
+    while flight.stats().calls < expected and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class _BlockingEmbeddingProvider:
+    provider_name = "siliconflow"
+    model = "mock-embedding-model"
+
+    def __init__(self, flight: SingleFlight) -> None:
+        self.flight = flight
+        self.calls = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        _wait_for_callers(self.flight, _CALLERS)
+        return [float(len(text)), 1.0]
+
+
+def test_threaded_embed_query_calls_share_one_request() -> None:
+    flight = SingleFlight()
+    inner = _BlockingEmbeddingProvider(flight)
+    provider = CoalescingEmbeddingProvider(inner, flight)
+
+    with ThreadPoolExecutor(max_workers=_CALLERS) as pool:
+        vectors = list(pool.map(provider.embed_query, ["policy question"] * _CALLERS))
+
+    assert inner.calls == 1
+    assert vectors == [[15.0, 1.0]] * _CALLERS
+    assert flight.stats() == SingleFlightStats(calls=_CALLERS, executions=1, coalesced=5)
+    assert provider.embed_query("policy question") == [15.0, 1.0]
+    assert inner.calls == 2
+
+
+class _AsyncRerankProvider:
+    provider_name = "siliconflow"
+    model = "mock-rerank-model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def arerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
+        self.calls += 1
+        await self.release.wait()
+        return (
+            [RerankResult(candidate_index=1, score=0.9)],
+            ProviderCallMetrics(
+                provider=self.provider_name,
+                model=self.model,
+                latency_ms=5.0,
+                status="ok",
+            ),
+        )
+
+
+def test_async_rerank_calls_share_one_request_and_survive_caller_cancellation() -> None:
+    async def scenario() -> tuple[int, list[bool], SingleFlightStats]:
+        inner = _AsyncRerankProvider()
+        flight = SingleFlight()
+        provider = CoalescingRerankProvider(inner, flight)
+        request = {"query": "approval", "candidates": ["a", "b"], "top_n": 1}
+
+        cancelled = asyncio.ensure_future(provider.arerank(**request))
+        callers = [asyncio.ensure_future(provider.arerank(**request)) for _ in range(3)]
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        inner.release.set()
+        outcomes = await asyncio.gather(*callers)
+        return inner.calls, [metrics.coalesced for _, metrics in outcomes], flight.stats()
+
+    calls, coalesced, stats = asyncio.run(scenario())
+
+    assert calls == 1
+    assert coalesced == [True, True, True]
+    assert stats == SingleFlightStats(calls=4, executions=1, coalesced=3)
+
+
+def test_identical_answer_requests_share_one_llm_call() -> None:
+    flight = SingleFlight()
+    llm_calls: list[object] = []
+
+    def _answer(prompt: object) -> str:
+        llm_calls.append(prompt)
+        _wait_for_callers(flight, _CALLERS)
+        return (
+            '{"answer":"Manager approval is required.","confidence":0.8,'
+            '"decision":"ANSWERED","citations":[{"doc_id":"expense-policy-v1",'
+            '"section":"4.2","chunk_id":"chunk-expense-0",'
+            '"quote_span":"Expense reimbursement requires manager approval.",'
+            '"retrieval_score":0.82,"version":"v1"}]}'
+        )
+
+    chain = build_citation_answer_chain(
+        CoalescingChatModel(RunnableLambda(_answer), flight, scope="mock-llm")
+    )
+    retrieval = RetrievalResponse(
+        trace_id="trace-single-flight",
+        question="Who approves expense reimbursements?",
+        normalized_query="who approves expense reimbursements",
+        decision=DecisionEnum.ANSWERED,
+        retrieved_chunks=[
+            RetrievedChunk(
+                chunk_id="chunk-expense-0",
+                doc_id="expense-policy-v1",
+                version_tag="v1",
+                chunk_index=0,
+                content="Expense reimbursement requires manager approval.",
+                retrieval_score=0.82,
+                metadata={"section": "4.2"},
+            )
+        ],
+    )
+
+    with ThreadPoolExecutor(max_workers=_CALLERS) as pool:
+        responses = list(
+            pool.map(
+                lambda _: run_citation_answer(retrieval, answer_chain=chain),
+                range(_CALLERS),
+            )
+        )
+
+    assert len(llm_calls) == 1
+    assert all(response.decision == DecisionEnum.ANSWERED for response in responses)
+    coalesced = [response.audit_events[-1].metadata["coalesced"] for response in responses]
+    assert sorted(coalesced) == [False] + [True] * (_CALLERS - 1)
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from compliance_bot.retrieval.benchmarks import run_retrieval_benchmarks
+from compliance_bot.chains.citation_chain import shared_answer_llm
+from compliance_bot.providers.client_registry import reset_client_registry
+from compliance_bot.providers.llm_cache import CachedChatModel
+from compliance_bot.providers.local_rerank import LocalRerankProvider
+from compliance_bot.providers.single_flight import CoalescingChatModel
+from compliance_bot.retrieval.benchmarks import (
+    compare_rerank_providers,
+    run_retrieval_benchmarks,
+    speculation_answer_llm,
+)
 from compliance_bot.retrieval.indexer import RetrievalIndex, build_retrieval_index
 from compliance_bot.schemas.ingestion import ChunkRecord, CorpusManifest
 from compliance_bot.schemas.retrieval import RetrievalBenchmarkCase, RetrievalFilters
@@ -94,3 +103,49 @@ def test_benchmark_report_fails_when_recall_gate_is_not_met() -> None:
 
     assert report.avg_recall_at_k == 0.0
     assert report.meets_quality_gate is False
+
+
+def test_compare_rerank_providers_reports_each_mode() -> None:
+    index = _build_index()
+    cases = [
+        RetrievalBenchmarkCase(
+            case_id="case-expense",
+            question="Who approves expense reimbursements?",
+            expected_doc_ids=["expense-policy-v1"],
+            filters=RetrievalFilters(jurisdiction="US"),
+        )
+    ]
+
+    reports = compare_rerank_providers(
+        index,
+        cases=cases,
+        rerank_providers={"none": None, "local": LocalRerankProvider()},
+        top_k=1,
+    )
+
+    assert list(reports) == ["none", "local"]
+    assert reports["local"].avg_recall_at_k == 1.0
+    assert reports["none"].avg_recall_at_k == 1.0
+    assert "rerank" in reports["local"].stage_p95_latency_ms
+    assert reports["none"].stage_p95_latency_ms == {}
+
+
+def test_speculation_llm_skips_the_cache_single_flight_and_shared_client(tmp_path) -> None:
+    reset_client_registry()
+    env = {
+        "SILICONFLOW_API_KEY": "k",
+        "SILICONFLOW_BASE_URL": "http://127.0.0.1:9/v1",
+        "COMPLIANCE_LLM_CACHE_PATH": str(tmp_path / "llm-cache.sqlite"),
+        "COMPLIANCE_PROVIDER_SINGLE_FLIGHT": "1",
+    }
+
+    llm = speculation_answer_llm("siliconflow", env=env)
+
+    layers = []
+    layer = llm
+    while layer is not None:
+        layers.append(layer)
+        layer = getattr(layer, "_inner", None)
+    assert not any(isinstance(item, (CachedChatModel, CoalescingChatModel)) for item in layers)
+    assert llm is not shared_answer_llm("siliconflow", env=env)
+    reset_client_registry()
@@ -0,0 +1,92 @@
+"""Embedding store tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from compliance_bot.ingestion.manifest_builder import write_manifest
+from compliance_bot.retrieval.embedding_store import (
+    EmbeddingStore,
+    load_cached_retrieval_index,
+    referenced_content_hashes,
+)
+from compliance_bot.retrieval.indexer import content_sha256
+from compliance_bot.schemas.ingestion import ChunkRecord, CorpusManifest
+
+
+class _CountingEmbeddingProvider:
+    provider_name = "siliconflow"
+    model = "mock"
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def _write_manifest(tmp_path: Path, contents: list[str]) -> Path:
+    chunks = [
+        ChunkRecord(
+            chunk_id=f"chunk-000{index}",
+            doc_id="doc-1",
+            version_tag="week-03-v1",
+            chunk_index=index,
+            content=content,
+            metadata={"jurisdiction": "US"},
+        )
+        for index, content in enumerate(contents)
+    ]
+    manifest = CorpusManifest(
+        version_tag="week-03-v1",
+        manifest_hash="x" * 64,
+        doc_count=1,
+        chunk_count=len(chunks),
+        metadata_coverage={},
+        chunks=chunks,
+    )
+    return write_manifest(manifest, tmp_path / "corpus")
+
+
+def test_rebuild_only_embeds_chunks_missing_from_store(tmp_path: Path) -> None:
+    store_path = tmp_path / "embeddings.sqlite"
+    manifest_path = _write_manifest(tmp_path, ["Receipts are mandatory.", "Receipts are mandatory."])
+    provider = _CountingEmbeddingProvider()
+
+    first = load_cached_retrieval_index(
+        manifest_path, embedding_provider=provider, embedding_store_path=store_path
+    )
+    assert provider.embedded == ["Receipts are mandatory."]
+
+    manifest_path = _write_manifest(
+        tmp_path, ["Receipts are mandatory.", "Expense approvals require manager signoff."]
+    )
+    second = load_cached_retrieval_index(
+        manifest_path, embedding_provider=provider, embedding_store_path=store_path
+    )
+
+    assert provider.embedded == [
+        "Receipts are mandatory.",
+        "Expense approvals require manager signoff.",
+    ]
+    assert second.chunks[0].vector == first.chunks[0].vector
+    assert second.vector_dim == 2
+
+
+def test_store_export_import_and_gc_round_trip(tmp_path: Path) -> None:
+    kept = content_sha256("kept")
+    stale = content_sha256("stale")
+    with EmbeddingStore(tmp_path / "a.sqlite") as store:
+        store.put_many("mock", {kept: [0.5, 1.0], stale: [2.0, 3.0]})
+        assert store.export_jsonl(tmp_path / "vectors.jsonl") == 2
+
+    with EmbeddingStore(tmp_path / "b.sqlite") as store:
+        assert store.import_jsonl(tmp_path / "vectors.jsonl") == 2
+        assert store.get_many("mock", [kept]) == {kept: [0.5, 1.0]}
+
+        manifest_path = _write_manifest(tmp_path, ["kept"])
+        assert referenced_content_hashes([manifest_path]) == {kept}
+        assert store.garbage_collect({kept}) == 1
+        assert store.count() == 1
+        assert store.get_many("mock", [kept, stale]) == {kept: [0.5, 1.0]}
@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from compliance_bot.retrieval.indexer import build_retrieval_index
+from pathlib import Path
+
+import pytest
+
+from compliance_bot.ingestion.manifest_builder import write_manifest
+from compliance_bot.retrieval.indexer import (
+    EmbeddingJobConfig,
+    EmbeddingJobError,
+    EmbeddingJobProgress,
+    build_retrieval_index,
+    load_retrieval_index,
+    plan_embedding_batches,
+    run_embedding_job,
+)
 from compliance_bot.schemas.ingestion import ChunkRecord, CorpusManifest
 
 
@@ -38,3 +51,103 @@ def test_build_index_with_embedding_provider_sets_vectors() -> None:
     assert index.vector_dim == 2
     assert index.chunks[0].vector is not None
     assert len(index.chunks[0].vector) == 2
+
+
+def test_load_retrieval_index_streams_jsonl_manifest(tmp_path: Path) -> None:
+    chunks = [
+        ChunkRecord(
+            chunk_id=f"chunk-000{index}",
+            doc_id="doc-1",
+            version_tag="week-03-v1",
+            chunk_index=index,
+            content=content,
+            metadata={"jurisdiction": "US"},
+        )
+        for index, content in enumerate(
+            ["Expense approvals require manager signoff.", "Receipts are mandatory."]
+        )
+    ]
+    manifest = CorpusManifest(
+        version_tag="week-03-v1",
+        manifest_hash="x" * 64,
+        doc_count=1,
+        chunk_count=len(chunks),
+        metadata_coverage={},
+        chunks=chunks,
+    )
+    path = write_manifest(manifest, tmp_path, manifest_format="jsonl")
+
+    streamed = load_retrieval_index(path, embedding_provider=_MockEmbeddingProvider())
+    expected = build_retrieval_index(manifest, embedding_provider=_MockEmbeddingProvider())
+
+    assert streamed.model_dump() == expected.model_dump()
+
+
+class _FlakyEmbeddingProvider:
+    provider_name = "siliconflow"
+    model = "mock"
+
+    def __init__(self, *, fail_on: str, failures: int) -> None:
+        self.fail_on = fail_on
+        self.failures = failures
+        self.batches: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        if self.fail_on in texts and self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("provider unavailable")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_plan_embedding_batches_caps_items_and_chars() -> None:
+    texts = ["a" * 10, "b" * 10, "c" * 10, "d" * 50, "e"]
+
+    assert plan_embedding_batches(texts, max_batch_items=2, max_batch_chars=100) == [
+        (0, 2),
+        (2, 4),
+        (4, 5),
+    ]
+    assert plan_embedding_batches(texts, max_batch_items=10, max_batch_chars=25) == [
+        (0, 2),
+        (2, 3),
+        (3, 4),
+        (4, 5),
+    ]
+
+
+def test_run_embedding_job_retries_and_keeps_partial_vectors() -> None:
+    texts = ["alpha", "beta", "gamma", "delta"]
+    progress: list[EmbeddingJobProgress] = []
+    config = EmbeddingJobConfig(
+        max_batch_items=1,
+        max_concurrency=2,
+        max_attempts=2,
+        backoff_seconds=0.0,
+        progress_callback=progress.append,
+    )
+
+    flaky = _FlakyEmbeddingProvider(fail_on="beta", failures=1)
+    vectors = run_embedding_job(flaky, texts, config=config, sleep_fn=lambda _: None)
+    assert vectors == [[float(len(text)), 1.0] for text in texts]
+    assert len(flaky.batches) == 5
+    assert progress[-1].embedded_chunks == 4
+    assert progress[-1].retries == 1
+
+    broken = _FlakyEmbeddingProvider(fail_on="gamma", failures=10)
+    with pytest.raises(EmbeddingJobError) as exc_info:
+        run_embedding_job(broken, texts, config=config, sleep_fn=lambda _: None)
+    assert exc_info.value.failed_batches == [(2, 3)]
+    assert sorted(exc_info.value.partial_vectors) == [0, 1, 3]
+
+
+def test_rate_limited_providers_are_not_retried_again_by_the_job() -> None:
+    limited = _FlakyEmbeddingProvider(fail_on="beta", failures=1)
+    limited.rate_limiter = object()  # type: ignore[attr-defined]
+    config = EmbeddingJobConfig(max_batch_items=1, max_attempts=3, backoff_seconds=0.0)
+
+    with pytest.raises(EmbeddingJobError) as exc_info:
+        run_embedding_job(limited, ["alpha", "beta"], config=config, sleep_fn=lambda _: None)
+
+    assert exc_info.value.failed_batches == [(1, 2)]
+    assert [batch for batch in limited.batches if batch == ["beta"]] == [["beta"]]
@@ -0,0 +1,103 @@
+"""Rerank payload budgeting and deduplication tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from compliance_bot.retrieval.indexer import build_retrieval_index_from_chunks
+from compliance_bot.retrieval.rerank_payload import (
+    RerankPayloadConfig,
+    parse_rerank_budget,
+    trim_candidate_text,
+)
+from compliance_bot.retrieval.retriever import run_retrieval
+from compliance_bot.schemas.ingestion import ChunkRecord
+from compliance_bot.schemas.retrieval import ProviderCallMetrics, RerankResult
+
+_FILLER = " ".join(f"filler{number}" for number in range(40))
+_POLICY_TEXT = f"{_FILLER} Reimbursement requires manager approval and receipts. {_FILLER}"
+
+
+def test_trim_keeps_budgeted_window_centred_on_matched_terms() -> None:
+    by_chars = trim_candidate_text(
+        _POLICY_TEXT,
+        {"reimbursement", "approval"},
+        max_chars=60,
+    )
+    by_tokens = trim_candidate_text(_POLICY_TEXT, {"receipts"}, max_tokens=5)
+
+    assert by_chars == "filler39 Reimbursement requires manager approval and"
+    assert by_tokens == "approval and receipts. filler0 filler1"
+    assert trim_candidate_text(_POLICY_TEXT, {"absent"}, max_tokens=2) == "filler0 filler1"
+    assert trim_candidate_text("short text", {"short"}, max_chars=100) == "short text"
+
+    assert parse_rerank_budget("full") == RerankPayloadConfig()
+    assert parse_rerank_budget("chars:400+tokens:64").label == "chars:400+tokens:64"
+    with pytest.raises(ValueError):
+        parse_rerank_budget("words:10")
+    with pytest.raises(ValueError):
+        parse_rerank_budget("chars:0")
+
+
+class _RecordingRerankProvider:
+    provider_name = "recording"
+    model = "recording-v1"
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, object]] = []
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[str],
+        top_n: int,
+    ) -> tuple[list[RerankResult], ProviderCallMetrics]:
+        self.requests.append({"query": query, "candidates": candidates, "top_n": top_n})
+        return (
+            [RerankResult(candidate_index=index, score=0.9 - index / 10) for index in range(top_n)],
+            ProviderCallMetrics(
+                provider=self.provider_name,
+                model=self.model,
+                latency_ms=1.0,
+                status="ok",
+            ),
+        )
+
+
+def test_retrieval_sends_trimmed_unique_texts_and_maps_scores_back() -> None:
+    chunks = [
+        ChunkRecord(
+            chunk_id=f"chunk-policy-{position}",
+            doc_id=f"policy-{position}",
+            version_tag="v1",
+            chunk_index=0,
+            content=content,
+            metadata={"jurisdiction": "US"},
+        )
+        for position, content in enumerate([_POLICY_TEXT, _POLICY_TEXT, "Receipts are archived."])
+    ]
+    index = build_retrieval_index_from_chunks(chunks, version_tag="v1")
+    provider = _RecordingRerankProvider()
+
+    response = run_retrieval(
+        index,
+        question="Does reimbursement need approval and receipts?",
+        rerank_provider=provider,
+        top_k=3,
+        rerank_payload=RerankPayloadConfig(max_tokens=8),
+    )
+
+    [request] = provider.requests
+    assert len(request["candidates"]) == 2
+    assert all(len(text.split()) <= 8 for text in request["candidates"])
+    assert request["top_n"] == 2
+    assert [chunk.chunk_id for chunk in response.retrieved_chunks] == [
+        "chunk-policy-0",
+        "chunk-policy-1",
+        "chunk-policy-2",
+    ]
+    assert [chunk.retrieval_score for chunk in response.retrieved_chunks] == [0.9, 0.9, 0.8]
+    metadata = response.audit_events[-1].metadata
+    assert (metadata["rerank_trimmed"], metadata["rerank_deduplicated"]) == (2, 1)
+    assert response.provider_metrics[-1].item_count == 2
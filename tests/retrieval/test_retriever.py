@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from compliance_bot.providers.resilience import (
+    ProviderGuard,
+    ResilienceConfig,
+    ResilientRerankProvider,
+)
 from compliance_bot.retrieval.indexer import RetrievalIndex, build_retrieval_index
 from compliance_bot.retrieval.retriever import run_retrieval
 from compliance_bot.schemas.ingestion import ChunkRecord, CorpusManifest
@@ -247,6 +252,15 @@ def test_retrieval_uses_provider_embeddings_and_rerank() -> None:
     assert response.retrieved_chunks[0].chunk_id == "chunk-expense-1"
     assert any(metric.status == "ok" for metric in response.provider_metrics)
 
+    embed_metrics = [item for item in response.provider_metrics if item.stage == "embed_query"]
+    rerank_metrics = [item for item in response.provider_metrics if item.stage == "rerank"]
+    assert embed_metrics and all(item.latency_ms > 0.0 for item in embed_metrics)
+    assert all(item.item_count == 1 and item.payload_bytes for item in embed_metrics)
+    assert rerank_metrics[0].item_count == 2
+    stages = {item.stage: item for item in response.provider_latency}
+    assert stages["embed_query"].count == len(embed_metrics)
+    assert stages["rerank"].p95_ms == 8.2
+
 
 def test_rerank_timeout_falls_back_to_pre_rerank_order() -> None:
     index = _build_index()
@@ -260,3 +274,25 @@ def test_rerank_timeout_falls_back_to_pre_rerank_order() -> None:
 
     assert response.retrieved_chunks[0].chunk_id == "chunk-expense-0"
     assert any(metric.error_code == "rerank_failed" for metric in response.provider_metrics)
+
+
+def test_open_rerank_circuit_falls_back_without_calling_provider() -> None:
+    index = _build_index()
+    rerank_provider = ResilientRerankProvider(
+        _FailingRerankProvider(),
+        ProviderGuard(ResilienceConfig(failure_threshold=1)),
+    )
+    options = dict(
+        question="Who approves expense reimbursement requests?",
+        filters=RetrievalFilters(jurisdiction="US", policy_scope=["expense"]),
+        rerank_provider=rerank_provider,
+        top_k=2,
+    )
+
+    first = run_retrieval(index, **options)
+    second = run_retrieval(index, **options)
+
+    assert first.provider_metrics[-1].error_code == "rerank_failed"
+    assert second.provider_metrics[-1].error_code == "circuit_open"
+    assert second.provider_metrics[-1].circuit_state == "open"
+    assert second.retrieved_chunks[0].chunk_id == "chunk-expense-0"
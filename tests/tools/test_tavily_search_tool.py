@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from compliance_bot.schemas.tools import TavilySearchInput
 from compliance_bot.tools.tavily_search_tool import (
     TavilySearchConfig,
+    asearch_tavily,
     has_tavily_api_key,
     load_tavily_search_config,
     search_tavily,
@@ -88,3 +91,42 @@ def test_search_tavily_returns_unresolved_when_no_results() -> None:
 
     assert result.resolved is False
     assert result.sources == []
+
+
+def test_asearch_tavily_maps_results_and_enforces_timeout() -> None:
+    async def _request(
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout: float,
+    ) -> dict[str, object]:
+        del url, headers, timeout
+        return {
+            "results": [
+                {
+                    "title": "Expense guidance",
+                    "url": "https://example.com/expense",
+                    "content": f"Guidance for {payload['query']}",
+                    "score": 0.8,
+                }
+            ]
+        }
+
+    async def _slow_request(
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout: float,
+    ) -> dict[str, object]:
+        await asyncio.sleep(5.0)
+        return {}
+
+    config = TavilySearchConfig(api_key="test-key", timeout_seconds=0.05)
+    tool_input = TavilySearchInput(question="expense approval")
+
+    result = asyncio.run(asearch_tavily(tool_input, config=config, request_fn=_request))
+    assert result.resolved is True
+    assert result.sources[0].url == "https://example.com/expense"
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(asearch_tavily(tool_input, config=config, request_fn=_slow_request))